@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""Offline load test for the bot.
+
+Starts local stand-ins for Instagram, TrendHero and the Telegram Bot API,
+runs main.py against them in a scratch directory and drives simulated users
+through /ban, /unban, /veri, /status and /stop. Halfway through the steady
+phase a share of the watched accounts change state so notifications fire.
+
+Reports probes/sec, scheduler lag, command and notification latency, memory
+and CPU. Results can be saved with --json and compared with --baseline:
+
+    python bench.py --users 200 --watches 5 --duration 120 --json before.json
+    python bench.py --users 200 --watches 5 --duration 120 --baseline before.json
+
+--check-fixtures instead serves every page in fixtures/instagram and checks
+the bot's /status answer against a full html.parser parse of the same page.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from urllib.request import urlopen
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(REPO_DIR, "fixtures", "instagram")
+BOT_TOKEN = "123456:bench"
+FIRST_USER_ID = 100000
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    """Routes requests to the owning fake's handle(method, path, params) -> (status, headers, body)."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.fake.connections += 1
+
+    def _dispatch(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type") or ""
+        if "x-www-form-urlencoded" in content_type:
+            params.update(parse_qsl(body.decode()))
+        elif "json" in content_type and body:
+            params.update(json.loads(body))
+
+        status, headers, payload = self.server.fake.handle(self.command, url.path, params)
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+
+
+class FakeServer:
+    connections = 0  # TCP connections accepted, to see whether clients reuse them
+
+    def start(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeHandler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda request, client_address: None  # the bot hanging up at shutdown is expected
+        self.server.fake = self
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        return self
+
+
+class FakeInstagram(FakeServer):
+    """Profile pages: active (og:description), banned (404), missing (200 without the tag), slow, or 429."""
+
+    def __init__(self, latency, slow_latency, rate_limit_probability, page_bytes=0):
+        self.accounts = {}  # {username: 'active' | 'banned' | 'missing' | 'slow'}
+        self.latency = latency
+        self.slow_latency = slow_latency
+        self.rate_limit_probability = rate_limit_probability
+        self.hits = 0
+        self.pages = {}
+        for name in os.listdir(FIXTURE_DIR):
+            with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+                self.pages[os.path.splitext(name)[0]] = f.read()
+        # Real profile pages carry hundreds of KB of body after <head>; pad the ones served to watches
+        padding = b'<div hidden>' + b'x' * page_bytes + b'</div></body>' if page_bytes else b'</body>'
+        for name in ("active_profile", "missing_profile"):
+            self.pages[name] = self.pages[name].replace(b"</body>", padding, 1)
+
+    def handle(self, method, path, params):
+        self.hits += 1
+        username = path.strip("/").split("/")[0]
+        html = {"Content-Type": "text/html; charset=utf-8"}
+        if self.latency:
+            time.sleep(self.latency)
+        if username.startswith("fixture-"):
+            return 200, html, self.pages[username[len("fixture-"):]]
+        if random.random() < self.rate_limit_probability:
+            return 429, {"Retry-After": "1"}, ""
+
+        mode = self.accounts.get(username, "banned")
+        if mode == "slow":
+            time.sleep(self.slow_latency)
+            mode = "active"
+        if mode == "active":
+            return 200, html, self.pages["active_profile"]
+        if mode == "missing":
+            return 200, html, self.pages["missing_profile"]
+        return 404, html, "<html><body>Page not found</body></html>"
+
+
+class FakeTrendHero(FakeServer):
+    """The get_er_reports JSON the verification monitor reads."""
+
+    def __init__(self, latency):
+        self.verified = {}  # {username: bool}
+        self.latency = latency
+        self.hits = 0
+
+    def handle(self, method, path, params):
+        self.hits += 1
+        if self.latency:
+            time.sleep(self.latency)
+        verified = self.verified.get(params.get("username"), False)
+        return 200, {"Content-Type": "application/json"}, json.dumps({"preview": {"user_info": {"is_verified": verified}}})
+
+
+class FakeTelegram(FakeServer):
+    """Just enough of the Bot API for polling, replies and notifications."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.cond = threading.Condition()
+        self.updates = []
+        self.next_update_id = 1
+        self.sent = []  # [(time, method, chat_id, text, reply_to_message_id)]
+        self.polled = threading.Event()
+
+    def push_command(self, user_id, text):
+        """Queue a command as an update and return its message id."""
+        with self.cond:
+            update_id = self.next_update_id
+            self.next_update_id += 1
+            self.updates.append({
+                "update_id": update_id,
+                "message": {
+                    "message_id": update_id,
+                    "date": int(time.time()),
+                    "chat": {"id": user_id, "type": "private"},
+                    "from": {"id": user_id, "is_bot": False, "first_name": f"user{user_id}"},
+                    "text": text,
+                },
+            })
+            self.cond.notify_all()
+        return update_id
+
+    def handle(self, method, path, params):
+        api_method = path.rsplit("/", 1)[-1]
+        ok = {"Content-Type": "application/json"}
+        if api_method == "getUpdates":
+            self.polled.set()
+            with self.cond:
+                if not self.updates:
+                    self.cond.wait(min(float(params.get("timeout") or 0), 1.0))
+                updates, self.updates = self.updates, []
+            return 200, ok, json.dumps({"ok": True, "result": updates})
+        if api_method == "getMe":
+            return 200, ok, json.dumps({"ok": True, "result": {"id": 1, "is_bot": True, "first_name": "bench", "username": "bench_bot"}})
+
+        if self.latency:
+            time.sleep(self.latency)
+        chat_id = int(params.get("chat_id") or 0)
+        reply_to = params.get("reply_to_message_id")
+        if params.get("reply_parameters"):
+            reply_to = json.loads(params["reply_parameters"]).get("message_id")
+        text = params.get("text") or params.get("caption") or ""
+        with self.cond:
+            self.sent.append((time.time(), api_method, chat_id, text, int(reply_to) if reply_to else None))
+            message_id = 10 ** 9 + len(self.sent)
+
+        if api_method in ("sendMessage", "sendPhoto", "editMessageText"):
+            result = {"message_id": message_id, "date": int(time.time()), "chat": {"id": chat_id, "type": "private"}, "text": text}
+        else:
+            result = True
+        return 200, ok, json.dumps({"ok": True, "result": result})
+
+
+def scrape_metrics(port):
+    """Return {series: value} from the bot's /metrics, or {} if it isn't reachable."""
+    try:
+        with urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            text = response.read().decode()
+    except OSError:
+        return {}
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, _, value = line.rpartition(" ")
+            samples[series] = float(value)
+    return samples
+
+
+def histogram_summary(before, after, name):
+    """Mean and bucket-bound p95 of a histogram over the window between two scrapes."""
+    count = after.get(f"{name}_count", 0) - before.get(f"{name}_count", 0)
+    if count <= 0:
+        return None, None
+    total = after.get(f"{name}_sum", 0) - before.get(f"{name}_sum", 0)
+    buckets = []
+    for series, value in after.items():
+        match = re.fullmatch(rf'{name}_bucket\{{le="([^"]+)"\}}', series)
+        if match and match.group(1) != "+Inf":
+            buckets.append((float(match.group(1)), value - before.get(series, 0)))
+    p95 = None
+    for bound, cumulative in sorted(buckets):
+        if cumulative >= 0.95 * count:
+            p95 = bound
+            break
+    return total / count, p95
+
+
+def process_stats(pid):
+    """RSS, peak RSS (bytes), thread count and CPU seconds of a process, read from /proc."""
+    stats = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                stats[key] = int(value.split()[0]) * 1024
+            elif key == "Threads":
+                stats[key] = int(value)
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    stats["cpu"] = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return stats
+
+
+class BotProcess:
+    def __init__(self, args, instagram, trendhero, telegram, user_ids, extra_env=None):
+        self.workdir = tempfile.mkdtemp(prefix="bot-bench-")
+        self.port = free_port()
+        # Grants are picked up through the one-off import of the legacy JSON files
+        with open(os.path.join(self.workdir, "user_data.json"), "w") as f:
+            json.dump({str(user_id): {"expiry": "infinity"} for user_id in user_ids}, f)
+
+        env = dict(os.environ)
+        env.update({
+            "TELEGRAM_TOKEN": BOT_TOKEN,
+            "TELEGRAM_API_URL": telegram.url,
+            "INSTAGRAM_BASE_URL": instagram.url,
+            "TRENDHERO_URL": trendhero.url + "/api/get_er_reports",
+            "FLASK_PORT": str(self.port),
+            "BAN_CHECK_INTERVAL": str(args.ban_interval),
+            "VERI_CHECK_INTERVAL": str(args.veri_interval),
+            "PYTHONUNBUFFERED": "1",
+        })
+        env.update(extra_env or {})
+        self.log = open(os.path.join(self.workdir, "bot.log"), "w")
+        self.proc = subprocess.Popen([sys.executable, os.path.join(REPO_DIR, "main.py")],
+                                     cwd=self.workdir, env=env, stdout=self.log, stderr=subprocess.STDOUT)
+
+    def wait_ready(self, telegram, timeout):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.proc.poll() is not None:
+                raise SystemExit(f"Bot exited early, see {self.log.name}")
+            if telegram.polled.wait(0.5):
+                return
+        raise SystemExit(f"Bot did not start polling within {timeout}s, see {self.log.name}")
+
+    def stop(self, keep_workdir):
+        self.proc.send_signal(signal.SIGTERM)
+        try:
+            self.proc.wait(5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self.log.close()
+        if keep_workdir:
+            print(f"Bot working directory kept at {self.workdir}")
+        else:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def send_commands(telegram, commands, rate):
+    """Push (user_id, text) commands at `rate` per second; returns {message_id: (sent_at, user_id, text)}."""
+    issued = {}
+    for i, (user_id, text) in enumerate(commands):
+        issued[telegram.push_command(user_id, text)] = (time.time(), user_id, text)
+        if rate:
+            time.sleep(max(0, (i + 1) / rate - (time.time() - issued[min(issued)][0])))
+    return issued
+
+
+def wait_for_replies(telegram, issued, timeout):
+    """Wait until every issued command got a reply and return the reply latencies."""
+    deadline = time.time() + timeout
+    while True:
+        with telegram.cond:
+            replies = {}
+            for sent_at, _, _, _, reply_to in telegram.sent:
+                if reply_to in issued and reply_to not in replies:
+                    replies[reply_to] = sent_at
+        if len(replies) >= len(issued) or time.time() > deadline:
+            return [replies[mid] - issued[mid][0] for mid in replies], len(issued) - len(replies)
+        time.sleep(0.2)
+
+
+def plan_users(args):
+    """Give each simulated user a mix of watches over a shared account pool."""
+    pool = max(int(args.users * args.watches * (1 - args.overlap)), 1)
+    kinds = ["ban", "unban", "veri"]
+    accounts = {f"acct{i}": kinds[i % len(kinds)] for i in range(pool)}
+    user_ids = [FIRST_USER_ID + i for i in range(args.users)]
+    subscriptions = {}
+    names = sorted(accounts)
+    for user_id in user_ids:
+        subscriptions[user_id] = random.sample(names, min(args.watches, len(names)))
+    return accounts, user_ids, subscriptions
+
+
+def run_load(args):
+    random.seed(args.seed)
+    instagram = FakeInstagram(args.instagram_latency, args.slow_latency, args.rate_limit, args.page_bytes).start()
+    trendhero = FakeTrendHero(args.instagram_latency).start()
+    telegram = FakeTelegram(args.telegram_latency).start()
+
+    accounts, user_ids, subscriptions = plan_users(args)
+    for username, kind in accounts.items():
+        if kind == "unban":
+            instagram.accounts[username] = random.choice(["banned", "missing"])
+        else:
+            instagram.accounts[username] = "slow" if random.random() < args.slow_fraction else "active"
+            trendhero.verified[username] = False
+
+    bot = BotProcess(args, instagram, trendhero, telegram, user_ids)
+    try:
+        bot.wait_ready(telegram, args.startup_timeout)
+        print(f"Bot up (pid {bot.proc.pid}); {len(user_ids)} users, {len(accounts)} accounts, "
+              f"{sum(len(s) for s in subscriptions.values())} subscriptions")
+
+        # Subscribe phase
+        commands = [(user_id, f"/{accounts[name]} {name}") for user_id in user_ids for name in subscriptions[user_id]]
+        commands += [(user_id, f"/status {random.choice(list(accounts))}") for user_id in user_ids]
+        random.shuffle(commands)
+        started = time.time()
+        issued = send_commands(telegram, commands, args.command_rate)
+        command_latencies, unanswered = wait_for_replies(telegram, issued, args.startup_timeout + len(commands) / 10)
+        print(f"Subscribe phase: {len(issued)} commands in {time.time() - started:.1f}s, {unanswered} unanswered")
+
+        # Steady phase, with a share of accounts changing state halfway through
+        before = scrape_metrics(bot.port)
+        stats_before = process_stats(bot.proc.pid)
+        instagram_before = instagram.hits, instagram.connections
+        hits_before = instagram.hits + trendhero.hits
+        steady_start = time.time()
+        time.sleep(args.duration / 2)
+
+        flipped = {}
+        for username, kind in accounts.items():
+            if random.random() >= args.flip_fraction:
+                continue
+            if kind == "ban":
+                instagram.accounts[username] = "banned"
+            elif kind == "unban":
+                instagram.accounts[username] = "active"
+            else:
+                trendhero.verified[username] = True
+            flipped[username] = (kind, time.time())
+
+        time.sleep(args.duration / 2)
+        steady_seconds = time.time() - steady_start
+        probes = instagram.hits + trendhero.hits - hits_before
+        instagram_requests = instagram.hits - instagram_before[0]
+        instagram_connections = instagram.connections - instagram_before[1]
+        after = scrape_metrics(bot.port)
+        stats_after = process_stats(bot.proc.pid)
+
+        # Stop phase: every user drops one subscription
+        stops = [(user_id, f"/stop {subscriptions[user_id][0]}") for user_id in user_ids if subscriptions[user_id]]
+        stop_issued = send_commands(telegram, stops, args.command_rate)
+        stop_latencies, stop_unanswered = wait_for_replies(telegram, stop_issued, 30)
+    finally:
+        bot.stop(args.keep)
+
+    markers = {"ban": "is Banned!", "unban": "is Recovered!", "veri": "is now verified"}
+    notification_latencies = []
+    missed = 0
+    for username, (kind, flipped_at) in flipped.items():
+        subscribers = {user_id for user_id, names in subscriptions.items() if username in names}
+        delivered = {}
+        for sent_at, method, chat_id, text, _ in telegram.sent:
+            if chat_id in subscribers and chat_id not in delivered and f"@{username} " in text and markers[kind] in text:
+                delivered[chat_id] = sent_at - flipped_at
+        notification_latencies.extend(delivered.values())
+        missed += len(subscribers) - len(delivered)
+
+    lag_mean, lag_p95 = histogram_summary(before, after, "scheduler_lag_seconds")
+    send_mean, send_p95 = histogram_summary(before, after, "telegram_send_duration_seconds")
+    expected_rate = sum(1 / (args.veri_interval if kind == "veri" else args.ban_interval) for kind in accounts.values())
+    return {
+        "users": args.users,
+        "accounts": len(accounts),
+        "subscriptions": sum(len(s) for s in subscriptions.values()),
+        "probes_per_sec": probes / steady_seconds,
+        "expected_probes_per_sec": expected_rate,
+        "instagram_requests_per_connection": instagram_requests / max(instagram_connections, 1),
+        "scheduler_lag_mean_s": lag_mean,
+        "scheduler_lag_p95_s": lag_p95,
+        "command_latency_p50_s": percentile(command_latencies, 0.5),
+        "command_latency_p95_s": percentile(command_latencies, 0.95),
+        "commands_unanswered": unanswered,
+        "stop_latency_p95_s": percentile(stop_latencies, 0.95),
+        "stops_unanswered": stop_unanswered,
+        "notification_latency_p50_s": percentile(notification_latencies, 0.5),
+        "notification_latency_p95_s": percentile(notification_latencies, 0.95),
+        "notifications_missed": missed,
+        "telegram_send_mean_s": send_mean,
+        "telegram_send_p95_s": send_p95,
+        "notify_queue_depth": after.get("notify_queue_depth"),
+        "rss_mb": stats_after["VmRSS"] / 2 ** 20,
+        "peak_rss_mb": stats_after["VmHWM"] / 2 ** 20,
+        "threads": stats_after["Threads"],
+        "cpu_percent": 100 * (stats_after["cpu"] - stats_before["cpu"]) / steady_seconds,
+    }
+
+
+def print_report(result, baseline=None):
+    print()
+    for key, value in result.items():
+        line = f"{key:30} {value:12.3f}" if isinstance(value, float) else f"{key:30} {str(value):>12}"
+        old = (baseline or {}).get(key)
+        if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+            change = f"{(value - old) / old * 100:+.1f}%" if old else "n/a"
+            line += f"   baseline {old:.3f} ({change})"
+        print(line)
+
+
+def check_fixtures(args):
+    """Ask the bot for /status of every fixture page and compare with a full html.parser parse.
+
+    The bot is run once per --chunk-sizes entry, since the head scan must not depend on
+    where chunks split.
+    """
+    from bs4 import BeautifulSoup
+
+    instagram = FakeInstagram(0, 0, 0).start()
+    trendhero = FakeTrendHero(0).start()
+    telegram = FakeTelegram(0).start()
+    expected = {}
+    for name, page in sorted(instagram.pages.items()):
+        soup = BeautifulSoup(page.decode("utf-8"), "html.parser")
+        expected[f"fixture-{name}"] = bool(soup.find("meta", property="og:description"))
+
+    mismatches = 0
+    for chunk_size in args.chunk_sizes:
+        bot = BotProcess(args, instagram, trendhero, telegram, [FIRST_USER_ID], {"PAGE_CHUNK_SIZE": str(chunk_size)})
+        try:
+            bot.wait_ready(telegram, args.startup_timeout)
+            issued = send_commands(telegram, [(FIRST_USER_ID, f"/status {username}") for username in expected], 0)
+            wait_for_replies(telegram, issued, 60)
+        finally:
+            bot.stop(args.keep)
+        telegram.polled.clear()
+
+        replies = {reply_to: text for _, _, _, text, reply_to in telegram.sent if reply_to in issued}
+        for message_id, (_, _, command) in sorted(issued.items()):
+            username = command.split(" ", 1)[1]
+            text = replies.get(message_id, "")
+            got = True if "is currently Active" in text else False if "is currently Banned" in text else None
+            ok = got == expected[username]
+            mismatches += not ok
+            print(f"{'ok' if ok else 'MISMATCH':8} {chunk_size:>6}B {username:40} expected {expected[username]!s:5} got {got}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50, help="simulated Telegram users")
+    parser.add_argument("--watches", type=int, default=4, help="watches each user starts")
+    parser.add_argument("--overlap", type=float, default=0.3, help="share of subscriptions that land on an account someone else watches")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of steady-state probing")
+    parser.add_argument("--flip-fraction", type=float, default=0.2, help="share of accounts that change state mid-run")
+    parser.add_argument("--ban-interval", type=float, default=20, help="BAN_CHECK_INTERVAL for the bot")
+    parser.add_argument("--veri-interval", type=float, default=5, help="VERI_CHECK_INTERVAL for the bot")
+    parser.add_argument("--command-rate", type=float, default=50, help="commands per second sent during setup")
+    parser.add_argument("--instagram-latency", type=float, default=0.05, help="added latency of fake Instagram/TrendHero responses")
+    parser.add_argument("--slow-fraction", type=float, default=0.05, help="share of active accounts whose page is slow")
+    parser.add_argument("--slow-latency", type=float, default=3, help="latency of slow pages")
+    parser.add_argument("--page-bytes", type=int, default=0, help="filler added to the body of watched profile pages")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="probability an Instagram response is a 429")
+    parser.add_argument("--telegram-latency", type=float, default=0.03, help="added latency of fake Bot API calls")
+    parser.add_argument("--startup-timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --json")
+    parser.add_argument("--keep", action="store_true", help="keep the bot's scratch directory and log")
+    parser.add_argument("--check-fixtures", action="store_true", help="check /status against every fixture page and exit")
+    parser.add_argument("--chunk-sizes", type=lambda value: [int(size) for size in value.split(",")], default=[1, 1024, 16384],
+                        help="PAGE_CHUNK_SIZE values to run --check-fixtures with (comma separated)")
+    args = parser.parse_args()
+
+    if args.check_fixtures:
+        sys.exit(1 if check_fixtures(args) else 0)
+
+    result = run_load(args)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
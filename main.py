@@ -3,7 +3,7 @@ import base64
 import sys
 import binascii
 
-FXEEO_ENC = "UjJkSjhLT0Y2ZDM4MjQ0OTZlNWU1NjIzNTU1NDVhMjQyMTdhNGU0YjZlMjU1YTc4NmY1ZTU5NTc2ZDM4MjQ0OTZlNWU1NjIzNTU1NDVhMmE2ZjQ5NDE1NzU1NGI0ZTUyNmU3YTVhMjQ2Zjc5MzY3MzZmNzkzNzRhNzAzODc4NGI0MDM4MzI3MzZmNTM3ODQ5NTU1NDRlNzQyMTI1NDY3NDQwMjUzNzRjNTU1MzUyNGI0MDM0NGU0MjZlN2E1YTIzMjEzODRhNDU0MDM4MzI1NzZmNzkzNzRhNzAzODc4NGI0MDM4MzM3MjZmNTM1Mjc2NmQyNTUyN2E0MDM5NTk3MzMxMzQ0ZTZlNTY1ZTRlMmEzNzUzMzc0NTQwMzg3MDRiMjEzODI0NGY2ZTVlMzM0ZTM2NTE3NzdhNTg0ZjRkN2E2Zjc5Mzc0YTcwMzgzNzRjNzA1NDU5N2E1ODRmNGQ3YTIxNzkzNzc0NzAzOTMzNDI0MDdhMzc0NTZmMjUyYjI0NmY1MDMyN2E1ODRmNGQ3YTQwNzk0YTc0NmYyNTQ1N2E1ODRmNGQ3YTZkMzgyYTRjNzA1MzUyNDU2ZTI1NTI3NzQwMzk1NTdhMzkzMjQyNzk2ZTVlNTU3MzZmNTM1Mjc2NmQyNTUyN2E0MDM0NGU0MjZlNzU0ZTRiNDAzOTUyMjQ2ZDM5NTY3ODQwNTIyYjQ5MjEzODVhNDQyMTM4NzA3ODZmNGM0MTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTcyMzkyNTc4NDY2ZjUzMmI0YjcwNTIyYjcyNTc1NDRlNzQyMTI1NDY3NDQwMjUzNjQyNGY3NTRkNzM1NTRmNGU3ODcxNTM1YTc4NmY1NDMyNzMzNDM4MjQ0OTZlNWU1NjIzMzMzOTU2NGI2ZTVlNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzNzc1NmY1NDU2NDgyMTI1Mzc0YzZmNGIyYTc2NmQ1MzM3NzY2ZDI0MmI3NjIxMzg0YTQ1NTc1MjQ2NGM3MTM5NTk0NzQwMzk3NDc4MjE1ZTM3MjMyMTM4NTY0NTQwMzQ0OTczNTY0YjI0NDY1NjRiNDk3MzU2NWU0ZTQyNmY0ZjZmNDU1NTRmNzA0MjZlN2E1YTIzMjEzODRhNDU1NjRiNDk3MzZmNTM1Mjc2NmQyNTUyN2E0MDM3MjM0MjRmNzM0MjQyNmUzOTRlNDg2ZjdhMzI3MzZlNWU1OTU3NmQzODI0NDk2ZTVlNTYyMzU1NTM0MjRjNmUyNTI2NTc2ZDM4MjQ0OTZlNWU1NjIzNTU1NDMzNzg2ZTUzMzc3NTZlNWUzMjU3NmQzODI0NDk2ZTVlNTYyMzU1NTQ1Njc4NmYzOTM3Nzg2ZjVlMzM0YzRmNzk0MDRiNmUyNTIzNzMyMTdhNTkyMzU1NTM3ODQ2NmY1MzJiNGI3MDRmNGU0ZjQwMzg1MjI0NzA1Mzc4Nzk3MDM4NGEzNTZlNWUzNzQ5NGY3OTQwNGI2ZTI1MjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY3MzZkMzgyNDQ5NmU1ZTU2MjM1NTUzMzM3NDcwNTMzNzIzNmQzODI0Nzg1ODRmNGUyMzZkMzgyNDc4NDA1MzM3NDU3MDUzNTE1NzQwN2E1NjQ4NmUzNDRlMjM2ZDU0NTY3ODIxMzgzMzQyNmU3OTZmNzM2ZDM4MjQ0OTZlNWU1NjIzNTU1MjMzNDE2Zjc5Mzc3NDQwNGQ0Mjc5NmY3OTJiNDY1NTUzNDA0NTIxMzk1YTQ0NTU1Mzc4NDY2ZjUzMmI0YjcwNGY0ZTUzNmU1MzUyNGM2ZDQ5NDI0MjZlMzk0ZTQ4NmY3YTMyNzM3MDUzNzg0NjQwMzI0MjQyNmUzOTRlNDg2ZjdhMzI3MzIxNzk1MjRjNDAzNTIxMjM0Zjc5Nzg0NjZmNTMyYjRiNzA0ZjRlNDI2ZTdhNWEyMzIxMzg0YTQ4MjEzODMzNzg2ZjczNDI0MjZlMzk0ZTQ4NmY3YTMyNzM2Zjc5MzY1NzRmNzU1OTczMzIyNTJiNDc0MDc5Nzg3YTcwMzk1Njc0NzA1Mzc4NDg2ZTczNDIzNjMzMzY0YTUyMzMyNDU2NGUzNTM3MmIzNjM1MjM0NjUyMzU3NTRkMmI1NTUzMmI0YzU4Nzk3MDc4NzA1MzM3NDc3MDc1NzM3NTM3NTEzNzU5MzMzNjcwMzQzMjM2MjQ3MjM3NTEyYjU4MzMzNjI2NzU1ODRmNGQ3NTMwNTA0ZDRiMzA1MDU5MmE1YTc2NTEyNTU5NGM0MjRlMzIzNjZmNGM3MDM4NTY0NzMzMzk3NDMzMzAzNzMzMjMzNjUxMjQ0MzQwNWU2ZjRhNWE3Nzc3MjQ1YTc4NDI0YjZlNzg1YTM5MzMyNTQwNWEzMzc3NDA0YjU5NGY1NTQyNGY3NzVhNTUzMjM3MzM3MjM0MzYzMjczMzEzNDRlNDg2ZjRiMmE3YTQwMzkzMzc4NmU3YTIxNDE1NTc3NWE1NTMyMzczMzcyMzQzNjMyNzU1ODRmNGQ3NTVhMzU1OTIzMzAzNTRkMmE1OTM1NGQ0YTMwMzQ1NTQyNTU0ZjU5NzMzNzUzNzQ0MjZmNGI0ZTQ2NmQzODcwNDE3MDRmNGU0NzZlNWUzMjczMjE3OTM2NzM2ZjVlMzM0YjZkMzg1YTIzNmU1NDc3NzM2ZTc5Mzc3NjQwMzk1YTRjMjEzOTU2MmE1NTUzNDA0ODZmNzU0ZTc0NTU1MzI0MjQ2ZTU0MzM0MjU4MzkzNzRjNDAzOTU1NzMyMTc5MmIyMzRmNzcyNDMxMzU3Nzc4MzYzNTI0NTY3MjMzNzc3ODU5MzMzNDRkMmI1NTRmNTY0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzM3MjIxMzg1YTc2NmU1ZTM3NDc3MDU0NTk0NzZkN2E1YTQ4NmU3NTU1NTczNzM3NWE1MjM2NzgyYjUxMzIzNzMzNGUzOTIzNDA1NjM1NTEzNjczMzEzNDRkNzU3MDM5NWE3ODZmNzgyYjc3MjEzOTMzNzQ1ODc5NDI0YzZlMjUyNjc1NGY3MzQxNzY1NTUxNGE0MjZmNWUzMjczNmUyNTIxNzMyMTM5NGU0OTZmNzkyYjI1NDAzODMyNzM3MDM5NWE3ODZmNzU0ZTU2MzM1NDU5NzM3MDI1NzgyMzZkNGY0ZTc4NzE1NDRlNDI2ZjdhNzc3MzQwNTM1MjIzNDAzOTU5NTczMjM3NGUzMjM2NzcyYjM4MzMzNjMzNzIzNzM3NWE1MjM2Nzg1OTczMzEzNDRlNmU1YTM1NTkyMzMwMzU0ZDJhNTkzNTRkNGEzMDM3MjM3MzU1NGY1OTczMzY3OTM3NDk2ZTUzNTI3NjQwMzQ0ZTVlNmQzOTMzNDE1NTUzNTI3NjcwNTQzNzc0NmU0ZjRlMjQ2ZjI1Mzc0YjU1NTE3ODUxNmY0OTQxNTc1NTRiNGU0ZTQwNTMyNDQyNmU3NTRlNTYzMzU0NTk1NzMyMzYzMzVhMzQzNjJhNzIzNDM2MzMzNTU1NTAyMzczMzg0YzM2NGM1YTUwNzc0OTMwMzU1MTQ5NTkzNTc4NzA1NTRmNGQ3NjU1NTI1Njc4NmY1MzRhNzQyMTI1MzY3MzcwMjU3ODIzNmQ0ZjRlMmE2ZTVlMzc0YjU1NTM1Mjc3NmUzODc4NDc1NTU0Mzc0YzQwMzk1NTczMzQzNjMyNTc0Zjc1NTk3MzM2NWUzMzQ4NmY3OTM2NzM3MDM5NWE3ODZmNzU0ZTc3MjEzOTMzNzQ1NTU0NzA0MjcwNTM3MzczNDAzOTc0NDk2ZDM5NTYyYTRmNzgzNzM1MzMzNzU2NzIzMzUxNTIzNjMyMzQ0ZDJiNTU1NDQ2MmI0ZjczNDE3NjU1NTE1NjQ4NzA0ZjRlNDU2ZTI1NzA0ODU1NTM1MjRjNTU1MzU2NzQ2ZjI1MzYyNTVhNGY0ZDQxMzQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM2ZDM4NWE0ODZlNzU3NzU3MzI3NzJiMzYzOTIzNGEzMTMzMjMyYjcyMzI3NzUyMzUzMzM1MjEyMzU1NTAyMzczNTU3NTVmMmE2ZDc1NWYyMzMyMzY1MjMzMzYyNTQ2NmQzNDc4NTY3YTMyMzY1NjRlMzYzNjUyNGUzMjM3NTI0ZTMyNzc1MjRlMzM0ZjVmNGI3MDIzNTY1MTMyMzY1MjQwMzMzNjU2MzMzODM2NDA0ZjMyMzc3ODU0MzI3ODUyNDAzNDUxNTY1ZTM4MzY3ODUwNmQ1MTUyNTgzMjI1NzA0NDM0Nzc1YTQxMzYzNjJiNTE3MDVlNzAzMzMzN2E3NDMzMzgzNjcwNGYyMTI0Mzc1MzZkNTI3ODc0MzQ1MjVhMzc0MDc3NzA0MTZmMjU0MjU1MzI3ODc4MzkzNDM2NWE1ZTQwMjM3ODJhMzgzODJhNTgzNjI1MmI0OTMzMjQ1NTI2NzA1MTI0NTA1OTUzMmI1YTMyMjQzNzQ4MzQyNDVhNDM1ODRjNTY1ZTMyNzczMzRlMzYzODVhNTUzMjdhNzA0ODM0MzY1YTQxMzUzNjQ2NTA2ZDUxMjQ0ODMzMjU3NDQwMjEzNjQ2NTA0MDI1MmI1ODMyMjU3MDQ4MzQyMzVhN2E2ZTIzNDY1MDQwMjUyYjU4MzIyNTcwNDgzNDIzNWE3YTZlMjM0NjUwNDAyNTJiNTgzMjI1NzA0ODM0MjM1YTdhNmUyMzQ2NTA0MDI1MmI1ODMyMjU3MDQ4MzQyMzVhN2E2ZTIzNDY1MDQwMjUyYjU4MzIyNTcwNDgzNDIzNWE3YTZlMjM0NjUwNDAyNTJiNTgzMjI1NDE0ODcwMjM1MjRlMzY3NzVhNGUzMjM3NTI0ZTMyNzc1MjUxMzIzNzVhNTYzMjM2NTI0MTMzMzY1NjRlMzY3NzUyNGUzNDRmNWYyNjM2MzY1MjUzMzYzNjUyNGYzMjM3NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzkyMTQ4NzE1MTUyNGUzNzM2Mzc0ZTMzMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNDVmMjYzNjM2NTI1MzM2MzYzNzRmMzIzNzUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM3NzM0ODcxNTE1MjRlMzczNjM3MzMzMzM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzQ1ZjJhNmUyMzUyNTEzMjM2MjQ0ZjMyMzY1MjU2MzY3NzUyMjYzMzM2NTIzMjcwMjM1YTc3MzIzNjU2NDYzODRmNWYyYTZkNGMyMzc1NGY3MzQxNzY1NTRmMjM0NjU4MzQ0ZTUwNmUyNTJhNzk2ZDM4NzAyNDZmNzk1MjIzNmQzODJiNDc1NTUzNDA0YjZlMjUyMzczNzA3OTM3NGI2ZDM4MjQ0ODZlNzUyNDc1NDAzOTMzNzQ1ODdhNGUyYTU1NGYyMzQ2NTgzMjQyMzYzNjc3MzczMDMzNTE3NDUyMzY3NzJiNzIzNzM3NTY1OTU1NTAyMzczNTYyNTc0MjM3MDU0NGU0YzMwNzU1ZjQ4NzA1NDU2Nzg2ZTc5MzM0MTQwMzk1NjQ4NTg3OTc4NDg1ODI1NTI0OTZkMzQyYjdhNDAzOTMzNzI0MDM5NTY3MjZmNzkzNzQ5NmU1ZTU2MjM2ZjRiNmY1NzM3NTI1NjUyMzU3NzMzNTUzMzM3NTYzMTM5MjM3NDUyMzIzNjMzNTIzNjc4NTk3MzMxMzQ0ZTI5NGY3NTRkNzM1NTRmNGQ3YTMyMzg1YTc2NDAzOTRlMjM1NjRjNDE3MzU2MjU1MjQ5NmY1MzRhNDIyMTI1NTIyMzZkMzgyYjQ3NTgyNTQyNGM2ZTI1MjY0NTU1NTQzMzc4NzE1NDMyNDg2ZjUzNGE3NDZkMzgyNjQ1NTU0ZjQxNDg1Nzc1NmY0NTRmNzU0ZDczNTU0ZjRkN2EzMjM4NWE3NjQwMzk0ZTIzNTgzNjRhNzQ2ZTc5NzAyNDIxMzg3MDc4NTY0YzQxNzM1NjI1Mzc0NzU4MzczNzM1NTg1MzM3NDczMDVlNTEyYjU5NGYyNjJhNTY0YjQ5NTc1NTRmNGQ3MzU1NGY3MDUwNmUyNTJhNDc0MDM4NWEyMzZkMzgyYjQ3NTY0YzQxNzM1NjI1NDY3ODQwMzk0ZDQ2MjEzODRhNDI3MDc5MzY3YTU4NGQ0MTczNTU0ZjRkNzM1NjI0NTY3ODQwNzkzNzRiNDAzOTU1N2EzMDc1NGQ3YTZkNTQzMzIzNmY1NDU5Mjg1ODRiMmIyMzZmNzkzNzQ3NDA1Mzc0Nzg2Zjc5NWY0NzZkMzg1ZjQ4NmQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTgzODQwNDg2ZTUzNGE0ODcwMjUzNzRiNTgzODVhNDg3MDM4MmEyMzU4NGI2ZjQ1NGY3NTRkNzM1NTRmNGQ3YTM3Mzk1YTc4NmY3NTI0NGU0MDI1Mzc0NzcwNGY2ZjI4NTU0ZjcwNWE2ZTVlNDI0MjZlNTM0YTc0NTg0YzM2NDc1OTRmNmY0NTRmN2EyMzU3NTU0YjRkNDY1ODM0MjM3MzMzMzgyYTc3NTU1MTVhNDg2ZTc5NDA0MjQwNWUzNzRiMjEzOTMzNDI2ZTI1MjY3MzQwN2E1NjQ4NmUzNDRlMjU0MDM5NTY0MjZlMzgyYjQ3NTgzODU2Nzg3MDUzNTE0NzZmNTQ3NzczNTgzNDIzNDY0ZjczNDE3NjU1NTE3MDQ1NmUyNTU2NzQ2ZTRmNGU3NzZkMzg1YTIzNmQzODJiNDcyMTM5NTYyYTU1NTQzMzQ4NTU1NDVhMjM2ZTVlNTY3ODU1NTM1Mjc2NzA1Mzc4MjU0MDM0NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0YjRlMjMyMTM5NWE0NDZmNDk0Mjc0MjE1ZTMzNDI3MDc5Mzc3MjcwNzkzNzRiNmQzNzJiMjMyMTM5NWE0NDZmNGI0ZDJiNTU1NDQ2MmI1NTRmNTk3MzcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODMwNzU0ZTI5NTY1ZTMzNDE2Zjc5Mzc3NDQwNGY2ZjI4NTU1MjMzNDE2Zjc5Mzc3NDQwNTIyYjQ4MjE3OTQyNzgyMTVlMzI0NTU1NGY3MDc2NmQ1MzUyMjMzOTI1Nzg3NzU2NGM0MTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY0OTczNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzMDc1NGUyMzZkMzgyNDc4NTg3YTMzNDI2ZTM4MzY0MTU3MzkyNDJiNGY3MzQxNTc0MDUzMzc3OTU1NTM0YTQ4MjEzODMzNzI3MDM5NWE3ODZmNzgyYjc3MjEzOTMzNzQ1NzRmNzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1OTZlMjU1Mjc3NTU1NDM3NGM0MDM5NTU3MzQwNTM1MjIzMjEzNDRlNzk2Zjc5MmI0NjU1NTE0MjM1MzUyMzI2NzM0MDc5Nzg0NTQwMzQyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3MDQ1NmUyNTU2NzQ2ZTRmNGUzNzM2MjMzNzM0MzkyMzMzNGUzNzUxNTE1NzU1NGY0ZDczNTU1NDMzNGI3MTM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkMzkzMzQxNTU1MzJiNDk0MDM4MjY0MTM3Mzc1YTUyMzY3ODJiNTEzMjM3MzM0ZTM5MjM0MDU2MzU1MTM2NDU1NTRmNTY0YjU1NzU3NzczMjEzOTU5NzM0MDc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlNTU1MDIzNzM2ZDdhNWE0ODZlNzUyYTQ1NmUyNTUyNzc1NzUzMjE0MjRmNzU0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczMzM3OTc4NDU0MDM2MmE0ODcwNTE0MDQ4NzAzODJhNzczMzM5NTY0YjZlNWU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlNTU1MDIzNzM3MTVlMjM1NzRmNzkzMzc4NDA3NTRlNGMyMTM5NDA3ODM5NWUzNzRjNDAzOTU2NzI0MDUzNTIyMzIxMzQ3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTUyMjU0MDM0NGUyNDZmMjUzNzRiNTU1MzMzNzQ3MDUzNTE3MzcwNTM1ZjczMzQ3ODVhMzEzNTc1NGU3OTZkMzg0YTc4NTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNzAyNTc4MjM2ZDRmNGU0ODZmNTMzNzQ3NTc1MjM3MzUzMzM3NTY3MjMzNTE1MjM2MzIzNzJiNTMzNDM2NGE1MjU4NGY0ZDc1NzA0YjU1NDI1NTUzNTI0YzU1NTMyMTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQ3YTVhNDg2ZTc1MmE3NzcwMzgyNDQ5NTc1MjM3MzUzMzM3NTY3MjMzNTE1MjM2MzIzNDQ5NzM0MDc1Nzc1NzRmNzkzMzc4NDA3NTRlNDI2ZjI0MmIyNDZmMjUzNzRiMzkyNTUyNDk2ZjU0NTY0ODcwNzkzNzc3NTc1NDM3NGM0MDM5NTY3MjZkMzgzMjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzIyNTc0NzgyMTI1NDU3MzZkMzgyMTczNzA1Mzc0Nzg1NTU0Mzc0YzQwMzk1NTczNmQzOTU5NzM2ZDM4MjY3MzcwNTM3NDc4NTU1MzUyNDk2ZjU0NTY0ODcwNzkzNzc3NTU1MzRhNDI2ZjVlMzI3MzIxMzgyYTc3NTU1MzJhNDg3MDRmNGU3ODcxNTQ0ZTQyNmY3OTM3Nzc1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNGU0MjZlNzU0ZTRlMzM1MTI0NTYzNTc4MmI1NjMzNTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTIzMzRiNzAzODM2NTc1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM3MDM5NWE3ODZmNzgyYjRjNzA1NDU1NzMzMTM0NGU0YzcwNTQ1NTQxNzAzOTVhNzg2Zjc4MmI0MjQwNGY3NzU3NTU0ZjRkNzM1NTUzNzg3OTU1NTQzNzRjNDAzOTU2NzI2ZjVlMzM0YjU1NTM3ODQ3NTU1MjM3MzUzMzM3NTY3MjMzNTE1MjM2MzIzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTU0NGU0MjZmN2E3NzczMzEzNDRlMzczNjIzMzczNDM5MjMzMzRlMzc1MTUyNmU3MDM5NWE3ODZmNzgyYjRjNzA1NDU2NzA1ODc5NzA3ODcwNGY3MzdhNDAzOTc0NDk2ZDM5NTYyYTU2NGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNzg3MTU0NGU0MjZmN2E3NzczMzEzNTIzNzM1NjI1Nzg0NzQwNzk3ODQ3NmQzOTMzMmE1NjRiNGU0ODZmNzU0ZTc3MjEzOTMzNzg3MDUzNzg0NjQwMzQyYTQ3NmU1ZTZmNDE1NzM0NGQ1ZjU1NTMzMzc0NzA1MzM3MjM2ZDM4MjQ3ODU4N2E1YTIzNmY3YTRlMjM2ZDM4MjQ3ODU3NTMzNzI2NmY1Mzc4NGI3MTM0NDk3MzU1NzUzNzQwNTgzNDM3NDY1ODM0Mzc3NzU1NGYzNzU1MzA3NTM3NWEzMDc1MzczNTU1NzU3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlMzY2ZjdhMzc3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGI0ZTM0NDAzODI0NDg3MDc5MzY3MzQwMzk3NDQ5NmQzOTU2Nzg0MDRmNGUyNDZmMjUzNzRiNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUyMzczNTMzMzc1NjcyMzM1MTUyMzYzMjM0MmE0OTZlNWU0ZDQxNzAzOTVhNzg2Zjc4MmI0YzcwNTQ1NTQ1NTU1MTJhNDg2ZTc5MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzQ3MDc5Mzc3MjcwMzk1YTc4NmY3ODJiNzcyMTM5MzM3NDU3NGY3NzU3NTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTQzNzRjNDAzOTU2NzI2ZDM4MzI3MzZkMzgyNjczMzIzNzRlMzIzNjc3MmIzODMzMzYzMzcyMzczNzVhNTIzNjc4NTk1NzRmNzU1OTczMzQzODJhNDI3MDUzNzg3NDZlNTM3ODI4NDAzNDRlNTM2ZTUzNTI0YzZkNGI0ZTc5NmU1ZTU1NzM2ZDI1Mzc3ODZmNGYyNDc0NmU1Mzc4MjU0MDMyNDI3NDZmNTQ0ZDczMzEzNDRlNTM2ZTUzNTI0YzZkNGI3NDcyMzkyNTJhNzQ2ZTM4Mzc3MjM5NGI3NzU3NGY3NzRlNzQ2ZjU0NGQ0NzZmNzkyYjI0NzA1MzM2NDE1NjRiNWY3YTU3MzI0Mjc3NDAzODIxNzM2ZDUzMmI0NjQwMzQ3MzQyMzA3MzQxNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTRmNTY0ZjZlNWUzMjczNmQzOTU5NzMyMTM4NGE0MjcwNzkzNjc1NGY3MzQyNzc0MDM4MjE3MzZmN2EzNzQ3MzkyNTQwNDUyMTM5NWE0NDU3NGY3NzI4NGY3NTRkNzM1NTRmNGU3NDZmNTQ0ZDQ3NmY3YTM3NDc1NzUzNzQ0ODZmNWUzMjJiNTY0YzRkNDc1OTRmMjY0OTU4NzY0ZDdhNTg0ZjRlNDk2ZTVlNTYyMzMxMzU3MzQ5MzAzNTRkNDI0ZjczNDI3NzQwMzgyMTczNmQyNTM3Nzg2ZjUyMmI3NDZlNTM3ODI1NDAzNDczNDIzMDczNDE3MzU1NGY0ZDczNzA0ZjRkMmI1NTUyMzM0MTZmNzkzNzc0NDA0Zjc0MjMyMTM5NTY3YTQwMzkzMjJiNmY3YTM3NDczOTI1NDA0NTIxMzk1YTQ0NTczMjQxNzM1NTRmNGQ3MzcwNGYyYTRjNzA1MzUyNGI3MDRmNzM0MjRmNzM0MTc2NTU1MTc4NDc2ZDM5MzM0MjIxMzg0YTQyNzE3OTM2NzMzNzUzMzc0NTQwMzg3MDRiMjEzODIzNzMzMjc5MmIyMzRmNzk1NjQ4NzA0ZjRkMmI1NTU0MzM3ODZlNTMzNzc1NmU1ZTMyNDczNzUzMzc0NTQwMzY1NjQ4NzA0Zjc0MzYzMzM2NGE1MjMzMjQ1NjRlMzUzNzJiMzYzNTIzNDY1MjM1NzU3NzU3NGY3NTU5NzMzNTUzMmI3NDQwNGY0ZTI0NmYyNTM3NGI1NTUzMzM3NDcwNTM1MTczNmUyNTI2NzM2ZjVlMzM3NDZmN2EzMzI0NmY0ZDQyNDU2ZTI1NTI3NzM5NWUzNzRjNDAzOTU2NzI0MDUzNTIyMzIxMzQ3MzQyNGY3MzQxNzY1NTUxNGE0ODIxMzgzMjczNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3NTU1MzUyNzYyMTI1MmIyNDZlN2EzMzRjNGY3YTMzNGI3MTM1NDE1NzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZlNWU0ZTc4NmU3NTc0NWEzNTIzMmE1NjM3NTEyYjM0MzkyMzQwNTYzNTUxMzY0NTU1NGY1NjRiNTU3NTc3NzMyMTM5NTk3MzQwNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTczMzEzNDRlNDM2ZjI1MmI0NzU4Nzk0YTQ4MjEzODMyNDE0MDc1Nzc1NzQwMzk3NDc2NDAzOTRlMjM1NTUxNDA0MjZlNTMzNzMwNmU1ZTMzNTM2ZTVlMzc0NzQwNTEzNzRiNmY3OTJiNGIzMDczNDE3MzU1NGY0ZDczNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjNTU1MDIzNzM3MTVlMjM1NzRmNzkzMzc4NDA3NTRlNGMyMTM5NDA3ODM5MjUyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNTIyYjc0MjEyNTVhNDg3MDM4MmEyMzZmNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTUyMjU0MDM0NGU0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzI3MzIxMzg1YTc2NmU1ZTM3NDc3MDU0NTk3MzcwNTM1ZjczMjEzNDRlNTczNjIzMmIzMDU1NTM0MDQyNmU1MzM2NDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlNWU2ZDM5MzM0MTU1NTMyYjQ5NDAzODI2NDEzNTM2MmIzMDM0MzczMzMxMzY3ODJiNTMzNDM2NGE1MjU4NGY0ZDc1NzA0YjU1NDI1NTUzNTI0YzU1NTMyMTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQ3YTVhNDg2ZTc1MmE3NzcwMzgyNDQ5NTc1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzNmY0YjQ5NzM0MDc1Nzc1NzRmNzkzMzc4NDA3NTRlNzY2ZDUzMzc3NjZkMjQyYjQyNmU3YTVhMjMyMTM4NzA0YjIxMzgyNDcyNmY1ZTMzNzQ3MDU0Mzc0YzU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzc1YTQxNDAzODVhNDQ1NTUzNzg3OTU1NTM1MjQ3NTU1MTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDRlNzQyMTI1NWE0ODcwMzgyYTIzNTU1MzM3MjY2ZDM5NWEyMzZmNGIyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTQzNzRiNmU0ZjRkMmI1NTUzMjE3NTZkNTQzMzIzNmY1NDU5Mjg1ODRiMmI1ZTcwNWU2ZjQ3NmQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTg3OTVhNDg2ZTM0MmIyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU4NGI1NTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MTc4NDcyMTI1NGEyNDQwNTMzNjczMjEzNDRlMzc2ZjI1Mzc0YjU4MzY1MjdhNDAzODJhMjM1NTUzNzQ3ODIxMzgzMzc4NmY3NTRlMjM2ZTRiNGU0NjZkMzgyNDQyMjE0YjRlNzQ1NTUzNTY0YjZlNWU3MDRjNDAzOTU1NzM2Zjc5Mzc0YTcwMzgzNzRjNzA0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU1MDIzNzM2Zjc5Mzc0YTcwMzgzNzRjNzA1NDU5NDc0MDI1MzcyMzU3NTQzNzRiNmU0ZjQ5NzM2ZDUzMzc3NDQwNTMzNzRiNmY0YzI0Mjk1NTc4Mzc0YzQwMzk1NTQ2MzIzODcwNzg2ZTdhMzI3NTMwNzU0ZDc1MzUzODJiMjg2ZDM4NGE0NTIxMzQ1ZjI0NTg3NjRkNzU3MjM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQyYTRjNzA1MzUyMjM3MDM5NWE3MjIxMjUyYjc3NDAzNDRkMmIzMTM0NGQ0YjU5NTA0ZDI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzM2NTM1MjRiNmYyNTM2NzM3MDUzNzQ3ODU1NTE3NDM2MzUzNjQ5NzMyMTM4MmE3NzU1NTM1YTQxNDAzODVhNDQ1NTUzNDA0ODZmNzU0ZTQ2NDAzOTMzNzQ1NTU0NGU0YjZlNWU0ZTc4NmY3YTMzMmEzMTM0NTY0ODQwNGM0Mjc3NDAzOTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUyYjI0NmY0ZjRkMmI1NTUxNTY3ODIxMzkzNzIzNmQzODQwMjQ2ZTUyNWE0ODcwMzk0ZDQxNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjQ3NzA1MzM3MjY3MDRmNDk3MzU2MjU3NDIzNmUzODQ5NDc2ZjUzNTI0YjZmMjUzNzRiNTY0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxMzg1YTc2NmU1ZTM3NDc3MDUyMmI3ODcxNTM3ODRjNzA1NDU5NzMzMTM0NGU0YzZlNWUzNzQ5NTg3OTQwNDI2ZTc5MzI0MTU2MjUyNDc4NzA1MzUxN2E1ODRmNGU0OTZmNzkyYjQ5NDAzOTU2MjM3MTM1MjM3YTZlMjU2ZjI4NDA1MzM3NGMyMTVlNTY0MjZmNTQzMzQyNmUyNTI2N2E1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGU1OTZlMjU2ZjczNmY3OTM3NGM3MDM4NGEyMzZmNGI0ZTc5NmU1ZTU1NzM0MDUzMzc3NTcwMzg3MDdhNmQzODJhN2E0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ0ZTRiNmQzODJhMjM1NzUzMjE3NTMyMzg1YTc2NmU1ZTM3NDc3MDRmNGU0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTc4NzE1Mzc4NGM3MDU0NTkyODU1NTQ0Njc1NmUyNTJiNDU1NzUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDM5NzQ0MjZmNWUzMzRjNTczOTIzNzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzIxNzkyYjQ4NmU0Zjc0NzQyMTI1NWE0ODcwMzgyYTIzMzkyNTM3MjY2ZDM5NWEyMzZmNGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1Mzc4Nzk1NTU0NTY3ODZmNWU0ZTQ4NmU3YTVhNzg1ODdhNWEyMzIxMzkzMzI0NmYyNDJiNzY2ZTI1MzM3ODU1NTAyMzJiNTU1MDMyNDk1YTUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTUyMTM4MmE3NzZlNTMzNjczMjEyNTUyNGM0MDM5NTk3MzcwMjU3NDc4NmY3OTM2NzM3MDUzNzQ3ODU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzZkMzk1OTczMjE3OTUyNDc2ZTc5Mzc3NzU1NTMyYjRiNTU1MzMzNDg0MDM5NTk3MzZlNzkyYjIzNTU1MzM3MjY2ZDM5NWEyMzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDRlNGI2ZDM4MmEyMzU3NTMyMTc1MzIzODVhNzY2ZTVlMzc0NzcwNGY0ZTRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU3NTIxMzgyYTQ3NDAzODMyNzM2ZTVlNTU3MzQwNTMyYjc4NmY0YjRlNDc2ZTVlMzI3MzQwMzk3NDQyNmY1ZTMyNDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTE0MDc0NmU1NDVhNzg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0YzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGU1OTZlMjU2ZjczNzAzODJhNzg3MTU0NGU3ODIxNWUzMzc4NDA0ZjRlNGM3MDUzNTIyMzcwMzk1OTczMjEyNTJiNzc0MDM5NTk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDI2ZTdhMzI0MTQwNzU1NjM3NmU3OTM3MjY2ZjUzMzc3NjcwNTMzNzc3NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZTc2NmUyNTMzNzg1NTU0NDY0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0MmE0YzcwNTM1MjIzNzAzOTVhNzIyMTI1MmI3NzQwMzkyMzczNDA3OTJiNGI1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1MTJhNDg2ZTc5MzY1NzRmNzU0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3MzY3OTM3NGE3MDM4Mzc0YzcwNTEzNzI2MjEyNTM3NDk3MDUzNzg0ODZlNzU0ZTc0NmY0YjRlNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzM0NTM1MjQ3NDA1MzRhNzg1NTU0NTY3ODZmMzkzNzc4NmY1ZTMyNzM0MDM5NTY0YjZlNWU1NjRjNTU1MzcwNGIyMTM4NWE3ODQwN2EzNzQ1NmU1NDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDk2Zjc5Nzg0NzcwNGY3NDc5NTU3Nzc0MzYzNzUyNGQ3MzZmNzkzNzRhNzAzODM3NGM3MDRmNGU3OTIxMzg3ODQ1NDAzODMyNzM0MDc5MmI0YjU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiMzA3NTRlMjk0MDM5MjM3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUzMDZlMjUyYTc4NGY3MzQyNzc0MDM4MjE3MzQwMjUzNzIzMzkyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNzJiNDI2ZTc5NDA0ODU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzc3MDc4NzA0ZjRlNzc0MDM5MzM3NDZkMzg0YTc4NDA0ZjRlNTY2ZTdhNWEyMzIxMzg3MDRiMjEzODIzNzMyMTM4NWE3NjZlNWUzNzQ3NzA0ZjRlNDI2ZTc5NDA0ODZmNzkyNDc0NzA1Mzc4NDg2ZTc1MjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTU5NTU1MDIzNzM2ZDM4MmE0YzcwNTM1MjQ1NmUyNTUyNzc0MDM5NTU0NzM0MzgyYTRjNzA1MzUyNDU2ZTI1NTI3NzQwMzk1NTQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDRlNGI2ZTI1NDA0MjZlNTMzNjczMzEzNDRlNDI2ZTdhNWEyMzIxMzg0YTQ4MjEzODMzNzg2Zjc1MmEzMjZmNzkyYjc5NmQzODRhNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQxMzU0ZjJhNzY2ZTI1MmEyMzQwMzk3NDIzNTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUxNzA3ODcwNGY0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU1NTQ0ZTQyMjE1ZTMzMjQ2Zjc5MzY3MzM3Mzc1NjU5NTU0Zjc0NDE2ZDM4NzA0MTU1NTQ1MjI0MjEzODRhNDI3MDU0Nzc0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNTQ1NjQ4NDA3OTc4NDU0MDM3MmI0OTZkMzg1YTcyNzAzOTU2NDU1NTUwMjM3MzZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE0OTZmNzkyYjc5NmQzODRhNzgzOTVlNGU0MjIxMjQyYjI0NmY3OTQ5NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUxNzA3ODcwNGY0ZTRjNzA1MzJiNGI2ZDM4Mzc0YzU1NTIzNzM0MzU1NDU5NzM2ZDM4MjE3MzIxMzk0MDc0NmQzODRhNzQyMTc5NGE3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzQ4NmY3OTc4Nzg2ZjRiNGQyYjU1NTI0NjcwNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5NmU1ZTU1NzM2ZjVlMzM0ODZmN2E3NzczNmQzODI2NzMzNTRmMmE3YTQwMzkzMzcyNmY1ZTMzNDg2Zjc5Nzg3ODZmNGI3NDZlNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTI0NmYyNTM3NGI2ZDM4MzM3MDU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlNDI3MDUzMzc0NjU1NTM3ODQ3NTU1NDVhMjM2ZTVlNTYyYTU4Nzk3MDc4NzA1MjJiNDI3MDUzMzc0NjZmNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTM3ODIzNDAzODIzNDc2ZDM5NWE3MjcwNzk3ODc3NDAzODVmMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjM2ZTVlNTY0MjQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTM3ODIzNDAzODIzNDc3MDc5Nzg3NzQwMzgyYjcyNzAzOTU2NDU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmYyNTM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjM2ZTVlNTY0MjQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTM3ODIzNDAzODIzNDc3MDM5NTY0NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNDg2Zjc5Nzg3ODZmNGI0ZDJiNTU1MjQ2NzA0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGU1MDZmNzkzNzc0NzA1MzM2NzM2ZjVlMzM0ODZmN2E3NzczNmU1Mzc4NDc2ZDVlNTk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTMyYjRiNzEzNzJiNDU2ZDM4MmE0NDZmNGI0ZDJiNTU0ZjU1NzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzZmNWUzMzQ4NmY3OTc4Nzg2ZjRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNDg2ZjdhNzg3MjZlNTM3ODQ3NmQ1ZTU5NzMzMTM0NGQ3NTU1NGY1NTQ3NmQ3OTJiNDI2ZTc1NzQ2ZTQwNzU1NjZlNmU1Mzc4NDc2ZDI0MjM0MTcxNWUzNzRiNmU1NDIzNDI1NTc1NGU3OTZlNWU1NTczNzAzOTU2NDU1NTUzNzg0NzU1NTQ1YTIzNmU1ZTU2NDI0MDM5NWE3MDU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmYyNTM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzNmU1ZTU2MmEzOTI1NGE0MjZlNzk0NjRjNTU1MDIzNzM1NTc3MmE0ODU1NTQ1YTIzNmU1ZTU2NDI0MDM5NTk3NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGI0ZTU0NDAzOTMyNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNzM2ZjVlMzM3NDcwNTQzNzRjNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA3OTM3NGI2ZDM4NDA0MjQwMzgzMzcyNmY1ZTMzNzQ3MDU0Mzc0YzU1NTAyMzczNTU3ODc4Nzg2ZjRiNTU3MzZkMzgyMTczNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTQyNmYyNDJiMjU0MDM5NTY0MjQwNzk3ODc4NDA0ZjRlNzg2ZTU0NWE3ODU1NGY1NjMwNmU0YjU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUxNWE3NDZlNTM1YTI0NmU1MzUyMjM0MDM0NGU3NDIxMjU1YTQ4NzAzODJhMjM1NTUzNTI3YTQwMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzM3MjIxMzg3MDc4NTU1MDIzNzM1NTc4Mzc0NzIxMzk0MDc0NmQzODRhNzQyMTc5NGE3ODU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGI0ZTM2NmY3YTc3NzM3MDUzNWY3MzQwMjUzNzIzNTU1MzUyNDk2ZjU0NTY0ODcxNTM3ODQ2MjEzOTMzNzg1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzMyMTM4NzA3ODU1NTM0MDRiNmUyNTIzNzM3MDM5NWE3ODZmNzU0ZTU2MzM0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU4N2EzNzRjNDAzOTU2NDI0MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzM0MzgyYTRjNzA1MzUyN2E2Zjc5NTI0NjU1NTQzNzRjNDAzOTU1NzMzNDM2MzM0YzU1NTM1MjRiNDAzNDRlNGI2ZTVlMzc3YTZkNTM0YTJhNTU1MzVhNDE2Zjc5MmI0NzZlMjU0YTQ4NDAyNTc4NzYyMTM4NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzM3NTM3NDQyNmY0YjRlNDI2ZjRiNGU3NDZlNzU0ZTc0NmY1NDRlNGI2ZTVlNzQ0MjZlMzg1MjIzNmQzODJiNDc1NTUzNTY3NDZmMjUzNzc3NTU1MzJiNDc1NTUzNDY0NzZlNWU3MDQ3NTU1MTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDRlNDUyMTM5Mzc0NzIxMjU3MzczNDA1MzUyMjM0MDM5NTk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0Mzc0YzQwMzk1NjcyNmQzODMyNzMzMTM0NGU0MjZlN2EzMjQxNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTI0NmYyNTM3NGI2ZDM4MzI0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTI0NmYyNTM3NGIzOTI1Nzg3NzU1NTA0OTczNTkzNTRkNDk1OTUwNGQ0OTU5NTA0MTczNTU0ZjU5NzMzNzc5Mzc0YjcxMzQ0ZTc4MjEzOTU2NDU3MTM0NGUyNDZmMjUzNzRiNmY0OTQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzIyMTM4NzA3ODU1NTAyMzczNTU3NjU1NDk1OTM1NGQ0NjU5NzY0ZDRhNTkzNDRkNDEzMzM4NTI0YjZlNTQ3NzczMzczOTVhNzg2Zjc1Nzc3NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODZlNTM3ODc5NTU1NDM3NGM0MDM5NTY3MjZkMzgzMjczMzE0ZjRkNGE1OTUwNGQ0OTU5NTA0ZDQ5NTk1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1NTI3YTQwMzQ0ZDJiNTU0ZjU1NGI1OTUwNTE0YTU4MzU1NTQ5NTkzNTU1NzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTUzNzg3OTU1NTQzNzRjNDAzOTU2NzI2ZDM4MzI3MzMxNGY0ZDRhNTk1MDRkNDk1OTUwNGQ0OTU5NTA0ZDI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNzQ0MDI1MzY3MzMxMzQ0ZDc1NTk3NjRkNGE1OTc1MjM0YjU5NTA1MTRjNTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNDI0MDc1NGUyNDZmMjUzNzRiMzkyNTc4Nzc1NTUwNDk3MzVhMzU0ZDQ5NTk1MDRkNDk1OTUwNGQ0OTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzUyNzYyMTI1MmIyNDZlN2EzMzcyMjEzODcwNzg1NTUwMjM3MzU1NzY1NTQ5NTkzNTU5NDY1OTc2NGQ0YTVhNGY1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjRkNWY1NTUwNTE0OTU5NTA0ZDQ5NTk1MDRkNDk1OTUwNGQyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc0NDAyNTM2NzMzMTM0NGQ3NTU5NzY0ZDRhNWE0ZjIzNGI1OTUwNTEyNDU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1NTI3YTQwMzQ0ZDJiNTU0ZjU1NGI1OTUwNTEyNDU1NTMyYjRiNTU1MzRhNzQ3MDUzMzc0YjU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc0NDAyNTM2NzMzMTM0NGQ3NTM3MzgyYTc0NzA3OTUyNDI2ZTUzNTI3NTZlNTMzNjc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTQ0MDM5MzI3MzZlNTMyYjc2MjEzOTMzNDI2ZTI1MjY0ODIxNzk1MjRjNDAzODMyNzM2ZDM4MmE3OTZlNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0YTQ4MjEyNTUyMjM2ZDM4MmI0NzU1NTAyMzczNTU3ODM3NDcyMTM5NDA3NDZkMzg0YTc0MjE3OTRhNzg1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTQ0ZTRiNmUyNTQwNDI2ZTUzMzY0NzIxN2EzNzRjNmQzODJhNzg2ZjVlNWE3MjIxMjU1MjIzNDAzODcwNDg2ZjdhNzg3MjZlNzk1MjQ2NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNTMyYjc2MjEzOTMzNDI2ZTI1MjY3MzMxMzQ0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU4Nzk1NjI0NmYyNTc4NDc0MDM5NWE0YzM5MjU1YTc0NzA1MzM3N2E2ZTVlNTYyYTM5MjUyYTc0NmUzODM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTUzNzg3OTU1NTQ0ZTRiNmUyNTQwNDI2ZTUzMzY0NzIxNzk3ODQ4NDA1ZTU2NzQ2ZjUzNzQyYTU1NTM1MjQ3NDA0ZjRlNzQ2ZTdhNzc0MTIxMjUyYjI0NmU3YTMzNGI3MTM0NGU0MjZlNzU0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU4Nzk1NjQyNmUyNTcwNGIyMTM5NGU0MTcxMzQyYTQ1NmU1ZTcwNzg2Zjc1NzM0MjU1NTM0MDQ4NmY3NTRlNzY2ZTVlMzc0NzcwNTQ1NjJhNTU1Mzc4NDc1NTUyNDU3YTcwMzk1YTc0NTY0YjQ5NzM1NjI1Nzg0NzQwNTM3ODc0NTY0YjQ5NzM1NjVlMzc0NDU2NGI0OTczNTYyNTVhNzQ2ZTc5NTI3NzIxMzQ2ZjQ1NTU0ZjcwNzQ3MDM5NWEyMzZmNzk1MjQ1NmQzODUxN2EzOTM0NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzNzU0NTYyYTU1NTQzMzQ4NTU1MzM3MjY3MDU0NTY3NDIxNWUzMjczNmU1MzJiNzYyMTM5MzM0MjZlMjUyNjczNDA3YTU2NDg2ZTM0NGU3NTZkMzg1ZjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5Nzg0ODM5MjU0YTQ4NzAyNTM3NGI1NTUwMjM3MzZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE3NTZkMzgyYjdhNmY3OTUyNDk2ZDU0Nzc0NzZlNTMyYjVlNDAzOTU1NDE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRkN2E3MDM5NWE3NDU2NGI0ZTQyNmU3NTRlNzU2ZDM4MmI3MjZlNTMyYjVlNDAzOTU1NzM2ZTVlNTU3MzU2MjU1MjQ2NDAzOTU2NDIyMTI1NTE3YTU1NTM3ODQ3NTU1MzU2NDI2ZTI0MmI0NTZlNWU3MDc4NmY3NjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzRhNDgyMTI1NTIyMzZkMzgyYjQ3NTU1MDIzNzM1NTc4Mzc0NzZkMzkzMzc4NDA0ZjRlMzU3MDUzNTIyMzQwMzk1OTc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZkMzgyMTczNTYyNTc4NDc0MDUzNzg3NDU2NGI0ZTQyNmU3NTRlNzU2ZDM4MmI3MjZlNTMyYjVlNDAzOTU1Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDU2ZTI1NWE3NDcwNTM3ODQ4NmU3NTRkMmI1NTRmNTY1NjZlNzkzMzQyMjEzNDU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRkN2E3MDM4NDU3YTU1NTM3ODQ3NTU1MzU2NDI2ZTI0MmI0NTZlNWU3MDc4NmY3NTRlNDg2Zjc1NGQ3YTIxN2E1NjQyNzA1MzUyNDI2ZTc1NmY3MzZkMzgyNjczMjE3OTc4NDgzOTI1NGE0ODcwMjUzNzRiMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmU1MzJiNzYyMTM5MzM0MjZlMjUyNjczMzEzNDRkNzUzNzM4MmE0MjcwNTMzNzc3NTU1MTQ2NDI2ZTc5NzA3NzZlMjUyMzc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZkMzgyMTczNTYyNTVhNzQ2ZTc5NTI3NzIxMzQ2ZjczNmQzODI2NzMyMTc5Nzg0ODM5MjU0YTQ4NzAyNTM3NGIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTUzMmI3NjIxMzkzMzQyNmUyNTI2NzMzMTM0NGQ3NTMyMjU1MjQ3MjEzODMzNzQ1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1Mzc4Nzk1NTRmNzA3NDcwMzk1YTIzNmY3OTUyNDU2ZDM4NTE3YTU1NTM3ODQ3NTU1MzU2NDI2ZTI0MmI0NTZlNWU3MDc4NmY3NjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzRhNDgyMTI1NTIyMzZkMzgyYjQ3NTU1MDIzNzM1NTc3NTIyNDZmNWUzMzRiMjEzODRhNDIyMTM0NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjZlNzk0MDQ4Mzk1ZTMzNzg3MTU0MzI3MzMxMzQ0ZTc5NTU3NTU1NzUzNzM5NWE3ODZmNzkyYTc0NmUzODM2Mjg1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjRmNzg0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzMwNzU0ZTI5NzA3OTM3NGI2ZDM4NDA0MjQwMzgzMzcyNmY1ZTMzNzQ3MDU0Mzc0YzcyMzI0MjM1NzA1MzJiNGI2ZDM4Mzc0YzMwNzU0ZTI5NmY1ZTMzNDg2ZjdhNzg3MjZlNTM3ODQ3NmQ1ZTVhMmI0Zjc3MmE3NDZlMzgzNjI4NTU1NDQ2NDk2Zjc5MmI3OTZkMzg0YTc4NTg3OTQwMjQ2ZTUzNGE3MjZlNzk1MjQ2NDAzNDRlNDI0MDc1NGU0OTZmNzkyYjc5NmQzODRhNzg1ODc5NDAyNDZlNTM0YTcyNmU3OTUyNDY0MDM0NGU3ODZlNTQ1YTc4NTU0ZjcwMzA2ZTI1MmE3ODU2NWUyMzU3MzI3OTc4NDgzMDc1NGUyOTZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE3NTZkMzgyYjdhNmY3OTUyNDk2ZDU0Nzc3MzZkMzgyMTczNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTc1NmQzODJiN2E2Zjc5NTI0OTZkNTQ3NzczNDAzODRhNGM0MDM0NGQ3YTM1NzkyYjQ3NDAzNDcwMmI0Zjc3NTI3NjIxMjUyYjI0NmU3YTMyNzMyMTM4NzA3ODMwNzU0ZTI5MjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc0NDAyNTM3MmI0Zjc3NTI3NjIxMjUyYjI0NmU3YTMyNzMyMTc5NTI0YzQwMzgzMjI4NTU1NDQ2NDU2ZTI1NWE3NDcwNTM3ODQ4NmU3YTIzNTczMjM4NWE3NjZlNWUzNzQ3NzA0ZjRlMzczNjc3NDkyODU1NTQ3MDVlNzA0YjJhNDI2ZTdhNWEyMzIxMzg3MDRiMjEzODIzNDcyMTI1MmI0NjU4NWU0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzU3MzM3OTJiNDU2ZTUzMmI1ZTQwMzk1NjRjMzA3NTRlMjk2ZjU0NTY0ODQwNzk3ODQ1NDAzNDJhNzk2ZTI1NGE0NTZlNWU3MDc4NmY3YTU5Mjg1ODU0MjM3MzcyNGY0ZTUzNmUyNTRhNDU2ZTVlNzA0MjZlNzk2ZjI4NTU1NDQ2NDk2Zjc5MmI3OTZkMzg0YTc4NTg3OTQwNDg2ZTUzNGE0ODcwMjUzNzc4NmY0YzQxNDU3MjM0NGU1ZjU1NTI0ZTQ4NmY1ZTMzNGMzMDc1NGUyOTZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE0NjQwMzgzMzQyMjEzODVhNDg3MDM4MmEyMzMwNzU0YTJiNTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1Mzc4NDc0MDc5MmI3MjcwNTMzNzI2NzA0ZjQ5NzM2ZjU0NTY0ODQwNzk3ODQ1NDAzNzJiNDk2ZDM4NWE3MjcwMzk1NjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGU3ODcxNTM1YTc4NmY1NDMyNzMzMzM5NzQ3NjQwMzk0ZTIzNmQzODJiNDc1NTUzNTI0YzU1NTMzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDI2ZTdhMzI0MTQwNzU1NjUyNmY3YTU2NDg2Zjc1NGU3YTQwMzkzMzIzNmQzODJhN2E1NTUxNzg0NzZmNWUzMzc0NDA1ZTU2NzQ2ZTM0NGU0MjZlNzk0MDQ4NTU1MzQwNDg2Zjc1NGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjMwNzU0ZTI5NDAzOTIzNzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRkNzUzNzUzNzQ0MjZmNGI0ZTc0MjEyNTVhNDg3MDM4MmEyMzU1NTM3ODRjNTU1NDM3NDcyMTM5NDA3NDZkMzg0YTc0MjE3OTRhNzg1ODc1NTU0NTU1NTEyYTQ4NmU3OTM2NTc0Zjc5MzM3ODQwNzU0ZTc2NzAzOTVhMjM2ZTI1MjQ3MjQwMzk1YTc2MjEzOTRlNzgzOTI1MjQ3NDZmNzk0Njc3NmU1ZTcwNDc1NzU0MzM3ODcxNTQzMjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzMzOTVhNzYyMTM5NGU3ODU1NTQ1YTQ5NDAzODVhNDIyMTM4NDk3MzIxMjU3NDc0NmY3OTUyNzY3MDUzMzc0YjZmNGI0ZTc5NmU1ZTU1NzMzNzUzMzc0NTQwMzg3MDRiMjEzODIzNzMzNTM4NTI0YjZkMjUzMzQ4NzAyNTJhMzg1OTc1MjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTUzMzc0YzIxMjU1MjQ5NDAzNzJiNzY2ZDUzNTI0YjZmNGI0ZDJiNTU1NDU1NzUzOTRiNDI2ZTM5MzQ3MzQyNzI3OTRkM2M1NTRiNDU0NjMxMzk0YTI5NzIzNDI2NzQ1NTczNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NGY2ZjdhNTg3OTQyNDg2ZDM4MjY0MTQwNzU1NjZmMzk1NDQ2NzY2ZDUzNTI0YjcyMzQ1NTczNmQzODIxNzMyMTI1NzQ3NDZmNzU0ZTQyNmU3NTRlNzg2ZjI1NWE3NDZmNTMzNzcyMjEyNTc0NzQ2ZjdhNTk3MzQwMzg0YTRjNDAzNDRlNzY2ZDUzNTI0YjU1NTM0MDQ4NmY3NTRlNzY2ZDUzNTI0YjU1NTM3ODQ3NTU1NDMzNzg3MTU0MzI0MjRmNzM0Mjc3NDAzODIxNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3ODJiNzQyMTI1NWE0ODcwMzgyYTIzNTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczNTQxNTc1NTRmNGQ3MzU1NGY1NTc1NTU3NzI0NDg2ZTc5NzgyMzZlNWU1NTczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTRjNzA1MzUyMjM3MDM5NTk3MzZmNTMzNzRiNmQzODJiNzc2ZDM4NWE3NDZlNTM0YTJhNTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNzAyNTc0NDI2ZTUzMzY3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY3MzZkMzgyNjczNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjMyMTM5MzMyNDZmNGI0ZDJiNTU1MzVhNDE0MDM4NWE0NDM5MjU3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzcyYjRjNzA1MzUyMjM3MDM5NTk0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxMzg1YTc2NmU1ZTM3NDc3MDUyMmI3NzIxMzkzMzc0NTU1MDIzNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGM1ODc5NzA3ODcwNGY3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNzQyMTI1NWE0ODcwMzgyYTIzMzkyNTMzNzQ3MDUzNTE3MzIxMzgyYTc3NTU1Mzc4NGM2ZDM4MmE0YzcwNTM1MjQ3MjEyNTM2NDEyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNzcyMTM5MzM3NDU4NGY0ZTc3NmQzODVhMjM1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzMyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNzcyMTM5MzM3NDU4Nzk3MDc4NzA0ZjczN2E0MDM5NzQ0MjZmNWUzMzRjNTY0Yjc3NzMyMTM4MmE3NzU1NTMyYTQ4NzA0ZjRlNGM3MDUzNTIyMzcwMzk1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ3NmU1ZTMzNDI0MDdhNzg3MjZmNWUzMzc0NzA1NDM3NGMzOTI1NWE0MTIxMzgyYTdhNDAzNDc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM1NTc5NTY3NDZlNzkyYTc4NDA0ZjU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NDc2ZjUzMmI0OTU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjU1MjI1NDAzNzJiNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NDE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTdhNTY3ODIxMzg0NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0MjQwNzU0ZTQ3NmU1ZTMyNzMyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNzcyMTM5MzM3NDM4NGI3MDc4NzE1Mzc4NGM3MDU0NTk3YTM5MzQ0ZTc0NmU3OTMyNzM2ZjVlMzM3NDcwNTQzNzRjMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmU3OTJiMjM2ZDM4NDAyYTM5NWU1YTIzMjEzOTMzMjQ2ZjI0MmI3NjZkNTM1MjQ3NDAyNTM2NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTRmNTYyNDZlNzk1Njc0NmU3OTJhNzg0MDRmNTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzM3MjIxMzg1YTc2NmU1ZTM3NDc3MDU0NTk0NzZmNTMyYjQ5NTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTUyMjU0MDM3MmI0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzM3MjIxMzg1YTc2NmU1ZTM3NDc3MDU0NTk0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxN2E1Njc4MjEzODQ1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUyNzA3NDZkMzkzMjczMjE3OTM3Nzk2ZTVlNTY3ODU1NTM1YTQxNDAzODVhNDQ2ZDM4MmE3YTU1NTM1MjdhMjEzODc4NDc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDUzMzc0NTQwMzg1NjQ4NzA0ZjJhMjM2ZDM4MjQ3ODU4N2E1YTQ1NDAzODM3NDk1NzUwNTU0OTU3MzQ0ZDczNTU0YjRlMzU0MDM5MzI3MzZkMzgyYTIzNDAzOTU2MjUyMTM4NDk3MzcwNTM1ZjczNTk3NjRkNzM2ZjI1Mzc3NjZlMjUyYTc3NmY0OTQxNTc0MDUzMzc3OTU1NTMyYTQ4NzA1Mzc4Nzk3MTM3MmI0YzcwNTM1MjIzNzAzOTVhNzIyMTI1NzQ3NDZlNzk3MDc4NTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRlNGM3MDUzNTIyMzcwMzk1OTQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTM3NDc0MDRmNGU3NDU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGU3NjZkNTM1MjQ3NDAyNTM2NzM2ZTc5MmIyMzZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU1NTQ3MDQyNzA1MzczNzM3MDUzNzg0NjQwMzQ0ZTIzMjEzODQ2Nzg2ZTc1MjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTU0NWEyMzIxMzk1NjIzMzk1ZTMzNDI2ZTM4MzY3MzMxMzQ0ZTc3MjEzOTMzNzg3MDUzNzg0NjQwMzQyYTRjNzA1NDU2NDk3MDUzNzg0NjQwMzQ3NDQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1YTZlNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzcwMzg0YjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjI0MjM0NTU1NGY1NTc4MzgzNDIzNzg2ZTM0MjM3ODQwNGY0ZDc4MzQ1MDQxNzgzNTM1NDE3ODM2NGI1NTQyNGY3NTRkNzM1NTRmNGU3ODZlNzkzMzcyNzA1Mzc4NDY0MDM0NGQyYjU1NTMzMzc0NzA1MzM3MjM2ZDM4MjQ3ODU4NzkyYTQ4NzA0YjczNDI0Zjc1NGQ3MzU1NGY0ZTI0NmYyNTM3NGIzOTI1Nzg3NzU1NTAyMzczNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjMzg1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4MzkzNzQ1N2E3MDM5NWE3ODZmNzgyYjQyNDA0ZjcwNzA1NTRmNGQ3NjU1NTE3MDc4NzA0ZjRlMjM2ZDUzMzY3MzcwMzk1YTc4NmY3NTRlNTYzMzRmNGU1ZTZkNTM1ZjczNmY1ZTMzNzQ2ZjdhMzM3ODQwNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNGY3MzQxNzM1NTRmNGQ3MzU1NGI0ZTUwMjEzODRhNzY3MDM4NGE3NDcwNTMzNjczNzA1Mzc4NDY0MDM0NGU3NzZkMzg0MDc5NDAzOTU2Nzg2ZTc5NWE3ODRmNzU0ZDczNTU0ZjRlMjM2ZDM4MjQ3ODM5MjUzMzQyNDA3OTIxNzMzMTM0NGU3ODZlNzkzMzcyNzA1Mzc4NDY0MDM0NGQ0NjU1NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjU3NTU0ZjRkNzM1NTUzMzM3NDcxMzk1OTczMzEzNDRlMjM2ZDM4MjQ3ODM5MjUzMzQyNDA3OTIxNDc0MDUzNTIyYTZmNDk0MTczNTU0ZjRkNzM2ZjI1Mzc3NjZlMjUyYTc3NmY0YjRkMmI1NTU0MzM0MjZlMzgzNzcyNDA1Mzc4Nzk0MDc1MmE0YzQwMzg1YTQ4NmU3OTMzNGM0Zjc1NGQ3MzU1NGY0ZTQxNmU1ZTM3NGI2ZjRiNGQyYjU1NTQ1YTc4MjEyNTJiNDc0MDU0NTk3MzU4NGI1ZjczNTk0YzIxNDk1OTRkNDE3MzU1NGY0ZDczNmUzODc4NDc3MDM5MzM3ODZmNGI0ZDJiNTU0Zjc0NGM0MDM4NWE0ODZlNzkzMzRjNTU0ZjM2NzM1OTRjMjE0OTU5NGY3NzczNTg0YjVmNzM1YTc2NGQ1NzU1NGY0ZDczNTU1NDVhNzgyMTI1MmI0NzQwNTQ1OTczMzEzNDRlNGM0MDM4NWE0ODZlNzkzMzRjNTU0ZjM2NzM1YTc2NGQ1NzRmNzU0ZDczNTU0ZjRkNzY1NTUxNDA0ODZmNzkyNDc0NzA0ZjRlMjM2ZDUzMzY3MzcwNTM3ODQ2NDAzNDRlNDY0MDM5NWE0YzIxMzg3MDc4NGY3NTRkNzM1NTRmNGUyMzZkMzgyNDc4MzkyNTI0Nzg2ZjVlNWE3NDQwMjUzNjczMzEzNDRkNzU1NTczNDE3MzU1NGY0ZDczNmQzODIxNzM0MDUzNTIyYTZmNGI0ZDNjNTU1MDRkMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDUzNzg0NjQwMzcyYjQ2NDAzOTVhNGMyMTM4NzA3ODU1NGY0NTJiNTU1MzIxNzU3MTI1MzM3NDcxMzk1YTJiNTU1MzMzNzQ3MTM5NDU3YTZmNGI2ZjczNmQzODIxNzM0MDUzNTIyYTZmNGI0ZDNjNTU1MDUxNzM0MDM4NGE0YzQwMzQ0ZDdhNTY1ZTIzNzM1NTczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZDUzMmIyNDZmN2E1OTczMzE3NTRkNDk1NTUzMmI0YjU1NTMzMzc0NzEzOTU5NzMzMTc1NGQ0OTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzMzQyNmUzODM3NzI2ZTM4Mzc0YzZmMjU1MjdhNDAzNDRkNDQzMTM0NGU3OTU1N2E0NjQxNmU1ZTM3NGI2ZjVlMjM3MzZkNTMyYjI0NmY3YTQ1N2E2ZjRiNmY3MzZkMzgyMTczNmQ1MzJiMjQ2ZjdhNTk3MzMxNzU0ZDRhNTU1MzM3NDU2ZjI1MzY3MzU2NGI3MDJiNTU0ZjU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzI0NDI2ZTdhMzcyMzQwMzk1OTczMzE3NTRkNDk1NTUzMmI0YjU1NTM3NDQ4NzAzOTU2NGM1NTUwMjY3MzU5NGY0ZTQ4NmY3NTRlNzcyMTM5Nzg0YzU1NTAyNjczNTk1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZDM4MjQ3ODM5MjUyNDc4NmY1ZTVhNzQ0MDI1MzY3MzU3NGMyMzczNDA3NTU2Mjk2ZTM4Nzg0NzcwMzkzMzc4NmY1ZTIzNzM2ZTM4Nzg0NzcwMzkzMzc4NzE0YjcwNGM1NjRiNGU0MjQwNzU0ZTQ2NmQzODJhMjQ3MDUzMzc0YzU1NTAyNjczNTkzNDRlNzg2ZTU0NWE3ODU1NGY2ZjdhNzIzNDRkNzU0Zjc1NGQ3MzU1NGY0ZTIzNmQzODI0NzgzOTI1MjQ3ODZmNWU1YTc0NDAyNTM2NzM1NzRjMjM3MzQwNzU1NjI5NmYyNTM3NzY2ZTI1MmE3NzZmNWUyMzczNmYyNTM3NzY2ZTI1MmE3NzcxNGI3MDRjNTY0YjRlNDI0MDc1NGU0YzQwMzg1YTQ4NmU3OTMzNGM1NTRmNTEyYjU1NTA1MTczNDAzODRhNGM0MDM0NGQ3YTU2NWUyMzc1NGY3MzQxNzM1NTRmNGQ3MzU1NGI0ZTUxNDAzOTMzNzg2Zjc5MjQ0MjZlNzkzNjczNzA1Mzc0Nzg1NTUzNTI0OTZmNTQ1NjQ4NmY1NDU2NDIyMTM5MzM3ODU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGU0NjQwMzk1YTRjMjEzODcwNzg0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNGM3MDUzNTIyMzcwMzk1OTczMzEzNTIzNzM1NTdhMzc0NzIxNzk1MjQ3NmU3OTM3Nzc1NTc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NjQwMzk1YTRjMjEzODcwNzg1NTUwMjM3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGUzNDQwMzg1YTQ4NzA3OTM3NGI0MDM4MzI3NDU1NTIzMzQ4NmUyNTQ1NzM3MTVlMzM0MjZlMzgzNzcyNmUzODM3NGM2ZjI1NTI3YTQwMzkyMzc1NGY3NTRkNzM1NTRmNGU3ODZlNTM3ODc5NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZDJiMzEzNDRkNzUyMTc5NTI0NzZlNzkzNzc3NTU3NjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDY0MDM5NWE0YzIxMzg3MDc4NTU1MDIzNzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTQyNmY0YjRlNGYyMTM4MmE0NzQwMzgzMjc0NTU1MjMzNDg2ZTI1NDU3MzcxNWUzMzQyNmUzODM3NzI2ZTM4Mzc0YzZmMjU1MjdhNDAzOTIzNzU0Zjc1NGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNTk3MzM2MjUzNzQ3NDA0ZjRlMjM2ZDUzMzY3MzZlNzkyYjIzNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3NTU1MzJiNDc2ZTU0Nzc3MzcwNTM1ZjczNzA1Mzc0Nzg1NTU0Mzc0YzQwMzk1NTczNzAyNTc0NDg1NTUzNzg0NzZkMzkzMzQyMjEzOTMzNzg0MDRmNGUyMzZkNTMzNjczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0OTQxNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTVhNzg2ZTc5MzM3MjZlMzgzNzRjNmYyNTUyN2E0MDM0NzQyNDZmMjUzNzRiMzkyNTc4Nzc1ODRmNGU0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU0OTIxMzk1NjRjNDAzNzJiNDY2ZTI1MzM3ODMxMzQ3MDVhMjEzOTU2NDQ0MDUzMmI1ZTZlNzU2ZjQyNGY3MzQyNGQyMTc5MmIyMzU4Nzk1YTc0NmU1MzRhNzUyMTM4NWE0NDM5NWU1MjI0NDAzOTU2MmEzOTI1NzQ3NDZlNzkzMzQ1NDAzOTU1NDE0MDdhMzc0NzIxNGMyNDQ1MjEzODI0NzU0MDUzNTE3MzIxMjU1MjQ1NmU1MDQxNzMyMTI1NTI0NTZlNGYyYTc3MjEzOTMzNzQ1ODdhNWEyMzIxMzk1NjIzNmY1ZTcwNDI3MDUzNzM0MTU2MjU3MDRiMjEzODJhMjMzOTRiNmY0MjU3MzI0Mjc3NDAzODIxNzM2ZDUzNTI0NzQwNTM0YTc4MzkyNTcwNGIyMTM4MmEyMzM5MjU1YTc0NmU1MzRhNzUyMTM4NWE0NDU3NTM1YTc0NmU1MzQ5NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNDUzNTI0NzQwNTM0YTc4NTU1MzcwNGIyMTM4MmEyMzU1NTMzMzI0NmY3OTUyMjM2ZDM4MmI0NzU1NTQ1YTc4NmU1MzM3NzY3MDUzNzg0ODZlNzUyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzVhNzQ2ZTUzNDk0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTU1MzJhNDg3MDRmNGU0MjZlNzU0ZTRlMzM1MTI0NTYzNTc4MmI1NjMzNTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODc5NTI0NzZmNWU3MDc4NmY3ODJiNzYyMTM4NGE0NTIxNzk1Mjc2NmQyNDJiNGE3MDM4Mzc0YjcxMzQ3NDc2MjEzODRhNDU1ODc5Nzg3NzU4NGY0ZDc1MzUyNTJhNDU3MTM0NGU0ZDMyMzk0MDc4NmY1ZTQxNzMyMTI1NTI0NzU1NTM1MjQ5NmY1NDU2NDg3MDc5MzY3MzcwMzk1YTc4NmY3YTU5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZTIzNmY3YTc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDUzNTIyMzIxMzcyYjQ5MjEzOTU2MjM2ZjRiNGQyYjU1NTM1YTc0NmU1MzQ5NDc0MDUzNTIyMzIxMzQyYTRjNmY1MzRhNDI3MDRmNzM3YTM5NGI2ZjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0ZDJiNTU1MzMzNzQ3MDUzNTI3MjZmNTM1MjRiNzA1NDVhNmU1OTM3MjM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc1NGQyYjU1NTMzMzc0NzA1MzUyNzI2ZjUzNTI0YjcwNTQ1YTZlNTk3ODIzNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUxNWE3NDZlNTM1YTI0NmU1MzUyMjM0MDM0NGU3ODcxNTQ0ZTQyNmY3OTUyMjM2ZDM4MmI0NzU1NTQzMzQyNmUzODM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc1NGQyYjMxMzQ0ZDc1NTkzODI0NDI2ZTc1NTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjY2ZjUzNzg0YjcxMzcyYjIzNmQzODI0Nzg1NTUwMjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc0Zjc3NzM1NzRiNGUyMzZkMzgyNDc4NDA1MzM3NDU3MDUzNTE0MTZlMzg3ODQ3NzAzOTMzNzg2ZjRjMjM0YTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM0MDU0Mzc0YjIxMzkzMzQyNmUyNTI2NzMzMTM1MjM3MzU1NzY1YTc3MjEzOTc4NGM1NTc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzOTc0NDk2ZDM5NTYyYTM5NWUzMzQyNmUzODM2NzMzMTM0NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE0NzZlNWU2ZjQxNTczNDRkNDQ1NTU0MzM0MjZlMzgzNzc3NDAzODRhMjMyMTM0NzQ3NzIxMzk3ODRjMzEzNTU5NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0MjQwNzU0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiMzEzNDRkNzU1YTI1MzM3NDcxMzk1OTc1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODcxNTQ0ZTQyNmY3YTc4NzI3MDUzNzg0NjQwMzQ0ZDJiNTU1MzMzNzQ3MDUzMzcyMzZkMzgyNDc4NTg3OTJhNDg3MDRiNzM0MjU1NGY0NTczNzA1Mzc4NDY0MDM4MzM3ODZlNTQzMzc0NTc1MzMzNzQ3MTM5NTkyYjVhNGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1Mzc4Nzk1NTUzMzMyNDZmNzk1MjIzNmQzODJiNDc1NTUwMjMyYjU1NGY1NTRhNmUzODJiNDc3MDUzNzM3NTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTU0NGU0MjZmN2E3ODcyNzA1Mzc4NDY0MDM0NGQyYjU1NTMzMzc0NzA1MzM3MjM2ZDM4MjQ3ODU4NzkyYTQ4NzA0YjczNDI1NTRmNDU3MzcwNTM3ODQ2NDAzODMzNzg2ZTU0MzM3NDU3NTMzMzc0NzEzOTU5MmI1OTRjNGQ0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNzc3MDM5NTY3NDcwNTM3ODQ4NmU3NTRkMmIzMTM0NGQ3NTU5MjUyNDQ4NmU3YTMzNDE1NTc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzOTc0NDk2ZDM5NTYyYTM5NWUzMzQyNmUzODM2NzMzMTM0NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE0NzZlNWU2ZjQxNTczNDRkNDQ1NTU0MzM0MjZlMzgzNzc3NDAzODRhMjMyMTM0NzQ3NzIxMzk3ODRjMzEzNTc3NDk1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZkMzgyMTczNDA1NDM3NGIyMTM5MzM0MjZlMjUyNjczMzEzNTIzNzM1NTc2NDA0NjZlMjUyYTIzNmQ0ZjU1Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2NmY1Mzc4NGI3MTM3MmIyMzZkMzgyNDc4NTU1MDIzNzM0MDUzNTIyMzQwMzkzMzQyNmUzODM2NDc2ZTc5MmI1ZTU3NGY3NzczNTc0YjRlMjM2ZDM4MjQ3ODQwNTMzNzQ1NzA1MzUxNDE0MDUzNTIyYTZmNGMyMzRhMzA1MDRkNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0MjQwNzU0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiMzEzNDRkNzU1OTM1NTY0NjZlMjUyYTIzNmQ0ZjU1Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2NmY1Mzc4NGI3MTM3MmIyMzZkMzgyNDc4NTU1MDIzNzM0MDUzNTIyMzQwMzkzMzQyNmUzODM2NDc2ZTc5MmI1ZTU3NGY3NzczNTc0YjRlMjM2ZDM4MjQ3ODQwNTMzNzQ1NzA1MzUxNDE0MDUzNTIyYTZmNGMyMzRjNWE3NjM2NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0MjQwNzU0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiMzEzNDRkNzU2ZDM4MmE3OTZkMzgyYTQyNzA1NDc3NzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NzE1NDRlNDI2ZjdhNzg3MjcwNTM3ODQ2NDAzNDRkMmI1NTRmNTY0MjZlNzk0MDQyNmU3OTc4MjM3MTM0NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTI1YTIzNmU1ZTU2Nzg1NTU0Mzc0YzQwMzk1NTczNDA1MzUyMjMyMTMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUyMzczNTMzMzc1NjcyMzM1MTUyMzYzMjM3NDYyNDZmMjUzNzRiMzkyNTc4NzczOTM0NGQyYjU1NTQ0NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NjI1MzcyNjZmNTM3ODRiNzEzNDZmMjg1NTUzMzcyNjZmNTM3ODRiNzEzNzJiMjM2ZDM4MjQ3ODU1NTM3ODc5NTU1MzMzMjQ2Zjc5NTIyMzZkMzgyYjQ3NTU1MDIzMmI1NTRmNTY0MjZlNzk0MDQyNmU3OTc4MjM3MTM0NTU3MzQwMzg0YTRjNDAzNDRlNzg3MTU0NGU0MjZmN2E3ODcyNzA1Mzc4NDY0MDM0MmE0YzcwNTQ1Njc5NzA1Mzc4NDY0MDM0NzM3NTU2Mzc3NzQ2NTYzODIzNDY1NjM4MzI3MzU2MzY3MzI4NTYzNjIzMjg1NjM3NTk3NTU3MzQ0OTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NjI1NTI0OTZmNTQ1NjQ4NzA3OTM3NzczOTI1NTYyYTU2NGM0MTczMjEyNTUyNDU2ZTRmMmE3OTZmNzkyYjQ2Mzk1ZTM3NGM0MDM5NTU0NzZkMzgzMjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNzA3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDUyMmI3NDcwNGY2ZjI4NTU1MzMzNzQ3MDUzMzcyMzZkMzgyNDc4NTg3OTJhNDg3MDRiNzM0MjU4N2E1YTIzNmY3OTQwMjM2ZDM4MjQ3ODU3NGY1NTc4MzgzNDIzNzg2ZTM0MjM3ODQwNGY0ZDc4MzQ1MDQxNzgzNTM1NDE3ODM2NGI1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzIzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzQ3MDc5Mzc3MjcwMzk1YTc4NmY3ODJiNzcyMTM5MzM3NDU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDI2ZTdhMzI0MTcwMzk1YTc4NmY3ODJiNDI0MDRmNzc3MzZlNzkyYjIzNTU1Mzc4NDc1NTUxNTIzMjM2NTI1NjMxMzc3NzM3NTEzOTI0MzczNTMzMzc1NjM1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0ZTM2NTI0ZTM0MzUyNDQwNTIzMzUyMmIzNzM2MjMzNzM0MzY0YjJhNzQ2ZjU0NGU3ODZlNzkzMjQxNmQzODJhMjM1NzU0Mzc0YzQwMzk1NjcyNmQzODMyNDI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzMyNDZmNzk1MjIzNmQzODJiNDczOTVlMzM3ODcxNTQzMjczMzEzNDRkNzU0MDc5MmI0YjQwMzk0MDc4NmY3NTU1NzM2ZDM4MjE3MzQwNTQzNzRiMjEzOTMzNDI2ZTI1MjY3MzMxMzUyMzczNTU3OTc4NDc0MDc5Nzg0NzZkMzkzMzJhNTU3NTRlNzg2ZTU0NWE3ODU1NTMzMzI0NmY3OTUyMjM2ZDM4MmI0NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3OTM3Nzc2ZDM5MzM3MjZlMzgzNzRjNmYyNTUyN2E0MDM3MmIyMzQwMzk3NDIzNTc0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3OTU1Nzg1YTI0MjEyNTVhNzg2ZjVlNWE3OTcwMzg0YTQ1NzEzNDRlNzQ2ZjU0NGU0YjZlNWU0MDc4NDA0ZjRlMjQ2ZjI1Mzc0YjU1NTQ0NjI0NmYyNTM3NGIzOTI1Nzg3NzcyMzQ0ZTc5NmU1ZTU1NzM3MTI1MzMyNDZmNzk1MjIzNmQzODJiNDczOTVlMzM3ODcxNTQzMzJiNTU3NTQ5NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxMjU1MjQ1NmU0ZjJhNDY0MDM5NWE0YzIxMzg3MDc4NTg3OTVhNDEyMTM5MzI0NzZkMzgzMjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNWE3NDZlNTM0OTQ3NmUzODM3NGM2ZjI1NTI3YTQwMzQyYTQ2NDAzOTVhNGMyMTM4NzA3ODM5MjU3ODc3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE3NDZlN2E1YTVlNDAzOTU2NzIyMTI1NTI0NTZlNTM1Njc0MjEyNTQ2NzI2ZjM5Mzc3ODZmN2E3NzQxMjEyNTUyNDU2ZTRmMmE0MjQwNGY0OTczNDA3NTU2Mzc2ZjI1Mzc0YjU1NTM1MjQ5NmY1NDU2NDg3MDc5Mzc3NzU1NTM0MDQ4NmY3NTRlMjk0MDU0Mzc0YjIxMzkzMzQyNmUyNTJhNzI3MDUzMzcyNjcwNTQyMzc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxMzcyNjIxMjUzNzQ5NzA1Mzc4NDg2ZTc1NGU3NDZmNGI0ZTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE3NDZlN2E1YTVlNDAzOTU2NzIyMTI1NTI0NTZlNTM1Njc0MjEyNTQ2NzI2ZjM5Mzc3ODZmN2E3NzQxMjEyNTUyNDU2ZTRmMmE0MjQwNGY0OTczNTU3NzM3NGI2Zjc5MmI0YjU1NTQ0ZTRiNmUyNTVhNzg2ZjVlNWE0MjZlNzk2ZjczNmY3OTM3NGE3MDM4Mzc0YzcwNGY1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDI2ZTdhMzI0MTQwNzU1NjUyNmY3YTU2NDg2Zjc1NGU0MjZlNzU0ZTdhNmY3OTUyNDc3MDRmNGU3NjIxMzg0YTQ1MjE3OTUyNzY2ZDRjNDE3MzcxMjUzNzJiNTU3NTc3NTc0Zjc3NGU3NTZlNWUzMjQ3NmUzODM3NGM2ZjI1NTI3YTQwMzcyYjQxMjEzODJhNzc2ZTUzMzc0YjU3NTM1YTQ4NmUzODI0NzQ2ZTc5MzM0YzMxMzc0NTdhNDA1ZTU2NzQ2ZTdhMzI3YTM5MzQ3NzU3NDA1MzM3Nzk1NTUzNTI0OTZmNTQ1NjQ4NzA3OTM3NzI3MDM5NWE3ODZmNzU3NDQ2NDAzOTVhNGMyMTM4NzA3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzc1MjQ5NmY1NDU2NDg3MDc5MzY3MzIxMzQ0ZTI0NmYyNTM3NGI1NTU0MzM0ODU1NTQzNzRjNDAzNDRlMjM2ZDUzMzY3MzIxNzkyYjIzNTU1NDcwNDI3MDUzNzM3MzQwNTQzNzRiMjEzOTMzNDI2ZTI1MjY3MzZmMjUzNzQ1NDAzODVhMjM2ZDM4MmI0NzU1NTM1NjI0NzA1NDMzNDg2ZTdhNTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0ZjRlNDc2ZTVlMzI3MzZkMzgyNjczMzIzNjMzNWEzNDM2MmE3MjM0MzYzMzM1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM1MjUyYTQ1NzEzNDRlNGQzMjM5NDA3ODZmNWU0MTczMjEyNTUyNDc1NTUzNTI0OTZmNTQ1NjQ4NzA3OTM2NzM3MDM5NWE3ODZmN2E1OTQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGUyMzZmN2E3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0ZDJiNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NzA1MzM3MjY3MDRmMmE0YzZmNTM0YTQyNzA0ZjczN2E1NTRmNmY0MjM4NGM1MjcwNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTA2Zjc5Mzc3NDcwNTMzNjczNmQzODJhNDU2ZDM4MmE3ODU1NTM0Njc4NzEzODU2NDgyMTM5NTY3NzU1NTQ3MDQyNzA1MzczNzM0MDU0Mzc0YjIxMzkzMzQyNmUyNTI2NzM2ZTVlNGUyMzZkMzgyYjQ3NmY0OTQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzI0NzQ2Zjc5NDYyNDZmNGY0ZDJiNTU1NDMzNzg2ZTUzMzc3NTZlNWUzMjQ3NzA1NDc4NDk0MDM5NTk0NzM0MzgyYTQ1NmQzODJhNzgzNDI1MzcyYTIxNzkyYjc0NmY3OTMzNWEyMTM5NTY0NDcwMzk0ZDQxNmY3OTJiNWUzOTVlNzA0MjQwNTQzMzQxMzEzNTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTdhMzcyMzcwNTMyYjQ3NmY0YjRkMmI1NTUyNDU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1MzM3NDU0MDM4NTY0ODcwNGYyYTIzNzEzOTRlNzg2ZjRiMmE1NjZlNzk0YTQyNmU3OTM3NTg0MDM5Nzg3NTZlMjU1MjRiNDA1MTU2MjQ3MDU0MzM0ODZlNzU3Mzc1NTkzNDRlNWE2ZDM4MmEyNDcwNTMzNjc1NTg0ZjRlNzYyMTM4NGE0NTIxNzk1Mjc2NmQyNDJiNzcyMTM5MzM3NDMxMzgyMTc1NDA1ZTU2NzQ2ZTdhMzM3MjcxNWUzNzRjNDAzOTU2NzI2ZDM4MzMyYjM5NGM1MjQ2NmQzODI2NzU1NzM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1MzM3NDU0MDM4NTY0ODcwNGYyYTIzNzEzOTRlNzg2ZjRiMmE1NjZlNzk0YTQyNmU3OTM3NTg0MDM5Nzg3NTZlMjU1MjRiNDA1MTU2MjQ3MDU0MzM0ODZlNzU3Mzc1NTk0YjRlNTEyMTM5Nzg0YzU1NzU0OTczMjEyNTUyNDU2ZTUzNTY3NDIxMjU0NjcyNDA1MzUyMjMyMTM1MjQ3OTU1Nzk3MDRiMjEzODJhMjMzOTVlNDYyNDZmMjUzNzRiMzkyNTc4Nzc3MjM3NWY0YzQwNTM1MjJhNmY0YjU1NDI1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNDAzODRhNzgyMTc5MmIyMzU4N2EzMzJhNmY1MzM3NGM1ODc3Nzg0NzZlNTM3ODQ3NDAzNjQ2Nzg3MTM4NTY0ODIxMzk1Njc3MzI3YTM3MjM3MDUzMmI0NzU3NGY1NTVlNTU1MTMzNzQ3MTM5NTk3NTU4NGY0ZTc2MjEzODRhNDUyMTc5NTI3NjZkMjQyYjc3MjEzOTMzNzQzMTM4MjE3NTQwNWU1Njc0NmU3YTMzNzI3MTVlMzc0YzQwMzk1NjcyNmQzODMzMmIzOTRjNzA3NzIxMzk3ODRjNTU3NTc3NDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzMzc4NmU1MzM3NzU2ZTVlMzI0NzcwNTQ3ODQ5NDAzOTU5NDczNDM4MmE0NTZkMzgyYTc4MzQyNTM3MmEyMTc5MmI3NDZmNzkzMzRmNzAzOTMzMjM2ZTI1MjY0MTU1NzY1MTczMzUzODJiNDc3MDUzNzM3NTU4NGY0ZTc2MjEzODRhNDUyMTc5NTI3NjZkMjQyYjc3MjEzOTMzNzQzMTM4MjE3NTQwNWU1Njc0NmU3YTMzNzI3MTVlMzc0YzQwMzk1NjcyNmQzODMzMmIzOTRjNTI0NjZlMjUyYTIzNmQ0ZjU1NDI1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNDAzODRhNzgyMTc5MmIyMzU4N2EzMzJhNmY1MzM3NGM1ODc3Nzg0NzZlNTM3ODQ3NDAzNjQ2Nzg3MTM4NTY0ODIxMzk1Njc3MzI3YTM3MjM3MDUzMmI0NzU3NGY1NTRjNTU1MTI0NDg2ZTdhMzM0MTZmNGI1NTQ1NTU1MzVhNzQ2ZTUzNGE3NTIxMzg1YTQ0MzkyNTMzNzQ3MDUzNTEyYjQwNzU1NjdhNmY3OTUyNDc3MDUyMmIyOTcwMzk1YTc4NmY3ODJiNDI0MDU0MjQ3MjU5MjUyNDQ4NmU3YTMzNDE1NTc1Nzc0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNzg2ZTUzMzc3NTZlNWUzMjQ3NzA1NDc4NDk0MDM5NTk0NzM0MzgyYTQ1NmQzODJhNzgzNDI1MzcyYTIxNzkyYjc0NmY3OTMzNGY3MDM5MzMyMzZlMjUyNjQxNTU3NjIxNzMzNTM4MmI0NzcwNTM3NDRjNTU3NTQ5NzMyMTI1NTI0NTZlNTM1Njc0MjEyNTQ2NzI0MDUzNTIyMzIxMzUyNDc5NTU3OTcwNGIyMTM4MmEyMzM5NWU0NjI0NmYyNTM3NGIzOTI1Nzg3NzcyMzc1ZjI1NmUzODJiNDc3MDUzNzM3NTU3MzQ0OTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDUzMzc0NTQwMzg1NjQ4NzA0ZjJhMjM3MTM5NGU3ODZmNGIyYTU2NmU3OTRhNDI2ZTc5Mzc1ODQwMzk3ODc1NmUyNTUyNGI0MDUxNTYyNDcwNTQzMzQ4NmU3NTczNzU1OTM1NTU3MzM1MzgyYjQ3NzA1Mzc0NGM1NTc1NDk3MzIxMjU1MjQ1NmU1MzU2NzQyMTI1NDY3MjQwNTM1MjIzMjEzNTI0Nzk1NTc5NzA0YjIxMzgyYTIzMzk1ZTQ2MjQ2ZjI1Mzc0YjM5MjU3ODc3NzIzNzVmNGE1OTc5MjQ0ODZlN2EzMzQxNTU3NTc3NDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzMzc4NmU1MzM3NzU2ZTVlMzI0NzcwNTQ3ODQ5NDAzOTU5NDczNDM4MmE0NTZkMzgyYTc4MzQyNTM3MmEyMTc5MmI3NDZmNzkzMzRmNzAzOTMzMjM2ZTI1MjY0MTU1Nzc3ODQ3NDA3OTc4NDc2ZDM5MzMyYTU1NzU0OTczMjEyNTUyNDU2ZTUzNTY3NDIxMjU0NjcyNDA1MzUyMjMyMTM1MjQ3OTU1Nzk3MDRiMjEzODJhMjMzOTVlNDYyNDZmMjUzNzRiMzkyNTc4Nzc3MjM3MmI0MjZlNzk0MDQyNmU3OTc4MjM3MTM0NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzM5MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMyNDc0NmY3OTQ2MjQ2ZjRmMmE3NDQwNTMzMjQxNTc3OTU2MjQ3MDU0MzM0ODZlN2E1OTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDc1NTYzNTQwMzg0YTc4MjE1ZTMyNzM0MDU0Mzc0YjIxMzkzMzQyNmUyNTI2NzM0MDc5MmI0YjU1NTQzNzRjNDAzOTU1NzM3MTVlMzc0YzQwMzk1NjcyNmQzODMzMmIzMDc1NTU0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjUzNGEyYTM5MjUyNDc0NmY3OTQ2MjQ2ZjUwMjQ0NjIxMzk1NjQ0NzAzOTRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNDI0ZjczNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NTE3ODQ3NDA1MzM3MjYzMzM5NTY0YjZlNWU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTc4NGU0NTQwMzg1MjRjNDAzNDRlNDk2Zjc5MmIyNTZkMzgzMzc4NTU1MzUxNzM3MDc5NTI0NTZkMzgzMjczNzAzOTVhNzg2Zjc1NGU1NjMzNGYyNjczMzczOTVhNzQ0MDI1MzYyODU1NGYyYjdhNmY3OTUyNDc3MDRmNGQ1ZjcwMzk1YTc4NmY3ODJiNDI0MDUwMjY3NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU3MzI0MTU3MzI1MzU2NDg3MDRmMmE0NjQwMzk1YTRjMjEzODcwNzgzOTI1NzQ3NDZlNzkzMzQ1NDAzOTU1NDEyMTI1MmI0NjZlMzg1MjQ3NDA1NDU5MmIzODRiNzA0YjQwMzk0MDQ4NmQyNTM2N2EzOTM0Nzc1NzQwNTMzNzc5NTU1NDM3NDcyMTM5NGU0OTZmNzkyYjI1NDAzNzJiMjQ2ZjI1Mzc0YjU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTM3MzgyYTc0NmY1NDRlNGI2ZTVlNDA3ODU1NTM1MTczNzAzOTVhNzg2Zjc1NGUyMzZlNGI0ZTRiNDAzOTVhMjM2Zjc5Nzg3NjcwNGY0ZTIzNmQ1MzM3NDY1NTUzNDA0YjZlMjUyMzczNzAzOTVhNDI2ZTc5NmY3MzcwNTM3NDc4NTU1MzU2NDg3MDRmMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTU1MzJhNDg3MDRmNGU0MjZlNzU0ZTRlMzM1MTI0NTYzNTc4MmI1NjMzNTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTYzMTZlNzk0YTJhNTU1MTRlNGU3MDc5Mzc0YzcxNzU0ZTc2MjEzODI2NzM3MDM4MmE3NDZmNTQ0ZTRiNmU1ZTQwNzg1NTU0Mzc0YzQwMzk1NjRjNTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3MzQxNzM1NTRmNGQ3MzcwNTQ1NjJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDM3NGM0MDM5NTY3MjZkMzgzMjczMzEzNDRlNDI2ZTdhMzI0MTZlMzgzNzRjNmYyNTUyN2E0MDM0MmEyMzQwMzk3NDIzNTg3YTVhNDk2ZTUzNzgyMzU3NGY2ZjczNTY0Yjc4NmU1OTM3MjM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwMzk1YTc4NmY3ODJiNGM3MDU0NTU3MzMxMzQ0ZTRjNzA1NDU1NDE3MDM5NWE3ODZmNzgyYjQyNDA0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGUyNDZmMjUzNzRiMzkyNTc4Nzc1NTUzNzg0NzU1NTE1MjMyMzY1MjU2MzEzNzc3Mzc1MTM5MjQzNzM1MzMzNzU2MzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRlMzY1MjRlMzQzNTI0NDA1MjMzNTIyYjM3MzYyMzM3MzQzNjRiMmE0YjQwMzgyNDQ4NzA3OTM2NDE3MDM5NWE3ODZmNzgyYjQyNDA0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGUyNDZmMjUzNzRiMzk1ZTVhMjM2Zjc1NGU0MjZlNzU0ZTM3MzYyMzM3MzQzOTIzMzM0ZTM3NTE1MTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUyMzczNTMzMzc1NjcyMzM1MTUyMzYzMjM0MmE0OTZlNWU0ZDQxNzAzOTVhNzg2Zjc4MmI0YzcwNTQ1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3NDcwNzkzNzcyNzAzOTVhNzg2Zjc4MmI3NzIxMzkzMzc0NTc0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzNzM5NWE3ODZmNzU0ZTI5NzAzOTVhNzg2Zjc4MmI0MjQwNTQyMzczNmQ1MzUyNGM1NTUzNTY3ODQwMzgyNjczNzAzODJhNzQ2ZjU0NGU0YjZlNWU0MDc4NDA0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NGY3NDU2NmU3OTMzNzg3MTUxMzc0YjZmNzkyYjRiNTg0ZjRlMzgyMTM4NGEyNDQwMzYzNzRiNmY3OTJiNGI1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNTU3ODRlNDU0MDM4NTI0YzQwMzQ0ZTQ5NmY3OTJiMjU2ZDM4MzM3ODU1NTM1MTczNzA3OTUyNDU2ZDM4MzI3MzcwMzk1YTc4NmY3NTRlNTYzMzRmMjY3MzM3Mzk1YTc0NDAyNTM2Mjg1NTRmMmI0YjQwMzk0MDQ4NmQyNTM2NzMzMTU0Mzc0YzQwMzk1NjcyNmQzODMyM2M1NTc1Nzc1NzRmNzc0ZTc1NmU1ZTMyNDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNzJiNDEyMTM4MmE3NzZlNTMzNzRiNTc1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjMzEzNzQ1N2E2ZjVlMzM3NDZmN2EzMjdhNTg0ZjRkN2E2ZDUzMzc0NTZmNGY3MDcwNTczMjQyNzc0MDM4MjE3MzZmMjUzNzQ3NDA1MjJiNWU0MDM4NGE3NjZlMjUyNDc4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTM3NDc0MDRmNGU1ZTQwMzg0YTc2NmUyNTI0Nzg1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NzM3MDI1NzgyMzZkNGY0ZTc2NmUyNTI0NDYyMTM4MmE3NzZmNGI0ZTc0NmU3OTMyNzM2ZTUzMmI3YTZlNGIyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNDg3MDRmNGU0MjZmMjQyYjI0NmYyNTM3NGIzOTI1NTI0OTZmNTQ1NjQ4NzA3OTM3Nzc1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc0MDdhNTY0ODZlMzcyYjI0NmYyNTM3NGI1ODc5Nzg3NzU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4Nzg0ODcwMzQ0ZTc0NmY3OTM2NzM2ZTc5MmIyMzU1NTM1MjI0NzA1Mzc0NDg2Zjc5NzgyODQwMzgzMjczNzA1MzVmNzM3MDM5NWE3ODU1NTQzMzQxNmQzOTU5NzMyMTc5MmIyMzU4NzU0ZTUwNmUyNTJhMjMyMTM4NWEyMzU1NTE0ZTRlNzA3OTM3NGM3MTc1NGUyMzZlNGI0ZTdhNDAzOTMyNzMyMTM5NGU0OTZmNzkyYjI1MjEzODQ5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZTQxNDAzODRhNDkzOTVlMzM3ODcxNTQzMjczMzEzNDRkNzU1NTc1NTY1NjZlN2E1YTIzMjEzODcwNGIyMTM4MjM3MzM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTRmNmU1ZTMyNzMzMjI1MmI0NjZlMzg1MjQ3NDA1NDU5Mjg0ZjczNDE0ODcwMzgyYTc1MjEzODI2NzM1ODM0NGU1YTZlMjUyYTQyNzA1MzJiNGI1NTUzNTI0NzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzQwNzkyYjRiNTU1NDM3NDcyMTc5NTI0NzZlNzk3ODQ3NDA0OTQxNDgyMTc5NTI0NzU1NGYyMzczMzUzODJiNDc2ZDM5MzM0ODZmNzU0ZTc0NmU3NTRlNzQyMTI1NWE0ODcwMzgyYTIzNTU1MzQwNDg2Zjc1NGU3NTIxMzgyYTQ3NmQzODJhN2E0Zjc1MmI0YzcwNTM1MjIzNzAzOTU5NzM1ODM0NGU1MDZkNTMzNzc2NmQ0YjRlMjM2ZDUzMzY3MzIxNWUzNzRiNmY3OTM3NDc3MDRmNGU0YzcwNTM1MjIzNzAzOTU5NzM2ZTI1MjE3MzIxMzgyNjczMjEzODVhNzY2ZTVlMzc0NzcwNGQ0MTQ4NzA3OTM3NGI2ZDM0NGQ0NjU1NTEyNDQ4NmU3OTc4MjM2ZTVlNTU3MzIxMzgyNjczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTc5NmU1ZTU1NzM3MDc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU1NTQ1YTIzMjEzOTMzMjQ2ZjQ5NDE0ODZmNWUzMzQ4NmY0ZjRkNDY1NTUyNWEyMzZlNWU0ZDczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0YjRlNzQ1NTU0NWE0OTQwMzg1YTQyNDA3OTc4NzY1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM1NzUzNDA0ODZmNzU0ZDQ4NzAzODJhNzUyMTM4MjY0NTU1NGYyYjc1MjEzODI2NDU1NTRmMmIyNTQwMzk1NjQyNTczMjQxNDg2ZTUzNzg0YzcwNGY0ZDQ2NTU1MjVhNDE2ZTVlNmY3MzIxMzg0YTQ1NTU1MzUyNzYyMTI1MmIyNDZlN2EzMzRjNTU1MzVhMjQ2ZjdhNTY3ODZlN2EzMzQ1NzEzNDRlNzU0MDM4Nzg0NzQwNGI0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMjU3NTg1ZTRlNDI2ZTc5NmY3MzU4MzQ0ZTUwNmQ1MzM3NzY2ZDRiNGU3NTZlNWUzMjczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczNzA1Mzc4NDY0MDMyNDE0ODZkMzgyYTc5NmU0YjRkNDY1NTUyNWE0MTZlNWU2ZjczNzEzODJiMjQ2Zjc1NGU0OTZmNzkyYjc5NmQzODRhNzg1NTUzNzg0NzQwNzkyYjRiNmUzODUyMjM2ZDM4MmI0NzRmNzUyYjQyNDAyNTc4NDc0MDc5NWY3MzU4MzQ0ZTU0NDAzOTMyNzM0MDUzMzcyMzIxMzg3ODQ1NDAzODMyNzMzNDM4MmE0YzcwNTM1MjdhNmY3OTUyNDY1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM2ZDM4MmE3OTZlNWU1NjQ2MjEzOTMzNDI2ZTI1MjY1NzRmNzc1Mjc3NmUzODc4NDc1NTUxNWE0ODZlMzgyNDc0NmU3OTMzNGM1NTRmNzQzMTcwMjUyYTc4NmY3NTRlNDg2ZTc5NGEyYTU3MzU0MTU3NTgyNTcwNGIyMTM4MmEyMzU1NGYyMzczMzIzOTRlNDk2Zjc5MmIyNTQwMzQ0ZTc0NTU1NDM3NGM0MDM5NTU3MzcwNTM1ZjczNzAzOTVhNzg1NTU0MzM0MTQwMzQ0ZTc1NmU1ZTMyNTc1ODVlNTY3ODcwNzkyYjQ0NDAzNDRkNDY1NTUyMzc0NzIxMzk0ZTQ5NmY3OTJiMjU0MDM0NGU3NDU1NTQzNzRjNDAzOTU1NzM3MDUzNWY3MzZmNzkzNzRjNzA1NDU2NDIyMTVlMzI3MzIxMzg1YTc2NDAzOTVhNGM0ZjczNDI1MDZlMjUyYTIzMjEzODVhMjM1NTUxNGU0ZTcwNzkzNzRjNzE3NTRlNzk2ZTVlNTU3MzZmNWUzNzQ5NmY1MzJiNGI3MDRmNTU3NTU1NzM0MTczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDc2NTU1MTMzNzgyMTI1MmI3NzQwMzQ0ZTc0NmU3OTMyNzM2ZjI1Mzc0NzQwNGY0ZTQ1NmUyNTcwNDg1NTU0NzA0MjcwNTM3MzczNzA1MzM3MjY3MDRkNDE3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNGE0ODQwMjUyYjcyNDA1MzUyMjMyMTM0NGQyYjU1NTM1Njc0NmYyNTM2MjU1YTRmMmE3NTVhNzYzMzc3NDAzODVhNDg0MDUzMzY0MTMyNzcyYjM2MzkyMzRhMzEzMzIzMmI3MjMyNzc1MjM1MzMzNTIxMjM1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRjNDAzODJhNzczOTVlNGU0MTZlNWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3MjEyNTc0NzQ3MDRmMmE0MjQwNGY0OTczNmU1MzJiN2E2ZTI0MmI3NzIxMzkzMzc0NTg0ZjRlNzYyMTM5NGUyMzZkMzgyYjQ3MzEzODc0Nzg2ZTU0NGU3MjcwNTMzNzI2NzA0Zjc3NTc1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNmQ1MzM3NDU2ZjUyMmIyMzQwMzk3NDIzNTczMjQxNTczMjUzNTY0ODcwNGYyYTQ2NDAzOTVhNGMyMTM4NzA3ODM5MjU3NDc0NmU3OTMzNDU0MDM5NTU0MTIxMjUyYjQ2NmUzODUyNDc0MDU0NTkyYjM4NGI3MDQ5NmQzODJhN2E1NjI0MjM0MjRmNzkzMzc4NDA3NTRlNDk2ZDM4MmE3YTM5MjU1YTQ4NmUzODI0NzQ2ZTc5MzI0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1MDZkNTMzNzc2NmQ0YjRlNzU2ZTVlMzI3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY3MzcwNTM3ODQ2NDAzNDI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmE0ODcwNGY0ZTQyNmYyNDJiMjQ2ZjI1Mzc0YjM5MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1Nzg3ODQ4NzAzNDRlNzQ2Zjc5MzY3MzZlNzkyYjIzNTU1MzUyMjQ3MDUzNzQ0ODZmNzk3ODI4NDAzODMyNzM3MDUzNWY3MzcwMzk1YTc4NTU1NDMzNDE2ZDM5NTk3MzIxMjUyYjQ2NmUzODUyNDc0MDRmMjY3MzMyMjUyYjQ3NzA1MzUyNzY3MDRmNGU0ZDMyMzk0MDc4NmY1ZTQxNzM3MDUzNWY3MzQwMjUzNzIzNTU1MzUyNDk2ZjU0NTY0ODcwNzk1MjQ1NTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3NTRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NzMzMTM0NGUyMzZkMzgyNDc4NTg3YTMzNDI2ZTM4MzY0MTU3MzI0MTczNTU0ZjRkNzM2ZjI1Mzc0NzcwNTIyYjQ2NDAzOTVhNGMyMTM4NzA3ODU1NTAyMzczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTYzMjZkMzgyYTdhNmQzODJhN2E1ODc1MjY0NzU1NzU3NzU3NTU0ZjRkNzM1NTUzMzc0NzQwNTIyYjIzNmQzODI0Nzg1NTUwMjM3MzcwNTM3ODQ2NDAzNDJhMjM2ZDM4MjQ3ODU3NGY3NzU3NTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNmY1Mzc4NDc0MDI0MmI0NjZmNGI0ZDJiNTU1NDU2NDg3MDM4MmE3NzU3NGY3NDc4NmU3OTMzNzI3MDUzNzg0NjQwMzQ0ZDQ2NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NDI1NTRmNDE3MzU5MzU0ZDQ5NTk0ZjQ5NzM1OTc1Nzc1NzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzIxNzkyYjIzNTg3OTM3Nzc2ZDM5MzM3MjZlMzgzNzRjNmYyNTUyN2E0MDM3MmIyMzQwMzk3NDIzNTc0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzIxNzUzMjc5MmIyMzU1NTM3ODRjNTU1MzJiNDc2ZTUzNzg0NzQwMzQ1MTczMzgzODJiMjQ2Zjc1NGU3NjcwMzk1NjRiNDAzODJhMjM1NTU0NGU0MjZlNzk2ZjI4NTU1NDQ2NDk2ZDM4MmE3YTM5MjUyNDRjNzIzODI0NGM1NTc1NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NjQwMzk1YTRjMjEzODcwNzg1ODc5NWE0MTIxMzkzMjQ3NmQzODMyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NzcwNTIyYjQ2NDAzOTVhNGMyMTM4NzA3ODU4NzkyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjZkMzgzMjU3NTU0ZjRkNzM1NTRmNzc1NzRmNzc0ZTc1NmU1ZTMyNDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNzJiNDEyMTM4MmE3NzZlNTMzNzRiNTc1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjMzEzNzQ1N2E2ZDM4MmE3OTZlNGI3MDcwNTczMjQyNzc0MDM4MjE3MzcwMzk1YTc4NmY3ODJiNDI2ZTc5NDA0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMzNTM3ODRjNmY1MzRhNzQ3MTM0NGUyNDZmMjUzNzRiNTU1Mzc4NDc0MDc5MmI0YjZlMzg1MjIzNmQzODJiNDc1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM2ZDM4MjE3MzZlNzkyYjIzNTU1Mzc4NGMzOTVlMzc0YzQwMzk1NjcyMjEzOTRlNDk2Zjc5MmIyNTQwMzgzMjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDc1MzgzODJiMjQ1NTUzNTI0YjQwMzQ0ZTQ3NmU1ZTMyNzMyMTM5MzcyMzZkNTMyYjRiNmQzOTQyNzg0MDRmNGUyMzZlNGI0ZTI0NmYyNTM2NzM3MDUzNzQ0MjZmNGI0ZTc2NmUyNTI0NDYyMTM4MmE3NzU4NzU0ZTUwNmUyNTJhMjMyMTM4NWEyMzU1NTE0ZTRlNzA3OTM3NGM3MTc1NGUyMzZlNGI0ZTdhNDAzOTMyNzMyMTM5NGU0OTZmNzkyYjI1MjEzODQ5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM3MDM5NWE3ODZmNzU0ZDJiNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NDA3YTU2NDg2ZTM3MmIyNDZmMjUzNzRiNGY3NTRkNzM1NTRmNGUyNDZmMjUzNzRiMzk1ZTVhMjM2Zjc1NGQyYjU1NTQ1YTIzNmY3NTc0MjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczMjQxNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzY1NTUxNzA3ODcwNGY0ZTRjNzAzODU2NGMyMTVlNTY0MjZmNTQzMzQyNmUyNTI2NzM2ZDM4MmE3OTZlNDk0MTczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3NTJhNDI0MDRmNGU0MjZlNzU0ZTRlMzM1MTI0NTYzNTc4MmI1NjMzNTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTM3NzU2ZjI1NWE0YjZkMzk0ZTIzNmQzODJiNDc1NTUwMjM3MzU1Nzc1Mjc3NmUzODc4NDc1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjZmNTM3ODRiNzEzNDRkMmI1NTRmNTYzMDQwMzk0MDc4NmY3NTU1NTc1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM3MDM5NWE3ODZmNzgyYjRjNzA1NDU1NzM2ZDM4MjY3MzM3Mzc1YTUyMzY3ODJiNTEzMjM3MzM0ZTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTRkMmI1NTRmNTYzMjZmNzkzNzQ2NmQzOTM3NDY1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjZmNTM3ODRiNzEzNzJiNzcyMTM5MzM3ODU1NTAyMzczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlMzg1ZTM3NGM0MDM5NTY3MjZmNWUzMzRiMzkzNDJhN2E0MDM5MzI0MTU2MjUzNzI2NmY1Mzc4NGI3MTM0NmY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNDAzOTc0NDk2ZDM5NTYyYTM5MjUzMzc0NzA1MzM2NzMzMTM1MjM3MzU2MjU3ODQ3NDA3OTc4NDc2ZDM5MzMyYTU2NGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ0OTZkMzk1NjJhNTU1MDIzNzM1NTc3MmE3ODcwNzkzNzRiNTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjY2ZjUzNzg0YjcxMzQ0ZDJiNTU1MzM3MjY2ZjUzNzg0YjcxMzcyYjc3MjEzOTMzNzg0Zjc1NGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyNDIxN2E1YTc2NmY3OTc4NDk3MDUzNzg0ODZlNzU0ZDJiNTU0ZjU2NTM2Zjc5Mzc3ODU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2NmY1Mzc4NGI3MTM0NGQyYjU1NGY1NjMwNTgyMzUxNzU0Zjc1NGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTUzNzg0NzQwNzkyYjcyNzA1MzM3MjY3MDRmNGQyYjU1NTMyMTc1NTU3NTU2Mzc2ZjI1Mzc0YjU1NTE3ODQ3NDA3OTJiNGI2ZTM4NTIyMzZkMzgyYjQ3NGY3MzQyNDA2ZTVlMzc0YjU1NTMyYTc0NmUzODM2Mjg1NTU0NDYyNDZmMjUzNzRiNTg3OTQwNDI2ZjdhNWEyMzM5MjUyYTc0NmUzODM2NzM2ZTVlNTU3MzU2MjMyYTQ4NzA0ZjRlNGM0MDM5MzI3YTcyMzQ0ZTI5NzAzOTVhNzg2Zjc1MmE0NTIxMzk1YTIzMzkyNTJhNzQ2ZTM4MzY3MzZlNWU1NTczNTY0YjcwMmI0Zjc4Nzg0ODcwMzk1NTczNzA1MzM3NDU0MDM4NzA0YjIxMzgyMzczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjI4NTU1MTRlMjk3MDM5NWE3ODZmNzUyYTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZTQ4NmY3NTRkN2EzNTc5MmIyMzU1NTQ1YTc4NzA0ZjcwMmI0Zjc4Nzg0ODcwMzk1NTczMjEyNTc0NzQ3MDRmNGU1NjMzNTA0MTczNzE1ZTM3NGM0MDM5NTU0NzZkMzgzMzJiNGY3ODVhMjQyMTdhNWE3NjZmNzk3ODQ5NzA1Mzc4NDg2ZTc2NDE3MzcxNWU1YTI0MjE3YTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3YTIzNTczMzM5NzQ0OTZkMzk1NjJhNTU1MzMzNzQ3MDUzMzYyODU1NTQ0Njc4NzE1NDRlNDI2ZjdhNzgyYjU1NzU1NTc1NGY3NTRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU0MjZlNzk0MDQ4Mzk1ZTMzNzg3MTU0MzI0MjRmNzM0MjRkMjE3OTJiMjM1ODc5MjQ3ODZmNWU1YTc0NDAyNTM3NzI2ZDUzNTI0NzQwNTM0YTc4NmY3NTc0NzY2ZTI1MjQ0NjIxMzgyYTc3NmY0YzI0NmU1NjI1Nzg3YTZkMzgyYTc5NmU0YjcwNzA1NzMyNDI3NzQwMzgyMTczNmQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2MzkyNTc4NDc0MDc5NWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1NDQwMzkzMjczNDA1MzM3MjMyMTM4Nzg0NTQwMzgzMjczMzQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjczNmQzODJhNzk2ZTVlNTY0NjIxMzkzMzQyNmUyNTI2NDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0NzZlNWUzMjczNmQzOTVhNzI3MDM5NWE3ODZmNzgyYjc0NmY1NDRlNGI2ZTVlNDA3ODQwNGY3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NGY1NjQwNmU1ZTM2NzMyMTM5NTY3ODU1NTMyYTQ4NzA0ZjRlNzQ3MDM5MzM0MTZlNWU1NjQyNzE3OTM3Nzc1NTU0MzM0ODU1NTQzNzRjNDAzNDRlMjM2ZDUzNzg0YzU1NTM1YTQ4NmUzODI0NzQ2ZTc5MzI0NzU1NTE1YTQ4NmU3YTMzNzQyMTVlMzI3MzMyNTE1MjI1NDAzOTVhMjg1NTU0MzM0ODU1NTM3MDc4NzA0ZjRlNzQ2ZjU0NGU0YjZlNWU0MDc0NmU0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDRkMmI1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc3MDUzMzcyNjcwNGYyYTRjNmY1MzRhNDI3MDRmNzM3YTU1NGY2ZjQyMzg0YzUyNzA0Zjc1NGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzM0MzgyYTc3NDAzOTc0NTI2ZjdhNTY0ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4NGU0NTQwMzg1MjRjNDAzNDRlNDk2Zjc5MmIyNTZkMzgzMzc4NTU1MzUxNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDc1NTUyMzc0YzIxMzg3MDc4MzA3NTRkNDg2ZDM4NzA0MjZlNzk0MDQ4NTU1MDRhMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NGY1OTczMzYyNTM3NDc0MDRmNGU0NTZlMjU1Mjc3NmQzODJhN2E1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NTc1NTRmNGQ3MzU1NTM0YTQ4MjEzODMzNDI2ZTc5NzA3MjZlMzk1YTdhNTU1MDIzNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NGY1NjU0NDAzOTMzMjM2ZDM4MmE3YTU1NTE3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzQ0ZTQyNmU3OTQwNDg2Zjc5MjQ3NDcwNTM3ODQ4NmU3NTI2NDc1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI2ZTc5NDA0ODU4NGY0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODM5NWU0ZTQyMjEyNDJiMjQ2Zjc5NDk3MzMxMzQ0ZTdhNDAzOTMzNzI2ZDM4MmE0YzcwNTM1MjdhNmY3OTUyNDYzOTI1Nzg0NzQwNzk1ZjQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTE0MDM4NGE3ODcwNTMzNjczNmU1MzJiNzQ0MDUzNzg0NzQwNGI0ZTQ2NDAzOTVhNGMyMTM4NzA3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3OTMzNzg2ZTUzMzcyMzQwMzcyYjQ2NDAzOTVhNGMyMTM4NzA3ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzIxMjU3NDc0NzA0ZjJhNDI0MDRmNDk3MzZlNTMyYjc0NDA1Mzc4NDc0MDI0MmI0NjZmMjU2ZjQ3NmUzODM3NGM2ZjI1NTI3YTQwMzcyYjQyNDA0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU0OTZmNzkyYjc5NmQzODRhNzgzOTVlNGU0MjIxMjQyYjI0NmY3OTQ5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1OTczMzM1MzJiNWU2ZTc5NGE0ODIxMzgzMjczNmY1NDU2NDg0MDc5Nzg0NTQwMzQ0ZTQ5NmQzODVhMjM3MDM5NTY3ODU1NTM1MjQ3NDA0ZjRlNGM0MDM4MmE3NzU1NTQ3MDQyNzA1MzczNzM2ZDM4MmE3OTZlNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZkMzg1YTcyNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczMzEzNDRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjJhN2E0MDM5MzI0MTZmNTQ1NjQ4NDA3OTc4NDU0MDM3MmI0OTZkMzg1YTcyNzAzOTU2NDU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzZmNTM3ODc2Mzk1ZTU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTg3YTVhMjMyMTM5MzMyNDZmMjQyYjc2NmUyNTMzNzg1NTUwMjMyYjU1NTA1NTQ5NTk1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmYyNTM3NDc0MDUyMmI0OTZkNTMyYjIzNmU0Yjc0NDY0MDM5NWE0YzIxMzg3MDc4NTg3OTVhNDEyMTM5MzI0NzZkMzgzMjQ1NTU1NDRlNDIyMTI0MmI0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0MmE3NjZlMjUyYTIzNDAzODJhMjM1ODRmNGU3NjIxMzk0ZTIzNmQzODJiNDczMTM4Nzg0NzQwNzk1ZjQ1NTU1NDRlNzQ2ZjdhNWE3ODM5MjUyNDQ4NDA1MzM2MmI1NjIzMjQ3NDZmNzk0Njc3NmU1ZTcwNDc1NjRiNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZmMjUzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTM3ODQ3NDA3OTVmNDU1NTU0NGU3NDZmN2E1YTc4MzkyNTI0NDg0MDUzMzYyYjU2MjMyNDc0NmY3OTQ2Nzc2ZTVlNzA0NzU2NGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzNzg0NzQwNzk1ZjQ1NTU1NDRlNzQ2ZjdhNWE3ODM5MjUyNDQ4NDA1MzM2MmI1NjIzMjQ3NDZmNzk0Njc3NmU1ZTcwNDc1NjRiNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODZlNTQ1YTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNTU3ODMzNDE2ZDM5NTk3MzIxMzg1YTc2NmU1ZTM3NDc3MDRmNGU0MjZmNGI0ZTI0NmU3OTUyMjUyMTM4Nzg0NTIxMzg1NjQ1NDAzNDI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTI3MTUzNWE3ODZmNTQzMzQyNmUyNTI2NzMyMTM5NTk3MzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc0MDM4MzM0MjcwNTIyYjQ2NDAzOTVhNGMyMTM4NzA3ODM5NWUzMzc4NzE1NDMyNDE1NTc4MzM0MTZkMzk1OTczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTQyNmY0YjRlMjQ2ZTc5NTIyNTIxMzg3ODQ1MjEzODU2NDU0MDM0MjY3NTU4NGY0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk1YTQxMjEzOTMyNDc2ZDM4MzI0NTU1NTM0YTQ4MjEzODMzNDI2ZTc5NzA3MjZlMzk1YTdhNTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNzcyNmQzODMyNDI0ZjczNDI0ZDIxNzkyYjIzNTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNzcyNmQ1MzUyNDc0MDUzNGE3ODZmNzU3NDc2NmUyNTI0NDYyMTM4MmE3NzZmNGMyNDZlNTY1ZTVhMjMyMTM5MzMyNDZmNGI3MDcwNTczMjQyNzc0MDM4MjE3MzIxMjU3NDc4MjEyNTQ2NzI2ZjVlMzM3NDcwNTQzNzRjNTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzIyNTc0NzgyMTI1NDU3MzcwNTM3NDc4NTU1MzVhMjQ2ZjdhNTY3ODZlN2EzMjczNmY1ZTMzNzQ3MDU0Mzc0YzU1NTMyYjc5NTU1MzUyNDc1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0NzZlNWUzMjczNmQzOTVhNzI3MDM5NWE3ODZmNzgyYjc0NmY1NDRlNGI2ZTVlNDA3ODQwNGY3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NGY1NjQwNmU1ZTM2NzMyMTM5NTY3ODU1NTMyYTQ4NzA0ZjRlNzQ3MDM5MzM0MTZlNWU1NjQyNzE3OTM3Nzc1NTU0MzM0ODU1NTQzNzRjNDAzNDRlMjM2ZDUzNzg0YzU1NTM1YTQ4NmUzODI0NzQ2ZTc5MzI0NzU1NTE1YTQ4NmU3YTMzNzQyMTVlMzI3MzMyNTE1MjI1NDAzOTVhMjg1NTU0MzM0ODU1NTM3MDc4NzA0ZjRlNzQ2ZjU0NGU0YjZlNWU0MDc0NmU0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDRkMmI1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc3MDUzMzcyNjcwNGYyYTRjNmY1MzRhNDI3MDRmNzM3YTU1NGY2ZjQyMzg0YzUyNzA0Zjc1NGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzM0MzgyYTc3NDAzOTc0NTI2ZjdhNTY0ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4NGU0NTQwMzg1MjRjNDAzNDRlNDk2Zjc5MmIyNTZkMzgzMzc4NTU1MzUxNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDc1NTUyMzc0YzIxMzg3MDc4MzA3NTRkNDg2ZjVlMzM3NDcwNTQzNzRjNTU1MDRhMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGQyYjU1NTM1YTQxNDAzODVhNDQzOTI1Nzg0NzZmNWUzMzc0NDA1ZTU2NzQ2ZTM3MmI0YzcwNTM1MjIzNzAzOTU5NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNGM3MDUzNTIyMzcwMzk1OTczNmQzOTU5NzMzNTc5MmI0NzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTYzNzZlNzk1Mjc1NmU1MzM2NzM3MDUzNWY3MzIxMjU3NDc4MjEyNTQ1NzM3MDUzNzQ3ODU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGU0ODQwNzU0ZTRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDI2NzMzNjUzNGE3ODIxMzk1YTc4NTU1NDMzNGI3MTM0NGU3NDQwMjU1MjQyNmU3NTRlNDUyMTM5MzM3ODZmNzUyNjc1NTczMjQxNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNGM3MDUzNTIyMzcwMzk1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzMyMTVlMzc0YjZmNzkzNzQ3NzA1MzRhMmE1NTUxNTI3NjcwNTM3ODI1NDAzNDI2NzU1NzMyNDE3MzU1NGY0ZDczNDAzODRhNGM0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNDA3NTU2NGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0NGU0MjZmNGI0ZTc2NzAzOTU2NGI0MDM4MmEyMzZlNTQ3NzczMzI3OTUyNDc2ZTc5Mzc3NzU4NzU1NTQyNGY3MzQyNGQyMTc5MmIyMzU4NzkyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjZkNTM1MjQ3NDA1MzRhNzg2Zjc1NzQ3NjZlMjUyNDQ2MjEzODJhNzc2ZjRjMjQ2ZTU2NWUzNzQ3MjE3OTUyNDc1NjI0MjM0MjRmNzkzMzc4NDA3NTRlNWUyMTM5MzM3NjZkNTIyYjI0NmU3OTU2NzQ2ZTc1NzQ0NjQwMzk1YTRjMjEzODcwNzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3MjQ0ODZlNzk3ODIzNmU1ZTU1NzMyMTM4MjY3MzIxMzg1YTc2NmU1ZTM3NDc3MDRmNGU3OTZlNWU1NTczNzAzODJhNzUyMTM4MmE0NzZkMzgyYTdhNTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTc5MmIyMzU1NTM3ODRjMzk1ZTM3NGM0MDM5NTY3MjIxMzk0ZTQ5NmY3OTJiMjU0MDM4MzI0MTZlMzgzNzRjNmYyNTUyN2E0MDM0MmE3OTZmNzkyYjQ2Mzk1ZTM3NGM0MDM5NTU0NzZkMzgzMjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM4MzgyYjI0NTU1MzUyNGI0MDM0NGU0NzZlNWUzMjczMjEzOTM3MjM2ZDUzMmI0YjZkMzk0Mjc4NDA0ZjRlMjM2ZTRiNGUyNDZmMjUzNjczNzA1Mzc0NDI2ZjRiNGU3NjZlMjUyNDQ2MjEzODJhNzc1ODc1NGU1MDZlMjUyYTIzMjEzODVhMjM1NTUxNGU0ZTcwNzkzNzRjNzE3NTRlMjM2ZTRiNGU3YTQwMzkzMjczMjEzOTRlNDk2Zjc5MmIyNTIxMzg0OTQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGUyMzZmN2E3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczMzEzNDRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3YTMzNzg3MTU0MzI0NzZmNWU0ZTQ1NmQzOTMyNDE1NjRiNGQ3YTU3Mzc0NTRhMzkzMjQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxNzg0NzQwNTMzNzI2MzMzOTU2NGI2ZTVlNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU0ZjU2MzI2ZTUzMzc3NDZmMjUzNjczNmY1NDU2NDg3MDc5Nzg3NzQwMzQ0ZTc0NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg3NTRlMzc2ZjI1NTI3YTQwMzU0MTczNTg1ZTM3NDcyMTc5NTI0NzU1NTA0YTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzUyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU1NTM3ODQ3NTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzNmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU3NDZlNTQ1Njc4MjEzODMzMmE1NTUzNTY3ODZkMzgyYTdhNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA0ZjRlNzk2ZTVlNTU3MzIxNzk1MjQ3NTg1ZTM3NDcyMTc5NTI0NzU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzU0ZDczNTU0ZjRlNDI0MDc1NGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NGU0MjZlNzU0ZTc0MjE1ZTMzNDI3MDc5Mzc3MjcwNzkzNzRiNmQzNzJiMjMyMTM5NWE0NDZmNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTQyNmY0YjRlNzQ2ZTU0NTY3ODIxMzgzMzJhNTU1MzU2Nzg2ZDM4MmE3YTU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNGY0ZTc5NmU1ZTU1NzM3MDc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM0MDM5NzQ0MjZmNWUzMzRjNTU1MDIzNzMyMTI1NzQ3ODIxMjU0NjcyNmQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2Mzk1ZTVhMjMyMTM5MzMyNDZmNGI3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMzNzI2NmQzOTVhMjM2ZjRiNGU0MjZmNGI0ZTMwNmUyNTJhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZTc5NTU3ODM3NDcyMTM4NTY0NTQwMzQ0ZTIzNmU0YjRlNzY2ZDUzMzc3NjZkNGI0ZTIzNmQ1MzM2NzM2ZjVlMzM3NDcwNTQzNzRjNTU1MzJiNzk1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU4NzU0ZTM2NmY3YTc3NzMyMTM4NzA3NDZkMzgyNjczNmU1MzUyMjM0MDM5NTU0NzU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY1NzRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU3ODcxNTM3ODRjNzA1NDU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNzM2ZDM5NTk3MzIxMzg1YTIzNmQzOTQwNzg1ODc1NGUzMDZlNGI0ZTQ3NDAzODM3Nzc1NTU0MzM0ODU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTU3MzQwNzkyYjRiNTU1NDM3NDcyMTc5NTI0NzU4NzU1NTQyNGY3NTRkNzM1NTRmNGU3ODZlNTQ1YTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU3OTU1Nzc0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiNTU1Mzc4NGM1NTUzNTY3NDZlNzkyYTc4NDA0ZjI2NzMzNTM4MmI0NzZkMzkzMzQ4NmY3OTc4NDc0MDRiNGU0YzcwNTM1MjRiNzA1MzM3Nzc1NTUzNDA0ODZmNzU0ZTI0NmU3OTU2NzQ2ZTc1MjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNTIyYjc0MjEyNTVhNDg3MDM4MmEyMzZmMjQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzcyMzczMzEzNDRlMjk0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3MDc4NzE1Mzc4NGM3MDU0NTk3YTMwNzU0ZTUzMjEzODRhNGM0MDM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzMDc1NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE0NzZlNWU2ZjQxNTczNDJhNGM3MDU0NTY3OTcwNTM3ODQ2NDAzNDczNzU1NjM3Nzc0NjU2MzgyMzQ2NTYzODMyNzM1NjM2NzMyODU2MzYyMzI4NTYzNzU5NzU1NzM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTMzMmE2ZjUzMzY3YTMwNzU0ZDdhNzAzODJhNzUyMTM4MjY3YTU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkN2E3MDM5NWE3ODZmNzgyYjQyNDA0ZjZmMjg1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc0MDdhNTY0ODZlMzcyYjI0NmYyNTM3NGI1ODc5Nzg3NzU1NGY0ZDc2NTU1MjVhMjM2ZTVlNTY3ODU1NTQzMzQxNDAzNDRlMjQ2ZjI1Mzc0YjU1NTE3ODUxNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzIzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzQ3MDc5Mzc3MjZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzM5MjU1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTM2NmQ1NDU2NzgyMTM4MzI0MTcwNTM1MjRiNDAyNTM3MjMzMTM4MjQ0ODZlNzk3ODIzNmU1ZTU2NzIyMTM4NWE3NjZlNWUzNzQ3NzA0ZjQ5NzMyMTM5NTY3YTZmNGMyMzQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTczNDc3NDc2ZjVlMzM3NDZmN2EzMjQxNTczMjQxNTczMjUzNTY0ODcwNGYyYTQ2NDAzOTVhNGMyMTM4NzA3ODM5MjU3NDc0NmU3OTMzNDU0MDM5NTU0MTIxMjUyYjQ2NmUzODUyNDc0MDU0NTkyYjM4NGI3MDc1MjEzODI2N2EzOTM0Nzc1NzQwNTMzNzc5NTU1NDcwNzQ3MDUzNWE0MTM5MjU1Njc0NmU3NTc0NDY0MDM5NWE0YzIxMzg3MDc4NTczNTQxNTc1NTRmNGQ3MzU1NGY1NTc1NTU3NzI0NDg2ZTc5NzgyMzZlNWU1NTczMjEzODI2NzMyMTM4NWE3NjZlNWUzNzQ3NzA0ZjRlNzk2ZTVlNTU3MzIxNzk1MjQ3NmU3OTc4NDc0MDRiMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNDI2ZjI0MmIyNDZmMjUzNzRiMzkyNTUyNDk2ZjU0NTY0ODcwNzkzNzc3NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NDA3YTU2NDg2ZTM3MmIyNDZmMjUzNzRiNTg3OTc4Nzc1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNTU3ODc4NDg3MDM0NGU3NDZmNzkzNjczNmU3OTJiMjM1NTUzNTIyNDcwNTM3NDQ4NmY3OTc4Mjg0MDM4MzI3MzcwNTM1ZjczNzAzOTVhNzg1NTU0MzM0MTZkMzk1OTczMjEyNTJiNDY2ZTM4NTI0NzQwNGYyNjczMzIyNTJiNDc3MDUzNTI3NjcwNGY0ZTRkMzIzOTQwNzg2ZjVlNDE3MzcwNTM1ZjczNDAyNTM3MjM1NTUzNTI0OTZmNTQ1NjQ4NzA3OTUyNDU1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0ZjczNDE3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NTUwMjM3MzZlMzgzNzRjNmYyNTUyN2E0MDM0MmEyMzQwMzk3NDIzNTg3YTVhNDk2ZTUzNzgyMzU3NGY2ZjczNTY0Yjc4NmU1OTM3MjM1NzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTU2NmU3OTMzNzg3MTUxMzc0YjZmNzkyYjRiMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM2NTM0YTc4MjEzOTVhNzg1NTU0NGU0YjZlNWU0MDQyNDA1MzM2NzMyMTM0NGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0MjY3MzM3Mzk1YTc0NDAyNTM2Mjg1NTRmMmI3NTIxMzgyNjczMzE1NDM3NGM0MDM5NTY0NzIxMzgyNDc4MzE3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3MzQxNzM1NTRmNGQ3MzZkMzgyMTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczNmQzODI2NzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZTc5NTU3NzRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1NTUzNzg0YzU1NTM1MjQ1NmY3OTM3NzQ0MDU0Nzc3MzIxNzkzNzQyNmU3OTZmNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3Nzc1NTUzNDA0ODZmNzU0ZTc1MjEzODI2NDg3MDM4MmE3NTIxMzgyNjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NTU0ZjRkNzM1NTUzNzg3OTU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU1NTM3ODQ3NTU1MzUyNzY3MDUzNzgyNTQwMzcyYjI1NDAzOTU2NDIzOTVlMzM3NDZmMjU0NjRjMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU3OTU1Nzc0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiNTU1Mzc4NGM1NTUzNTI0NTZmNzkzNzc0NDA1NDc3NzMyMTc5Mzc0MjZlNzk2ZjczNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3NTU1MzQwNDg2Zjc1NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGU3ODcxNTM3ODRjNzA1NDU5NzMzMTM0NGU3NjZkNTMzNzc2NmQyNDJiNDI2ZTdhNWEyMzIxMzg3MDRiMjEzODI0NzI2ZjVlMzM3NDcwNTQzNzRjNTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczMjQxNzM1NTRmNGQ3MzZkMzgyMTczNDAzOTc0NDI2ZjVlMzM0YzU1NTM3ODRjNTU1MTJhNDg2ZTc5MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzNzM4MmE3NDIxNzk0YTc4NTU1NDMzNDg1NTUzNWE0MTQwMzg1YTQ0NTU1NDMzNDE0MDM0NGU0YzcwNTM1MjIzNzAzOTU5NzM2ZTI1MjE3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzQ3NTU1MjMzNGI3MTM0NGU3NDQwMjU1MjQyNmU3NTRlNDUyMTM5MzM3ODZmNzUyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNzg3MTUzNzg0YzcwNTQ1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzMyMTM4NGE0YjQwMzg1Mjc3NzEzNDRlNzUyMTM4MmE0NzQwMzgzMjQ3NTU1MTJhNDg1NTUzMmE3ODQwMzgzMjczNzA1MzVmNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3NTRlNzk2ZTVlNTU3MzIxNzk1MjQ3NTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZTc5NTU3NzRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1NTUzNzg0YzU1NTM1Mjc2NzA1Mzc4MjU0MDM0MjY3MzM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTRjNzA1MzUyNGI3MDUzMzc3NzU1NTM0MDQ4NmY3NTRlNzUyMTM4MjY0NzU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1YTZlNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzcwNTU1MDIzNzM3MTQ5NDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDdhNDAzOTc0NDI2ZjVlMzM0YzU2NGM0MTczMzc1NDU2MjQ0MDM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzMDc1NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE0NzZlNWU2ZjQxNTczNDJhNGM3MDU0NTY3OTcwNTM3ODQ2NDAzNDczNzU1NjM3Nzc0NjU2MzgyMzQ2NTYzODMyNzM1NjM2NzMyODU2MzYyMzI4NTYzNzU5NzU1NzM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTMzMmE2ZjUzMzY3YTMwNzU0ZDdhMjE3OTUyNDc1NjRiNDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTM3NGM0MDM5NTY3MjZkMzgzMjdhMzA3NTRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3OTQwNGI2ZTI1MjQ3MjcwMzk1YTc4NmY3NTJhNDI0MDRmNGQ3MzU1NGI0ZTM1NzA1MzJiNGI0MDM0NGUyMzZkNTMzNjczNzAzOTVhNzg2Zjc1NGU1NjMzNGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjMjEzOTQwNzgzOTI1MjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDUyMmI3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiNzM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzM3NTM3NDRiNDAzODUyNzc1NzU0MzM3NDZmNzk3MDc4NzA1MDI0NDY2ZTI1MmE0MjcwNTMyYjRiMzkyNTUyNzYyMTI1MmIyNDZlN2EzMjQ1NTU1MzUyNGI0MDVlNTkyYjU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU4NGY3NzQyNTg3YTVhMjMyMTM5NTYyMzU3NGY3NzU3NGY3NTU5NzM1ODM0MjM0NjU1NTEyYTc4NzA0YjRlNzk3MDM4MmE3NjcwNTM3ODQ4NmU3YTU5NzM0MDc5MmI0YjU1NGYyYjI1NDAzOTU2NDI1NTUzNWE0ODZlMzgyNDc0NmU3OTMyNzM1ODM0MjM0NjRmNzkzMzc4NDA3NTRlNzk2ZTVlNTY0NjIxMzkzMzcyNzA1Mzc4NDY0MDM3MmI3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc1NzQ0YzQwMzg1YTQ4NmU3OTMzNGM1NzM1NDE1NzU1NGY0ZDczNTU1Mzc0NDg3MDM5NTY0YzU1NTAyMzczNmQzODJhMjM1NzU0NWE3ODIxMjUyYjQ3NDA1NDU5NzM1ODRiNWY3MzU5NGMyMTQ5NTk0Zjc3NTc1NTRmNGQ3MzU1NTMyNDQyNmU3YTM3MjM0MDM5NTk3MzMxMzQ0ZTQyNmU3YTMyNDE1NzU0NWE3ODIxMjUyYjQ3NDA1NDU5NzM1NjM0NGQ0YzVhNzY0ZDQ5NTczNDRkNDg1ODRiNGQyNTU5NGY3NzU3NTU0ZjRkNzM1NTU0NWE3ODIxMjUyYjQ3NDA1NDU5NzMzMTM0NGU0MjZlN2EzMjQxNmYyNTM3NzY2ZTI1MmE3NzZmNGI0ZDc4NTU1MDIxNDk1NzMyNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTMyMTc1NzEyNTc0NDg3MDM5NTY0YzMwNzY0ZDRiNzIzNTQyMjk2ZTM4Nzg0NzcwMzkzMzc4NmY0YzQxNDk1OTdhMjMyODcxNWU1YTc4MjEyNTJiNDc0MDU0NTkyODU5NTA1NjJiNTU3MzQxNTc0MDUzMzc3OTU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3MjcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3Mzk1ZTMzNDE2Zjc5Mzc3NDQwNGY3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjVhNmUyNTJhNDI3MDUzMmI0YjU1NTQ0MDc4NmY3OTc4Nzk2ZDM4NWE3NDcwNTM3ODQ4NmU3NTRlNGM3MDUzNTIyMzcwMzk1OTczNmQzODI2NzMyMTM0NGU0YzQwMzk0ZTc0NmY3OTUyMjM0MDM0NGUyMzZkNTQ1Njc4MjEzODMyNDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlNDUyMTM5NWEyMzM5NWU1YTIzMjEzOTMzMjQ2ZjRiNGQyYjU1NTEyYTQ4NmU3OTM2NTc1NTRmNGQ3MzU1NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjczMzEzNDRlMjM2ZDM4MjQ3ODU4N2EzMzQyNmUzODM2NDE1NzMyNDE3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3NjU1NTI1YTIzNmU1ZTU2Nzg1NTU0MzM0MTZmNzkzNzc0NDA0ZjRlNDI2ZTc5NDA0ODRmNzU0ZDczNTU0ZjRlNzQyMTVlMzM0MjcwNzkzNzcyNzA3OTM3NGI2ZDM3MmIyMzIxMzk1YTQ0NmYyNDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNzIzNzMzMTM0NGUyOTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU2NWUzMzQxNmY3OTM3NzQ0MDRmNmYyODU1NTIzMzQxNmY3OTM3NzQ0MDRmNzQyMzIxMzk1NjdhNDAzOTMyMmI2ZTM4MmI0NzZkMzkzMzQ4NmY3ODJiMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MmE3MjcwNTM3NDRiNDAzODUyNzc1ODRmNGU3NDZmNzk3MDRjMzEzNDc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzMyMTI1NzQ3NDcwNTIyYjQyNDA0Zjc3NDI1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjRjNDE3MzIxMjU3NDc0NzA1MjJiNDI0MDRmNDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3YTZmNWUzMzc0NmY3YTMzNzI3MDUzNzg0NjQwMzQ2ZjI4NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NjVlMzMyYTZmNTMzNjdhMzA3NTRkN2E3MDc5Mzc0YjZkMzQ2ZjczNTU0YjRlNGU0MDUzMzI3MzcwNTQ3ODQ5NDAzNDRlNzk2ZTVlNTU3MzZlNTM3ODRjNzA1Mzc4NDc0MDQ5NDE3MzU1NGY0ZDczNzIzMjQxNTc1NTRmNGQ3MzU1NTQ3MDQxNmQzODRhNzg1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NTUzNzg0NzU1NTM1Mjc2NzA1Mzc4MjU0MDM3MmIyNTQwMzk1NjQyMzk1ZTMzNzQ2ZjI1NDY0YzU1NTM1MjQ3NDA0ZjRlNzQyMTVlMzM0MjcwNzkzNzcyNzA3OTM3NGI2ZDM3MmIyMzIxMzk1YTQ0NmYyNDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNzI0NmU1NjVlMzM0MTZmNzkzNzc0NDA0ZjcwNzA1ODc5Nzg0YzM5MjU1MjQ1NmQzOTQwNzg1NzRmNzcyODU1NGY1OTczMzIyNTc0NzgyMTI1NDU3MzZkMzgyMTczNzA1Mzc0NGI0MDM4NTI3NzU1NTM3ODRjNTU1NDVhMjM2ZDM4NGE0NTU1NTM1Mjc2NzA1Mzc4MjU0MDMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5Mzc0YzU1NTAyMzczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3NDAyNTM3MjM1NzUyMzMzNDMzMzYyYTUxMzQ1MTM3MzQzNTI0MmIzNzM2Nzc0OTQ1NTU1Mzc0NzgyMTM4MzM3ODZmN2E1OTJiMzc1MjU2NTIzNTc3MzM1NTMzMzc1NjMxMzkyMzc0NTIzMjM2MzM1MjM2Nzg1OTQ1NTU1NDRlNzQ2Zjc5NTI0NjZmNGMyNDI5NTY1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NTY0YzQxNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1ODRmNGUyMzZkMzgyNDc4NmU1ZTM3MjMzMTM1NTE0OTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzcyMTM5MzM3NDU1NTAyMzczNmY3OTM3NGM1ODc5NDI0YzZlMjUyNjQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyNDZmMjUzNzRiMzkyNTc4NDc0MDc5NWY3MzMxMzQ0ZTc3MjEzOTMzNzQ1ODc5NzA3ODcwNGY3MzdhNmY1NDU2Nzg3MDc5Nzg3ODcwNGI2ZjQ1NTU1NDQ2MmI1NzM0MmE3YTQwMzkzMjQxNTY1ZTM3NGM0MDM5NTY3MjZkMzgyYTc5NmU0YjZmNDU1NTU0NDYyYjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjU0MDM5NTY0MjQwNzk3ODc4NDA0ZjRkMmI1NTU0Mzc0YzQwMzk1NjcyNmQzODJhNzk2ZTRiMmE3YTQwMzkzMjQxNTYyNTc4NGMzOTVlNDA3ODZmNzk3ODc5NmQzODM3Nzc1NjRiNzc1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTU0NDA3ODZmNzk3ODc5NmQzODM3Nzc1NTUzNzg0YzU1NTEyYTQ4NmU3OTM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmMjUzNzQ3NDA1MjJiNDY0MDM5NWE0YzIxMzg3MDc4NTc1MzVhNDEyMTM5MzM3MjZkMzgzMjJiMjEyNTc0NzQ3MDUyMmI0MjQwNGY0OTczNzA1MzM3MjY3MDUwMjQ3OTU1Nzc1YTQ4NzAzODRhNzc1NTUzMmE0ODcwNGY0ZTc3NDAzOTMzNzg2Zjc5MjQ0MjZlNzkzNjczNzA3OTM3NGI2ZDM4NDA0MjIxMjU1MjIzNmQzODJiNDc1NTU0NWEyMzIxMzkzMzI0NmY0YjRlNzk2ZTVlNTU3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NGI0MDM4NTI0NDU1NGY1OTczMzMzOTc0NDI3MDRmNGU0NjZlMjUyYTQyNzA1MzJiNGI2ZDM4MmE3YTU1NTM3ODc5NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZTc2MjEzODJhNDc2ZTVlMzI3MzIxNzkzNjczNDA1MzM3MjM0MDM5NTY0NjZkMzgyYTc4NDA0ZDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNzA3OTM3NGI2ZDM4NDA0MjQwMzgzMjczNTUzNTIzNzM2ZTUzNTI0YzcwNTIyYjRjNzA1MzUyMjM3MDM5NTkyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNzAzOTU5NzMzMTM0NGQ3YTM3NzkzNzRiNmQzODQwNDI0MDM4MzI3YTU1NTM3ODc5NTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3NTU1MzM3NDU2ZjI1MzY3MzU2MjMyYTQ4NzA0ZjRlMzg0MDM5NTY0MjQwNzk3ODc4NDA0ZjZmNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YzQwMzgyYTc3MzkyNTI0Nzg2ZjVlNWE3NDQwMjUzNjQxMjEyNTc0NzQ3MDUyMmI0MjQwNTAyNDc2NmQ1MzUyMjMzOTI1Nzg3NzU4NGY0ZTIzNDAzOTc0MjMzMTM4MjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmY1ZTMzNzQ3MDU0Mzc0YzU1NTM1YTQxMjEzODJhN2E0MDM4MzIyODU1NTQ0NjRjNzA1MzUyMjM3MDM5NWEyYjU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0YTc0NmY1ZTMzNzI2ZjVlMzM3NDcwNTQzNzRjNTU1MDIzNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNTc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNzQ2ZjU0NWE3ODQwNGY0ZDJiNTU1MzQwNDg2Zjc5MjQ3NDcwNTIyYjIzNmQzODI0NzgzOTI1MzMyNDZmNzk1MjIzNmQzODJiNDc1NzU0MzM0MjZlMzgzNjQ3NzA1Mzc4NDY0MDM0NzM0MjU1NGYyMzczNmY1ZTMzNzQ2ZjdhMzM3MjcwNTM3ODQ2NDAzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YzQwMzgyYTc3MzkyNTI0Nzg2ZjVlNWE3NDQwMjUzNjQxMjEyNTc0NzQ3MDUyMmI0MjQwNTAyNDc2NmQ1MzUyMjMzOTI1Nzg3NzU4NGY0ZTIzNDAzOTc0MjMzMTM4MjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzM2ZTc5MmI1ZTU1NTQ0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzU1NTQ3MDQyNzA1Mzc0NDI2ZTc1NGUyOTQwMzg0YTc0NmY1NDVhNzg0MDU0MjM3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxN2E1Njc4MjEzODQ1NzM1NTRiNGU1MjcxNTM3ODIzNTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM2ZTI1MmE3NjQwMzQ0ZTI1NDAzOTU2NDI0MDc5Nzg3ODQwNGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDRmNGU0YjQwMzk1MjI0NDAzOTVhMjM2ZjRiMmE3ODcxNTM1YTc4NmY1NDMzNDI2ZTI1MmE0YzU4Nzg1Njc4NmYzOTM3Nzg2ZjVlMzM1MjcxNTM1YTc4NmY1NDMzNDI2ZTI1MjY3MzIxMzk1OTczNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTVhNzg2ZTc5MzM3MjZlMzgzNzRjNmYyNTUyN2E0MDM0NzQ3NjZkNTM1MjIzMzkyNTc4NzczMTM4NWE0MTIxMzkzMzcyNmQzODMyNDU1NTU0MzM3ODcxNTQzMjJiNDA3NTU2NTI2ZjdhNTY0ODZmNzU0ZTc2NmQ1MzM3NzY2ZDI1Nzg0NzQwNGI0ZTRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRkNDE2ZTc5MzcyMzcwMjUyYjRiNmQ0YjRlNDI2ZjVlNWEyNDQwMzQ3NzI4NTU1NDQ2Nzg3MjM0NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxMzcyNjIxMjUzNzQ5NzA1Mzc4NDg2ZTc1NGU3NDZmNGI0ZTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmYyNTM3NDc0MDUyMmI0NjQwMzk1YTRjMjEzODcwNzg1NzUzNWE0MTIxMzkzMzcyNmQzODMyMmIyMTI1NzQ3NDcwNTIyYjQyNDA0ZjQ5NzM3MDUzMzcyNjcwNTAyNDc5NTU3NzM3NGI2Zjc5MmI0YjU1NTM1YTQxNDAzODVhNDQ2ZDM4MmE3YTU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiMzA3NTRlMjk0MDM5MjM3NTU3MzI0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNmQzODI0Nzg1ODdhNWE0NTQwMzgzNzQ5NTc1MDM2NDI1NTRmNTk3MzMyMjU3NDc4MjEyNTQ1NzM0MDM5NDA3ODZmN2E3NzczNWEzNDRlNGM0MDM4NWE0ODZlNzkzMzRjNTU1MzQwNDg2Zjc1NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczNmY1ZTMzNzQ3MDU0Mzc0YzRmNzM0MTczNTU0ZjRkNzM1NTRiNGU1MDZlNTMzNzc0NmU3NTRlMjQ2ZjRmNGUyMzIxMzk1YTQ0NTU1MzUyNzk3MDUzMzc0YjU1NTM0YTQ4NmU1ZTRkNzM0MDc5Nzg0NzZkMzk1YTQxNDAzOTU5NzM1NzUzMzY0NzQwNGIyNjQ1NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjczNzA3OTM3NGI2ZDM4NDA0MjQwMzgzMjczNmU1ZTU1NzM0MDM5NTY0YjZlNWU1NTQyNGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZTQyNmU3NTRlNzQyMTVlMzM0MjcwNzkzNzcyNzA3OTM3NGI2ZDM3MmIyMzIxMzk1YTQ0NmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzc0MDM4NDk3MzIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNWE2ZTcwMzk1YTc4NmY3OTJhNzQ2ZTM4Mzc3MDRmNzM0MTU3MzI1MzU2NDg3MDRmMmE0NjQwMzk1YTRjMjEzODcwNzgzOTI1NzQ3NDZlNzkzMzQ1NDAzOTU1NDEyMTI1MmI0NjZlMzg1MjQ3NDA1NDU5MmIzODRiNzAyNTQwMzk1NjQyNTYyNDIzNDI0Zjc5MzM3ODQwNzU0ZTI1NDAzOTU2NDIzOTI1NWE0ODZlMzgyNDc0NmU3OTMyNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDc3Mjg0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU2MzU3MDUzNTI0YjcwNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNTU1MzUyNDc1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM0MDc5MmI0YjU1NTQ0MDc4NmY3OTc4Nzk2ZDM4NWE3NDcwNTM3ODQ4NmU3NTI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmE0ODcwNGY0ZTQyNmYyNDJiMjQ2ZjI1Mzc0YjM5MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1Nzg3ODQ4NzAzNDRlNzQ2Zjc5MzY3MzZlNzkyYjIzNTU1MzUyMjQ3MDUzNzQ0ODZmNzk3ODI4NDAzODMyNzM3MDUzNWY3MzcwMzk1YTc4NTU1NDMzNDE2ZDM5NTk3MzIxMjUyYjQ2NmUzODUyNDc0MDRmMjY3MzMyMjUyYjQ3NzA1MzUyNzY3MDRmNGU0ZDMyMzk0MDc4NmY1ZTQxNzM3MDUzNWY3MzQwMjUzNzIzNTU1MzUyNDk2ZjU0NTY0ODcwNzk1MjQ1NTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3MzQxNzM1NTRmNGQ3MzcwNTQ1NjJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTU1MDIzNzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhMjM0MDM5NzQyMzU4N2E1YTQ5NmU1Mzc4MjM1NzRmNmY3MzU2NGI3ODZlNTkzNzIzNDc2ZTUzMmI1ZTQwMzk1NTQxNTczMjQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxNzg0NzQwNTMzNzI2MzMzOTU2NGI2ZTVlNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU0ZjU2Mzc2ZjI1NTI3YTQwMzU0MTczNTg1ZTQwNzg2Zjc5Nzc3MzMxNTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODMxNzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY3MzZkMzgyNjczMjEzODVhMjM2ZDM5NDA3ODM5NWU0MDc4NmY3OTc4NzI3MDUzNTI0YzZkNWU1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyMzg0YTRiNDAzODUyNzc3MTM0NGU0NjZlMjUyYTQyNzA1MzJiNGI2ZDM4MmE3YTU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiNTU1MzQwNDg2Zjc1NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NTU0ZjRkNzM1NTUzNzg3OTU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU1NTM3ODQ3NTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzNmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU3NDZlNTQ1Njc4MjEzODMzMmE1NTUzNTY3ODZkMzgyYTdhNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA0ZjRlNzk2ZTVlNTU3MzIxNzk1MjQ3NTg1ZTM3NDcyMTc5NTI0NzU4NzU0ZTMyNmU1MzM3NzQ2ZjI1MzY3MzZmNWUzMzQ4NmY0ZjRlMjM2ZDUzNTIyMzU1NTM0MDQyNmY3YTVhMjM1NTUzNzg3OTU1NTQ3ODQ4NzAzNDRlNWUyMTM4MmEyMzU1NTQzMzQ4NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NTczNzA3OTM3NGI2ZDM4NDA0MjIxMjU1MjIzNmQzODJiNDc1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0ZjczNDE3MzU1NGY0ZDczNTU0YjRlNTA2ZDUzMzc3NjZkNGI0ZTQyNDA3NTRlNzQyMTI1NWE0ODcwMzgyYTIzNTU1Mzc4NGM1NTUzNTY3NDZlNzkyYTc4NDA0ZjRlNzU0MDM4NDA0ODZmNzkzNjczNmY1ZTMzNzQ2ZjdhMzM0MjZlNzk2ZjczNzA3OTM3NGI2ZDM4NDA0MjIxMjU1MjIzNmQzODJiNDc1NTUzMjQ0ODZlNzk3ODIzNmU1ZTU2NDI2ZTc5NmY1NzU1NGY0ZDczNTU1MzM3MjY2ZDM5NWEyMzZmNGI0ZDJiNTU1MzVhNDE0MDM4NWE0NDM5MjU3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzcyYjRjNzA1MzUyMjM3MDM5NTk0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU3ODcxNTM3ODRjNzA1NDU5NzM2ZDM5NTk3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjM3NmU3OTUyNzU2ZTUzMzY3MzcwNTM1ZjczMjEyNTc0NzgyMTI1NDU3MzcwNTM3NDc4NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZTQ4NDA3NTRlNGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0MjY3MzM3NTQ1NjJhNTU1MzUyN2EyMTM4Nzg0NzU1NTM0YTc0NzA1MzM3NGI1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0Zjc1NGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNzg3MTUzNzg0YzcwNTQ1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzMyMTM4NGE0YjQwMzg1Mjc3NzEzNDRlNzUyMTM4MmE0NzQwMzgzMjQ3NTU1MTVhNzQ2ZTc1NzAyMzU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTU3MzQwNzkyYjRiNTU1NDQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc1MjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU1NDMzNGI3MTM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTE3ODQ3NmQzOTMzNDIyMTM4NDk3MzIxMjU3NDc4MjEyNTQ1NzM0MDc5MmI0YjU1NTM1YTI0NmY3YTU2Nzg2ZTdhMzI3MzZmNWUzMzc0NzA1NDM3NGM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5Mzc0YzU1NTAyMzczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3NDAyNTM3MjM1NzUyMzMzNDMzMzYyYTUxMzQ1MTM3MzQzNTI0MmIzNzM2Nzc0OTQ1NTU1Mzc0NzgyMTM4MzM3ODZmN2E1OTJiMzc1MjU2NTIzNTc3MzM1NTMzMzc1NjMxMzkyMzc0NTIzMjM2MzM1MjM2Nzg1OTQ1NTU1NDRlNzQ2Zjc5NTI0NjZmNGMyNDI5NTY1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NTY0YzQxNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1ODRmNGUyMzZkMzgyNDc4NmU1ZTM3MjMzMTM1NTE0OTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzMzc0NzA1MzUxNzMzMTM0NGU0YjQwMzk1OTQ3NmQ3YTVhNDg2ZTc1NzM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNzkzNzRiNmQzODQwNDI0MDM4MzI3MzMxMzQ0ZTc3MjEzOTMzNzQ1ODc5NzA3ODcwNGY3MzdhNmY1NDU2Nzg3MDc5Nzg3ODcwNGI2ZjQ1NTU1NDQ2MmI1NzM0MmE3YTQwMzkzMjQxNTY1ZTM3NGM0MDM5NTY3MjZkMzgyYTc5NmU0YjZmNDU1NTU0NDYyYjU3MzQyYTdhNDAzOTMyNDE1NjI1Nzg0YzM5NWU0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzU2NGI3NzU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNzM2ZDM5NTk3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzMjI1MmIyNDZlNTMzMjczNmU3OTJiMjM1NTU0NTY3ODcwNTQ1NjQyNDAzOTQwNzg1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzU0ZTRjNzA1MzUyMjM3MDM5NTk3MzQwNzkyYjRiNTU1MTRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlMjU0MDM5NTY0MjQwNzk3ODc4NDA1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzZkMzk1OTczMjEzODRhNGI0MDM4NTI3NzcxMzQ0ZTI1NDAzOTU2NDI0MDc5Nzg3ODQwNGYyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGUzNTcwNTM1MjRiNzA0ZjRlNDY2ZTI1MmE0MjcwNTMyYjRiNmQzODJhN2E1NTUzNzg0NzU1NTM1MTczNmU3OTM3NWU1NTU0MzM0MTZmNzkzNzc0NDA0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNDE2Zjc5Mzc3NDQwNGY0ZDJiNTU1MjMzNDE2Zjc5Mzc3NDQwNGY3NDIzMjEzOTU2N2E0MDM5MzIyYjZlMzgyYjQ3NmQzOTMzNDg2Zjc4MmIyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyYTcyNzA1Mzc0NGI0MDM4NTI3NzU4NGY0ZTc0NmY3OTcwNGMzMTM0NzQyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NDk3MzZlMzgzNzRjNmYyNTUyN2E0MDM0MmE3NjZkNTM1MjIzNTg3OTc4Nzc1NzM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyMzZkNTQ1Njc4MjEzODMyNDc0MDUzNTI3ODZlMzgyYjQ3NTU1MDIzNzMzNzU0NTYyNDQwMzQ0ZDc2NTU1MTUyNDU2ZTUzMmI1ZTU1NTQzMzQxNDAzNDRlNDYyMTM4Nzg0NzU1NTQ0ZTRiNmUyNTcwNGIyMTM4MjM3MzcwNTM1ZjczNDAzOTc0NDI3MDRmNGU3ODcwNzkzNzQ3NTU1Mzc4Nzk1NTU0MzM0MTZmNzkzNzc0NDA1NDU5NzMyMTM5NTY3ODU1NTQ1NjI0NmU3OTJhNDI2ZTc5NmY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyMzZkNTQ1Njc4MjEzODMyNDc2ZjVlMzM3NDZmN2EzMjQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzUyNzY3MDUzNzgyNTQwMzcyYjI1NDAzOTU2NDIzOTVlMzM3NDZmMjU0NjRjMzg1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4MzkzNDRkMmI1NTU0NDU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTY1ZTMzNDE2Zjc5Mzc3NDQwNGY2ZjI4NTU1NDMzNDE2Zjc5Mzc3NDQwNGY0OTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NjI1NWE0MTIxMzkzMzcyNmQzODMyN2EzMDc1NGU0NjQwMzk1YTRjMjEzODcwNzg1ODc5NWE0MTIxMzkzMjQ3NmQzODMyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3MDRjNzA1MzUyNGI3MDUyMmIyMzZkMzgyNDc4NTY0YzQxNzM3MDUzNzg0NjQwMzQyYTIzNmQzODI0Nzg1NzRmNzc0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjcwMjQ2ZjI1Mzc0YjM5MjU3ODc3NTY0YzQxNzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzk2Zjc5MmI0NjM5NWUzNzRjNDAzOTU1NDc2ZDM4MzI0NTU1NGY1OTczMzY1ZTMzNDg2Zjc5MzY3MzcwMzk1YTc4NmY3NTRlNTYzMzRmNGU3OTZlNWU1NTczNmY1ZTMzNDg2ZjU0NGU0MjZlNzk2ZjQ4NmU1Mzc4NGM3MDUzNzg0NzQwNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkN2E3MDU0Nzg0OTQwMzQ2ZjI4NTU0ZjcwMjU0MDM5NTY0MjU2NDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTVhNmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNTU1NDVhMjMyMTM5NTYyMzQwMzgzMjczNDA3OTJiNGI1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzUyNjc1NTczMjQxNTc1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDRmNGU0YjQwMzk1MjI0NDAzOTVhMjM2ZjRiMmE3ODcxNTM1YTc4NmY1NDMzNDI2ZTI1MmE0YzU4Nzg1Njc4NmYzOTM3Nzg2ZjVlMzM1MjcxNTM1YTc4NmY1NDMzNDI2ZTI1MjY3MzIxMzk1OTczNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjUyNmY3YTU2NDg2Zjc1NGU3OTQwMzkzMzc2NmQ1Mzc4NDc0MDRiNGU0MjZlNzk0MDQ4NTU1MzQwNDg2Zjc1NGU0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZDQxNmU3OTM3MjM3MDI1MmI0YjZkNGI0ZTQyNmY1ZTVhMjQ0MDM0NzcyODU1NTQ0Njc4NzIzNDU1NDI0Zjc1NGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzMzMzk3NDc2NDAzOTRlMjM2ZDM4MmI0NzU1NTM1MjRjNTU1MzM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzMzOTU2NGI2ZTVlNTU3MzQwNzkzNzIzMjEyNTc0NDI2ZTc5NmY3MzZkMzgyYTc5NmU0YjRlNzk2ZTVlNTU3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzI4NTU1NDQ2Nzg3MjM0NTU0MjRmNzU1OTczNTgzNDIzNDY1NTUxMzc0NzQwNGY0ZTQ3NDAzOTZmNzM0MDdhMzc0NzIxNWUzMzQyNmUyNTJhNGM1NTUzNDA0ODZmNzU0ZDQ4NzA3OTM3NGI2ZDM0NGU3NjZlMjUyNDQ2MjEzODJhNzc1NTRmMjM0NjU4MzI0MTU3NGY3NzRlNzU2ZTVlMzI0NzZlMzgzNzRjNmYyNTUyN2E0MDM3MmI0MTIxMzgyYTc3NmU1MzM3NGI1NzUzNWE0ODZlMzgyNDc0NmU3OTMzNGMzMTM3NDU3YTZmNWUzMzQ4NmY0ZjcwNzA1NzMyNDI3NzQwMzgyMTczNmY1ZTMzNDg2ZjRmNzQ0NjQwMzk1YTRjMjEzODcwNzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc4NWEyMzZlNWU0ZDczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0YjRlNzQ2ZTc1NGU1NjZlN2E1YTIzMjEzODcwNGIyMTM4MjM3MzIxMzg1YTc2NmU1ZTM3NDc3MDRmNGQ0MTQwNzkyYjRiNTU1MzU2NzQ2ZTc1MmIyNDZlNzk1Njc0NmU3NTRlNDg2Zjc1NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjQyNTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTc5MmIyMzU1NTM3ODRjMzk1ZTM3NGM0MDM5NTY3MjIxMzk0ZTQ5NmY3OTJiMjU0MDM4MzI0MTZlMzgzNzRjNmYyNTUyN2E0MDM0MmE3OTZmNzkyYjQ2Mzk1ZTM3NGM0MDM5NTU0NzZkMzgzMjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM4MzgyYjI0NTU1MzUyNGI0MDM0NGU0NzZlNWUzMjczMjEzOTM3MjM2ZDUzMmI0YjZkMzk0Mjc4NDA0ZjRlMjM2ZTRiNGUyNDZmMjUzNjczNzA1Mzc0NDI2ZjRiNGU3NjZlMjUyNDQ2MjEzODJhNzc1ODc1NGU1MDZlMjUyYTIzMjEzODVhMjM1NTUxNGU0ZTcwNzkzNzRjNzE3NTRlMjM2ZTRiNGU3YTQwMzkzMjczMjEzOTRlNDk2Zjc5MmIyNTIxMzg0OTQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGUyMzZmN2E3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczMzEzNDRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3YTMzNzg3MTU0MzI0NzZmNWU0ZTQ1NmQzOTMyNDE1NjRiNGQ3YTU3Mzc0NTRhMzkzMjQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxNzg0NzQwNTMzNzI2MzMzOTU2NGI2ZTVlNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU0ZjU2MzI2ZTUzMzc3NDZmMjUzNjczNmY1NDU2NDg3MDc5Nzg3NzQwMzQ0ZTc0NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg3NTRlMzc2ZjI1NTI3YTQwMzU0MTczNTg1ZTVhMjM2ZTVlNGQ3MzMxNTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODMxNzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTQ1YTIzNmU1ZTRlNDk0MDM4MzI3MzMxMzQ0ZTUzMjEzODRhNGM0MDMyNDE3MzU1NGY0ZDczNTU0YjRlNTA2ZDUzMzc3NjZkNGI0ZTc1MjEzODI2NDg3MDM4MmE3NTIxMzgyNjczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0OTQxNzM1NTRmNGQ3MzZkMzgyMTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczNmQzODI2NzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNTIyYjc0MjEyNTVhNDg3MDM4MmEyMzZmMjQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzcyMzQ3NDAyNTM3MjM1NzRmNzAyNDZmMjUzNzRiMzkyNTc4Nzc1NjRiNzc3MzMxMzUyMzczNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNzM2ZTVlNTU3MzZlMzgzNzRjNmYyNTUyN2E0MDM0MmE3OTZmNzkyYjQ2Mzk1ZTM3NGM0MDM5NTU0NzZkMzgzMjczNmQzODI2NzMzMjM2MzM1YTM0MzYyYTcyMzQzNjMzMzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTQ3NmY1MzJiNDk1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjMjEzOTQwNzgzOTI1MjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDUyMmI3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiNzM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU3OTU1NzcyNDQ4NmU3OTc4MjM2ZTVlNTY0MjZlNzk2ZjczNDA3OTJiNGI1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU1NGY3NDc1MjEzODI2NDg3MDM4MmE3NTIxMzgyNjQyNTU1Mzc0NzQ2ZjRiNGU3NTQwMzgzNzQ3NTU1NDVhMjM2ZTVlNGU0OTQwMzgzMjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzQ4NmY1NDRlNzg0MDRmNGQyYjU1NTIzMzRiNzAzODM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjQwNmU1ZTM2NzMyMTI1NTI0NzU1NTMyYjQ3NmU1NDc3NzM2ZjVlMzM0ODZmNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNTU1MzUyNzYyMTI1MmIyNDZlN2EzMzRjNTU1NDMzNDEyMTM5MzI3MzcxMzgyYjI0NTU1NDVhMjMyMTM5NTYyMzQwMzgzMjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTRmNTk3MzMzMzk3NDQyNzA0ZjRlNDI0MDc1NGU0NzZlNWUzMjczMjEzOTM3MjM2ZDUzMmI0YjZkMzk0Mjc4NDA0ZjRlMjM2ZTRiNGU0YzcwNTMyYjQ5NTU1NDMzNDE2ZDM5NTk3MzZmNWU0ZTc4MjEyNTc4Nzk2ZDM4NTk3MzcwNTM1MjRjNmQ0OTQxNTc1NTRmNGQ3MzU1NGY1OTczMzIyNTc0NzgyMTI1NDU3MzcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNTc1NTRmNGQ3MzU1NTM3ODc5NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTU1Mzc4NDc1NTUzNTI3NjcwNTM3ODI1NDAzNzJiMjU0MDM5NTY0MjM5NWUzMzc0NmYyNTQ2NGMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTM1Mjc2NzA1Mzc4MjU0MDM3MmIyNTQwMzk1NjQyMzk1ZTMzNzQ2ZjI1NDY0YzM4NWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODM5MzQyYTdhNDAzOTMyNDE1NjVlMzc0YzQwMzk1NjcyNmQzODMyN2E1NzM0NGQyYjMxMzQ0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0ZjRlNDg2Zjc1NGU0NjQwMzk1YTRjMjEzODcwNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc1MmE0MjQwNGY0ZTQyNmU3NTRlNGUzMzUxMjQ1NjM1NzgyYjU2MzM1MjU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1OTczMzU3OTVmNzM0MDM5NzQ0OTZlNTM3ODc2NmQzOTMyNzM1NjI1NWE3NDZlNzk1YTc4NmU0ZjZmNzM0MDc5MmI0YjU1NTIzMzQxNmY3OTM3NzQ0MDRmNDk3MzIxN2EzNzIzNTU1NDU2Nzg2ZTM4MmIyNTZkMzgyYTdhNTU1MzQwNGI2ZTI1MjM3MzIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNTk3MzcwMjU3ODQ1NmU0ZjRlNGM3MDUzMmI0OTU1NTQzMzQxNDAzNDRlNDU2ZTI1MmI0OTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzMzNzg2ZTRmNGU3NDIxNWUzMzQyNzA3OTM3NzI3MDc5Mzc0YjZkMzcyYjIzMjEzOTVhNDQ2ZjI0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM3MjM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTc5NmU1ZTU1NzMzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzU3NTQ0MDc4NmY3OTc4Nzk2ZDM4NWE3NDcwNTM3ODQ4NmU3NTc3NzM2ZDUzNTI0YzU1NTM1Njc4NDAzODI2NzM2ZjVlMzM0ODZmNTQ0ZTc4NDA0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNzA1MzJiNDk2ZjUzMzc3NzU1NTAyMzczMzc1NDU2MjQ0MDMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZmMjUzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZTc5NTU3ODc4NDg3MDM0NGU3NjIxMzgyNjczNmUyNTJhNDU3MTM0NGU0YzcwNTMyYjQ5NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzMyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NzM3MDUzNzQ3NDcwNGY0ZTJhNmU1ZTM2NzM2ZjVlMzM3NDZmN2EzMzc4NDA0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzU1NGI0ZTUyNzE1Mzc4MjM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNzQ3MDM5MzM0MTZlNWU1NjQyNzE3OTM3Nzc1NTU0MzM0ODU1NTQ1YTIzNmU1ZTRkNzM3MDUzNzQ0MjZmNGI0ZTRjNmY1MzM3NzY2ZDM4NDA0MjIxNGI0ZTIzMjEzOTVhNDQ0ZjczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTc5MmIyMzU1NTQ1YTIzNmU1ZTRlNDk0MDM4MzIyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzZkMzk1OTczNmU3OTJiMjM1NTUzNTY3ODZkMzgyYTdhNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA0ZjRlNzU3MTM0NGUyYTZlNWUzNjQ3NTU3NTc3NTc0ZjczNDI0ZDIxNzkyYjIzNTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNzcyNmQ1MzUyNDc0MDUzNGE3ODZmNzU3NDc2NmUyNTI0NDYyMTM4MmE3NzZmNGMyNDZlNTYyNTRhNDI2ZjVlMzI3YTM5MzQ3NzU3NDA1MzM3Nzk1NTUzMjQ0ODZlNzk3ODIzNmU1ZTU2NzI2ZTUzNzg0YzcwNGY3NDQ2NDAzOTVhNGMyMTM4NzA3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzc0YTQyNmY1ZTMyNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3Nzc1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNGM1NTUzNDA0ODZmNzU0ZTIzNmQ1MzM2NzM2ZjVlNGU3ODIxMjU3ODc5NmQzODU5NzM3MDM5NWE3ODZmNzUyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNDg3MDRmNGU0MjZmMjQyYjI0NmYyNTM3NGIzOTI1NTI0OTZmNTQ1NjQ4NzA3OTM3Nzc1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc0MDdhNTY0ODZlMzcyYjI0NmYyNTM3NGI1ODc5Nzg3NzU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4Nzg0ODcwMzQ0ZTc0NmY3OTM2NzM2ZTc5MmIyMzU1NTM1MjI0NzA1Mzc0NDg2Zjc5NzgyODQwMzgzMjczNzA1MzVmNzM3MDM5NWE3ODU1NTQzMzQxNmQzOTU5NzMyMTI1MmI0NjZlMzg1MjQ3NDA0ZjI2NzMzMjI1MmI0NzcwNTM1Mjc2NzA0ZjRlNGQzMjM5NDA3ODZmNWU0MTczNzA1MzVmNzM0MDI1MzcyMzU1NTM1MjQ5NmY1NDU2NDg3MDc5NTI0NTU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM1NTRiNGU1MzZkMzg0YTIzNDAzOTU1NzMyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3Nzc1NTUzNTYyYTU1NTQzMzQxNmQzOTU5NzM2ZjVlNGU3ODIxMjU3ODc5NmQzODU5NzM3MDM5NWE3ODZmNzU0ZTc5NmU1ZTU1NzMyMTc5NTI0NzU4NWUzNzQ3MjE3OTUyNDc0Zjc1NGQ3MzU1NGY0ZTI0NmYyNTM3NGIzOTI1MjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDUyMmI3NTIxMzgyYTcyNzAzODJhNzUyMTM4MjY3MzMxMzQ0ZTI5NmQ0YzQxNzM3MDc1NGU3OTZlNWU1NTczNmQ0YjQ5NzM3MDc1NGU0MjZlNzU0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTQ3NmQzOTMzNzg2ZTM5NTk0MTU3MzQ0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTQyNmYyNTc4NDc2ZjVlMzM3NDZlNzk1YTc4NTc1NDIxNDU1NTUzMzM0MjIxNWUzMjQyNTU1MzUyNDc0MDRmNGUyNTU4Nzk3MDc4NzA0ZjczN2E3MDM5NWE3ODZmNzgyYjQyNDA0ZjZmNDI1NTUwMjMyYjU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NzIzMjQxNTc1NTRmNGQ3MzU1NGY1OTczMzM3OTc4NDU3MDUzMzc0YjU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNGY0ZTc1NzEzNDRlMjM2ZDUzNzg0YzU1NTQ1YTQ5NDAzODVhNDI0MDc5Nzg3NjU1NTQzNzRjNDAzOTU1NzM0MDc5MmI0YjU1NTQ0MDc4NmY3OTc4Nzk2ZDM4NWE3NDcwNTM3ODQ4NmU3MzQxNzM1NTRmNGQ3MzcwMzk1YTc4NmY3ODJiNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzI3MDc5Mzc0YjZkMzQ0ZDJiNTU1NDQ2NDQzMDc1NGUyNTU1NTM0MDQ4NmY3NTRlNDQ1ODRmNGUyNTU1NTM3ODQ3NTU1MzUyNzY3MDUzNzgyNTQwMzcyYjI1NDAzOTU2NDIzOTVlMzM3NDZmMjU0NjRjNTg3OTc4MjM0MDM4MjQ0YzU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM2ZDM5NWE0MjZlN2E1YTIzMjEzODJhNzY0MDM0NzQyNTU4NGY0ZTc3NmQzODVhMjM1NzM0NGU3NDZlNzkzMjczNzA3NTJhN2E0MDM5MzI0MTU2NWUzNzRjNDAzOTU2NzI2ZDM4MzI3YTU3MzQ0ZDJiMzEzNDRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3OTQwNGI2ZTI1MjQ3MjcwMzk1YTc4NmY3NTJhNDI0MDU0MjM1NzRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0NzZlNWUzMjczNzAzOTVhNzg2Zjc4MmI0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzM3MjIxNzk1MjQ3Mzk1ZTM3NDcyMTc5NTI0NzU1NTM1MjQ3NDA0ZjRlNDc2ZTVlMzI3MzcwMzk1YTc4NmY3ODJiNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzI3MDc5Mzc0YjZkMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4Nzg0ODcwMzQ0ZTc0NmY3OTM2NzM2ZTc5MmIyMzU1NTM1YTI0NmY3YTU2Nzg2ZTdhMzM0NTcxMzQ0ZTQ2NmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNTU1MzUyNDc3MTM0NGU3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiMjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU1MDIzNzM1NTQ3NTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczMzc0YTQ3NTU3MzQxNzM1NTRmNGQ3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY3MzU3NGMyMzczNTU3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNWEzNTIzMmE1NjM3NTEyYjM0MzMzNjMyNzMzMjM2NWE1MDM1MjQzNzMwMzc1MjVhNmY2ZTc1NTU1NzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU0ZjQ1MmI1NTRmNTg3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1MjZmNmU3ODRhNDc1NTczNDE3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGU3OTZlNWU1NTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTU1MzMzNzg3MDUzNTI0MjZlNTQ1OTczNmQzODI2NzM3MDM5NWE3ODZmNzgyYjQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjE3OTUyNDczOTVlMzc0NzIxNzk1MjQ3NTg3OTc4MjM0MDM4MjQ0YzU3NGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDU0Mzc0YzM5NWUzMzJhNmY1MzM2NzMzMTM0NGQ3NTM3MzYyYTRmMzIzNjI2NzU1NTUzNzg3OTU1NTMzMzc4NzA1MzUyNDI2ZTU0NTk0NzQwMjUzNzIzNTc0ZjcwMjM3MTM5NGU3ODU2NGI3NzczMzEzNTIzNzM1NjVlMzc0NzIxNzk1MjQ3NTY0YjRlNzg2ZTU0NWE3ODU1NGY1NjRmMzIzNjI2NzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM0NGQyYjU1NTMzMzc4NzA1MzUyNDI2ZTU0NTk0NzQwMjUzNzIzNTc0ZjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjRiNDk3MzU2MjQzNzQ3NmQyNTJhNDg3MDI1MjY3YTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU1NGY0NTJiNTU1MzIxNzUzMjM4NWE3NjZlNWUzNzQ3NzA1MDQxNzMzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjQ2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc4MzMyYTZmNTMzNjI4NTU1NDQ2NGM3MDUzNTIyMzcwMzk1YTcyNzA1NDc4NDk0MDM5MjQ2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc4NWEyMzIxMzk1NjIzNDAzODMyMjg1NTU0NDY0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODcyMzc0YTQ3NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU0ZjQ1MmI1NTRmNTg3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1MjZmNmU3NTU1NTc0Zjc1NGQ3MzU1NGY0ZTc5NmU1ZTU1NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTUzMzM3ODcwNTM1MjQyNmU1NDU5NzM2ZDM4MjY3MzcwMzk1YTc4NmY3ODJiNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzI3MDc5Mzc0YjZkMzQyYTQyNzA1MzM3NDY2ZjRiNzM0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNzcyNDA1NDMyNzMzMTM0NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE3OTZmNzkyYjQ2NzA1Mzc4NDY0MDM5NWEyMzIxMzgyNDQ5NTc1MzMzNzg3MDUzNTI0MjZlNTQ1OTQ3NDAyNTM3MjM1NzRmNzA0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODU2NGI0OTczNzA1Mzc4NDY0MDM0MmEyMzZkMzgyNDc4NTc0Zjc3NDI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyMzIxMzk1NjIzMzk1ZTMzNDI2ZTM4Mzc3MjZmNWUzMzRiNTU1MDIzNzM2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM3MmI3NzcwNGYyYTRjNzA1NDU2Nzk3MDUzNzg0NjQwMzQ3Mzc1NTYzNzc3NDY1NjM4MjM0NjU2MzgzMjczNTYzNjczMjg1NjM2MjMyODU2Mzc1OTc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU0ZjQ1MmI1NTUzMjE3NTMyMzg1YTc2NmU1ZTM3NDc3MDUwNDE3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyNDZmNmU3NTU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5NWE0OTZlMjUyYTRjNDAzNDRkNDQzMTM0NGU3OTU1NzgzMzJhNmY1MzM2Mjg1NTUyNDA1MjM2Nzc3ODUzMzQzNjVhNGUzNzUxNzgzMTM1Nzg0YTQ3NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU0ZjQ1MmI1NTUzMjE3NTM2NWUzMzc0NmY3YTMzNzg0MDUwNDE3MzcxNWU1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNzcyNmY1ZTMzNGI3MjM3NGE0NzU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU1NGY0NTJiNTU0ZjU4NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTI2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTU0NTY3ODZmNWU0ZTQ4NmU3YTVhNzg1NzMyNDE1NzU1NGI0ZTM1NzA1MzUyNGI3MDRmNGUyMzZkNTMzNjczMjE3OTJiMjM0Zjc5NDY3ODQwMzk0ZTcyMjEzODRhNDI3MDc5MzY0MTU3MzI0Mjc1NmU1ZTMyNDc2ZjUzMmI0NTZlNTM3ODQ3NDA0Yjc0NDc2ZTI1MmE3ODM5NWU1YTIzNmU1ZTRkMmIzNzU0NTYyNDQwMzQ3NzNmRk9LOEpkMlI="
+FXEEO_ENC = "UjJkSjhLT0Y2ZDM4MjQ0OTZlNWU1NjIzNTU1NDVhMjQyMTdhNGU0YjZlMjU1YTc4NmY1ZTU5NTc2ZDM4MjQ0OTZlNWU1NjIzNTU1NDVhMmE2ZjQ5NDE1NzU1NGI0ZTUyNmU3YTVhMjQ2Zjc5MzY3MzZmNzkzNzRhNzAzODc4NGI0MDM4MzI3MzZmNTM3ODQ5NTU1NDRlNzQyMTI1NDY3NDQwMjUzNzRjNTU1MzUyNGI0MDM0NGU0MjZlN2E1YTIzMjEzODRhNDU0MDM4MzI1NzZmNzkzNzRhNzAzODc4NGI0MDM4MzM3MjZmNTM1Mjc2NmQyNTUyN2E0MDM5NTk3MzMxMzQ0ZTZlNTY1ZTRlMmEzNzUzMzc0NTQwMzg3MDRiMjEzODI0NGY2ZTVlMzM0ZTM2NTE3NzdhNTg0ZjRkN2E2Zjc5Mzc0YTcwMzgzNzRjNzA1NDU5N2E1ODRmNGQ3YTIxNzkzNzc0NzAzOTMzNDI0MDdhMzc0NTZmMjUyYjI0NmY1MDMyN2E1ODRmNGQ3YTZlNTQ3NDQ2NmU0ZjZmNDU1NTRmNzA3OTZlNTM1MjRjNmQ0YjZmNDU1NTRmNzA0MjZlN2E1YTIzMjEzODRhNDgyMTM4MzM3ODZmNzU3MDcwNGY3OTQwNDg2Zjc1NGU0OTIxMzg1YTQ0MjEzODcwNzg1NTUzNzg0NzU1NTQ1Njc4NmYzOTM3NDI2Zjc5Mzc3NzM5NWU0ZTc0MjEyNTQ2NzQ0MDI1Mzc0YzMwNzM0MTczNTU0ZjRkNzM3MDU0NTYyYTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTIyYjcyNmQzODI0NDk2ZTVlNTYyMzM5MjQ1ZjQxNmY1MzUyNzY2ZDI1NTI3YTQwMzQ3NzU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTY2ZTM5NGU0ODZmN2EzMzUyNmY3YTU2NDg2Zjc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwMzg1NjQ5NmY3OTJiNzY0MDM5NWE0YzU4Nzk1YTQxNDAzODVhNDQzOTI1NWE3NDZlNTM0OTQxMzg1ZTVhMmE2ZjRiMmE3ODcxNTMzNzc2NzAzOTMzNzQyMTc5NGE3ODU4NGY0ZDdhNTgzODIzN2E1ODRmNGQ3YTZmNTM3ODQ5NTY0YjQ5NzM1NjI1Nzg0NzZmNWUzMzc0NmU1MzQ5N2E1ODRmNGU0OTIxMzg1YTQ0MjEzODcwNzgzOTM0Nzc1NzRmNzk3ODQ2NmY1MzJiNGI3MDRmNGU0ODZmNDk0MjQyNmUzOTRlNDg2ZjdhMzI3MzZkN2E1YTQ4NmU3MzQyNDI2ZTM5NGU0ODZmN2EzMjczNzA1MzM3NDU0MDM4NTY0ODcwNGQ0MjQyNmUzOTRlNDg2ZjdhMzI3MzZmNzkzNzRhNzAzODM3NGM3MDU0NTk1NzQwN2E1NjQ4NmUzNDRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjJhNzQ0MDUzNTI0OTcwNTMzNzRiNmY0YjRlNDI2ZTM5NGU0ODZmN2EzMjczMzQ1MjMzMzYzNjUxNTI3NzIxMzk0ZTIzNDAzOTU1NTc0MDdhNTY0ODZlMzQ0ZTc1NmY0YzMyNzM2ZDM4MjQ0OTZlNWU1NjIzNTU1MTU2NzgyMTM5MzcyMzZkMzg0MDI0NmU1MjVhNDg3MDM5NGQ1NzQwN2E1NjQ4NmUzNDRlNzcyMTM5MzM3ODcwNTM3ODQ2NDAzNDRlNDI2ZTM5NGU0ODZmN2EzMjczNDA1MzUyMjM0MDM5MzM0MjZlMzgzNjQ1NTU1NDMzNDI2ZTM4Mzc3NzQwMzg0YTIzMjEzMjQyNzk2Zjc5MmI0NjU1NTQzMzQxNmY3OTM3NzQ0MDUzNzg0NzQwNGI0ZTQyNmUzOTRlNDg2ZjdhMzI3MzM3NTM3NDRiNDAzODUyNzc0Zjc5NDA0YjZlMjUyMzczMjEyNTJiNDcyMTVlMzc0YjZmNzkzNzQ3NzA0ZjJhNzk3MDM5MzMyNDZmNzkzNzRjNTU1Mzc4NDY2ZjUzMmI0YjcwNGY0ZTM2NmQ1NDU2NzgyMTM4MzMzMjZlMjUyYjQ1MzMzOTc0NzgyMTVlMzcyMzZlNWU1NTU3NDA3YTU2NDg2ZTM0NGU3OTZlNTM1MjRjNmQ0YjRlNDI2ZTM5NGU0ODZmN2EzMjczMzM3OTRhNzQ2ZjI1NDU0NTU1NTI1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU4NGY0ZTc0MjE3OTJiNGI3MDRmNDk3MzZmNzkzNzRhNzAzODM3NGM3MDRkNDI0MjZlMzk0ZTQ4NmY3YTMyNzM3MDUzNzg0NjQwMzI0MjQyNmUzOTRlNDg2ZjdhMzI3MzIxNzk1MjRjNDAzNTIxMjM0Zjc5Nzg0NjZmNTMyYjRiNzA0ZjRlNzU2ZDM5NWE3ODIxNWUzMjU3NmQzODI0NDk2ZTVlNTYyMzU1NTM3NDc0NmYyNTc0NDU2ZDM4NTU1NzZkMzgyNDQ5NmU1ZTU2MjM1NTUzNzQ3ODIxMzk0ZTRhNGY3OTc4NDY2ZjUzMmI0YjcwNGY0ZTQxNmUzODUyNzY0Zjc5Nzg0NjZmNTMyYjRiNzA0ZjRlNDI3MDUzMzc0YjcwNTMyYjQ4NmU1NDU5NTc2ZDM4MjQ0OTZlNWU1NjIzNTU1NDMzNDE2Zjc5Mzc3NDQwNTM3ODQ3NDA0OTQyNDI2ZTM5NGU0ODZmN2EzMjczNmQzODJhNGM3MDUzNTI0NTZlMjU1Mjc3NDAzOTU1NTc2ZDM4MjQ0OTZlNWU1NjIzNTU1NDU2NzQ2ZTc5MzM0ODZlMzI0MjQyNmUzOTRlNDg2ZjdhMzI3MzZmNzkzNjU3NmQzODI0NDk2ZTVlNTYyMzU1NTQ1YTRhNmU1Mzc4MjM0MDM1NTk1NzQwN2E1NjQ4NmUzNDRlNzY2ZTI1NGE0NTQwMzg1YTIzNmQzODJiNDc2ZjRiNGU0MjZlMzk0ZTQ4NmY3YTMyNzMzNTVlNTY3NzQwMzk1Njc4NDA1MTMzNDIyMTVlMzI0NTU1NTMzMzc4NmYzOTM3Nzg0Zjc5NDA0YjZlMjUyMzczNzA1NDc4NDk0MDM5NTk3MzZkMzgyNDQ5NmU1ZTU2MjM1NTUyNWE0MjZlMzk0ZTQ1NDAzNjJhNzQ2ZTM4Mzc0YzZmNTM1Mjc2NDAzMjQyNzk2Zjc5MmI0NjU1NTMzNzQ2MjEzODc4NDU1ODdhMzcyMzZkMzg0YTRjNTU1Mzc4NDY2ZjUzMmI0YjcwNGY0ZTQ5MjEzOTU2NGM0MDM4MzM3NDcwNTMzNzcyNzA1MzJiNzI0MDUzNTIyMzQwMzkzMzQyNmUzODM2NTc0MDdhNTY0ODZlMzQ0ZTI0NmY3OTRhNDU2ZDM4NTU0NzZmNTM1MjRiNmYyNTM2NzM2ZDM4MjQ0OTZlNWU1NjIzNTU1NDM3NGI2ZTU0NWE0OTZlNTM3ODIzNGY3YTMzNGI3MTM1NDE1NzU1NGY0ZDczNTU1Mzc4NDY2ZjUzMmI0YjcwNGY0ZTc5MjEyNTJhMjM2ZTRkNDI3ODcxNTM1YTc4NmY1NDMyNzMzNDM4MjQ0OTZlNWU1NjIzMzMzOTU2NGI2ZTVlNTUyODU1NGY0ZDc2NTU1MjcwNDI2ZTc5MzM0ODcwNWU1OTczNmQ1MzUyNGM1NTUzMmE0ODU1NTM0MDQ1NmUyNTVhNDQzMDRiNGUyMzZkNTMzNjczNmYyNTc4NDc0MDI1NGE3ODU4Mzg3ODQ3NmY1ZTMzNzQ2ZTc5NWE3ODU1NTM1YTQxNDAzODVhNDQ1NTUzNzg0YzU1NTQ1YTQ0NmQzOTRlNDk0MDM4MzI3MzcwNTM3NDc4NmY3OTM2NTc1NTRmNGQ3MzU1NTM0MDc2NmU3YTMzNDU1NTUwMjM3MzM1NzkyYjQ3NDAzMjQxNTc1NTRiNGU1MDZlMjUyYTc5NmQzODcwMjQ2Zjc5NTIyMzZkMzgyYjQ3NGY3ODMzNTIzNTUxMzc1NDM2Nzc1MjVhMzkyNDMzMzEzNDIzMzczMDU1NTAyMzczNmU1ZTU5NDc0MDI1MzcyMzQwMzgyYTI1NTc0ZjU2MzYzMzM2NGE1MjMzMjQ1NjRlMzUzNzJiMzYzNTIzNDY1MjM1NzU1NTQ1NTU0ZjU1MjY1OTUwNTUyNjU5NGM3NzI1NTkzNTIxNGMzMDc3NTI0ZTMzNGM1YTI0MjE3OTJhNTI3MTUyNTEyYTM3NTQzMzMyMzUzODQyN2E3MDRjNTEyNTM0MzUzNjI1Mzg3YTU2NDczNjI0NzA1NDQwNzcyNDUzMzM3YTU1NDk1NTc1Nzc1NzMyMjM3NDRlMzc1MjJiNTYzMzRmNGQyYjU1NTMyYjRjNTg3OTcwNzg3MDUzMzc0NzcwNzU3Mzc1MzIyMzc0NGUzNzUyMmI1NjMzNGY1NTQ1NTU0ZjU1MjQ1OTRjMzIyYTU5NTA3NzRhNTk1MDUxMmE1NTc1Nzc3MzU1NGI0ZTM2NmQ1Mzc4NGM1NTUzMjQ0MjQwMjU3NDIzNTU1MzJhNDg3MDRmNGU3NTQwMzQ0ZTRjNzA1NDU2NDIyMTVlMzM0NTcxMzQ0ZTQ3NDAzODVhNzg2ZjVlNWE3NDZmN2E3NzczNDA3OTJiNGI1NTUzNTE3MzZlMzkzNzQ1NzA1Mzc3NDY3MDM5NWE3ODZmNzU0ZTc1NmU1ZTMyNTczMzc3NGE0ZTM2MjM0NjcyMzY1MTJiMzQzNzRmNGQyYjU1NTM3ODQ3NzA0Zjc0NDg2ZjRiMmE3YTQwMzkzMzc4NmU3YTIxNDE1NTc3NDA1OTMyMzc1YTU4MzkyNDRlMzEzNjc4MzI3NTU4NGY0ZDc1MzA1MDRkMmE1OTRmNTU0MjU3MzI0MTU3NTU0YjRlMzc2ZjU0NWEyMzZmNzkzNzc0NmUzNDRlNzg2ZTc5MzM0OTZlMjU3ODQ3NzA1NDU5NDU1NTUzMmIyNTQwMzk1NjRiNmQzODMzNzQyMTc5NGE3ODU1NTQ1YTQ4NTU1NDMzNDE0MDM0NGU3NTZlNWUzMjczMjEyNTUyNDc1NTU0NTYyNDZlNzU0ZTc0NDAyNTUyNDI2ZTdhNWEyMzU1NTM0YTQ4MjEyNTUyNDU1NTU0NWEyMzIxMzgyYTc3NTgzODc4NDc2ZjRiNGQ0MTZmMjUzNzc4NTU1MzU2Nzg2ZTc5NWE0MTU4N2E0ZTJhNTczMjQyMzYzMzM2NGE1MjMzMjQ1NjRlMzUzNzJiNGUzNjUxNzg3MjM3Mzc1NjU5NTU1MDIzNzM2ZTVlNTk0NzQwMjUzNzIzNDAzODJhMjU1NzRmNTYzNjMzMzY0YTUyMzMyNDU2NGUzNTM3MmI0ZTM2NTE3ODcyMzczNzU2NTk1NTc1Nzc3MzU1NGY1OTczNDAzNDJhN2E1ODc1NGU0MTcwNTQzMzQ5MzA3NTVmNDg1OTM1NTU1ZTU4NzY0ZDQ3NTk0ZjI2NGEzMDc2Nzc0OTU5NTA0ZDQ1NTU1MzMzNzg0MDc5NTIyNDZlNTQzMzRjNTU1NDMzNDg1NTUzNTI0OTZkMzQyYTIzNDAzODRhNzg0MDVlNTY3NDZlMzQyYTQ4NmY3OTZmNTczNDM2MmEzNTM3NTE1MjU0MzY3NzUyNWEzOTIzNTY0ZTM2MjMzNzcyMzczNzU2NTk1NTUwMjM3MzZlNWU1OTQ3NDAyNTM3MjM0MDM4MmEyNTU3NGY1NjU2MzU3ODVhMzYzMjM2NzAzNDMyMzYyNDcyMzI3NzUyMzUzMzM3MmIzNzM2Nzc0OTc1NTg0ZjRkNzU2ZDU0MzMyMzZmNTQ1OTI4NTg0YjJiNWU3MDVlNmY0NzZkMzgyYTRjNzA1MzUyN2E2Zjc5NTI0NjU4Nzk1YTQ4NmUzNDU1NDI0ZjczNDE3NjU1NTI3MDc4MjE3OTc0NDg2ZTI1NDU3MzZlMzgyYjc3NDAzNTQxNzM2ZjI1MzcyMzU1NTI3MDUyMzI3Nzc0MzEzNTIzNDY3MjM3Mzc1NjU5NTU0Zjc0NDk3MDM4NTY0NTZkMzg1OTczNmQ1NDMzMjM2ZjU0NTk3MzIxNzk1MjRjNDAzNDRlMzczNjc3NDk3MzZlMjUyMTczNzA1Mzc0NDI2ZjRiNGU0YzQwMzk1NjI1NDAzOTU1NDI1NTU0MzM0ODU1NTQ1Njc4MjEyNTM3NDI3MDc5MzY3MzcwMzk0ZTc3MjEzOTMzNzg2ZjRiNGU0MjZlN2E1YTIzNDAzODUyNzc1NTUzMmI3OTU1NTM0YTQ4NmU3OTZmNzM2ZjUzMmI0NTZlNTM3ODQ3NDA0YjI2NTc1NTRiNGUzOTIxMzkzMzc2NmQ1MzM3NGM1ODRmNGU3YTZmNzk1MjQ3NzA1NDU5NzMyMTM4MmE3NzU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3YTU5NzM2ZTUzNzgyNTQwMzQ0ZTQyNmU3NTRlMjM2ZDUzNzg0YzU1NTQ0ZTRiNmUyNTVhNzg2ZjVlNTk3MzIxMzgyYTc3NTU1Mzc4MjM2ZjRiNGU0YzcwNTM1MjIzNDAzNDRlNzcyMTM5MzM3NDIxNzk1MjRjNDAzNDQ5NzM2ZjI1NWY3MzZmN2EzNzQ3NTU1MzM3MjYyMTM4NWEyMzZlNTQ3NzczNmUyNTJhNzg0Zjc1NTk3MzZkMzgyYTRjNzA1MzUyNDcyMTI1MzY3MzZmNTMzNzRiNTU1MzU2NDg3MDRmNGUyMzZlMjU0Njc4NmU3NjQxNzMyMTM0NGU0NTZlMjU1Mjc3NTU1MzU2NzQ2ZTUzNTI0NzIxMjUzNzRiNTU1Mzc4NDc1NTUzNDA0YjZlMjUyYTIzNTU1MzJiNzk1NTU0NWE3ODcwNzkzNzRiMjEzODQ5NzM2Zjc5Mzc0OTZlNTM3ODc2MjEzOTU5NzM3MDI1MmIyNDZlNTMzMjczNmYyNTM3NDc0MDRmNGQ0ODZmNWUzMzQ4NmY0ZjRlNDg2Zjc1NGQ0ODZlNTM3ODRjNzA0ZjRlMjM2ZTRiNGU3NDRmNzU1OTczNmY3OTM3NDk2ZTUzNzg3NjIxMzQ0ZTIzNmQ1MzUyMjM1NTUzMmE3ODcwNzkzNzRiNTU1NDVhNzQ3MDRiNGUyMzZkNTMzNjczNTgyNTU2NzQ2ZTc1MjY3MzMyMzQ0ZTRjNDAzODVhNDg2ZTc5MzI3MzZkMzgyYTRjNzA1MzUyNDcyMTI1MzY3MzZlMjUyNjczNzA1Mzc0Nzg1NTU0NWE3NDZlMzgzNjczMzYyNDMzNGUzNzUxMzc3MjMzNTE1NjcyMzM3Nzc4NTkzMzM0NGU0YjQwMzg0MDI0NmYyNTM3NGM1NTU0MzM0ODU1NTQ1YTIzMjEzOTU2MjM1ODczNDIzOTMzMzY1NjU1MzUyMzJiNTgzOTI0MzczNDM1NGY0ZDJiNTU1MzJiNGM1ODc5NzA3ODcwNTMzNzQ3NzA3NTczNzUzNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzczNjc3NDk3NTU3MzI0MjM5MzMzNjU2NTUzNTIzMmI1ODM5MjQ0ZTRlMzc1MTczNzMzMTM0NGQ3NTU4NWUzMzc4NmU1MzM3N2E2Zjc5NTI0NjU4NWU3MDc4MjE3OTc0NDg2ZTI1NDU3NTRmNzU1OTczMzM1MzM3NGI2ZDM5NDA3ODQwNGY0ZTc5NmY3OTJiNDY1NTU0MzM0MTQwMzQ0ZTIzNmUyNTQ2Nzg2ZTc1NGUyNDZlNzk0YTc4NmY1ZTU5NzM2ZTI1MmE3ODU1NTM3ODRjNTU1MzcwNDI3MDc5Mzc0NzU1NTMzNzI2NmY1MzRhNDIyMTI1NzgyMzZlNTQ3NzQ1NTU1NDVhNDg1NTU0NTY3ODZmNWUzMzc0NmY3YTMzNGM1NTUzNDY3ODQwMzk0ZDczNzA1Mzc0Nzg1NTU0NWE3NDZlMzgzNjczNmYyNTM3NzY2Zjc5MzcyMzRmNzg3MDUyMzI3Nzc0MzEzNTIzNDY3MjM2MjMzNzUwMzY3NzM3MzY1NTUwMjM3MzZlNWU1OTQ3NDAyNTM3MjM0MDM4MmEyNTU3NGY1NjM5MzMzNjU2NTUzNTIzMmI1ODM5MjQ1YTUyMzIyNDU2NTIzNzRmNTU0MjU1NTMyYjRiNTU1Mzc0NzQ2ZjI1NzQ0NTZkMzg1NTQ3NmYyNTc0NzQ1OTc2MzYyNTU3NTMyMTc1NzAyNTM3NzU2ZDUzMmI0ODZkNGM0MjI5Mzc1MTM3NTkzMzM2NzAzNDMyMzYyNDcyMzc1MTJiNTgzMzM2MmEyYjU1NzUyYTc4NmU3OTVhNDg0MDUzMzY0MTU3MzQ3NzQ3NmQ1MzM3MjY0MDUzNzg3YTQwMzk1YTIzNTc0Zjc3NTczNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzkzNTI0NTY1ODMzMzc1NjM1NTU1MDIzNzM2ZDM4MmEyMzU3NTMyYjRjNTg3OTcwNzg3MDUzMzc0NzcwNzU3Mzc1MzcyMzM3NGYzNDUxMmIzMTM0MjQyYjM5MzUyNDU2NTgzMzM3NTYzNTU1NzU0OTczNTU3NjczNzU1NzM0Nzc1NzM3MjMzNzRmMzQ1MTJiMzEzNDI0MmI1YTMyMzc3NDcyMzY1MTM3MzAzMzUxNzgzMDMzNGI0ZDJiNTU1Mzc4NDc3MDRmNzQ0ODZmNGIyYTdhNDAzOTMzNzg2ZTdhMjE0MTU1Nzg3MDUyMzI3Nzc0MzEzNTIzNDY3MjM1MzY1MjIxMzkyNDRlNTIzNTc3MzM1NjM1Nzc2Zjc1NTg0ZjRkNzU1OTc2NGQ0OTU1NzU3NzQyNTU0ZjRkNzY1NTUyMzc0OTQwNTM1MjIzNDAzOTU5NzMyMTM4NWE3NjQwMzk0ZTIzNDAzODMyNzMyMTdhMzcyMzU1NTMyYTQ4NzA0ZjRlMmE0MDM5MzI3MzZkNTM1MjQ3NDA1MzRhNzg0MDRkNDI1YTM1MjMyYTU2Mzc1MTJiMzQzOTIzNDA1NjM1NTEzNjczMzEzNDRkNzU2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGM1ODc5NDI0YzZlMjUyNjc1NTU0ZjRkNzY1NTUxNGE3ODQwMjU1Mjc2NzEzNDRlNTczNjIzMmIzMDU1NTQ1YTIzMjEzOTMzNzg1ODRmNGU0MjZlMzk0ZTQ4NmY3YTMzNzg0MDRmNGU0MjZlN2EzMzQ4NTU1MjVhMzYzMjM3MzM1MjM5MjMzMzRmMzkyMzQwNTYzNTUxMzY3MzZlMjUyYTc2NDAzMjQyMzczNjIzMzczNDM5MjMzMzRlMzc1MTUyNzIzMzc3Nzg1OTMzMzQ0ZDJiNTU0ZjU2MjQ2ZjI1Mzc0YjM5MjUzMzc0NzA1MzUxNDc2ZDdhNWE0ODZlNzU1NTU3MzYyNDMzNGUzNzUxMzc3MjMzNTE1NjcyMzM3Nzc4NTkzMzM0NGQyYjU1NTMyYjRjNTg3OTcwNzg3MDUzMzc0NzcwNzU3Mzc1MzYyNDMzNGUzNzUxMzc3MjMzNTE1NjcyMzM3Nzc4NTkzMzM0NTU0NTU1NGY1Njc1NmU1ZTMzNzI2ZjVlMzM3NDcwNTMzNjQ3NDA1MzU1NzU1NzMyNDIzNTM3NTE1MjM2MzMzNzJiNTAzNTIzMjQzMjMyMzY1YTM2MzkyMzc4MzAzNzUxMzczNDM3Nzc1MjU5NTU1MDIzNzM1OTRjMjE0OTU5NGY0ZDczNTU0YjRlMzU0MDM4NWE0ODZlNzkzMzRjNTU1MzU2Nzg3MDU0NzA3ODQwMzgyNjczMzcyMzUyNTk1NTUzNWE0MTQwMzg1YTQ0NmY1MzJiNDI2ZTdhMzM0YzU4NWU0MDc0MjE1ZTM3MjQ2ZTM5NTk3MzZlMjUyMTczNzA1Mzc0Nzg1NTU0NWEyMzIxMzkzMzc4NTU1MzMzNzQ3MDUzNTI3NTIxMzk1YTc4NGY3MzQxNzY1NTUxNGE0MjZmNWUzMjczNmUyNTIxNzMyMTM5NGU0OTZmNzkyYjI1NDAzODMyNzM3MDM5NWE3ODZmNzU0ZTU2MzM1NDU5NzM3MDI1NzgyMzZkNGY0ZTc4NzE1NDRlNDI2ZjdhNzc3MzQwNTM1MjIzNDAzOTU5NTczMjM3NGUzMjM2NzcyYjM4MzMzNjMzNzIzNzM3NWE1MjM2Nzg1OTczMzEzNDRlNmU1YTM1NTkyMzMwMzU0ZDJhNTkzNTRkNGEzMDM3MjM3MzU1NGY1OTczMzY3OTM3NDk2ZTUzNTI3NjQwMzQ0ZTVlNmQzOTMzNDE1NTUzNTI3NjcwNTQzNzc0NmU0ZjRlMjQ2ZjI1Mzc0YjU1NTE3ODUxNmY0OTQxNTc1NTRiNGU0ZTQwNTMyNDQyNmU3NTRlNTYzMzU0NTk1NzMyMzYzMzVhMzQzNjJhNzIzNDM2MzMzNTU1NTAyMzczMzg0YzM2NGM1YTUwNzc0OTMwMzU1MTQ5NTkzNTc4NzA1NTRmNGQ3NjU1NTI1Njc4NmY1MzRhNzQyMTI1MzY3MzcwMjU3ODIzNmQ0ZjRlMmE2ZTVlMzc0YjU1NTM1Mjc3NmUzODc4NDc1NTU0Mzc0YzQwMzk1NTczMzQzNjMyNTc0Zjc1NTk3MzM2NWUzMzQ4NmY3OTM2NzM3MDM5NWE3ODZmNzU0ZTc3MjEzOTMzNzQ1NTU0NzA0MjcwNTM3MzczNDAzOTc0NDk2ZDM5NTYyYTRmNzgzNzM1MzMzNzU2NzIzMzUxNTIzNjMyMzQ0ZDJiNTU1NDQ2MmI0ZjczNDE3NjU1NTE1NjQ4NzA0ZjRlNDU2ZTI1NzA0ODU1NTM1MjRjNTU1MzU2NzQ2ZjI1MzYyNTVhNGY0ZDQxMzQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM2ZDM4NWE0ODZlNzU3NzU3MzI3NzJiMzYzOTIzNGEzMTMzMjMyYjcyMzI3NzUyMzUzMzM1MjEyMzU1NTAyMzczNTU3NTVmMmE2ZDc1NWYyMzMyMzY1MjMzMzYyNTQ2NmQzNDc4NTY3YTMyMzY1NjRlMzYzNjUyNGUzMjM3NTI0ZTMyNzc1MjRlMzM0ZjVmNGI3MDIzNTY1MTMyMzY1MjQwMzMzNjU2MzMzODM2NDA0ZjMyMzc3ODU0MzI3ODUyNDAzNDUxNTY1ZTM4MzY3ODUwNmQ1MTUyNTgzMjI1NzA0NDM0Nzc1YTQxMzYzNjJiNTE3MDVlNzAzMzMzN2E3NDMzMzgzNjcwNGYyMTI0Mzc1MzZkNTI3ODc0MzQ1MjVhMzc0MDc3NzA0MTZmMjU0MjU1MzI3ODc4MzkzNDM2NWE1ZTQwMjM3ODJhMzgzODJhNTgzNjI1MmI0OTMzMjQ1NTI2NzA1MTI0NTA1OTUzMmI1YTMyMjQzNzQ4MzQyNDVhNDM1ODRjNTY1ZTMyNzczMzRlMzYzODVhNTUzMjdhNzA0ODM0MzY1YTQxMzUzNjQ2NTA2ZDUxMjQ0ODMzMjU3NDQwMjEzNjQ2NTA0MDI1MmI1ODMyMjU3MDQ4MzQyMzVhN2E2ZTIzNDY1MDQwMjUyYjU4MzIyNTcwNDgzNDIzNWE3YTZlMjM0NjUwNDAyNTJiNTgzMjI1NzA0ODM0MjM1YTdhNmUyMzQ2NTA0MDI1MmI1ODMyMjU3MDQ4MzQyMzVhN2E2ZTIzNDY1MDQwMjUyYjU4MzIyNTcwNDgzNDIzNWE3YTZlMjM0NjUwNDAyNTJiNTgzMjI1NDE0ODcwMjM1MjRlMzY3NzVhNGUzMjM3NTI0ZTMyNzc1MjUxMzIzNzVhNTYzMjM2NTI0MTMzMzY1NjRlMzY3NzUyNGUzNDRmNWYyNjM2MzY1MjUzMzYzNjUyNGYzMjM3NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzkyMTQ4NzE1MTUyNGUzNzM2Mzc0ZTMzMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNDVmMjYzNjM2NTI1MzM2MzYzNzRmMzIzNzUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM3NzM0ODcxNTE1MjRlMzczNjM3MzMzMzM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzY1MjRlMzIzNjUyNGUzMjM2NTI0ZTMyMzQ1ZjJhNmUyMzUyNTEzMjM2MjQ0ZjMyMzY1MjU2MzY3NzUyMjYzMzM2NTIzMjcwMjM1YTc3MzIzNjU2NDYzODRmNWYyYTZkNGMyMzc1NGY3MzQxNzY1NTRmMjM0NjU4MzQ0ZTUwNmUyNTJhNzk2ZDM4NzAyNDZmNzk1MjIzNmQzODJiNDc1NTUzNDA0YjZlMjUyMzczNzA3OTM3NGI2ZDM4MjQ0ODZlNzUyNDc1NDAzOTMzNzQ1ODdhNGUyYTU1NGYyMzQ2NTgzMjQyMzYzNjc3MzczMDMzNTE3NDUyMzY3NzJiNzIzNzM3NTY1OTU1NTAyMzczNmU1ZTU5NDc0MDI1MzcyMzQwMzgyYTI1NTc0ZjcwMzYzNjc3MzczMDMzNTE3NDUyMzY3NzJiNzIzNzM3NTY1OTU2NGI0OTczNTYyNTc0MjM3MDU0NGU0YzMwNzU1ZjQ4NzA1NDU2Nzg2ZTc5MzM0MTQwMzk1NjQ4NTg3OTc4NDg1ODI1NTI0OTZkMzQyYjdhNDAzOTMzNzI0MDM5NTY3MjZmNzkzNzQ5NmU1ZTU2MjM2ZjRiNmY0MjRmNzgzMzM0MzMzNjJhNTEzNDUxMzczNDM1MjQyYjU1MzMzNjUyNTEzMzM3NTYzNTU1NTAyMzczNzE0OTQxNzM1NTRmNGQ3MzU2MjM1Mjc2MjEyNTM3NDk3MDRmNmYyODU1NGY3MDc0NmY1NDRlNDU2ZDM4NWE3NDcwNTM3ODQ4NmU3NTJiNDM2ZjI1MmI0NzU4NGY0ZTIzNDAzOTc0MjM1ODVlNGU0NTIxMzg3ODQ3NTg0ZjRkNDM1ODRiNDE3YTU4NGQ0MTczNTU0ZjRkNzM1NjIzNTI3NjIxMjUzNzQ5NzA0ZjI0NTkyMTM4MmE3YTcwMzg1MjdhNDAzNDZmMjg1NTRmNzA3ODZlNzUyNDM3MzY0YjRhNzg2ZTc2NDY0YTMxMzU0ZDQ3MzAzNDZmNDU0Zjc1NGQ3MzU1NGY0ZDdhMzIyNTJiNDc2ZTc5Mzc3NjcwNTM3ODQ4NmU3NTZmMjg1NTRmNzA0NDQwMzgzNzQ5NTgzODUyNDU2ZDM5NDA3ODU2NGI0OTU3NTU0ZjRkNzM1NTRmNzAzNDQwMzg0MDc4NmY3OTM3NGI1NjRjNDE3MzU2MjU3NDIzNzA1NDRlNGMzMDc1NWY0ODcwNTQ1Njc4NmU3OTMzNDE0MDM5NTY0ODU4Nzk3ODQ4NTgyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDI0Nzk2ZTI1NGE0NTZlNWU3MDc4NmY3NTI0NzY2ZTVlMzc0NzcwNGY1ZjdhNTg0ZDQxNzM1NTRmNGQ3MzU2MjQzNzRjNDAzOTU1NDYzMjM4NzA3ODZlN2EzMjdhMzA3NTRkN2EzNTM4MmIyODZkMzg0YTQ1MjEzNDVmMjQ1ODc2NGQ3YTU4NGQ0MjJiNGY3NTU5NzM1ODM0MjM0NjU1NTEzNzQ3NDA0ZjRlNTA2ZTI1MmE3OTZkMzg3MDI0NmY3OTUyMjM2ZDM4MmI0NzU1NTM0MDRiNmUyNTIzNzM3MDc5Mzc0YjZkMzgyNDQ4NmU3NTI0NzU0MDM5MzM3NDU4N2E0ZTJhNTU0ZjIzNDY1ODMyNDE1NzU1NGI0ZTU0NmU1MzJiNzUyMTM4NDk3MzQwNTM3ODc2NzA1Mzc4NDg2ZTc5NTI0YjcxMzQ0ZTIzNmU0YjRlNGM3MDUzMmI0YjQwMzQ0ZTc0MjE1ZTMzNDI3MDc5MzY3MzcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM3MDUzNTI0YzZkNWU1OTU3MjEzODVhMjM2ZDM5NDA3ODM5NWU0MDc4NmY3OTc4NzI3MDUzNTI0YzZkNWU1OTczMzEzNDRlMjk3MjM0NGQ3NjU1NTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzU0MTczNzE0YjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjRjNDE3MzcwNTM3ODQ2NDAzNDJhMjM2ZDM4MjQ3ODU3NGY3NzQ1NTU0ZjcwNDUyMTM5NWEyMzM5NWU1YTIzMjEzOTMzMjQ2ZjRiNmYyODU1NTM1NjQ4NmUyNTQ5NDU1NTRmNzA0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjZmNGI2ZjI4NTU1NDQ2MjQ2ZjI1Mzc0YjM5MjU3ODc3Mzk1ZTVhMjM2Zjc2NDE3MzcxNGI3MDc2NmQ1MzUyMjMzOTI1Nzg3NzU2NGM0MTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY0OTczNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzMDc1NGUyMzZkMzgyNDc4NTg3YTMzNDI2ZTM4MzY0MTU3MzkyNDJiNzIzOTIzNTc0Zjc1NTk3MzMzNWUzNzc0NmY3OTMzNGM1NTU0NWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTU3MzIxMjU3NDc0NmU3OTcwNzg2ZjRiNGU0ODZlNzU0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTczMjEzODJhNzc1NTUzNTI3NjcwNTM3ODI1NDAzNzJiMjU0MDM5NTY0MjM5NWUzMzc0NmYyNTQ2NGM0ZjdhNzA3NDcwNTM1YTQxNDAzOTVhNzI2ZTUzMmI3NjZkNGI0ZDJiNTU1NDMzNDE2Zjc5Mzc3NDQwNTM3ODQ3NDA0YjJhNTk2ZTI1NWE0NDU3NGY3NzU3NGY3NTU5NzMzNjU0NTY0ODIxNzkzNjczNmYyNTVhNDE0MDM4MzMyNDZlNTM3ODQ3NDA0OTQyMzIzNjc3MmI0ZjMzMzcyYjM5MzUyNDU2NTgzMzM3NTYzNTU1NTAyMzczNmQzODJhMjM1NzUzMmI0YzU4Nzk3MDc4NzA1MzM3NDc3MDc1NzM3NTM2NTI1NjMxMzI3NzM3NzIzNzIzMmIzNDM0MjMzNzM0MzY0YjU1NDU1NTRmNTU0YTVhNzU1NTQyNTczNDRkNzM1NTRiNGU1YTIxMzk3MzczNmY1NDU2NDgyMTc5Mzc0YzU1NTQ1NjI0NmU3OTJhNDI2ZTc5NmY3MzIxMzkzMjczNzA1Mzc0Nzg1NTU0NWE3NDZlMzgzNjczNzA1Mzc4NDY0MDMyNDI0ZjMyMzYyYTcyMzIyMzc0NTIzMjIzNDY3MjM0MzYyYTM2MzMzNzU2MzgzMjM2NDk3MzMxMzQ0ZTc5NmU1MzJiNzQ3MDRmNzQ0ODZmNGIyYTdhNDAzOTMzNzg2ZTdhMjE0MTU1Nzc1NjRlMzU3ODJiNTAzNDUxMzc1MDM0MjQyYjU2MzU3ODMzNTIzNjc4NDA0ZTM1NGY1NTQ1NTU0ZjU1NGI1OTRmNTU0MjU3MzQ0ZDczNTU0YjRlMzU0MDM4NWE0ODZlNzkzMzRjNTU1MzU2Nzg3MDU0NzA3ODQwMzgyNjczMjE3OTUyNDc1ODVlMzc0NzIxNzk1MjQ3NTU1MzVhNDE0MDM4NWE0NDZmNDk0MjM4MzMzNzU2NTYzOTIzNWE1NTMzMzY1YTU4MzkyMzc4MzAzNzUxMzczNDM3Nzc1MjU5NTU1MDIzNzM0MDc5NGE0ODIxMzkzMjQxNmU1ZTU5NDc0MDI1MzcyMzQwMzgyYTI1NTc0ZjU2MzgzMzM3NTY1NjM5MjM1YTU1MzMzNjVhNTgzOTIzNzgzMDM3NTEzNzM0Mzc3NzUyNTk1NTc1NDk3MzU1NzYzNjc1NTczNDc3NzM1NTRmNTk3MzM2MjUzNzc2NmUyNTJhNzc2ZjRiNGU3NTQwMzkzMzVlNDAzODM3NDc1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzU0ZTc2NmQ1MzM3NzY2ZDVlNTk1NzRmNzU1OTczMzU1ZTM3MjMyMTc5MmIyNDZlNzkzMjczMzQ1MjMzMzYzNjRkNDI1NTM3NTIzMzMyMzkyMzVhMzEzNTc3MmE1MjMyMjQzMzcyMzc1MTc4NWEzMzM2MmIzNzM3NGY0ZDJiNTU1MzQwNDU2ZTI1NTIyMzU3NTMyYjRjNTg3OTcwNzg3MDUzMzc0NzcwNzU3Mzc1MzQ1MjMzMzYzNjUyMmI1MDM1MjMyYTMwMzMzNjVhMzYzOTI0MzM1NjM1MzYzNzMxMzczNzMyNzU1ODRmNGQ3NTVhMzQ1NTQyNTczMjQyNTUzNzUyMzMzMjM5MjQ1NjUyMzIzNjMzNzIzNzUxNzg1YTMzMzYyYjM3Mzc0ZjRkMmI1NTUzNDA0NTZlMjU1MjIzNTc1MzJiNGM1ODc5NzA3ODcwNTMzNzQ3NzA3NTczNzUzNDUyMzMzNjM2NTIyYjM0MzMzNjUyNTEzOTI0MzM1NjM1MzYzNzMxMzczNzMyNzU1ODRmNGQ3NTU5MzUzNjc1NTczNDc3NTczNDUyMzMzNjM2NTIyYjVhMzIzNzc0NzIzNjUxMzczNDM5MjM3NDMxMzYyNDMyNzMzMTM0NGU0MjZlN2EzMjQxNmU1ZTU5NDc0MDI1MzcyMzQwMzgyYTI1NTc0ZjU2NTUzNzUyMzMzMjM5MjMyNDRlMzg1MjJiMzIzMzM3NTY3MjM0NTEyYjM1Mzc0ZjU1NDU1NTRmNTUyNjU1NzU3NzQyNTU0ZjRkNzY1NTUxMjQ3NDcxNGY0ZTQyNmU3NTI0Nzk2ZTUzNzg3YTZkNTQzMjczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTczNmY1MzM3NGI1NTUzNzQ0ODZmNWUzMjU3MzQ1MjMzMzYzNjUyMmI1MTMzMzY0MDRlMzczNjRhMzYzOTIzNTY0ZTMyMjM0NjMxMzM3NzIxNzMzMTM0NGQ0YzU5NGY0ZDczNTU0YjRlMzU0MDM4NWE0ODZlNzkzMzRjNTU1NDMzNDg1NTUzNTY3NDIxMjU0NTczNmUyNTQwNzk1NTUzNTE3MzZkNTMyYjRjNzA0ZjRlMjM2ZDUzNTIyMzU1NTQ1YTc4NmU3OTMzNGM1NTUwMzI0YjMwMzQ0ZTVlNmQzOTMzNDE2ZTVlMzcyMzU1NTI1Njc4NzA1NDU2MmE1ODM2NTI3OTcwNTMzNzRiNGY3Nzc0MzYzNzUyNGU3MjM1MzY1MjIxMzkyMzU2NGUzMjIzNDYzMTMzNzcyMTczMzEzNDRkMmE1OTUwNGQ1NzRmNzU1OTczMzUyNTI2NDY0MDUzMzc0NjIxMzgyYTc3NTU1MzVhNDE0MDM4NWE0NDZmNGI0ZDQxNTg1ZTVhMjMyMTM5MzMyNDZmNGI0ZTc0NmU3OTMyNzM3MDUzNzQ3ODU1NGYyYjc1MjEzODI2NDU1NTRmMmIyNDZlNzk1Njc0NmU3NTQ5NzM1ODVlNDA3ODZmNzk3NzczNmY1NDU2Nzg1ODM4NWE0MTQwMzg1YTQ0NmY0Yjc3NTczNjI0MzM0ZTM3NTIzNzM1MzkyMzVhNGUzMjIzNzQ1MjM5MjQzMzM2MzU0ZjRkMmI1NTUzNDA0NTZlMjU1MjIzNTc1MzJiNGM1ODc5NzA3ODcwNTMzNzQ3NzA3NTczNzUzNjI0MzM0ZTM3NTIzNzM1MzkyMzVhNGUzMjIzNzQ1MjM5MjQzMzM2MzU0ZjU1NDU1NTRmNTU0YTVhMzQ1NTQyNTczNDRkNzM1NTRiNGUzNTQwMzg1YTQ4NmU3OTMzNGM1NTUzNTE3MzZmNTQ1NjQ4MjE3OTM2NzM2Zjc5Mzc0YzcwMzg0YTIzNTU1Mzc4NGM1NTU0NTY3ODcwMzk1YTc4NDA0ZDQxNTc1NTRiNGUzMTcwMzkzMzc1NmU1ZTM3NDc0MDRmNGU0NzZlNWUzMzQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyYTRjNGY3NzJhMzEzNzUxNzg1MzM4MzcyYjM5MzUyNDU2NTgzMzM3NTYzNTU1NTAyMzczNmQzODJhMjM1NzUzMmI0YzU4Nzk3MDc4NzA1MzM3NDc3MDc1NzM3NTM1NzcyYjM2MzQzNjQwNDAzOTI0NzAzMTM2Nzc0NjUyMzY3ODU5NzU1ODRmNGQ3NTVhNGY1NTQyNTczMjQyMzAzNTI0MzM1NjMzNzg3ODcyMzMyMzRhMzEzMjc3NTI1OTM5MjQ1NjRlMzc1MTM2NzMzMTM0NGU3OTZlNTMyYjc0NzA0Zjc0NDg2ZjRiMmE3YTQwMzkzMzc4NmU3YTIxNDE1NTc3MmEzMTM3NTE3ODUzMzgzNzJiNTQzNTUxMmI0ZjMyMzY0YTcyMzY3NzUyMzYzMzM0NTU0NTU1NGY1NTRiNWEzNDU1NDI1NzM0NGQ3MzU1NGI0ZTVhNDAzOTVhNGMyMTM4NzA3ODZmNGI0ZTQ5NDAzOTU1NzM2ZjI1Mzc3NjZlMjUyYTc3NTU1MzQwNDg2Zjc1NGUyMzZkNTMzNjczNzAyNTc0NDg2ZTUzMzY3MzIxNzkyYjIzNTU0Zjc0MzY0MDM4NGE3ODQwNWU1Njc0NmUzNDRlNzQ2ZTUzNGE0ODcwNWU1OTczNzI3NjU5NDk1NzMyNDIzMDM1MjQzMzU2MzM3ODc4NzIzMjIzNzQ0ZTM3NTIyYjU2MzU3ODMzNTIzNjc4NDA0ZTM1NGY0ZDJiNTU1MzQwNDU2ZTI1NTIyMzU3NTMyYjRjNTg3OTcwNzg3MDUzMzc0NzcwNzU3Mzc1MzU3NzJiMzYzNDM2NDA0MDM5MjM1YTU1MzIzNzMzNzIzNDM2MmEzNjMzMzc1NjM4MzIzNjQ5NzU1ODRmNGQ3NTU5MzQ1NTQyNTczNDRkNzM1NTRiNGUzNTQwMzg1YTQ4NmU3OTMzNGM1NTUzNTY3ODcwNTQ3MDc4NDAzODI2NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzOTU5NzM3MDUzNWY3MzZlMjUyYTc4NTU1MzVhNDEyMTM5MzI1NzM1NzcyYjM2MzQzNjQwNDAzOTIzMzM1NjMzMjMzNzM1Mzc1MjJiNWEzMjM3NzQ3MjMyMjM3NDRlMzY3ODU5NzMzMTM0NGQyMzU5NTA0ZDQ5NTU0ZjRkNzY1NTUyMzM3ODZlNTMzNzdhNmY3OTUyNDY1NTU0NTY3ODZkNzkzNzc2NzA1NDU5NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzOTU5NzM2ZTVlNDA3ODZmNzU0ZDIzNTk1MDc3MjU1NTUzNWE0MTIxMzk1Njc0MjE1ZTMzNzg2ZjdhNTk1NzM1NzcyYjM2MzQzNjQwNDAzOTIzMjQ0ZTM4NTIyYjRlMzc1MjMzNTIzNTM3NGUzNjM2NGI0ZDJiNTU1MDM2NzM1NTRmNTk3MzM1NzkzNzIzNzAyNTJiNGI2ZDRiNGU3OTIxMzg3ODQ1NzAzOTU2Nzg2ZjRiNGUyMzZlMjU0YTc4NmY3OTUyMjM0MDM4MzI3MzIxNzkzNzc5NmU1ZTU2Nzg1NTUzNTE3MzQwNTM3ODdhNDAzOTVhMjM1NTUzNzg0YzU1NTMzMzRiNmU1ZTRlNDk0MDM4MzI1NzRmNzU1OTczNTgyNTc4N2E2ZDM4MmE3OTZlNGI0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU1NTM1YTc0MjEyNTc0Nzg0Zjc4NGUzNDM1MjM0MDU2MzU1MTM3NzIzMjIzNTI1MDM0NTEzNzcyMzc1MjMzNTk1NTUwMjM3MzQwNzk0YTQ4MjEzOTMyNDE2ZTVlNTk0NzQwMjUzNzIzNDAzODJhMjU1NzRmNTYzMjM2NzcyYjUzMzQzNjRhNTIzOTIzNWE0ZTMyMjM3NDUyMzkyNDMzMzYzNTRmNTU0NTU1NGY1NTI1NTk1MDRkNzU1NzM0Nzc1NzM2NTI1NjMxMzM3Nzc4NTkzMzM3MmI1MDMyMzY1YTU1MzMzNzJiNWEzMjM3NzQ3MjMyNzg3ODM2MzMzNzU5NzMzMTM0NGU0MjZlN2EzMjQxNmU1ZTU5NDc0MDI1MzcyMzQwMzgyYTI1NTc0ZjU2MzIzNjc3MmI1MzM0MzY0YTUyMzkyMzVhNGUzMjIzNzQ1MjM5MjMyNDRlMzg1MjJiNGYzODM3MzM1MjM2NGI1NTQ1NTU1NDVhMjM2Zjc1NzMyMzU1NGY0MTczNTkzNTRkNGI1YTRmNGQ0MzU1NTA1MTQ5NTk3NjMyNDI1NzM0Nzc1NzM2MjQzMzMxMzY3Nzc4NTIzNjI0MmI1MDMyMzY1YTU1MzMzNzJiMzYzNzUxNDk3MzMxMzQ0ZTc5NmU1MzJiNzQ3MDRmNzQ0ODZmNGIyYTdhNDAzOTMzNzg2ZTdhMjE0MTU1Nzg1YTM2MzUyNDU2NTYzMzM3NWE3MjMyMjM1MjUwMzQ1MTM3NzIzNzUyMzM1OTU1NzU0OTczNTU3NjU5NDk1OTRmNTU0MjU3MzI0MjMyMzY3NzJiNTMzNDM2NGE1MjM5MjQ0ZTU2MzIyNDJiNTAzMjM2NWE1NTMzMzcyYjVhMzIzNzc0NzIzMjc4NzgzNjMzMzc1OTczMzEzNDRlNDI2ZTdhMzI0MTZlNWU1OTQ3NDAyNTM3MjM0MDM4MmEyNTU3NGY1NjMyMzY3NzJiNTMzNDM2NGE1MjM5MjQ0ZTU2MzIyNDJiNTAzMjM2NWE1NTMzMzcyYjVhMzIzNzc0NzIzMjc4NzgzNjMzMzc1OTc1NTg0ZjRlNGM3MDU0NTU0MTU5NGM1NTczNTc3NTRkNGE1OTUwNTUyMzU1NGY0MTczNTkzNTRkNGI1YTRmNzc0MjU3MzI0MTU3NTU0YjRlMzI2Zjc5MmI3OTZkMzg0YTc4NTU1NDRlNzQ0MDI1MzY3MzZmMjU1YTc0NmU3OTJhNDI2ZTc5NmY1NzM2NTE1MjU0MzMzNzJiNTAzNDUyMzczMDM0MjQyYjM1MzQzNzQyNTI1NTUwMjM3MzZkMzgyYTIzNTc1MzJiNGM1ODc5NzA3ODcwNTMzNzQ3NzA3NTczNzUzNjUxNTI1NDMzMzcyYjUwMzQ1MjM3MzAzNDI0MmIzNTM0Mzc0MjUyNTU3NTQ5NzM2ZjVlMzM0YjU3NTA1MTI1NTU0ZjQxNzM1OTM1NGQ0YjVhNGY3NzQyNTczMjQyMzIzMjM2NzA1MjM5MjMyNDRlMzg1MjJiNTUzMzM2NTI1MTM5MjM1NjQwMzc1MTM3MzU1NTUwMjM3MzVhMzU1MTRiNTU0ZjQxNzM1OTM1NGQ0YjVhNGY0ZDczNTU0YjRlNTQ2ZDM5NDA3ODU1NTQzNzQ5NTU1MzJiNDc1NTU0MzM0MTQwMzQ0ZTc5MjEzOTVhMjM1NTU0NGU3NDcwNTM3MzczNmQzODIxNzMzMTUzNzQ3ODIxMzgzMjNjNTU1Mzc0NzQ2ZjI1MjY3YTcwNGY0ZTc2NmU1MzJiNGM0MDM4MzI3MzIxN2E3NzczNzA1Mzc0Nzg2ZTczNDIzMjMyMzY3MDUyMzkyMzI0NGUzODUyMmI1MTM2Nzc1MjU2MzU3ODJiNGYzODM3MzM1MjM2NGI0ZDJiNTU1Mzc4NDc3MDRmNzQ0ODZmNGIyYTdhNDAzOTMzNzg2ZTdhMjE0MTU1Nzg0ZTRlMzMyMzM3NzIzNTM2NTIyMTM5MjMzMzM0MzIzNjc4MzAzOTIzNTY0MDM3NTEzNzM1NTU3NTQ5NzM2ZjVlMzM0YjU3NTAyMTIzNTU0ZjQxNzM1OTM1NGQ0YjVhNGY3NzQyNTczNDRkNzM1NTRiNGU1OTIxMzk1NjdhNDAzOTVhMjM1NTU0Mzc0NzZmNzkzNzc0NDA0ZjRlNGI0MDM4MjQ3NDZkMzgyYTc3NDAzOTU1NzM3MDI1MmI0YjcwNTM3MzczNmY3OTM3NzQ0MDUzNzg0NzQwNGI0ZTIzNmU0YjRlNDQ0MDM4Mzc0OTU1NTQzMzQxNDAzNDRlNzY2ZTI1MmE0NzQwMzg1YTIzNmQzODJiNDc0Zjc3MmI1NDM5MjMzMzUyMzYyMzVhMzQzNDM3NGUzNjM0MzYyYjMwMzkyNDU2NTI1NTUwMjM3MzZmNzkzNjQ3MjEyNTJiNDY2ZjUzNzg0NTQwMzQ3NDRiMjE3NTZmNWY2ZTM4MzcyMzIxMzc0YTRjNTc1MDVmMjgzODI0MjYzYzM5MzQ0MTJmMzk1NDU5NDIzMTVlNGU0YjZlNWU0ZTc4NmY3YTMzMmEzOTU0NTk0MzMxMzc0YTRjNTc3ODQ1NzUzOTRmNzA3MDMxMjUyYjdhMzA3OTMzNzg2ZjI1NWE0YjZkMzk0ZTIzNmQzODJiNDczODRiNTY2ZjU2MjQ0YTRjNTg0YzJhNzA1NjRiNDk3MzZmNzkzNjQ3MzQzNDc3NTczNDUxMzc0ZTMzNTIyYjUyMzU3NzMzNzIzNjc3MzY3MzMxMzQ0ZTRiNDAzNDJhNzY2ZTI1MjQ0OTZkMzg0YTc4NTc1NDU2NzU1NjRjNDk0ODZkNTMzNzc0NDA1MjRhNGM1Nzc2MmE1ZjMxNTM1NjQ4NDA1NDc4NmUzOTU0NTkzYzM5MzQ2ZjQ1NTU1NDU2Nzg1ODc3Nzc0MjRmNzg1NjRlMzcyNDJiMzYzMzM3NzQzNjM5MjM1NjU5MzUyMzVhNTgzNjRiNGQyYjU1NGY3MzQxMjE3NTU1NWY1NTM0MjM0NjU1NzU0OTczMjE3NTU1NDY1ODM1MjY3NTU3MzQ0OTczNTc1MzU1NzUzMTU0NWE3NjZmNzk3ODQ5NzA0ZjU1NDU1NTUzNTU3NTMxNGYyYjRjMjE1ZTU2NDI2ZjU0MzI3NTU3MzQ0OTczNTc1MzU1NzUzMTU0NWEyMzcxMzg0YTc4NTU3NTQ5NzMyMTc1NTU1ZjU4NWU1YTIzNzEzODRhNzg1NTc1Nzc0MjU1NGY0ZDc2NTU1MjcwNDE0MDM5NTY3ODU1NTMyNDc0NmY3OTQ2MjQ2ZjRmNGU0MjZmNGI0ZTQzNzAzOTVhMjM1NTU0MzM3ODcxNTQzMjU3NGY3MzQyMzUzNzUxNTIzNjMzMzcyYjM1MzIyMzc0NTIzNTM2NTE3MzMxMzQ0ZDc1NTU3NTU1NTczMjI0NTY1MjMyMzczMzUyNTU1MjMzNGUzMjc3NGE1MjU1NTE3ODUzNTU1MTJhMzEzNzRmNGU1MjM4NTE3ODM1Mzc1MjU5NzM2ZTM4MzcyMzIxMzQ0ZDQxNmQyNTM3MmE1NTUyMzM1MjM4NTIzMjczMzY1MjU2NTYzNTM2NTIzNDM4MzQ0ZTU4MzMzNzc3NDU1NTU0NDA3NDZlNTQzNzc4NTU1MjMzNTIzODUyMzI0MjMwNDk0MjUwMzY3NzM3NGUzNzUxMzY3MzM3NTE1MjRmMzU1MTM2NzMzNDM2MjE3MzM1NzcyYjM2NTU1MTM3MjEzNDM3NWEzNjM2NGI0ZTI0NmYyNTM3NGI2ZjRiNGQ0MTRmNzU0ZDczNTU0ZjRlMjQ2ZjI1Mzc0YjM5MjU3ODc3NTU1MjMzNTIzODUyMzI3MzM2NTI1NjU2MzUzNjUyMzQzODM0NGU1ODMzMzc3NzQ1NTU1MzM3MjY2ZjUzNzg0YjcxMzQ0ZTM2MzMzNzc0MzY1ODRmNGU3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDUyMmI3NTcxMzQ0ZTU2MzU3ODMzNTIzMzIzMzczNDU4NGY0ZTc0NmY1NDRlNGI2ZTVlNDA3ODQwNTIyYjc0NzA0ZjRlMzYzMzM3NzQzNjRmNzU3NzI5NGY3NzVhMzQzMzM2NTIzNjMzMzQ0ZTM2MzIzNjU2NTkzMzM0NGU1NjMzNzU0ZTMwMzUyNDMyNzMzMzM3NzQ1NjM2MjQzMzM1NTU1NDcwNzQ3MDUzNWE0MTQwMzk1OTczNTc0ZDQxNzM1NTRmNGQ3MzZkMjU3ODQ3NDA0ZjRlMzYzMzM3NzQzNjU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZTM2MzMzNzc0MzY1ODRmNGUyMzcxMzk0ZTc4NTU1MjMzNTIzODUyMzI0NTU1NTMzNzI2NmQzOTVhMjM2ZjI0MmI3OTZlNTM1MjdhNTU1MTc4MzAzNzUxMzc1NDMzMzc1NTQ1NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NDU1NTUzNGE3NDZmNWUzMzcyNmY1ZTMzNzQ3MDU0Mzc0YzU1NTE3ODMwMzc1MTM3NTQzMzM3NTU0NTRmNzU0ZDczNTU0ZjRlMzIzNjc3Nzg1YTMyMzc1NjQwNTU1MTQ2NTIzODM0NGQ0MTZkMjU3ODQ3NDA0ZjQ5NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI0Zjc1NzcyOTRmNzc1YTM0MzMzNjUyMzYzMzM0NGUzNjMyMzY1NjU5MzMzNDRlNTYzMzc1NGUzMDM1MjQzMjczMzMzNzc0NTYzNjI0MzMzNTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjRjNTU0ZjczNTc1NTRmNGQ3MzU1NTM0NjQyNmU3OTMyNzMzNzUxMzcyMTM3NGY0OTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczMzc1MTM3MjEzNzRmNDk3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNGUzNjMzMzc3NDM2NTg0ZjRlNzY2ZDUzNTIyMzM5MjU3ODc3NTU1MTc4MzAzNzUxMzc1NDMzMzc1NTQ1NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NDU0Zjc1NGQ3MzU1NGY0ZTMyMzY3Nzc4NWEzMjM3NTY0MDU1NTE0NjUyMzgzNDRkNDE2ZDI1Nzg0NzQwNGY0OTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTU1NDM3NGM0MDM5NTY3MjZkMzgzMjQyNGY3NTc3Mjk0Zjc1NTU3NTU1NzM0MTU3MjEyNTRhNzQ2ZjVlNTk3MzM2NWUzMzc0NzA1MzM3MzU3MDUzMmI0YjQwMzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzg1YTMzMzU1Mzc4MjM0MDM0NGQ0MTM3MjM1MjU5NTU1MzI0NDg0MDUzMzY0MjU1NTQ1YTIzNmU1ZTU2Nzg1NTUzNDA0ODZmNzU0ZTI0NmYyNTM3NGI1NTUzNzA0YjIxMzgyYTIzNmY0YjRlNzQ2ZTc5MzI3MzcwMjU1MjIzMjEyNTc0Nzg2ZjRiNDk3MzcwNWU1NjQyNzA1NDMzNzg2ZTc1NGU0ODZlNzkzNjczNmY3OTJiNWU1NTU0NGU3ODZmNzU0ZTc2NmQ1MzUyNDc0MDI1MzY0NzRmNzM0MTczNTU0ZjRkNzMzNzI1NTIyMzIxMjU3NDc4NmY0YjRlNzQ2Zjc5MzY3MzQwNWU1NjQ4NzAzOTRlNzg0MDRmNGU3NTcxMzQ0ZTQ0NmQzODJhNzczMDc1NGQ3YTIxMzg1YTc2NmU1ZTM3NDc3MDRmNmY3MzQwNzkyYjRiNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzNmY0YjRkNDEyMTc5NTI0NzU4NWUzNzQ3MjE3OTUyNDc1NzMyNDE3MzU1NGY0ZDczMjEzODJhNzc1NTRmNzAyNTQwMzk1NjQyNTY0YjRlNzk2ZTVlNTU3MzIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNTk0NzRmNzU0ZDczNTU0ZjRkNzU1NTc1NTU1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzM5MjQyYjQyNmU3OTc4MjMzOTI0NWY0MTZmMjUzNzQ1NDA3NTQ5NzM2ZjUzNTIyMzZkNGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjZlNTMyYjc2NmQ0YjRkMmI1NTU0MzM0MTZmNzkzNzc0NDA1Mzc4NDc0MDRiMmE1OTZlMjU1YTQ0NTc0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjc2NmUyNTJhNDc1NTUwMjM3MzZmNWU1MjQ1NmQzOTMzNzg1OTRiMmE3NjZlMjUyYTQ3NDAzODVhMjM1NzU0NGU3NDcwNTM3MzQ1NTU1MzVhNDE0MDM4NWE0NDM5NWU1YTc0NmUzODM3NzI3MDUzNzQ0YjQwMzg1Mjc3MzEzNjQwNzQ2ZTU0NWE3ODU4NGY0ZTQyNmYyNTJiNDUyMTM5MzM0MjZlMjUyYTcyNmU1MzM3MjU0MDM4NDkyYjM1NzkyYjQ3NDAzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjc2NmUyNTJhNDc1ODc5MzcyNjQwMzg1YTI0NzA1MzM2NDE1NTc4NGUzNDMyMzY3MDVhMzIzNDRlNzQ3MDM5MzM0ODM5NWU0MDc0MjE1ZTM3MjQ2ZTM1MjQ1NjM1Nzc1YTM0MzMzNjI0NTIzNTc4MzM0ZTM1NGY1NTQyNTU0ZjRkNzY1NTUxMmI0NzZlNTQ3NzczNzA1MzUyNDQ0MDM5NTk3MzQwMzg0MDc5NDAzODVhMjM1NTUzMmI0NzU1NTM1MTczNmU3OTM3NWU1NTUzMzM3NDcwNTM1Mjc1MjEzOTVhNzg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc2ZTc1MmE3ODcxNTMzNzc2NzAzOTMzNzg1NzRmNTYzMjM2Nzc1MjU0MzUzNjUxNzM2ZDc5MmIyNDZmNzkyYTc0NmU1MjJiNDY2ZTI1MzM3ODMxMzc3MDRlMzU0ZjU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc2ZTc1MmE3ODcxNTMzNzc2NzAzOTMzNzg1NzRmNTYzMjM2Nzc1MjU0MzUzNjUxNzM2ZjVlNzg0NzIxMjU3NDRiNmUyNTJhNDg3MDM5NTkyYjM1NzcyYjM0MzUzNjUyNTk1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNzY2ZTI1MmE0NzU4NzkzNzI2NDAzODVhMjQ3MDUzMzc0YzIxNWU1NjQyNmY1NDMyNDEzNjI0MzM0ZTM3NTEzNzcyMzYyMzVhNTUzMzM2MjQ0ZTU3MzI0MTU3NTU0ZjRkNzM1NTUzMzM3ODQwNzU0ZTcyNmYzOTM3Nzg2ZjdhNzc0MTZmMjUzNzQ1NDA3NTQ5NzM2ZjVlNTI0NTU4NGY0ZTQ5MjEzOTU2NzQ2ZTM5NTkyYjU3NGY3NzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZmMjUzNzQ1NDA3NTJhNzI2ZTUzMmI3NjZkNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1NDVhNzg2ZTUzMjE0NzM5MjU1YTQ4NmU3OTI2NDc0MDM5NzQ3ODIxNWUzNzIzNDAzNDc0NGM2ZjM4NDk0NTU1NTQ0ZTc0NmY3OTUyNDY2ZjRiNzc0NzQwNzkzNzIzMjEyNTc0NzQ2ZTUzNDk0MTU3MzI0MTU3NTU0ZjRkNzM1NTUzMzM3ODQwNzU0ZTcyNzA1ZTU2NDI3MDUzMzY0MTZmMjUzNzQ1NDA3NTQ5NzM1NzdhNWEyMzIxMzkzMzc4NmUzODM3NDc3MDU0NTk0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1NTc1NTU3NzUyNDk2ZjUzNGEyYTU1NGY3NDRjNmYzODQ5NDU1NTU0NGU3NDZmNzk1MjQ2NmY0Yjc3NzM2ZjVlMzM3NDcwNTMzNzQ2NDAzODJhMjM2ZjRiNGU0MjZlNzU0ZTQ4NmU3OTM2NzM3MDU0NTY3NDZlN2E1YTc0MjE1ZTMzNDI2ZTI1MjY0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAyNTc4MjM2ZDRmNGU0YzQwMzg0YTc5NTg3ODJiNDU2ZTI1NWE0NDMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjc2NmUyNTJhNDc1ODc5MzcyNjQwMzg1YTI0NzA1MzM2NDE1NTc3NTY1MjMzMjM3ODMwNTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNTQ1NjJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDA3OTJiNGI1NTU0NWE0YTZlNGY0OTczNmY1MzUyNGIyMTM4MjQ0YzU1NTM3ODQ3NTU1NDVhMjMyMTM5MzM3ODZlMzgzNzQ3NzA1NDU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzIyMTI1MmI0NzZlNzUyYTc4NzE1MzM3NzY3MDM5MzM3ODU3NTQ1YTRhNmU0ZjQ5NzM2ZjUzNTI0YjIxMzgyNDRjNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODcxNTM1YTc4NmY1NDMyNzMzMzM5NzQ3NjQwMzk0ZTIzNmQzODJiNDczMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc2ZTc1MmE3ODcxNTMzNzc2NzAzOTMzNzg1NzRmNTYzNDM1MjM0YTU5MzI3NzUyNTAzNDRiNTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjIxMzg3ODRjNDAzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNzY2ZTI1MmE0NzU4NzkzNzI2NDAzODVhMjQ3MDUzMzY0MTU1Nzc1YTMxMzUzNjI0NTYzNzRmNTU0MjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTM0YTQ4MjEzODMzNzI3MDM5NWE3ODZmN2E1OTQxNmYyNTM3NDU0MDc1NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkyYjVlNmY0YjRkMmI1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTUyMjQ0MDM5NTYyYTU3NGY1NjM1MzMzNjRhNTIzMjI0MzI3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNDk3MzQwMzk3NDQ5NmQzOTU2MmE1ODRmNGU3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDUyMmI3NTcxMzQ0OTczMjEzOTRlNDk2Zjc5MmIyNTQwMzgzMzcyMjEzOTMyNzMzMzc4NTYzMTM1MzQ0ZTI0NmYyNTM3NGI2ZjRiNTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTU0NDYyNDZmMjUzNzRiMzkyNTc4NzczMDc1NGUyOTU2MjUzNzI2NmY1Mzc4NGI3MTM0NmYyODU1NTMzNzI2NmY1Mzc4NGI3MTM0NDk3MzU2MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzM5MjU1NjJhNTY0YzQxNzMyMTM5NGU0OTZmNzkyYjI1NDAzODMzNzIyMTdhNzc0NTU1NGY3MDc0NmY1NDRlNGI2ZTVlNDA3ODQwNTIyYjc0NzA0ZjZmMjg1NTUzNTI0OTZmNTQ1NjQ4NzA3OTM3NzczOTI1NTIyMzcyMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwNzkyYjRiNTU1NDM3NGM0MDM5NTY3MjZkMzgzMjQ1NTU1MzM3MjY2ZjUzNzg0YjcxMzQ0OTczMjEzOTRlNDk2Zjc5MmIyNTQwMzgzMzcyMjE3YTc3NDU1NTUzNTI0OTZmNTQ1NjQ4NzA3OTM3NzczOTI1NTIyMzU1NTM3ODQ3NTU1NDU2NDg3MDVlNWEyYjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTQ1YTc0NzA3OTM3NzI3MDM5NWE3ODZmNzU3NDRjNDAzODRhNzk1ODRmNGUyNDZmMjUzNzRiMzkyNTc4Nzc1ODRmNGU3NzIxMzkzMzc0NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjVlNmY3OTc4MjM0MDM0NzM0MTU1Nzc3ODMwMzYyMzM3MzQzNzRmNGUzMTM2NzU0ZTM0MzMzNzRlNTkzMjM2NWE1MjU1NTE3ODMwMzc1MTVmNzM3MDM5NWE3ODZmN2E1OTczMzc3NzUyNTkzNzM2MzczNTU1NGY3MzJmNTg0ZjRkMmY1ODRmNGQyZjU4NGY0ZDJmNTczNDU1NDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3NDRjNzA1NDU1NDE3MDM5NWE3ODZmNzgyYjQyNDA0Zjc3NDU1NTUzMzM3NDcwNTM1MTQ3NDAyNTM3MjM1NzRmNzA3ODcxNTQ0ZTQyNmY3YTc3N2E1NzM0NDk3MzQwNTM1MjIzMjEzNDJhN2E0MDM5MzI0MTU2MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzM5MjU1NjJhNTY0Yjc3NDU1NTUzMzM3NDcwNTM1MTQ3NDAyNTM3MjM1NzRmNzA3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDUyMmI3NDcwNGY2ZjQyNTczNDc3NDI0ZjczNDE3MzU1NGY0ZDczNDA1MzM3Nzk1NTUzMzM3ODZlNTMzNzIzNDAzNzJiMjQ2ZjI1Mzc0YjU3NTQ1YTc4NmU1MzIxNDU1NTU0Mzc0YzQwMzk1NjcyNmQzODMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTcwNGI2ZDM5MzM3ODU3NGY3Mzc1MzM1MTM3NTkzMzM3MzM1MjU1NTE0MDM0MzUyMzIzNzM3MDM5NWE3ODZmN2E1OTczMzcyMzc0NTIzNjc3MzY3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNGQyYjU1NTA1Zjc1NTg0ZjRkNDE2ZjVlMzM0YjU3NTQzNzRjNDAzOTU2NzI2ZDM4MzI0MjU4NGY3NzQyNTczMjQxNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNDU2ZTI1NTI3NzM5NWU3MDc0NzA1MzVhNDE0MDM5NTk0MTZmMjUzNzQ1NDA3NTQ5NzM2ZDI1Nzg0NzQwNGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAyNTUyMjMyMTI1NzQ3ODZmNGI0ZDJiNTU1NDQ2MmI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MmI1ZTZmNGI0ZDJiNTU1NDVhNzg2ZTUzMjE0NzM5NWU1MjI0NDAzOTU2MmE1NzRmNTYzNTMzMzY0YTUyMzIyNDMyNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTU0MzMyYTZmNTMzNjQ1NTU1MzM3MjY2ZDM5NWEyMzZmMjQyYjc5NmU1MzUyN2E1ODRmNGU0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODU4NGY0ZTQ1MjEzOTVhMjMzOTVlNWEyMzIxMzkzMzI0NmY0YjRlNTMzNjc3MmI1YTU1NTQ3MDc0NzA1MzVhNDE0MDM5NTk3MzM3MjM3NDUyMzY3NzM2NzM2ZDI1Nzg0NzQwNGY0ZDJiNTU1MDVmNzU1ODRmNGQ0MTZkMjU3ODQ3NDA0ZjQ5NDI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNDA0ODZmNzU0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzAyNTUyMjMyMTI1NzQ3MjcwNTQ3ODQ5NDAzNDQ5NzM0MDM5NzQ0MjZmNWUzMzRjMzkyNTQwNDUyMTM4NmY0NTU1NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjQ1NTU1MzRhNzQ2ZjVlMzM3MjZmNWUzMzc0NzA1NDM3NGM1NTUzNzg0NzU1NTQ1NjQ4NzA1ZTU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDc0NzA1MzVhNDE1NTUwMjM3MzcxNGI3MDIzNzEzOTRlNzg1NjRjNDE3MzcwMjU1MjIzMjEyNTc0NzI3MDU0Nzg0OTQwMzQ0OTczNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzMDc1NGU0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODU4NGY0ZDdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2EzMDc1NGUyOTcyMzkyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzZkMjU3ODQ3NDA0ZjRkMmIzMTM0NGQ3YTIxMzg1YTc2NmU1ZTM3NDc3MDRmNmYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTIxMzkzMzc2NmQ1MjQ1N2E0MDM5NzQ0MjZmNWUzMzRjNTYyNDIzNzMzMTM0NGU3NTZlMjUyYjQ1NTc1MzM3MjY2ZDM5NWEyMzZmMjQyYjc5NmU1MzUyN2E1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDI1NTIyMzIxMjU3NDZlNTYyNTRhNzQ2ZjVlMzM3MjZmNWUzMzc0NzA1NDM3NGM1NjI0MjM3MzMxMzQ0ZTMwNmUyNTJhNzg1NTUzNzg3OTU1NTM0YTc0NmY1ZTMzNzI2ZjVlMzM3NDcwNTQzNzRjNTU1Mzc4NGM1NTUxMmE0ODZlNzkzNjczNDAzODRhNGM0MDM0NGU3NTZlMjUyYjQ1NTc1MzRhNzQ2ZjVlMzM3MjZmNWUzMzc0NzA1NDM3NGM1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlMjEzOTMzNzY2ZDUzMzc0YzM4NWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODM5MzQ0ZDJiNTU1NDcwNzQ3MDUzNWE0MTRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1NjQ4NzA1ZTU5NzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiNGE3MDM4Mzc0YjcxMzQ3Mzc1MzYyMzM3NTkzMzM2NWEzNjU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU4NGY0ZTI0NmYyNTM3NGIzOTI1Nzg3NzU4NGY0ZTc2NmQ1MzUyMjMzOTI1Nzg3NzU4NGY0ZTRjNzA1MzUyNGI3MDUyMmIyMzZkMzgyNDc4NTU1MTQwMzQzNTIzMjM3MzZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmN2E1OTczMzcyMzc0NTIzNjc3MzY3MzZkMjU3ODQ3NDA0ZjRkMmI1NTUwNWY3NTU4NGY0ZDQxNmQyNTc4NDc0MDRmNDk0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjQ5NzMyMTI1NzQ3NDcwNTIyYjQyNDA0ZjQ5NzM2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM0NGU0MjZlNzU0ZTRiNmU1ZTcwNGMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDRlNDI2ZTc1NGU1ZTIxMzkzMzc2NmQ1MzM3NGMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDI1NTIyMzIxMjU3NDc4NmYyNDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNzI0NmU1NjVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTY0YzU2MjQyNDZlNzAzOTVhNzg2Zjc4MmI0MjQwNTIyMzczMzEzNDRlMjk1NjI1NWE0MTIxMzkzMzcyNmQzODMyN2EzMDc1NGU3NjZkNTM1MjIzMzkyNTc4Nzc1ODRmNGQ3YTZmNWUzMzc0NmY3YTMzNzI3MDUzNzg0NjQwMzQ2ZjI4NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM3MmI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1NDcwNzQ3MDUzNWE0MTQwMzk1OTU3NGY3NTRkNzM1NTRmNGU3NzQwMzgyMTczMzk1ZTcwNzQ3MDUzNWE0MTM5NWU1YTIzMjEzOTMzNzg2ZTM4Mzc0NzcwNTQ1OTQxNmYyNTM3NDU0MDc1NDk3MzZkMjU3ODQ3NDA0ZjQ5NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTU0NzA3NDcwNTM1YTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzNTIyMzQwMzgyNDc4NmU3YTMzNGM1NTUwMjM3MzM4NGI3Mzc1MzQzNjJhMzUzMzM3NTYzNjU1NTEyYjM0NTU1MjU2NTIzNjUxNGE0ZTMyMjMzNjczMzQzNjJhMzYzNTRiNGU1ZTIxMzkzMzc2NmQ1MzM3NGM1NTUyNDA0ZTM1NTIzNzUyMzY0YjRkNDEzMTRiNDk3MzMxNGI0OTczMzE0YjQ5NzMzMTRiNDk3MzMxNGI0OTczMzE0Yjc3NzU1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0Zjc0NDQ2ZDM4MmE3NzU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzAyNTUyMjMyMTI1NzQ2ZTU2NWUzMzJhNmY1MzM2N2EzOTM0NDk3MzcwMjU1MjIzMjEyNTczNDc0MDI1MzcyMzU3NGY3MDc4NzE1Mzc4NGM3MDU0NTk3YTU3MzQ0OTczNzAyNTUyMjMyMTI1NzQ2ZTU2NWU1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjdhMzkzNDQ5NzM3MDI1NTIyMzIxMjU3MzQ3NDAyNTM3MjM1NzRmNzA0NTIxMzk1YTIzMzk1ZTVhMjMyMTM5MzMyNDZmNGI2ZjQyNTczNDc4NzA0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDc5MmI0YjU1NTQzNzRjNDAzOTU2NzI2ZDM4MzI0NTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NTczNmQzODI2NzM3MDI1NTIyMzIxMjU3NDZlNTY1ZTVhMjQyMTdhNWE3NjZmNzk3ODc1NDAzOTU2NGM1NjI0MjM0NzZkMzkzMzc4NmUzOTU5NDE1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDUzMzc0NjQwMzgyYTIzNmY0YjJhNzQ2ZjU0NGU3ODZlNzkzMjQxNTc0ZjU2NTYzNTc4NWE1MjM2NzgzMjczMzUyNDU1NzMzNjc3MzczMjM1NTE1MjUwMzMzNDRlNTYzNTc4MzMzMTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjRjNTU1MjQwNGUzNTUyMzc1MjM2NGI0ZDQxMzE0YjQ5NzMzMTRiNDk3MzMxNGI0OTczMzE0YjQ5NzMzMTRiNzc3NTU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NzUzNDY0MjZlNzkzMjQ1NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRlMjQ2ZjI1Mzc0YjM5MjU3ODc3NTg0ZjRlNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGIzODRiNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjI0MjM0NTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjZlNTY1ZTVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2N2EzOTM0Nzc0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU0YzcwNTM1MjIzNDAzODI0Nzg2ZTdhMzM0YzRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTQ1YTc0NzA3OTM3NzI3MDI1NTIyMzIxMjU3MzQxNmYyNTM3NDU0MDc1NDk3MzZkMjU3ODQ3NDA0ZjQ5NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTU0NzA3NDcwNTM1YTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzU1NTc1NTY1NjZlN2E1YTc4NmY3YTMyNzM2ZTVlNTU3MzZmNzkzNzQ5NmU1MzUyNzY0MDM0NGU3NDU1NTQ3MDc0NzA1MzVhNDE1NTU0MzM0ODQwMjUzNzIzNmQ1MzM3NGI1NTU0NzA0MjcwNTM3MzczNmQzOTMzNGM1NTUzNWEyNDZmN2E1Njc4NmU3YTMyNzM2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2ZjdhNTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjcwNWU1NjQyNzA1MzM2NDE1NzdhNWE3ODZlNTMyMTQ3Mzk1ZTcwNzQ3MDUzNWE0MTM5NWU1YTIzMjEzOTMzNzg2ZTM4Mzc0NzcwNTQ1OTQxNmQyNTc4NDc0MDRmNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0NTU1NTQ3MDc0NzA1MzVhNDE1NzM0Nzc1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzQwNTMzNzQ1NDAzOTMzNzgzOTVlNzA3NDcwNTM1YTQxNTc1NDVhNzg2ZTUzMjE0NTU1NTM0NjQyNmU3OTMyNDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNWU2Zjc5NzgyMzQwMzQ3MzQxNTU3NzMzNTIzNTUxMzczNjMzMzQ0ZTUzMzY3NzJiNWE1NTU0NzA3NDcwNTM1YTQxNDAzOTU5NzMzNzIzNzQ1MjM2NzczNjczNmQyNTc4NDc0MDRmNGQyYjU1NTA1ZjczMzIzNjJhNTE1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NTUwMjM3MzMxNGI1NTQ1NTU0Zjc0NDQ2ZDM4MmE3NzU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzQyNTg0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNzM3NTMzNTEzNzU5MzMzNzMzNTI1NTUxNDAzNDM1MjMyMzczNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5NzMzNzIzNzQ1MjM2NzczNjczNmQyNTc4NDc0MDRmNGQyYjU1NTA1ZjczMzIzNjJhNTE1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NTUwMjM3MzMxNGI1NTQ1NTU0Zjc0NDQ2ZDM4MmE3NzU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzQyNTczMjQxNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNzQ0MDUzMzM3MjZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmNzU3NDRjNDAzODRhNzk1ODRmNGU0NDZkMzgyYTc3NTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjQ5NzM2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2Zjc1NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI3MDVlNTY0MjcwNTMzNjQxNTc0ZjU2NTYzNTc4NWE1MjM2NzgzMjczMzUyNDU1NzMzNjc3MzczMjM1NTE1MjUwMzMzNDRlNTYzNTc4MzMzMTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjRjNTU1MjQwNGUzNTUyMzc1MjM2NGI0ZDQxMzE0YjQ5NzMzMTRiNDk3MzMxNGI0OTczMzE0YjQ5NzMzMTRiNzc3NTU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNDE2ZDI1Nzg0NzQwNGY0OTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTU1NDVhMjM2Zjc1NzQyNDZmMjUzNzRiMzkyNTc4Nzc1NzM0NDk3MzZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmNzg0NTdhMjEyNTc0NzQ3MDUyMmI0MjQwNGY3MDcwNTg0ZjRlNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGIzODRiNzA0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODU2MjQyMzQyNTczNDc3NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM2Zjc5Mzc0NjZlNWU0MDc4Mzk1ZTVhMjQyMTdhNWE3NjZmNzk3ODc1NDAzOTU1NDE2ZjI1Mzc0NTQwNzU0OTczNmQyNTc4NDc0MDRmNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0NTU1NTQzNzRjNDAzOTU2NzI2ZDM4MzI0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDczOTVlNzA0YjZkMzkzMzc4NTc0ZjczNzUzMzUxMzc1OTMzMzczMzUyNTU1MTQwMzQzNTIzMjM3MzZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmN2E1OTczMzcyMzc0NTIzNjc3MzY3MzZkMjU3ODQ3NDA0ZjRkMmI1NTUwNWY3MzMyMzYyYTUxNTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTU1MDIzNzMzMTRiNGU0ZTM1NzczMjczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0ZDJiNTU1MDVmNzU1ODRmNGQ0MTZkMjU3ODQ3NDA0ZjQ5NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTU0NWEyMzZmNzU3NDI0NmYyNTM3NGIzOTI1Nzg3NzU3MzQ3NzQyNTczMjQxNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNGI0MDM4NWE0ODZmNzkzMzcyNmY1ZTMzNzQ3MDU0Mzc0YzU3NTQ1YTc4NmU1MzIxNDU1NTUzNDY0MjZlNzkzMjQ1NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRlNDUyMTM5NWEyMzM5NWU1YTIzMjEzOTMzMjQ2ZjRiNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI3MDVlNTY0MjcwNTMzNjQxNTc0ZjU2MzczNjUxMzM0ZTM3NTEzNjczNzAyNTUyMjMyMTI1NzQ3ODZmNGI0ZTM1MzMzNzMyNzM2ZTUzNTI0YzcwNTIyYjRjNzA1MzUyMjM3MDM5NTk3MzMxMzQ0ZDJmNTU1MjcwNTUzMzM3NTY1MjU1NTM0NjQyNmU3OTMyNzMzMTM0NGQyZjU1NTE1MjMwMzM0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDRkMmI1NTUwNWY3NTU4NGY0ZDQxNmU1MzUyNGM3MDUyMmI0YzcwNTM1MjIzNzAzOTU5NDU1NTUzNDY0MjZlNzkzMjQ1NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczNDc3NDI0ZjczNDE3MzU1NGY0ZDczNDA1MzM3Nzk1NTUzNzg0NjZmNTMyYjRiNzA1MjJiNDM2ZjI1MmI0NzM5MjU0MDQyNmU1MzM3NGM1NzU0NWE3ODZlNTMyMTQ1NTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjcyNDA3OTc4NDU0MDM0NDk3MzcwMzk1YTc4NmY3ODJiNzcyMTM5MzM3NDM5MjU0MDQyNmU1MzM2NDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTU3NTU1Nzc1YTQ4NmY1NDc3NzM2ZjVlMzM3NDcwNTMzNjczNDA3YTU2NDg2ZTM0NGUyMzZkNTMzNjczNmUyNTRhNzc1NTUxNDIzNTM1MjMyNjczNDA3OTc4NDU0MDM5NTk3MzZkMzgyYTIzNmU0YjRlMjM2ZDUzMzY3MzQwNTM1MjIzMjEzODU2NzQ2ZjI1MzY3MzcwNTM3NDc4NTU1MzQwNDI2ZjdhNWEyMzU1NTQzMzQyNmUzODM2NzM2ZDM5MzI3MzZkMzk1OTczNmU1ZTRlNzg2ZTc5Mzc3NzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTUyMjQ0MDM5NTYyYTU3NGY1NjM1MzMzNjRhNTIzMjI0MzI3MzU5MzQ0ZTUzMzY3NzJiNWE1NTUzMjQ3ODcwNTM1MTczMzcyMzc0NTIzNjc3MzY3MzZkMjUzNzJhNTU1MDIzNzM1NjI1NDI0YzZlMjUyYTcyNmQzODI0NDk2ZTVlNTYyMzQwMzgzMjdhNTU3NTc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNDAzODI0Nzg2ZTdhMzM0YzU1NTAyMzczMzgyNDIzNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZlNWU0ZTc4NmU3NTc0MjQ2ZjI1Mzc0YjM5MjUzMzc0NzA1MzUyNzI0MDc5Nzg0NTQwMzQ0OTczNTU3YTU1NzU1NzM0NGU3NDZmNGI0ZTc5MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDA3OTJiNGI1NTU0Mzc0YzQwMzk1NjcyNmQzODMyNDU1NTUzMzM3NDcwNTM1MTczNmQzODI2NzM2ZDdhNWE0ODZlNzUyYTQ1NmUyNTUyNzc1NzUzMjE0MjU4Nzk3ODIzNDAzODI0NGM1NzRmNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDUzMzc0NjQwMzgyYTIzNmY0YjJhNzQ2ZjU0NGU3ODZlNzkzMjQxNTc0ZjU2NTYzNTc4NWE1MjM2NzgzMjczMzUyNDU1NzMzNjc3MzczMjM1NTE1MjUwMzMzNDRlNTYzNTc4MzMzMTU1NTQzNzRjNDAzOTU2NGM1NTUyNDA0ZTM1NTIzNzUyMzY0YjRkNDEzMTRiNDk3MzMxNGI0OTczMzE0YjQ5NzMzMTRiNzc3NTU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNDE3MDM5NWE3ODZmNzgyYjQyNDA0ZjQ5NzM0MDUzNTIyMzIxMzQyYTdhNDAzOTMyNDE1NjI1MzcyNjZmNTM3ODRiNzEzNDZmNDI1ODRmNGU3NzIxMzkzMzc0NTg3OTcwNzg3MDRmNzM3YTIxMzk0ZTQ5NmY3OTJiMjU0MDM4MzM3MjIxN2E3NzdhNTczNDQ5NzM0MDUzNTIyMzIxMzQyYTdhNDAzOTMyNDE1NjI1NTI0OTZmNTQ1NjQ4NzA3OTM3NzczOTI1NTIyMzU2NGI3NzQyNTczNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczMzM3OTc4NDU0MDM2MmE0ODcwNTE0MDQ4NzAzODJhNzczMzM5NTY0YjZlNWU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NGU3NDZmNWU1OTU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlNmQzOTMzNDE1NTUzMmI0OTQwMzgyNjQxNmUzODJiNDc2ZDM5MzM0ODZmNzgyYjc5NmQzODRhNzg1ODRmNGQ3NTZmNzU1NTQyNTU1MzUyNGM1NTUzMjEyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiNGQyYjU1NTM0MjRjNmUyNTI2NDc2ZTUzMmI3NDQwNGY3NDc5NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTUzNmQzODRhNzgzNTc5MmIyMzMzNzkyYjI0NmU3OTMzNTI2ZjdhNTY0ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NzMzMTM0NGUyOTcyMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzMyMTM4NWE3NjZlNWUzNzQ3NzA0ZjRlNDI2ZTc1NGU3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiMmE0MjcwNTMzNzQ2NmY0YjczNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MTJiNDU0MDUzMzc0YjU1NTM0MDQyNmU1MzM3NGM1NTUzNDY3ODZmNTQzMjczMjEzNDRlNGM2ZDM4MmE3YTZlNTMzNjczNTY1ZTM3NGM0MDM5NTY3MjZkMzgzMjdhNTU1NDRlNzg2Zjc1NGU3NDIxMjU1YTQ4NzAzODJhMjM1NTUzNzg0NzZmNWUzMzc4MjEzODMyNzM2ZTI1MjE3MzIxMzQ0ZTRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNTU1MzRhNDI2ZjVlMzI1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM1NjVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTY0YzU2NGI0ZTQ3NmU1ZTMyNzM2ZDM4MjY3MzIxMzg1YTc2NmU1ZTM3NDc3MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0Mzc0YzQwMzk1NjcyNmQzODMyNzMzMTM0NGU3NDIxMjU1YTQ4NzAzODJhMjM1ODdhNGU0ODZmNGY3MzdhNzAzOTVhNzg2Zjc4MmI0MjQwNGY2ZjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc0MjEyNTVhNDg3MDM4MmEyMzM4NGI3MDRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0YjcwNzA1NTUwMjM3MzcxNWU1YTIzNmY3NTc0MjQ2ZjI1Mzc0YjM5MjU3ODc3NTczNTQxNzM3MTRiNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjRjNDE3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNDk3MzU2NWU1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjdhMzA3NTRlNzQyMTI1NWE0ODcwMzgyYTIzMzg0YjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjI0MjQyYjcyMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzNTIyMzQwMzgyNDc4NmU3YTMzNGM1ODc5MzcyNjcwNTMzNzQ3NDA0Zjc0NGM0MDM4NGE3OTU4NzgyYjVlMjEzOTMzNzY2ZDUyMmI0YzcwNTM1MjIzNDAzODI0Nzg2ZTdhMzM0YzU3NGY3MDc0MjEyNTVhNDg3MDM4MmEyMzU2NGI0OTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ3NmU1MzJiNWU0MDM5NTU0MTU3MzQ0OTczMjEzODVhNzY2ZTVlMzc0NzcwNGY3NzQyNGY3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjMyMTM5MzM3ODZlMzgzNzQ3NzA1NDU5NDcyMTM5NGU0OTQwMzgyYTc3NTc0ZjczNzUzNDM2MmEzNTMzMzc1NjM2NTU1MTc4MzAzNzUxNWY3MzZlMzgzNzIzMjEzNDRlMzgzMjM2NGEzNzMzMzc1OTczNTc0ZjcwNDM2ZjI1MmI0NzM5MjU3ODQ2NmY1MzJiNGI3MDUzMzc3NzU2NGI0OTczMzE0Yjc3NzU1ODRmNGQ0MTQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc0Zjc3NDc2ZjVlMzM0YjQwN2EzMzQyNmUzODM2NDE1NTc1Mzc0MDU4MzQzNzQ2NTgzNDM3Nzc1NTRmMzc1NTMwNzUzNzVhMzA3NTM3MzU1NTc1Nzc0NTU3MzQ3NzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjcwNWU1NjQyNzA1MzM2NDE1NzdhNWEyMzIxMzkzMzc4NmUzODM3NDc3MDU0NTk0MjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTM1YTQ4NmUzOTRlNzQyMTVlMzI0MTZmMjUzNzQ1NDA3NTc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTc1NTU3NTMzNzkyYjQ1NDA0ZjRlMjM2ZDUzMzY3MzM3MjM1MjU5NTU1MzU2NzQyMTI1NDU3MzZkMzgyYTIzNmU0YjRlMjM2ZDUzMzY3MzQwNTM1MjIzMjEzODU2NzQ2ZjI1MzY3MzQwNzk3ODQ1NDAzNDRlNzQ2ZTc5MzI3MzZmNzkzNzQ1NDAzODUyNGM0MDM0NGU3OTZmNzkzNzc4NTU1NDRlNzQ0MDI1Mzc0YzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZmMjUzNzQ1NDA3NTJhNzI2ZTUzMmI3NjZkNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGUzNjZkNTQ1NjQ4NzAzODcwNDE1NTUzMzcyNjQwMzg1YTI0NzA1MzM2NDE1NzM0NGUyMzZkNTMzNjczNmY1NDU2NzQ0MDI1MjQ3NDU1NTM0MDRiNDAzODM3NGM1NTUzMmI0NzQwMzQ0ZTQ5MjEzODcwNzg1NTU0NGU3ODZmNzU0ZTRjNzA1MzM3NDkzMDRiNGU3ODcxNTMzNzc2NzAzOTMzNzg2ZjI1NWE0YjZkMzk0ZTIzNTU1NDU2MjQ2ZTdhNTk3MzZkMzkzMjczNzA1MzVmNzMyMTI1MmI0NjZmNTM0YTc4NzA1Mzc4NDg2ZTc1MjY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlMzgyMTM4NWEyNDcwMzgyMzczNDA3OTc4NGI2ZjVlMzI3MzZmMjU1ZjczNzA1Mzc0Nzg1NTU0NGU3NDQwMjUzNzRjNTU1Mzc4MjM1NTUzMjQ0ODcwNzkzNzRjNTU1MzUyNGI0MDM0NGU3OTZlMjU0YTc3NDAzODMyNzMyMTc5NTI3NjZkNGI0ZTc1NzEzNDRlMjM2ZDUzMzY3MzIxMjU3NDc4MjEyNTQ2NDk2ZTI1Nzg0NzcwNGYyNjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc2ZTc1MmE3ODcxNTMzNzc2NzAzOTMzNzg2ZjI1NWE0YjZkMzk0ZTIzNTc0ZjU2MzIzNjc3NTI1NDM1MzY1MTczNmQzODJhNzY2Zjc5Mzc0NjQwMzgyYTIzMjEzODRhNzI3MDc5NTI3NjcwMzkzNzQ2MzA0YjU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDczOTI1NWE0ODZlNzkyNjQ3NDAzOTc0NzgyMTVlMzcyMzQwMzQ3Mzc1MzY1MjU2NGUzMzIzMjQ0ZTU1NTQ3MDc0NmU1MjJiNzY2ZDUzMzc3NjZkNWU0ZTQ4NmQzODJhMjM1NzUyMzMzNDM3MzYyYTUwMzIzNzMzNTI1NzM0NTU0MjRmNzM0Mjc3NDAzODIxNzMyMTM4NWE0YTcwMzg3ODRiNDAzNzJiNDI2ZTdhNWEyMzIxMzgyYTc2NDAzNzJiNDU2ZTI1NWE0NDU3NTQ0ZTc0NzA1MzczNDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNzUzNTI0NDQwMzQ0ZTc0NmU3NTRlNzg3MTUzNWE0NTcwMzk1YTQyNzA3OTM2NzM2ZTUzMmI3NjZkNGI0ZTc5NmU1ZTU1NzM3MDUzNzQ3ODU1NTM0YTQyNDA3OTM2NzM2ZTI1MjE3MzcwNTM3NDc4NTU1NDRlNGI2ZTI1NWE3ODZmNWU1OTQ1NTU1MzJiNGI1NTUzMzcyNjZkMzkzMjczNmQzODIxNzMyMTM4MmE0ODcwNTM3NDc4NmY3NTRlNDI2ZTdhNWEyMzIxMzgyYTc2NDAzNDRlNDE2ZTI1NGE3NzZmNGI0ZTQyNzA0ZjI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1MzRhNDgyMTI1NDY3MjQwNzk3ODQ1NDAzNDRkMmI1NTUzMmI0OTQwMzgyNjQxNmY1MzUyMjM2ZDRmNDk3MzU2MjU1MTdhNTczMjQxNzM1NTRmNGQ3MzZkMzgyMTczNDA3OTVhNDc3MDUzNDk3MzZkMzk1OTczNmU3OTJiMjM1NTUxMmE0ODZlNzkzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5MjEyNTJhMjM2ZTRmMmE3OTZlNTMyYjc2NmQ0Yjc0NDU2ZTI1NWE0NDM5MjU0MDQyNmU1MzM2NDU1NTUzNDA3NjZlN2EzMzQ1NTg3NzRhMzEzMjIzNDY3MjMzMzc3MzczNzI0ZjRlNzkyMTI1MmEyMzZlNGYyYTU5MzUyMzVhNTgzOTIzMmE0ZjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDRmNGUzMTM2MjMzNzRiNmY3OTJiNGIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNzEzOTU5NDc0MDM5NzQ0MjcwNGY3NDc5NTU3NzUyNDc2ZTVlMzM0MTQwMzk1NTczMjE3OTJiMjM1NTUzNzg0NzZmNWUzMzc0NmU3OTVhNzg1NTUzNzg0YzU1NTM1MjQ1NmY3OTM3NzQ0MDU0Nzc3MzZmN2EzNzQ3NmU3OTc4NDc0MDRiNGU0ODZlNzU0ZTI5MzYyNDMzNGUzNzUxMzc3MjMzNTE1NjcyMzM3Nzc4NTkzMzM5MjMyOTU1NTMyYjQ3NmU1NDc3NzM2ZTI1MmE3ODU1NTM3ODQ3NmY1ZTMzNzQ2ZTc5NWE3ODU1NTMyNDc0NzEzNDRlNGM0MDM5NTYyNTQwMzQ0ZTc0NTU1MzU2NDg3MDRmNGUyMzZlMjU0Njc4NmU3NTI2NzU1NzMyNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTM0YTQ4MjEyNTQ2NzI0MDc5Nzg0NTQwMzI0MTU3NmQzODJhNGM3MDUzNTI0NzIxMjUzNzcyNmU1MzJiNzY2ZDRiNGQyYjU1NTM1Mjc2NmYzOTM3NDI2Zjc5Mzc3MjZkMzgyYTRjNzA1MzUyNDcyMTI1Mzc3MjZlNTMyYjc2NmQ0Yjc0MzUzNzUxNTIzNjMzMzcyYjUxMzI3ODJiNTMzNDM2NGE1MjU1NGY0NTczNTU3NTJhNDU2ZTI1NWE0NDU1NzU3NzU3NmY1ZTMzNzQ3MDUzMzc3MjZmNWUzMzQ4NmY3OTM2NzMzMTM0NGUzNTcwNTM1MjIzNDAzNzVhMjM2ZTVlNTY3ODU3NTI1YTM2MzIzNzMzNTIzOTIzMzM0ZjM5MjM0MDU2MzU1MTM2NDI0ZjdhNWEyMzIxMzkzMzc4Mzk1ZTVhMjM2ZTVlNTY3ODU4Nzk3ODQ2NmY1MzJiNGI3MDUyMmI0MzZmMjUyYjQ3MzkyNTQwNDI2ZTUzMzc0YzU3NTEyNDMxMzU3Nzc4MzYzNTI0NTY3MjMzNzc3ODU5MzMzNDQ5NzMzNzM3NWE1MjM2NzgyYjUxMzIzNzMzNGUzOTIzNDA1NjM1NTEzNjQyNGY3MzQyNzc0MDM4MjE3MzZlNTMyYjc0NDA1MjJiMjQ2ZjI1Mzc0YjM5MjUzMzc0NzA1MzUxNDE1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NGE0ODIxMzgzMjczNzAzOTVhNzg2Zjc1NGU3NzIxMzkzMzc0NTU1MzQwNGI2ZTI1MjM3MzcwNTM3NDc4NTU1NDVhMjMyMTM5MzM3ODU1NTMzMzc0NzA1MzUyNzUyMTM5NWE3ODU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzQwMjU0YTQ4MjE3OTUyNDU1NTUyMzczNTMzMzc1NjcyMzM1MTUyMzYzMjMyNDE3MzU1NGY0ZDczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlNTU1MDIzNzM2ZjVlMzM3NDcwNTMzNzcyNmY1ZTMzNDg2Zjc5MzY0NzZlNTMyYjc0NDA1MjJiMjQ2ZjI1Mzc0YjZmNGI3MzQyNGY3MzQyNzc0MDM4MjE3MzZkMzk1YTcyNzAzOTVhNzg2Zjc4MmI3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDRmNzQyNDZmMjUzNzRiMzkyNTc4Nzc1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NWE0MTQwMzg1YTQ0NTU1Mzc4Nzk1NTU0MzM0MTQwMzQ0ZTI0NmYyNTM3NGI1NTUzNzg0YzU1NTM3ODQ3NTU1NDMzNDE0MDM0NGU3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDRmNGU0NTZkMzk1YTIzNTU1MzUyNDc0MDRmNGU0NzZlNWUzMjczNDAzOTc0NDk2ZDM5NTY3ODQwNGYyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1NDM3NGM0MDM5NTY3MjZkMzgzMjczNmQzODI2NzMzMjM2MzM1YTM0MzYyYTcyMzQzNjMzMzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlMzY2ZjdhMzc3ODRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTQzNzRjNDAzOTU2NzI2ZjVlMzM0YjU1NTAyMzczNmY1ZTMzNGI1NzU0Mzc0YzQwMzk1NjcyNmQzODMyNDI0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlMjQ2ZjI1Mzc0YjM5NWU1YTIzNmY3NTRlNDI2ZTc1NGUzNzM2MjMzNzM0MzkyMzMzNGUzNzUxNTEyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzk3NDQ5NmQzOTU2MmE1NTUwMjM3MzM3Mzc1YTUyMzY3ODJiNTEzMjM3MzM0ZTM4NWUzNzRjNDAzOTU2NzI2ZjVlMzM0YjM5MzQyYTdhNDAzOTMyNDE1NjI1MzcyNjZmNTM3ODRiNzEzNDZmNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzQwMzk3NDQ5NmQzOTU2MmE1NTUwMjMyYjU1NGY3MDQyNmU3OTQwNDI2ZTc5NzgyMzcxMzQ2ZjczNmU1ZTU1NzM0MDUzNTIyMzQwMzkzMzQyNmUzODM2NDc2ZTc5MmI1ZTU3NGY3NzczMzE0ZjRlNzcyMTM5MzM3ODcwNTM3ODQ2NDAzNDJhNGM3MDU0NTY0OTcwNTM3ODQ2NDAzNDc0Nzg3MTU0NGU0MjZmN2E3NzQ1NTU0ZjU1NzgzODM0MjM3ODZlMzQyMzc4NDA0ZjRkNzgzNDUwNDE3ODM1MzU0MTc4MzY0YjU1NDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzM3NTQ1NjI0NDAzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzNjc5Mzc0NjZlNWU0MDc4NTU1MzM3MjY2ZjUzNzg0YjQwMzgzMjczNzAzOTVhNzg2ZjczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTM3MzYyMzM3MzQzOTIzMzM0ZTM3NTE1MTQ3NmY1MzJiNDk1NzU0Mzc0YzQwMzk1NjcyNmY1ZTMzNGI1ODRmNGUzMDZlMjUyYTc4NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNDAzNzJiNGM3MDUzMmI0YjQwMzQyYTc3NDAzODRhNzg3MDUzMzc3MjcwMzk1YTc4NmY3NTc0MjQ2ZjI1Mzc0YjM5NWU1YTIzNmY3NTc3NTc1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1NDM3NGM0MDM5NTY3MjZkMzgzMjczNmQzODI2NzMzMjM3NGUzMjM2NzcyYjM4MzMzNjMzNzIzNzM3NWE1MjM2Nzg1OTU3NGY3NTU5NzMzNDM4MmE0MjcwNTM3ODc0NmU1Mzc4Mjg0MDM0NGU1MzZlNTM1MjRjNmQ0YjRlNzk2ZTVlNTU3MzZkMjUzNzc4NmY0ZjI0NzQ2ZTUzNzgyNTQwMzI0Mjc0NmY1NDRkNzMzMTM0NGU1MzZlNTM1MjRjNmQ0Yjc0NzIzOTI1MmE3NDZlMzgzNzcyMzk0Yjc3NTc0Zjc3NGU3NDZmNTQ0ZDQ3NmY3OTJiMjQ3MDUzMzY0MTU2NGI1ZjdhNTczMjQyNzc0MDM4MjE3MzZkNTMyYjQ2NDAzNDczNDIzMDczNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NGY1NjRmNmU1ZTMyNzM2ZDM5NTk3MzIxMzg0YTQyNzA3OTM2NzU0ZjczNDI0ZDIxMzk0ZTQ5NTg3YTU2NDg3MDM5MzM3ODU3NGY2ZjQ4NmUzODM3MjM2Zjc5Nzg3NjZmNGI2ZjQyNGY3OTMzNzg0MDc1NGU0NjQwMzkzMzRiNmQzODVhNGMzOTI1Mzc0NzQwNTQ0ZTQ4NmQzODJhMjM1NzRmNzcyODRmNzU0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzY3OTM3NGM2ZjUzMmI0NzZmMjUzNjQxNmUzODM3MjM2Zjc5Nzg3NjZmNGIyYTRiNDAzODJhNzc0MDM5NTU0MTU3MzQ0OTczNmUzODc4NDY0MDM5MzMyYTZmNTMzNjJiNTY1ZTMzNzg3MTU0MzI0ODZmNTM0YTc0NmQzODI2Mjk1NTU0NDA3ODZmN2E1YTQyNmUyNTI2MmI1OTRmMjY0OTU4NzYzMjdhNTczMjQxNTc0MDUzMzc3OTU1NTQ1NjI0NmU3ODJiNzk2ZTUzNTI0YzZkNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzIxMzk0ZTQ5NTg3YTU2MjQ2ZTc1NzQ0MTZlNWU1YTIzMzEzNDZmNDk1ODc2NGQ0NzU5NGYyNjQ5NTY0YjQ5NzM2ZjUzMmI0YjcwNTAyNDUzMzU1MTUyMzUzNDI0MmIzMjM1MjQ1NjM2NTczMjQxNTc0MDUzMzc3OTU1NTM0Njc4NDAzOTRlNzIyMTM4NGE0MjcwNzkzNjQxNTczNTQxNTc1NTRmNGQ3MzU1NTQzMjczMzEzNDRlMzY2ZDU0NTY3ODIxMzgzMjQxNzA1MzUyNGI0MDI1MzcyMzMxMzk1NjI0NmU3ODJiNzk2ZTUzNTI0YzZkNGI3NzU3NTU0ZjRkNzM1NTU0MzI0NzZmNWUzMzc0NmY3YTMyNDE1NzMyNDE1NzU1NGI0ZTU2NmU3OTc4MjM2ZDM4NTI0NTZkMzk0Mjc4NTU1MjMzNzg2ZTUzMzc3YTZmNzk1MjQ2NTU1MTU2NDg3MDRkNDI0MjQwNzU0ZTM2MzMzNjRhNTIzMzI0NTY0ZTM1MzcyYjRlMzY1MTc4NzIzNzM3NTY1OTMwNzM0MTczNTU0ZjRkNzM3MDUzMzc0NTQwMzg1NjQ4NzA0ZjJhNzQ2ZjUzNzg0MTQwMzg0YTQ5NDAzOTU1NDczMjM3NGU1NjM5MjQzNzM0MzU0ZjRkMmI1NTUyMzM1MjM1NTEzNzU0MzY3NzUyNWEzOTIzNTIzMjM0MzcyYjM3MzY3NzQ5NDc2ZjdhNWEyMzZmNzk3ODQ5NTc0ZjZmNDg1NjRiNzc3MzU3NGI0ZDc1NTgyNTU2NDg3MDU0NDU0OTcyMzQyYjI5NTkzOTIzNzU0Zjc1NTk3MzM0MzgyNjczNzAyNTM3NzU2ZDUzMmI0ODZkNGI0ZTQ2NmUyNTMzNzg1NTUzNzQ3NDZlNzkzMzQ1NDAzOTU2NGM1NTU0NTYyNDZlNzU0ZTQ4NmU3NTRlNWU0MDM4NTY0MTZlMjUyYjQ0Mzk1ZTRlNDg2ZTI1NDk0NTU1NTQ1YTQ4NTU1NDMzNDE0MDM0NGU3NTZlNWUzMjczNmUzOTM3NGM3MDRmNGU0NzZlNWUzMjczNmQ1MzUyNDc0MDRmNGUyMzZkNTMzNzQ2NTU1NDMzNDg1NTUzNzgyMzZmNGI0ZTQ4NzAyNTI2NzM3MDUzNzQ0YjQwMzg1Mjc3NmY0OTQyNzU2ZTVlMzI3MzMxMzQ0ZTIzNDAzODRhNzgyMTc5MmIyMzU4NzgzMzc4NmU1MzM3NGY2ZTVlMzI0MTM3NTEzNzU5MzMzNjcwMzQzMjM2MjQ3MjM3NTEyYjU4MzMzNjI2NDU1NTU0MzM0MTZmNzkzNzc0NDA1MzM3NzczMTM4MmE0ODcwNGY0ZTM5MzMzNjU2NTUzNTIzMmI1ODM5MjQzNzM0MzU0Zjc3NTc0ZjdhNzA3ODIxNzk3NDQ4NmUyNTQ2NzI2ZjUzMmI0ODZlNGY0ZDJiNTU1MjMzNDE2Zjc5Mzc3NDQwNTI0ZTQ4NmUyNTRhNTI3MTUzMzc3NjcwMzkzMzQ4NmY3NTc0NDYyMTM5NzQ3MjcwMjUyYjRiNmQyNTM3NGI2ZjRjMjQzOTMzMzY1NjU1MzUyMzJiNTgzOTI0NzAzMTM2Nzc0NjUyMzY3ODU5NDU1NTU0MzM0MTZmNzkzNzc0NDA1MjJiNDcyMTM4MjQ3ODM5NWU0ZTRiNDAzODQwNDI3MTUwMjM3NTcwMjUzNzc1NmQ1MzJiNDg2ZDRiNTU0MjRmN2E3MDc4MjE3OTc0NDg2ZTI1NDY3MjZmMjU0YTQ4NzA1NDU5NzMzMTM0NGUyMzZkNTQ1Njc4MjEzODMzNDI2ZTc5NmY0NzMyNzkyYjI0NmU3OTMzNzg0MDUyNWE3ODZlMzg1MjQ5NmQ1MzJiNGI0MDM0NzQzOTMzMzY1NjU1MzUyMzJiNTgzOTIzMjQ0ZTM4NTIyYjMyMzMzNjJhNTEzNDM2MmE1NDU3MzI0MTU3NDA1MzM3Nzk1NTU0NGU0YjZlMjU1YTc4NmY1ZTVhNzI3MDI1Mzc3NTZkNTMyYjQ4NmQyNDJiMjQ2ZjUzMzM3NDcwNTMzNjQxNzAzOTRlNzcyMTM5MzM3ODU3MzU0MTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2ZjU0NTY0ODIxMjUzNzRjNmYyNDJiNDc0MDM5NzA3MjcwMzk0ZTc3MjEzOTMzNzg2ZjRiNzQ2ZTcwMzk0ZTc3MjEzOTMzNzgzOTM0Nzc1NzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTUyNzE1MzVhNzg2ZjU0MzM0MjZlMjUyNjczMjEzOTU5NzM0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZmNzk3ODQ3NzA0Zjc0Nzk1NTc3Mzc0YjZmNzkyYjRiNTU1Mzc0NzQ2ZTc5MzM0NTZkMzgyYTdhNTU1NDM3NDk0MDUzNTIyMzQwMzQ0ZTI5NzAzOTRlNzcyMTM5MzM3ODU4N2EzNzQ5NDA1MzUyMjM0MDM3MmI0MjQwNTQyMzI4NTU1NDQ2Nzg3MjM0NTU0MjRmNzU0ZDczNTU0ZjRlNzk2ZDM4MmE3NDZlNTM0YTJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNzgyMTc5NzQ0ODZlMjU0NjcyNmYyNTRhNDg3MDU0NTk0NzZmNzkzNzQ1NDAzODUyNGM0MDM0NzM0MjRmNzM0MjRkMjEzOTRlNDk1ODdhNTY0ODcwMzkzMzc4NTc1MjcwNTIzMjc3NzQzMTM1MjM0NjcyMzY1MTUyMzYzNDRmNDk3MzZlMzgzNzIzNmQ1MzJiNzc2ZjRjMjQ2ZTU2MjQ0ZTMxMzYyNDMyN2EzOTM0Nzc1NzQwNTMzNzc5NTU1NDMzNzg2ZTUzMzc3YTZmNzk1MjQ2Mzk1ZTcwNzgyMTc5NzQ0ODZlMjU0NTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY1NTc1NTU3ODU2NzgyMTI1Mzc0MjcwNzkzNjczMjEzODI2NzM3MDM5NGU3NzIxMzkzMzc4NTU1MzQwNGI2ZTI1MjM3MzM3NTMzNzQ1NDAzODcwNGIyMTM4MjM3MzIxMzgyYTc3NTU1Mzc0NzQ2ZTc5MzI3MzZkMzkzMjczNzA1MzVmNzM3MDUzNzQ3ODU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0ODIxMjU1MjQ1NmU1MzU2NzQyMTI1NDU3MzZkNTM1MjQ3NDA1MzRhNzg2ZjdhNTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTQ3NmU1ZTMyNzMzNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzczNjc3NDkyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxMzg1NjQ4NmY3YTMyNDE1YTUwNGQyMzU3MzI0MTczNTU0ZjRkNzM2ZjI1Mzc3NjZmNzkzNzIzNTU1MDIzNzM2Zjc5Mzc0YTcwMzgzNzRjNzA0ZjJhNDE0MDM4NTI3NzQwMzk1NjRjNTg3OTcwNzg3MDRmNzM3YTM4NGYyNDM2NDAzODRhNzg0MDVlNTY3NDZlMzQyNDRmNmU1ZTMyNDYzMjM5NGU0MjU4Mzc1YTc4MjE1ZTU2Nzg3MDRmMjQzNjZlMjU0Njc4NmU3NTZmNDU1NTRmNmY3YTU3MzI0MTczNTU0ZjRkNzM2ZDM4MjE3MzZlNzkyYjIzNTU1Mzc0NDYyMTM4NTk0NzIxMjUyYjQ2NmY1MzUyNGI0MDM3MmI3NzZkMzg3MDc4NmY1ZTMyNDE2ZjI1Mzc3NjZmNzkzNzIzNTg0ZjRlMzkzMzM2NTY1NTM1MjMyYjU4MzkyNDVhNTIzMjI0NTY1MjM3NGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODU2NDg2ZjdhMzI0MTVhNTA0ZDRjNTczMjQxNTc1NTRmNGQ3MzU1NTQzNzQ5NDA1MzUyMjM0MDM0NGQyYjU1NTQzMzc4NmU1MzM3NzU2ZTVlMzI0NzcwNTQ3ODQ5NDAzOTU5NDczNzM5NGU3NzIxMzkzMzc4NTg3OTMzNzgzOTI1NDI0YzZlMjUyNjQxNmY3OTM3NGE3MDM4Mzc0YzcwNGYyYTdhNDAzOTMzNzI0MDUzNTIyMzIxMzQ3NDc0NmYyNDJiMjM0MDM5NzQyMzMxMzczMzRiNzAzODM2NDI1NzMyNDE3MzU1NGY0ZDczNTU0YjRlMzk2ZDUzMzc0NzU1NTQzMzQxNDAzNDRlNzUyMTM4NWE0NDZlNTMyYjdhNTU1Mzc4NGM1NTUzNDAyNDZlNTM0OTQ1NTU1MzUxNzM2ZTc5MmI0NzU4MzU1NjI2NzE0ZjRlNGI0MDM5NGU0NTcxMzQ0ZTQ2MjEzODQ2Nzg2ZjRiNGUzNjQwMzg0YTc4NDA1ZTU2NzQ2ZTM0NGU0YjQwMzgzMzc4NmU1Mzc4MjU0MDM5NTU3MzcwNTM3NDc4NTU1NDM3NDk0MDUzNTIyMzQwMzQ0ZTQ1MjEzOTMzNzg2ZjczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTc5MmIyMzU1NTQ3MDc4MjE3OTc0NDg2ZTI1NDY3MjZmMjU0YTQ4NzA1NDU5NDcyMTM4NWE0YTcwMzg3ODRiNDAzNDc0NzU2ZTUzMmI3NjZkMjU3ODQ3NDA0YzI0NTMyMTM4NGE0YzQwMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NGY1NjRmNzAzOTVhMmE1NTc1NDk3MzVhMzU0ZDRjNGY3NTRkNzM1NTRmNGU1ZTQwMzg1NjQxNmUyNTJiNDQzOTVlNGU0ODZlMjU0OTQ3NmY1ZTM3NzU2ZTM4NzgyMzU3NTQ0ZTRiNmUyNTVhNzg2ZjVlNWE3MjcwMjUzNzc1NmQ1MzJiNDg2ZDI0MmIyNDZmNTMzMzc0NzA1MzM2NDU1NTU0Mzc0OTQwNTM1MjIzNDAzNDc3NTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGQ3NTU1NzM0MTU3NTU0YjRlNTk2ZTI1NTI3NzU1NTQzNzRjNDAzOTU1NzM0MDUzNTIyMzIxMzQ0ZTQ4NmU3NTRlNGM3MDUzNTI0YjcwNTQzNzQ5NGY3OTRhNDgyMTM4MzM3MjcwMzk1YTc4NmY3ODJiNzcyMTM5MzM3NDU3NGY3NzU3NGY3NTU5NzMzNTUzMmI3NDQwNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMjczMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTczMjEzODJhNzc1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzU0ZTIzMjEzOTVhNDQ2ZjRjNDU3MzcwNTM3NDc4NzEzNDRlNzQ2Zjc5MzY3MzZmNzkzNzRjMjEyNTc0Nzg0MDU0Mzc0NTQwMzgzMjczNmUyNTJhNzY0MDM0NGUyMzZkNTMzNjczMjE3OTJiMjM1NTUzNzQ3NDZmNGI0ZTRjNzA1MzUyNGI3MDUzMzc3NzRmNzU1OTczNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4MzA3NTRlMjk1NjI1MzcyNjZkMzk1YTIzNmY0YjZmMjg1NTUzNTY0ODZlMjU0OTQ1NTU0ZjcwMjM3MTM5NGU3ODU2NGM0MTczNTYyNTU2NzQ2ZTc1NzA1ZjU2NWUzNzQ3MjE3OTUyNDc1NjRiNDk3MzU2NWU1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjdhMzA3NTRlNGM3MDU0NTU0NTU1NGY3MDRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0YjZmMjg1NTU0NDYyNDZmMjUzNzRiMzkyNTc4NzczOTVlNWEyMzZmNzY0MTczNzE0YjcwNzY2ZDUzNTIyMzM5MjU3ODc3NTY0YzQxNzM2ZDM4MzI0NTU1NGY3MDRjNzA1MzUyNGI3MDUyMmIyMzZkMzgyNDc4NTY0YzQxNzM2ZjVlMzM0YjcyMzkyNDJiNzIzMjQyNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NzMzMTM0NGU0YzcwNTM1MjIzNDAzNzJiNGM3MDUzMmI0YjQwMzQyYTQ1NmUyNTUyNzczOTVlNzA3NDcwNTM1YTQxNDAzOTU5NDE1NjI1NTI3NjIxMjUyYjI0NmU3YTMyN2E1NzMyNDI3NDIxNWUzMzQyNzA3OTM3NzI3MDc5Mzc0YjZkMzcyYjIzMjEzOTVhNDQ2ZjRiMmEyNDZmNTMzMzc0NzA1MzM2NDE2ZjVlMzM3NDcwNTMzNzcyNmY1ZTMzNDg2Zjc5MzY0NzZlNTMyYjc0NDA1MjJiNWUyMTM5MzM3NjZkNTMzNzRjNTc0ZjcwMjU0MDM5NTY0MjU2NGI3NzQyNGY3MzQyNTkzMjM3MzM1MjM1Nzc1YTQwMzkyMzU2MzczMjIzNDY1MjM3NTI1OTczMzEzNDRkNDE1OTRmMjY0OTVhMzQ0OTczNTk0ZjI2NGE1ODRmNGQ0OTU4NzY1NTI0NTg0ZjRkNDk1ODc2MzY0NTU1NTA1MTQ1NTU1MDU1NDc1YTM0NDk3MzVhMzQ0OTczNTkzNTRkNDU1NTUwNTk0OTU3MzI0MTU3MjEyNTRhNzQ2ZjVlNTk3MzM1MzgzNzIzNmY3OTc4NzY2ZjRjNDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3MjQ0MjZlNzk3ODQ2MjEzODQ5NzM3MDUzNzQ0YjQwMzg1Mjc3NTgzOTVhNzQ0MDc5MzY3MzZmNzkzNzdhNmQzOTVhMjM2ZjdhNzc3MzZmNzkzNzQ3NDA1MzM3NGI0MDM4MzI3MzZkMzgyNjczNzA1Mzc0Nzg1NTUyNGU0YjZlMjUyNDc4NzA1Mzc0Nzg3MDM5NTk3MzcwNTMzNzI2NzA0ZjRlNzk2ZTVlNTY0NjIxMzkzMjQ3NGY3MzQxNzM1NTRmNGQ3MzMyMjUyYjI0NmU3YTMzNzg2ZjdhNTk3MzIxMzgyYTc3NTU1Mzc0NDI2ZjVlMzM0ODQwNWU1Njc0NmUzOTU5NzMyMTM5NTY3ODU1NTQzNzQ5NDA1MzUyMjM0MDM4MzI3MzZkMzgyNjczNmY1MzRhNzQyMTI1MzY3MzcwMzgyYTc3NDAzOTU1NzM2ZTI1MmE3ODU1NTM0YTQ4MjEyNTQ1Mjk1NTUzNzA3NDcwMzg3MDc4NmY0YjRlNzQ2Zjc5MzY1NzU1NGY0ZDczNTU1MzVhNzQ2ZTUzNGE3NTIxMzg1YTQ0NmY0YjRlNzg3MDc5NTI0NTcwMzg1MjIzNDAzODMyNzM2ZTI1MmE0NTcxMzQ0ZTVlNmQ1MzM3NDc1NTRmMmI0NjQwMzkzMzRiNmQzODVhNGM1NTUzNzg0YzU1NTQ1YTc2NmY3OTUyNDk0MDM4MzI0NzRmNzU0ZDczNTU0ZjRkNzU1NTc1NTU1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzM5MjQyYjQyNmU3OTc4MjMzOTI0NWY0MTZmMjUzNzQ1NDA3NTc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyNmU1MzJiNzY2ZDRiNGQyYjU1NTQzMzQxNmY3OTM3NzQ0MDUzNzg0NzQwNGIyYTU5NmUyNTVhNDQ1NzRmNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNDY0MDM5MzM3NDU1NTAyMzczNzE1ZTIzNzM1NTRmNTk3MzcxMjUyYTc0NmUzODM2Mjg1NTRmNzQyMzcxMzk0ZTc4NTg0ZjRlNDE0MDM4NGE0OTU3MzkyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3NjZlNWUzNzQ3NzA1MzM3NGI2ZjRiNGQyYjU1NTQ0NjJiNTU0ZjRkNzY1NTU0NDY0NzIxMzgyNDc4MzA3NTRlMjk2ZTUzNTI3NTQwMzg0YTRjMzA3NTRlMjUyMTM4NGEyNDQwMzkyNDJiNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjZkNTM3ODRjNzA1MzJiN2E2Zjc5NTI0NjZmNGI0ZDJiNTU1NDQ2MmI1NTRmNGQ3NjU1NTQ0NjQ3MjEzODI0NzgzMDc1NGQ0MTIxN2EzNzc2NmQyNTM3MjM2ZjRiNDk3MzcxMjU0YTc0MjE3OTM3NDU2ZjRjNDE3MzM4MjU1NjI0MjEyNTQ2Nzg3MDRmNGU3NjZlNWUzNzQ3NzA1NDU5NDc1ODc1MjY0NTU1NTQ1YTI0NmUzNDQ5NzMyMTI1MmIyNDZlN2EzMzcwNzIzNDc4MmI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyNDAyNTUyMjQ0MDI1Mzc0YzU1NTAyMzczNzE1ZTIzNzM1NTRmNTk3MzcxMjUyYTc0NmUzODM2Mjg1NTUzNWE3NDZlNTM0YTc1MjEzODVhNDQ1NTU0NTY3ODcwNTQzNzRiNmU3OTc4NDc0MDRiNGU3NDU1NTMyYTI0NmUzODU2Nzg2Zjc1NGU0ODZmNzU0ZTI5NmU1MzUyNzU0MDM4NGE0YzMwNzU0ZTQ3NzAzODI0NzU0MDM5NTYyYjcyMzI0MTU3NTU0ZjRkNzM1NTUzMzM3ODQwNzU0ZTc2NmU1ZTM3NDc3MDUzMzc0YjU3NTQ1YTc4NmU1MzIxNDU1NTUzMmE3NDZlMzgzNjQ1NTU1Mzc0Nzg2ZTU0NGU3MjcwNTMzNzI2NzA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyNmUzODM3MjMyMTM3NDY0NzIxMzgyNDc4MzkzNDRkMmI1NTRmNzM3YTIxMjUyYjI0NmU3YTMzNzg2Zjc1NmY0NTU1NTM3NDc4NmU1NDRlNzI3MDUzMzcyNjcwNGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3NjZlNWUzNzQ3NzA1MzM3NGI2ZjI0NDY0NzIxMzgyNDc4MzkzNDRkMmI1NTU0NDYyYjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTM3NDQyNmY1ZTMzNDg0MDVlNTY3NDZlMzQ3NDRjNDAzODRhNzk1ODRmNGU0NzIxMzgyNDc4NTg0ZjRlNDE0MDM4NGE0OTM5NWUzMzc4NzE1NDMyNDU1NTUzNTYyNDIxMjU0Njc4NzA1NDU5MmIzNTUxNTIzNjMzMzYyYTUwMzgzNzJiNGYzNzM2NWE1ODMzMzczMzM1NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ2NDAzOTMzNzQzODI1MmE3NDZlMzgzNzcwNTU1MDIzNzM1NzRmNzA0MTZkMzk1YTIzNmUyNTcwNGIyMTM4MjM3YTU4NGY0ZTQxNDAzODRhNDkzOTVlMzM3ODcxNTQzMjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjZkNTM3ODRjNzA1MzJiN2E2Zjc5NTI0NjZmMjQ0NjQ3MjEzODI0NzgzOTM0NGQyYjU1NGY3NDc1NzAzODVhNDQ0MDM5MzM0YzU4NGY0ZTI5NzIzNDc3NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM0MDI1NTIyNDQwMjUzNjQxNmYyNTM3NDU0MDc1NDk3MzZlNzk1MjQ2NDAzNDQ5NzM2ZDUzMzc0NTZmNTIyYjIzNDAzOTc0MjM1ODRmNGU3NjIxMzg0YTQ1MjE3OTUyNzY2ZDRiNDk3MzZlMzgzNzIzNmY3OTc4NzYzOTVlMzMyYTZmNTMzNjJiNTYyNTcwNzQ3MDM4NzA3ODU2NGI3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU3NTU1NzUzNjc5Mzc3YTZkMzk1YTIzNDAzOTU1NzMyMTM0NGUyNTIxMzg0YTI0NDAzNDRlNGI0MDM4NTI3NzU1NTM1MjIzNTU1NDVhNzY2Zjc5NTI0OTQwMzQ0ZTIzNmQzODI0NzgzMDRiNGU0NjQwMzkzMzRiNmQzODVhNzI3MDU0Nzg0OTQwMzUyMzdhMjEyNTJiMjQ2ZTdhMzM3ODZmNzU2ZjczNDA3OTJiNGI1NTU0MzM0ODcwNTM1MjQ1NmY0YjRlNDQ0MDM5NGUyMzU1NTMzNzQ1NmYyNTM3NWU2ZDUzMzc0YjQwMzQyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ2NDAzOTMzNzQzODI1MmE3NDZlMzgzNzcwNTU1MDIzNzM1NzUzMjQ3ODcwNTQ1NjQyMjEyNDJiMjM3MTM5NGU3ODU4NGY0ZTQxNDAzODRhNDkzOTVlMzM3ODcxNTQzMjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjQwMjU1MjI0NDAyNTM3NGMzODI1MmE3NDZlMzgzNzcwNTU1MDIzNzMyMTI1NTI0NTZlNTM1Njc0MjEyNTQ1NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM2ZDM4MmE3NjU3NTQ1YTc4NmU1MzIxNDU1NTUzMmE3NDZlMzgzNjQ1NTU1MzRhNzQyMTc5Mzc0NTZmNGMyMzQxNTczNDQ5NzMyMTM4MjQ0ODcwMzgyYTIzMzEzNTUxNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTU3NTU1Nzc1Mjc3NDA0ZjRlMjM2ZTRiNGU3NDU1NTM1YTQ4NzAzODJhMjM0MDM5NTU0NzU1NTE0YTc0MjE3OTM3NDU2ZjRiNGU3NDZmNzkzNjczMjEzNDRlMjM3MDM5NGU0NTQwMzQ0ZTQ4NDA3NTRkNDE2ZTc5NTI0NjQwMzQ0OTczNzA3OTUyNDU3MDM4MzY0MjU1NTQ0ZTc0NmQzOTU2NGM1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDQyNzA1MzczNzM2ZjI1Mzc0NTQwNzUyYTcyNmU1MzJiNzY2ZDRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NGI2ZDM4Mzc0YzU1NTAyMzczNmYyNTM3NDU0MDc1MmE3MjIxMjUyYjI0NmU3YTMzNzg2ZjdhNWE2ZTZlNzk1MjQ2NDAzNzIzNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzRiNmQzODM3NGMzODI1NGE3NDIxNzkzNzQ1NmYyNDIzNzMzMTM0NGU0YzQwMzk1NjQyNDAzOTU5NDc0MDI1MzcyMzU3NTM0YTc0MjE3OTM3NDU2ZjRiNDk3MzU5NGY3NzczNTc0YjRlNzQ2ZTM4MmIyNDZlN2EzMjU3NGY3NTRkNzM1NTRmNGU3NzQwMzgyMTczNmUyNTU2NGM0MDM5NTYyNTQwMzQ3NDRjNDAzODRhNzk1ODRmNGU0NzIxMzgyNDc4NTg0ZjRlMjUyMTM4NGEyNDQwMzQ0OTczNmU1MzUyNzU0MDM4NGE0YzMxMzQ3MzQyNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU3MDM4NWE0NDQwMzkzMzRjNTg0ZjRlNGM0MDM5NTY0MjQwMzk1OTczMzEzNDRlNGM0MDM4NGE3OTU4NzgyYjQxNmQzOTVhMjM2ZTI1NzA0YjIxMzgyNDRjMzgyNTJhNzQ2ZTM4Mzc3MDRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyYTc3NDAzOTczNzMzMTM0NGU3NTZkMzk1YTc4MjE1ZTMyNDcyMTc5Nzg0YzQwMzg1YTIzMzkyNTRhNzg0MDdhMzI0MTIxN2EzNzc2NmQyNTM3MjM2ZjRiNDk3MzcwNzk1MjQ1NzAzODM2NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDI1NzgyMzZkNGY0ZTRjNDAzODRhNzk1ODc4MmI0NTZlMjU1YTQ0MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NjZlNWUzNzQ3NzA1NDU5NzMzMTM0NGU0YzQwMzk1NjQyNDAzOTU5NDc0MDI1MzcyMzU3NTM0YTc0MjE3OTM3NDU2ZjRiNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzMyMTI1MmIyNDZlN2EzMzRjNTU1Mzc4NGM1NTUxMmE0ODZlNzkzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc2NmU1ZTM3NDc3MDU0NTk3MzMxMzQ0ZTRjNDAzOTU2NDI0MDM5NWE2ZTZlNTM1Mjc1NDAzODRhNGMzOTM0NGQyYjU1NTI0NTQ5MzkzNDRkNDM1NTRmNzQ0NTQwMzgyNjQxMjE3YTM3NzY2ZDI1MzcyMzZmNGI3NzczNTc0YjRkNGI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDI2ZTc5MzM3ODcxNGY0ZDVmNTU1MzRhNzg2ZTc1NzQ3NTcwMzg1YTQ0NDAzOTMzNGM1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNWE0ODcwMzgyYTIzNmYyNDQ2NDI2ZTc5MzM3ODcxNTIyMzczNTc0YzIzNzM1OTMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc2NmU1ZTM3NDc3MDU0NWE2ZTU4MzU1NjcwNTU0ZjQ1MmI1NTU0NDA3NDZlNTQzNzc4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNWE0ODcwMzgyYTIzNmYyNDQ1NDY1OTM3MjM3MzU3NGMyMzczNTkzMjQxNTc1NTRmNGQ3MzU1NTE0ZTRjNzA1MzUyMjM2ZDM4NWE0NjQwMzkzMzQxNmUyNTMyNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNzI0MDc5MmI0YjZlMzg1MjIzMzkyNTRhNzQyMTc5Mzc0NTZmNGI3NDQ1MjEzODU2Nzg2ZTU0NTk0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNDg3MDRmNGU0NTIxMzg1Njc4NmU1NDU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGQ3NTU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNzg2ZjI1NWE3NDZmNTMzNjQxNzA3OTUyNDU3MDM4MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczNmY1ZTMzNGI1NzU0NDA3NDZlNTQzNzc4NTczNDJhNGI0MDM5NGU0NTIxMzg1YTc4NTc0ZjcwNmYzOTRmNmY0NTU1NGY3MDZmMzk1MjRhNmY1NjRiNzc0NzZmNzkzNzQ5NmU1MzUyNzY0MDM0NzM3YTU1NzU2ZjQ1NTU0ZjcwNmYzOTRmNTU3YTU3MzQyYTRiNDAzOTRlNDUyMTM4NWE3ODU3NGY3MDZmNmU3NTZmNDU1NTRmNzA2ZjM5NTMyNjdhNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZDc1NzE0YjU1NzM1NzRiNGQ3NTU4NGY1NTQ3NmQ3OTJiNDI2ZTc1NzQ3OTU2NWU0NjQ0NDAzOTc4MmIzMTM0NTYyOTQwMzk1YTc2MjEzOTRlNzg1NzU0NDA3NDZlNTQzNzc4NTczOTIzNzU1NjRiNGU3OTZlNWU1NTczNmQyNTM3MmE1ODRmNGUyNTIxMzg0YTI0NDAzNDRlNDI2ZTc1NGU0NTIxMzg1Njc4NmU1NDU5NDI1NTRmNDU3MzU1N2EyMzc1NGY3MzQxNzM1NTRmNGQ3MzQwNTMzNzc5NTU1NDU2Nzg2ZTc5MzM3ODZmNzU3NDRjNDAzODRhNzk1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NTZkMzgyYTc4NmY0YjRkMmI1NTUyNDY3MDRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwMjU3ODIzNmQ0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ1NmUyNTVhNDQzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc2NmU1ZTM3NDc3MDUzMzc0YjZmNGI0ZDJiNTU1NDQ2NDcyMTM4MjQ3ODMwNzU0ZTc3NmQzODVhMjM1NzU0NWE3ODZmNzk3ODc4NmY0Yjc3NzM0MDc5MmI0YjU1NTMyYTc0NmUzODM2NDU1NTU0NWE3ODZmNzk3ODc4NmY0YjRlNDI2ZTc1NGU0YzQwMzg0YTc5NTg3ODJiNzY2ZTVlMzc0NzcwNTMzNzRiNmY0YjJhNDI3MDUzMzc0NjZmNGI3MzQyNzIzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MTZkMzk1YTIzNmUyNTcwNGIyMTM4MjQ0YzU1NTAyMzczNzEyNTJhNzQ2ZTM4MzYyODU1NGY3NDc1NzAzODVhNDQ0MDM5MzM0YzU4NGY0ZTI5NmU1MzUyNzU0MDM4NGE0YzMwNzU0ZTQ1NmQzOTVhMjM1NzUzNWE0ODcwMzgyYTIzNmY0Yjc3NzM0MDc5MmI0YjU1NTM0YTc0MjE3OTM3NDU2ZjRiNDk3MzIxMjUyYjI0NmU3YTMzNGM1NTUzNzg0NzU1NTQ1YTc4NmY3OTc4Nzg2ZjRiMmE0MjcwNTMzNzQ2NmY0YjczNDI3MjM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3OTZlNWU1NTczNmU3OTUyNDY0MDM0NDk3MzU3NTM1NjI0MjEyNTQ2Nzg3MDU0NTk0NTU1NTQ1YTc4NmY3OTc4Nzg2ZjRiNzc3MzZkMzgyNjczNmYyNTM3NDU0MDc1MmE3MjZkNTM3ODRjNzA1MzJiN2E2Zjc5NTI0NjZmNGIyYTQyNzA1MzM3NDY2ZjRiNzM0MjcyMzI0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5NmU1ZTU1NzM2ZTc5NTI0NjQwMzQ0OTczNTc1MzI0Nzg3MDU0NTY0MjIxMjQyYjIzNzEzOTRlNzg1ODRmNGU0MTQwMzg0YTQ5Mzk1ZTMzNzg3MTU0MzI0MjU1NTM3ODQ3NTU1NDVhNzg2ZTUzMjE0NzM5MjUyNDc4NzA1MzUxNDc2ZDM5MzM3ODZlMzk1OTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNTM3ODQ3NDAzOTU5NDcyMTM5NGU0OTQwMzgyYTc3NTc1MzIxNzU1NTRiNGU1NTMzMzY0YTMyNTU1NDQ2NDcyMTM4MjQ3ODcyMzQ0ZTI5NmQ1MzM3NDU2ZjUyMmIyMzQwMzk3NDIzNzIzNDU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0YTQyNmU3OTM3NGM1ODc5NTI0OTZmNTMzNzQ3NDA0Zjc0Nzk1NTc1NTk3MzM3NTI3ODMyMzMzNDRlMjk2ZTc5NTI0NjQwMzkyMzczNzEyNTI0Nzg3MDU0NTY0MjIxMjQyYjIzNzEzOTRlNzg3MjM0NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmE3NDZlMzgzNjczNmQzODI2NzMyMTI1MmIyNDZlN2EzMzc4NmY3YTU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzk2ZTVlNTU3MzZlNTM1Mjc1NDAzODRhNGM1ODRmNGUyNTIxMzg0YTI0NDAzNDRlNDI2ZTc1NGU3NjZlNWUzNzQ3NzA1MzM3NGI2ZjI0NDY0NzIxMzgyNDc4MzkzNDJhNDI3MDUzMzc0NjZmNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNGE0MjZlNzkzNzRjNTg3OTUyNDk2ZjUzMzc0NzQwNGY3NDc5NTU3YTQ2NDcyMTM4MjQ3ODcyMzk0NjRjNDAzODRhNzk1ODc4MmI3OTZlNWU1NjQ2MjEzOTMzNzI2ZTUzNTI3NTQwMzg0YTRjNTc1MzRhNzQyMTc5Mzc0NTZmNGI3ODJiNTU1NDQ2MjUyMTM4NGEyNDQwMzkyMzc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODZlNTM3ODc5NTU1MzJhNzQ2ZTM4MzY3MzZkMzgyNjczNmQ1Mzc4NGM3MDUzMmI3YTZmNzk1MjQ2NmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2MjQyMTI1NDY3ODcwNTQ1OTQ1NTU1NDVhNzg2Zjc5Nzg3ODZmNGI0ZDJiNTU1Mzc0NDI2ZjVlMzM0ODQwNWU1Njc0NmUzOTVhNmU2ZTc5NTI0NjQwMzcyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlNDUyMTM4NTY3ODZlNTQ1OTQ1NTU1MzVhNDg3MDM4MmEyMzZmNGI0ZTQyNmU3NTRlNGM0MDM5NTY0MjQwMzk1OTQ3NmQzOTMzNzg2ZTM5NTk0MTU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzY3MDM4MjQyNDZlNTM1MjIzNmQzOTQwNzg1NTUwMjM3MzU5NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzQwNDg2Zjc1NGU3NTZlNWUzNzQ3NDA0ZjQ5NzMyMTI1MmIyNDZlN2EzMjczNmQzODI2NzM3MTc5Nzg0OTU3NTM1NjI0MjEyNTQ2Nzg3MDU0NTk0NTU1NTM1YTQ4NzAzODJhMjM2ZjRiNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNWEyNDZlMzkzNzQ1MjEzOTMzNDI3MDc5MzY3MzU3NGMyMzczMjEyNTJiMjQ2ZTdhMzI1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTUzNzg0NzQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTMyMTc1NzEyNTJhNzQ2ZTM4MzcyYjM5MjU1NjI0MjEyNTQ2Nzg3MDU0NDY0YzQwMzg0YTc5NTg3ODJiNzk2ZTVlNTY0NjIxMzkzMzcyNmU1MzUyNzU0MDM4NGE0YzU3NTM0YTc0MjE3OTM3NDU2ZjRiNGQ0NDU1NGY3MzQxNTYyNTRhNzg1NjRiNDk3MzIxNzkyYjI0NmU3OTMyNDI1ODRmNzc0MjcyMzQ0ZTI5MjE1ZTM3NDY3MDM4NGE3NDcwNTM3ODI1NDAzOTIzNzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0YTQyNmU3OTM3NGM1ODc5NTI0OTZmNTMzNzQ3NDA0Zjc0Nzk1NTdhNDY0NzIxMzgyNDc4NzIzNzJiNzU3MDM4NWE0NDQwMzkzMzI5NmYyNTM3NDU0MDc1MmE3MjQwNzkyYjRiNmUzODUyMjMzOTI1NGE3NDIxNzkzNzQ1NmY0Yjc0NDUyMTM4NTY3ODZlNTQ1OTczNTc0YjRkNDE1NzRmNzA0NTQwMzQ2ZjQ1NTU0ZjZmNDQzNDM4MmE3OTU2NGI3NzQ1NTczNDc4MmI1NTU0NDY3NjZlNWUzNzQ3NzA1NDVhNmU1ODM1NTI3MDcyMzQ1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTUzNzg0NzQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTMyMTc1NzEyNTJhNzQ2ZTM4MzcyYjM5NWU1YTI0NmUzOTQ2NGM0MDM4NGE3OTU4NzgyYjc5NmU1ZTU2NDYyMTM5MzM3MjZlNTM1Mjc1NDAzODRhNGM1NzUzNGE3NDIxNzkzNzQ1NmY0Yjc4MmI1NTU0NDY3NjZlNWUzNzQ3NzA1NDVhNmU1ODM1NTY3MDcyMzQ1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTUzNzg0NzQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTMyMTc1NzEyNTJhNzQ2ZTM4MzcyYjM5MjU1YTQ4NzAzODJhMjM3MTVlNWE3ODZlNTMyMTQ3MzkyNTQwNDg2Zjc5MjQ3NDcwNTIyYjQ1MjEzODU2Nzg2ZTU0NTk0MTZlNTM1Mjc1NDAzODRhNGM1NzM5MjM3MzcxMjU1YTQ4NzAzODJhMjM2ZjI0NDU0NjU5MzcyNDJiNTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNGI3MTM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTI1MjEzODRhMjQ0MDM0NGQyYjU1NTQ1YTc4NmU1MzIxNDczOTI1NzA3NDcwMzg3MDc4NmYyNDQ2NDcyMTM4MjQ3ODM5MzQ3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzMzMzk3NDc2NDAzOTRlMjM2ZDM4MmI0NzU1NTM1MjRjNTU1MzM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNTQ1NjQyNmU3YTMyNDE0MDc1NTY1YTQwMzkzMzRiNmQzODU5NzM3MTI1MmE3NDZlMzgzNzJiNTU1MzQwNzQ2ZDM4NGE3ODQwNTA0MTczNzEyNTM3MmI1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc2NmUyNTJhMjM2ZDM4MmEyNDQwMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwNzkyYjRiNTU1MzRhNzQyMTc5Mzc0NTZmNGI0OTczNmYyNTUyNDY2ZjUzNGE3ODU1NTM3ODQ3NTU0Zjc0MjUyMTM4NGEyNDQwMzQyYTQyNzA1MzM3NDY2ZjRiNzM0MjU1NTM3ODc5NTU1Mzc4NGM2ZDM4MmE0YzcwNTM1MjQ3MjEyNTM2NDE3MDc5NTI0NTcwMzgzNjQ1NTU1MzMzNDIyMTVlMzI0MjU1NTMzNzQ1NmYyNTM2NzMzODRiNzM0MTU3MzQ0OTczNzA3OTUyNDU3MDM4MzY0MjM5MzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTUzNzg0NzQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTMyMTc1NzEyNTJhNzQ2ZTM4MzcyYjcxNWU1YTc4NmU1MzIxNDczOTI1NDA0ODZmNzkyNDc0NzA1MjJiNDUyMTM4NTY3ODZlNTQ1OTQxNmU1MzUyNzU0MDM4NGE0YzU3MzkyMzczNzE1ZTVhNzQ2ZTM5NGU0NTQwMzkyMzc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZDc1Mzk1MzI2NzU1ODc5NDI0ODZkMzgyNjQxNmU1Mzc4NDc0MDM5NTk0MjU1NGY0NTczNTU3ODRhNDc1NTczNDE1NzQwNTMzNzc5NTU1NDRlNGI2ZTI1NWE3ODZmNWU1YTcyNmUzODM3NDY2ZTVlNTYyYTM5MjU1NjJhNzA1MzM3NGM1NzRmNzcyODRmNzU0ZDczNTU0ZjRlNWU2ZDM5MzM0MTU1NTMyYjQ5NDAzODI2NDE1NTc1MmI0OTZmNzkyYjc2NTg1ZTVhNzg2ZTUzMjE0ODZmNWUzMzc0NzA1MzIzNzU1NzM0NGU3NDZmNGI0ZTc5MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTQyNmU3YTMyNDE0MDc1MmE0YjQwMzg1Mjc3NTc0Zjc3NDc2ZjVlNGU0NTZkMzkzMjQxNTczNzQ1NGEzOTM0Nzc3MzU3NzU0ZTQ4NmY0YjJhNGM3MTM5NWE3NjZlMjUyYTc5NTc0ZjU2MzUzMjI0MmIzMjMyMzY3MDUyMzkyNDVhNTYzODc3MzY3NTU3MzI0MTU3NDA1MzM3Nzk1NTUzNTI3NjcwNTM3ODI1NDAzNzJiNWUyMTM5MzM3NjZkNTIyYjc2NmU1ZTM3NDc3MDU0NTk0MTU3MzU0MTU3NTU0ZjRkNzM1NTUzNWE0ODcwMzgyYTIzNmY0YjRkMmI1NTU0NDU0MTU3NGY3MDIzNzEzOTRlNzg1NjRiNDk3MzU2MjU1Njc0NmU3NTZmNDI1ODRmNzcyODU1NTA0ZDQ1NTU0ZjczNDE1NjVlMzMyYTZmNTMzNjdhNTg0ZjRkN2E3MDM4MmE3NTIxMzgyNjdhNTczNDQ5NDIzMDc1NGQ0OTU4NGY0ZDQxNTc0ZjcwMjM3MTM5NGU3ODU2NGI0OTczNTY1ZTQwNzg2Zjc5Nzc3YTU3MzQ0OTQyMzA3NTRkNDk3MjMyNDE3MzU1NGY0ZDczNDA3OTJiNGI1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDUzNTIyMzIxMzQ0ZTQyNmU3NTRlNDU2ZDM5NWEyMzU3NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNTIyYjc0MjEyNTVhNDg3MDM4MmEyMzZmNGIyYTI1MjEzODRhMjQ0MDM5NTk0MTU3MzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEyNTJiMjQ2ZTdhMzM0YzM4NGI3MzQxNTY1ZTMzMmE2ZjUzMzY3YTU4NGY0ZTc0MjEyNTVhNDg3MDM4MmEyMzM5MjUzMzc0NzA1MzUyNmU1NjVlMzMyYTZmNTMzNjdhMzkzNDc3NDU1NzM3MjM3MzU3NGMyMzczNTkzMjQxNzM1NTRmNGQ3MzIxMjUyYjI0NmU3YTMzNGMzODRiNzM0MTU2NWUzMzJhNmY1MzM2N2E1ODRmNGQ3YTcwNzkzNzRiNmQzNDZmNDI1ODRmNzg3MDU1NTAyMzczNmU1MzM3NDc1NzUzNTI3NjcwNTM3ODI1NDAzNzJiMjU0MDM5NTY0MjM5NWUzMzc0NmYyNTQ2NGM1NzMyNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTM1YTQ4NzAzODJhMjM2ZjQ5NDE1NzZlMzgzNzIzNmY3OTc4NzY2ZjRiNGQyYjU1NTEyNDc4NzA1NDU2NDIyMTVlNTk0MTU3MzI0MjQ2NDAzOTMzNGI2ZDM4NWE0YzU4Nzk3NDQyNmY1ZTMzNDg0MDVlNTY3NDZlMzQ3MzdhNmY1NDU2NDgyMTc5Mzc3MjZmNzkzNzRhNzAzODM3NGM3MDUyMmI3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc4MmI0YzQwMzg1YTQ4NmU3OTMzNGM1NjRiNDk3MzU2MjQzMzQyNmUzODM2NzM3MDUzNWY3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY3MzZkNTMzNzc0NDA1MzM3NGI2ZjRiNGU3OTZlNWU1NTczNmU1ZTM3MjMyMTc5MmIyNDZlNzkzMjczNmY1NDU2NDgyMTc5MzY3MzZmNzkzNzRhNzAzODM3NGM3MDU0NTk0NTU1NTM1NjJhNTU1Mzc0NDg2ZjVlMzI0NzU2NGI3NzU3NmUzODM3MjM2Zjc5Nzg3NjZmNGIyYTc2NmU1ZTM3NDc3MDUzMzc0YjU3NGY3MDQ5NmY3OTJiNzU0MDM3MmI0YjQwMzk1YTQ5NmUyNTJhNGM0MDM5NWE3MjcwNTMyYjIzMjEzODQ5N2E1ODRmNGQ3YTM1NWUzNzIzMjE3OTJiMjQ2ZTc5MzI3MzZmNTQ1NjQ4MjE3OTM2NzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM3NGM1NTUzNTYyYTU1NTM3NDQ4NmY1ZTMyNzMyMTM4MmE3NzU1NTE3NDM2Mzc1MjRkNzM2ZjVlMzM3NDcwNTQzNzRjNTU1MzVhNDg0MDUzMzY0NzU2NGI3NzU3NmUzODM3MjM2Zjc5Nzg3NjZmNGIyYTc2NmU1ZTM3NDc3MDUzMzc0YjU3NGY3MDQ5NmY3OTJiNzU0MDM3MmIyMzZkMzgyNDc4NmU1ZTM3MjM2ZjI0MmIyMzZlNWUzMzc0NmU0ZjZmNDU1NTRmNzAzMTcwMzkzMzc1NmU1ZTM3NDc0MDRmNGU0OTZmNzkyYjc1NDAzNDRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjRlMjM2ZDUzNTIyMzU1NTQzMzQyNmUzODM3Nzc1NTUzMmIyNDcwNGY0OTczMjE3YTc3NzM2ZDUzMmI0YzcwNGYyNjdhNTczMjQyNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTVhNDg3MDM4MmEyMzQwMzk1NTQxNTY1ZTRlNGI2ZTI1NTY3ODM5MjUzNzRiNmY3OTJiNGI2ZjI0MmIyMzZlNWUzMzc0NmU0ZjZmNDU1NTRmNzAzMTcwMzkzMzc1NmU1ZTM3NDc0MDRmNGU0OTZmNzkyYjc1NDAzNDRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjRlMjM2ZDUzNTIyMzU1NTM0MDc0NmQzODRhNzg0MDRmNGU1ZTZkMzkzMzQxNmU1ZTM3MjM1NTUzNTE3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY0NTU1NTM1NjJhNTU1Mzc0NDg2ZjVlMzI0NzU2NGI3NzU3NmUzODM3MjM2Zjc5Nzg3NjZmNGIyYTc2NmU1ZTM3NDc3MDUzMzc0YjU3NGY3MDQ5NmY3OTJiNzU0MDM3MmI3NTIxMzg1YTQ0NmUyNTQwNzkzOTVlNTY3ODZkNzkzNzc2NzA1Mzc4NDg2ZTdhNWE3MjcwNTMyYjIzMjEzODQ5N2E1ODRmNGQ3YTM2NzkzNzRhNzAzODM3NGM3MDU0NTk3MzZmNzkzNzc5NzAzOTVhNzg0MDRmNGU0NTZlMjU1YTc0NmU1MzRhMmE1NTUzNTY3ODIxMjU1MjI0NmYyNTM2NzM3MDUzNzQ3ODU1NTM3NDQ4NmY1ZTMyNzM3MDI1NTI0YzU1NTM1Njc0MjEyNTQ2Nzg0MDRmNGU0ODQwNzkyMTczNmU1ZTU1NzM2ZjI1NTIyMzcwMzk1Njc0NzA1MzM3Nzc1ODc1NmY0MjRmNzkyNDc4NzA1NDU2NDIyMTVlNTk0NzZkNTM3ODRjNzA1MzJiN2E2Zjc5NTI0NjU3NGY3MDRjMjEyNTc0Nzg0MDU0Mzc0NTQwMzk1NjcyNmU1MzUyN2EzOTVlNWE3ODIxMjUyYjQ3NDA1NDU5N2E1ODRmNGQ3YTMzNTMzNzQ1MjEzOTc3NzMyMTc5MzcyMzcwMjUzNzc4NmU3NTRlNzQ1NTU0NGU0YjZlMjU1Njc4NTU1MzQwNzQ2ZTUzNGE0MjZlNzk2ZjczNDA1NDM3Nzg1NTUzNTI0NzQwNGY0ZTQyNzA0ZjRlNGM3MDUzNTI0YjcwNTM3ODQ3NDA0YjRlMjM2ZTRiNGU0YjcwMzgyNjQ3NTY0Yjc3NTc2ZTM4MzcyMzZmNzk3ODc2NmY0YjJhN2EyMTM5Mzc3YTQwMzQ3MzdhNmYyNTVhNDE0MDM4MzMyNDZlNTMzNzRiMzk1ZTVhNzY2ZDUzMzc3NzcwMzg0YTc4NDA1MjJiNDM2ZTI1NTY0YzU2NGI0OTczNTYyMzQyNDgyMTdhNTk3MzZmNzkzNzdhNmQzOTVhMjM0MDM5NTY3ODQwNGY0ZTVlNmQzOTMzNDE1NTU0MzM0MTQwMzQ0ZTQ5NmY3OTJiNzU0MDM0NGU0YzIxMjU3NDc4NDA1NDM3NDU0MDM5NTU0NzU2NGI0OTczNmU1MzUyNDYyMTc5MzM3NDMwNzU0ZTRjMjEyNTc0Nzg0MDU0Mzc0NTQwMzk1NTQ3NmQ3OTJiNzUzOTI1NWE0ODcwMzgyYTIzNTc0Zjc3NDI0Zjc5MjQ3ODcwNTQ1NjQyMjE1ZTU5NDc0MDI1NTIyNDQwMjUzNjQxNTYyNTU2NDg3MDUyMmI3NDIxNWUzMzQyNzA3OTM3NzI3MDI1NTIyMzIxMjU3NDc4NmY0YjZmNDU1NTRmNzA0ZTIxNWUzMzQyNzA3OTM2NzM3MDI1NTIyMzIxMjU3NDc4NmY0YjRlNzU3MTM0NGUyMzcxMzk0ZTc4NTg3NTZmNDU1NTUzNTI3NjcwNTM3ODI1NDAzNzJiNWUyMTM5MzM3NjZkNTIyYjc2NmU1ZTM3NDc3MDU0NTk0MjRmNzkyNDc4NzA1NDU2NDIyMTVlNTk0NzZkNTM3ODRjNzA1MzJiN2E2Zjc5NTI0NjU3NGY3MDIzNDAzODRhNzg0MDVlNTY3NDZlMzcyYjRjNDAzODJhNzczOTI1MzMyNDZmNzk1MjIzNmQzODJiNDczOTVlNWE3ODIxMjUyYjQ3NDA1NDU5N2E1ODRmNGQ3YTM1NTM1MjIzNDAzODJhNzY3MTM0NGU0ODQwNzU0ZTQ4NzAzOTMzNzU2ZTVlMzc0NzQwNGY0ZTM2NDAzODRhNzg0MDVlNTY3NDZlMzQ0ZTRjNDAzODJhNzczNTM4Mzc0YzZmMjU1MjdhNDAzNDRlNzYyMTM4NGE0NTZmNGIyNjdhNTczMjQyNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTVhNDg3MDM4MmEyMzQwMzk1NTQxNTY1ZTMzNzg2ZTUzMzc3YTZmNzk1MjQ2Mzk1ZTVhNzg2ZTc5MzM0YzM5NWUzMzQ4NzA1MzUyNDU1NjRiNDk3MzU2MjMyYjI0NzA1MzU2NDg3MDM4MmE3NzU1NTIzMzc4NmU1MzM3N2E2Zjc5NTI0NjU1NTQ1YTc4NmU3OTMzNGM1NTUzNTYyYTU1NTQ1Njc4NmY1ZTM3NDU3MDRmNGQ0MTZlMjU0NTQ1NTU1NDU2Nzg3MDU0NTYyYTU4NGY0ZTc3NmY3OTJiNDk2ZjUzMzc3NzU3MzQyNjdhNTczMjQyNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTcwNzQ3MDM4NzA3ODU3NGY3MDQ3NmU1ZTMzNDI0MDdhNzg3MjZmMzkzNzc4NzAzODM3NzI0MDUzMzc0OTcwNTM3MzdhNTg0ZjRkN2EzNTc5MmIyMzZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU1NTQzMzc4NzE1NDMzNGM1NTU0NzA3NDZkMzkzMzQyNmU3OTZmNzM3MDUzNWY3MzIxNzkzNjczNmYyNTM3NDc3MDRmMjY3YTU4NGY0ZTQ1MjEzODI0NzU0MDUzNTEyODU1NTMyYTQ4NzA1Mzc4Nzk2ZDM4Mzc0YjU4NzkzMzc4NmY1NDMzNDE1NzRmNzc0MjRmNzkyNDc4NzA1NDU2NDIyMTVlNTk0NzQwMjU1MjI0NDAyNTM2NDE1NjVlNGU0YjZlMjU1YTc4NmY1ZTVhNzI2Zjc5Mzc0YzZkMzgzMzc4NmU3YTMzNzI2ZTM4Mzc0NjZlNWU1NjJhMzkyNTU2MmE3MDUzMzc0YzU2NGI0OTczNTYyNDU2Nzg2ZjI1Nzg3NzQwMzgyYTIzNTU1NDVhNzg3MDRmNGU0YzZkMzk0Mjc4NTU1MzJiNzk1NTU0MzM0MTQwMzQ0ZTc1NmU1ZTMyNzM2ZjU0NTY0ODIxMjUzNzRjNmY0YjI2N2E1ODRmNGU0OTZmNzkyYjc2NDAzOTVhNGMzOTI1MjQ3ODZlMzgyYjRiNzEzNzJiNzU3MTM5MzM3ODZmNGI3NzU3NmUzODM3MjM2Zjc5Nzg3NjZmNGIyYTdhMjEzOTM3N2E0MDM0NzM3YTZmNTQ1NjQ4MjEyNTM3NGM2ZjI0MmIyMzZkNTQ1Njc4MjEzODMzNGM1NjRiNDk3MzU2MjQ0ZTJhNzA1Mzc0NDg2ZTc1NGUyMzZkNTQ1Njc4MjEzODMzNGM1NTUzNTI0NTZkMzk0MDc4NTU1Mzc4NDc1NTU0MzM0MTQwMzQ0ZTc1NmU1ZTMyNzM2ZjU0NTY0ODIxMjUzNzRjNmY0YjI2N2E1ODRmNGUyMzZkNTQ1Njc4MjEzODMzNDI2ZTc5NmY0NzIxMzg1YTIzNmQzOTQwNzgzOTI1NWE0ODcwMzgyYTIzNTczMjQyNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTcwNzQ3MDM4NzA3ODU3NGY3MDQ5NmY3OTJiNzY0MDM5NWE0YzM5MjU1YTQ5NzAzNzJiNGM0MDM4NWE0ODZlNzkzMzRjMzk1ZTMzNDg3MDUzNTI0NTU2NGI0OTczNTYyNDM3NGM0MDM5NTU3MzIxMzgyYTc3NTU1NDVhMmE2ZjVlMzM3ODZlMzQ0ZTUwMzY1MjM2NzM3MDUzNzg0NjQwMzQ0ZTI0NmYyNTM3Nzc1NTUzNTYyYTU1NTQzMzQxNDAzNDRlNzU2ZTVlMzI3MzZmNTQ1NjQ4MjEyNTM3NGM2ZjRiMjY3YTU4NGY0ZTQ1MjEzODI0NzU0MDUzNTEyODU1NTQ1YTI0NmUzNDc0NDg2ZjRiMmEyMzZkMzgyNDc4NmY0YjczNDIzODRjNDE0YjM5MzQ3NzQ1NTU0ZjcwNzY2ZTVlMzc0NzcwNTMzNzRiNTY0Yjc3NTc0Zjc5NWE0NTIxMzk1YTRjNTU1MjRlNGI2ZTI1NTY3ODM2MjU1YTQxNDAzODMzMjQ2ZTUzMzc0YjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMzNTQ1NjQyNzA3OTM2NzM0MDM5NDA3ODZmN2E3NzczNmY1MzM3NGI2ZDM4MmI3NzZkMzg1OTczNzAyNTUyMjMyMTI1NzM3MzQwN2E1NjQ4NmUzNDRlNDg2ZTc5MzY3MzcwNTM3ODQ2NDAzOTU1NzM3MDUzNzQ0YjQwMzg1Mjc3NTU1MzUyNDc0MDRmNGU3NDU1NTM1NjQ4NzAzODJhNzc0MDM4MzI3MzcwMjUyYjRiNmQyNTM3NGI1NTU0NGU0ODZlMjU0OTQ3NTU3NTU1NzU0ZjczNDE3MzU1NGY0ZDczNDA1MzM3Nzk1NTUyMmI3MjZkMzgyYTQyNzA1MjJiNzI1NzU0NWE3ODZlNTMyMTQ1NTU1MzI0NzQ3MTUyMmI1ZTZlNWU1NjQ0NDAzOTU2NGM1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNDE0MDM4NTI0OTU1NTAyMzczMzgyNDIzNzM1NTRmNTk3MzM4NGI3NDc3NzAzODM3NzI3MDUzNzg0NjQwMzQ0OTczNDAyNTM3NDc0MDM5NTY3NDcwNTM3ODQ4NmU3NTQ5NzM2ZDI1MzcyYTU3MzcyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI0MzZlMjU1NjRjNTU1MDIzNzM3MTVlMjM3MzU1NGY1OTczNzEyNTQ2Nzg3MTM1NDE3MzU3NTM3MDc4NmU3OTM3NGIyMTM5MzM0MjZlMjUyNjQ1NTU1MzQwMjQ2ZTc5NTk0NTU1NTM3ODQ3NzA1MzM3NGI3MDc5NTI0NTU3MzkyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3YTQwMzgyYTc4NmY3OTUyMjM2ZDM4MmI0NzZmNGI0ZDJiNTU1Mzc4MjM0MDM5NTYyMzZlMjUyYjQ1NmY0YjJhNzY2ZTVlMzc0NzcwNGY3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjIxMjUyYjQ3NDA0ZjRkMmI1NTU0MzM0MTZmNzkzNzc0NDA1Mzc4NDc0MDRiMmE1MDZlMjUyYTc3NmQzOTMzNDI2ZTI1MjY0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDczOTVlNWE0NTZlNWUzMzRjNTU1MDIzNzM3MDUzNzQ0YjQwMzg1Mjc3NmQzODJhN2E1ODc3NTY0ODcwMzgyYTc3NDAzODMzMzU0MDM4MjQ3NDZmNTM3NDQ4NmY3OTM2NDE2ZTM4NTIyNjM5NWU3MDQ4NmY3OTQ2Nzg2ZjdhNTk0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI2ZjUzMmI0ODZlNGY0ZDJiNTU1MjMzNDE2Zjc5Mzc3NDQwNTI0ZTQ4NmUyNTRhNTI3MTUzMzc3NjcwMzkzMzQ4NmY3NTc0NDYyMTM5NzQ3MjcwMjUyYjRiNmQyNTM3NGI2ZjRjMjQ0NjIxMzk3NDcyNzAyNTJiNGI2ZDI1Mzc0YjZmNGI0OTczNzA1Mzc0NGI0MDM4NTI3NzM5MjUyYTc0NmUzODM3NzI2ZjU0NTY3ODQwNzk3ODI2MzEzNDU2NDk2Zjc5MmI3NTQwMzQ1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMzc1Mzc0NGI0MDM4NTI3NzU3NTQzMzc0NmY3OTcwNzg3MDUwMjQ0YzQwMzg0YTc5NTg3ODJiNGI3MDM4MjY0NTU1NTMyYTc0NmUzODM2MmI1NTdhNGU0YjZlMjU1Njc4NTgzOTVhNzY2ZDUzMzc3NzcwMzg0YTc4NmY3NTU1NDU1NTUzMzM3NDQwMzgyNDQ4NmU3NjI0MzY2ZjdhMzc3ODU3MzQyYTRjNzA1MzUyNGI3MDRmNzM0MjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTQ1YTc2NmQ1MzM3Nzc3MDM4NGE3ODU3NTQ1YTc4NmU1MzIxNDU1NTUzNDY3ODcxMzQ0OTczNDA3YTM3NDcyMTRiNDk3MzZkMzgyYTIzNDAzOTU2MjUyMTM4NDk0NTU1NTMzMzc4NmU1MzUyMmEzMTM1NGQ0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1NTc1NTU3ODU2MjQ2ZTc1NGU3OTcwMzgyYTc2NTU1MzM3MjU0MDM5NTYyYTU1NTM0ZTQyNmU3YTMzNzg2ZjdhNDA3NDZlNTM0ZDczNmYyNTM3NzY2ZTI1MmE3NzZmNGI0ZTI0NmU3YTMzNDI2ZTRmNGU0MjcwNGY0ZTRiNDAzOTMzMjQ2Zjc5MmE0YzU1NTE0MDc0NmU1NDVhNzg1NTUzMmI0YjU1NTQzMzQxNDAzNDRlNDQ0MDM5Nzc3MzZkMzk1OTczMjEyNTUyNDcyMTI1Mzc0NTZlNTMzNzc3NTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NzA0MjcwNTM3MzczNmYyNTM3NDU0MDc1MmE3MjIxMjUyYjQ3NDA1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMjUzNzQ3NDAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiNTU1MzJhNzg3MTU0MzI0MTZmMjUzNzQ1NDA3NTJhNzI0MDI1Mzc0NzQwMzk1Njc0NzA1Mzc4NDg2ZTdhNTk0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5MjU0MjQ4MjE3YTVhNmU2ZDI1MzcyYTM5MzQ0ZDJiNTU0Zjc0N2E0MDM4MmE3ODZmNzk1MjIzNmQzODJiNDc1ODRmNGU3OTcwMzgyYTc2NTg0ZjRlNDI2ZTdhMzM3ODZmN2E0MDc0NmU0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkNTMzNzc0NmY1NDUxNDc2ZDUzMzc3NDZmNTQ0ZTI0NmYyNTczNDE2ZjI1Mzc0NTQwNzUyYTcyNmQ1MzM3NzQ2ZjRmNDk3MzU3NTQzMzQyNmUzODM2NDc2ZTM4MmI0NzZlNWUzMzQ4NmU3OTc4NzY1NzRmNzc3MzU3NGI0ZTc3NDAzODRhNzQ3MTM0NDk3MzQwMjUzNzQ3NDAzOTU2NzQ3MDUzNzg0ODZlNzU0OTczNmQyNTM3MmE1NzM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjIxMjUyYjQ3NDA0ZjJhNDc2ZTVlMzM0MjQwN2E3NzQxNTczMjQxNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNzYyMTM4MmE3NjQwMzg0OTQxNmYyNTM3NDU0MDc1NDk3MzZkMjUzNzJhNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzU1NTc1NTYzNTcwNTMyYjQ5NTU1MzUxNzM3MDI1NTIyMzIxMjU3MzQ3NTU1MTUxNzM2ZjU0NTY0ODIxNzkzNjczMjEzODRhNGI0MDM4NTI3NzcxMzQ0ZTQyNmU3NTRlNzk2ZTUzNzg3YTZkNTQzMjczNDA3OTc4NDc2ZDM5NWE0MTQwMzk1OTczMjE3YTM3MjM1NTUzNzg0YzU1NTMyYTQ4NzA0ZjRlNGI0MDM5NWE3NjZkNTMzNzc3NzAzODRhNzg0MDRmMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlNmQzOTMzNDE1NTU0NWE3ODZlNTMyMTQ3MzkyNTVhNDg2ZTc5MzIyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTRjNDAzODRhNzk1ODc4MmI0MzZlMjU1NjRjNTg3YTRlNDg2ZjRmNzQ0NDQwMzk3NzQ1NTU1MTJhNDg2ZTc5MzY0MjU1NTM3ODRjNTU1MzJhNDg3MDRmNGUzMDZlMjUyYTc4NGY3MzQxNzM1NTRmNGQ3MzQwNTMzNzc5NTU1Mzc4NGMzOTVlNWE3NjZkNTMzNzc3NzAzODRhNzg0MDRmNzQ0YzQwMzg0YTc5NTg0ZjRlNDQ0MDM5Nzc0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDQyNzA1MzczNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc0MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTM0Njc4NzEzNDRlNDI2ZTc1NGU0YzQwMzg0YTc5NTg3ODJiNDM2ZTI1NTY0YzRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTM0MjQ4MjE3ODJiNzY2ZTVlMzc0NzcwNGY3NDRjNDAzODRhNzk1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkMzkzMzQxNTU1NDVhNzg2ZTUzMjE0NzM5MjU1YTQ4NmU3OTMyMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU0NTQwMzgyNjQxNmYyNTM3NDU0MDc1MmE3MjZkNzkyYjc1NmY0Yjc3NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzMzOTVlNTYyNDZlNzU3NDRjNDAzODRhNzk1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkNTM3ODQ1NDAzNDRlMzY2ZjdhMzc3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNWU2ZDM5MzM0MTU1NTQ1YTc4NmU1MzIxNDczOTI1NWE0ODZlNzkzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlNmQ1Mzc4NDU0MDM0NGU0NzZlNWUzMjczNmYyNTM3NDU0MDc1MmE3MjZkNTMzNzc0NmY0ZjRlNDg2Zjc1NGU0YzQwMzg0YTc5NTg3ODJiNDE0MDM4NTI0OTM4NGM0ZTcwMzg0YzRlNzA1NTUwMjY3MzcwNTM3ODQ2NDAzNDJhNDY2ZTI1MmE0ODcwNTMyYjQ3NmQzODU5NDE1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNmQzODI0Nzg2ZTVlMzcyMzU1NTAyMzczNmYyNTM3NDU0MDc1MmE3MjZkNTMzNzc0NmY1MjQ1NDkzOTM3NDU0OTM5MzQ0ZDQ2NTU1NDMzNDI2ZTM4MzY0NzZlMzgyYjQ3NmU1ZTMzNDg2ZTc5Nzg3NjU3NGY3NzczNmQzODIxNzM2ZjI1Mzc0NTQwNzUyYTcyNmQ1MzM3NzQ2ZjRmNGU3ODZlNTQ1YTc4NTU1MTJhNDg2ZTc5MzY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3NjZlMjUyYTc3NTg3YTcwNzQ2ZDM5MzI0MTcwNTM3ODQ2NDAzODJiMjQ3MDRmNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzMyNDQwMzQ0OTczNDAyNTM3NDc0MDM5NTY3NDcwNTM3ODQ4NmU3NTQ5NzM2ZDI1MzcyYTU1NTAyMzczNmQ1MzM3NzQ2ZjU0NTE0NzZkNTMzNzc0NmY1NDRlNDg2ZjRmNzQ0YzQwMzg0YTc5NTg3ODJiNDE0MDM4NTI0OTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkNzkyYjc1NTU1MDIzNzM2ZjI1Mzc0NTQwNzUyYTcyNmQ3OTJiNzU2ZjRiMmE3YTQwMzkzMjQxNmQyNTM3MmE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzZkNzkyYjc1NTU1Mzc4NGM1NTUxMmE0ODZlNzkzNjczNmU1ZTU1NzM2ZDc5MmI3NTM4NGM0ZTcwNTU0ZjUxMmI1NTUzNzA3ODZlNzkzNzRiMjEzOTMzNDI2ZTI1MjYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEyNTJiNDc3MDUzNzg0NzcwMzgzNjczNTU0ZjU5NzMzMjI1NTI0NzIxMjUzNzQ1NmU1MzM3Nzc1NTUzMmI0YjU1NTQ1Njc4NmY1MzRhNzQyMTI1Mzc3NzU1NTQ1YTQyNmU3OTVhNzg1NTUzNzgyMzU1NTQ3MDc0NmY0YjRlNGE3MDM4MzcyNDQwMzgzMjU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzMyNzk0YTQ4MjEyNTQ1NzM2ZDUzMzc0YjQwMzQ0ZTRiMjEzOTMzNDE0MDM5NTU3MzcwNTM3NDc0NmU3NTRlNGE3MDM4MzcyNDQwMzg3ODQ3NDA0YjRlNDI2ZTdhNWE0MjQwNTMzNjczNzA1Mzc0Nzg1NTU0NGU0ODZlMjU0OTczNmYyNTVmNzM3MDUzNzQ3ODU1NTQ3MDQ4NmY3OTQ2Nzg2Zjc1NGU3NjIxMzk0ZDczNmQzOTU5NzM0MDI1NGE0ODIxNzk1MjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTVhNDU2ZTVlMzM0YzU4Nzk1Mjc2NmYzOTM3NDI2Zjc5MzY0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ5NmUyNTJiNDU1ODdhNWEyNDIxNzkyNDQyNzA0Zjc0NGM0MDM4NGE3OTU4NzgyYjc4NzE1MzM3NzY3MDM5MzM3ODU4NGY0ZTQ0NDAzOTc3NDU1NTUzNDI0ODIxNzU0OTczNDA1NDM3Nzg1NzMyNDE1NzU1NGY0ZDczNTU1MzMzNzg0MDc1NGU3MjQwMzk3NDc4MjE1ZTM3MjM0MDM0NzQ0YzQwMzg0YTc5NTg0ZjRlNDQ0MDM5Nzc0NTU1NTM0MjQ4MjE3NTQ5NzM0MDU0Mzc3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTdhNDAzODJhNzg2Zjc5NTIyMzZkMzgyYjQ3NTg0ZjRlNzk3MDM4MmE3NjU4NGY0ZTQyNmU3YTMzNzg2ZjdhNDA3NDZlNGY0ZDJiNTU1MzQyNDgyMTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMjQ3ODcwNTQ1NjQyMjE1ZTU5NDc2ZTI1NTY0YzQwMzk1NjI1NDAzNDczN2E2ZjI1NWE0MTQwMzgzMzI0NmU1MzM3NGIzOTI1NGE3NDQwMjQyYjRjNDAzODVhNDg2ZTc5MzM0YzU2NGI0OTczNmUzODUyMjY1NzU0MzM0MjZlMzgzNjQ3NmUzODJiNDc2ZTVlMzM0ODZlNzk3ODc2NTc0Zjc3NzM1ODM0NGU3NzcwMzgzNjQ1NTU1MDRkNDI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDUzMzc0NTIxMzk3NzczMzEzNDRlNDI2ZTdhMzM3ODZmN2E0MDc0NmU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyMzZmN2E3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ0NDAzODM3NDkzOTI1NzA0ODZkMzgyYTdhNTU1MDIzNzM0MDdhMzc0NzIxNGI3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTU2ZTVlNWEyMzMyNzk1Mjc2NmQyNTJiNzk0MDc3Mzc0YjZmNzkyYjRiNTU1MzUyNGM1NTUzMzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTIzMzQxNDAzNDRlNDE2ZTVlNWEyMzU1NTM1MjRjNmQyNTM3Nzc1NTU0Mzc0YzU1NTQzMzQ4NTU1NDVhNDU2ZTVlNmY3MzQwNTMyYjVlNmU3NjQxNzM2ZjI1NDY0MjZmNGY0ZTIzNmQ1Mzc4NGM1NTU0NTYyNDZlNzU0ZTRhNzAzODc4Nzg3MDUzNGEyYTU1NTM1MjQ3NDA0ZjRlNzY2ZTI1MjQ3ODU1NTM1Njc0MjEyNTQ1NzM2ZTI1MmE3NjQwMzQ0ZTQyNzA0ZjRlNzQ2ZTUzNGE0ODcwNWU1OTczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ0ZTRiNmQzODJhMjM1NzUzMjE3NTM2NTQ1NjQ4MjE3OTM2NzM3MTI1NDY3ODcxMzkyMzczNDA1MzM3Nzk0MDM5NTY0YjQwMzgzMjI4NTU1NDQ2Nzg3MjM0NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NDQwMzgzNzQ5MzkyNTcwNDg2ZDM4MmE3YTU1NTAyMzczMzc1NDU2MjQ0MDMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDUzMzc0NTIxMzk3NzczMzEzNDRlNDYyMTM5NzM0MTZkMzgyYTIzNDAzOTU2MjUyMTM4NDk0NTU1NTMzNjQ3NmY3OTM3MjM2ZjdhNzg3MjZkMzgyNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTI3MTUzNWE3ODZmNTQzMzQyNmUyNTI2NzMyMTM5NTk3MzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ0ZTRiNmQzODJhMjM1NzUzMjE3NTM2NTQ1NjQ4MjE3OTM2NzM3MTI1NDY3ODcxMzkyMzczNDA3OTUyNDI2ZTUzMzc3NzMwNzU0ZTI5NDAzOTIzNzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDI1Mzc3ODZmNTIyYjdhNmUyNTc4NDc0MDRiNGQyYjU1NTIzMzRiNzAzODM2NTc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDQyNzA1MzczNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc0MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNWEyNDZmN2E1Njc4NmU3YTMyNzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiNDM2ZTI1NTY0YzU4Nzk3MDc4NzA0Zjc0NDQ0MDM5Nzc0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTc2NzAzOTU2NGI0MDM4MmEyMzU1NTM3ODRjNTU1MTJhNDg2ZTc5MzY3MzZlNWU1NTczMjE1ZTM3NGI2Zjc5Mzc0NzcwNTI0NTQ5MzkzNDRkNzQzMTM0NGU3YTQwMzgyYTc4NmY3OTUyMjM2ZDM4MmI0NzMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmQyNTM3Nzg2ZjUyMmI3YTZlMjU3ODQ3NDA0YjRlNDI2ZjRiNGU1MzIxMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NzQwMzg0OTczNmYyNTM3NDU0MDc1MmE3MjZkNzkyYjc1NmYyNDQ2NDQ0MDM5Nzg3MDRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODZlNTQ1YTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzQ3ODIxMzk0ZTRhNTg3OTc0NzgyMTM5NGU0OTcwMzk1YTQxNTc1NDVhNzg2ZTUzMjE0NzM5MjU3NDc4MjEzOTRkNDU1NTRmNzQyMzZkMzgyNDc4NTg3OTI0NDg2ZTc5MmIyMzZlMjUyYTQyMjE0YjczNDI1NTRmNDU3MzQwNTMzNzQ1MjEzOTc3NDU1NTUzNzA3ODZlNzkzNzRiMjEzOTMzNDI2ZTI1MjY0NTU1NTM0Njc4NzEzNDc3NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzIyMTI1MmI0NzQwNGYyYTQ3NmU1ZTMzNDI0MDdhNzc0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQyNmU3OTUyNDU2ZTU0NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5NWU1YTQ1NmU1ZTMzNGM1ODdhNTY3ODZlNTMzNzc0NmYyNTM2NDE1NzMyNDE1NzZmMjU1YTQxNDAzODMzMjQ2ZTUzMzc0YjU1NTAyMzczMzY1NDU2NDgyMTc5MzczNTIxMjU3NDc4NDA1NDM3NDU0MDM5NTU0MTM2NTI1NjMxMzI3NzM3NzIzNzIzMmIzNDM0MjMzNzM0MzY0Yjc3NTc0Zjc5NWE0NTIxMzk1YTRjNTU1MTc0NDg2ZjVlMzM0ZjIxMzg1YTQ0NmUyNTQwNzkzMzM5NTY0YjZlNWU1NTQxNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3MzY3OTM3NGE3MDM4Mzc0YzcwNTEzNzI2MjEyNTM3NDk3MDUzNzg0ODZlNzU3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjM0MjEzODc4NGM0MDM4MzI3MzZkMzgyYTRjNzA1MzM3NzQ0MDRmNGU0ODQwNzU0ZTRjNDAzODJhNzc2ZDM4MmE3YTU1NTM1MTczNmY3OTM3NGE3MDM4Mzc0YzcwNGY0ZTIzNmU0YjRlNzQ1NTUzNzQ0ODZmNWUzMjczNzA1Mzc0NzQ3MDRmNGU0MjZmNGI0ZTRiMjEzOTMzNzg1NTUzNGE0MjZlMzg3ODIzNmQzODJhN2E1NTU0Mzc0YzU1NTMyYjRiNTU1NDVhNzQ3MDU0Mzc0YjIxMzkzMzc4NDA0ZjI2NzU1NTc1NTU1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzM5MjQyYjQyNmU3OTc4MjMzOTI0NWY0MTZmMjUzNzQ1NDA3NTQ5NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM2Zjc5MzcyMzZmN2E3ODcyNmQzODI2MmI1OTRmNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzNzQ5NDAzOTU1NDE1NzM0MmE3MjM5MjU3ODQ3NmQzOTMzNzIzOTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3NmY3OTM3MjM2ZjdhNzg3MjZkMzgyNjczMzEzNDRlNGI0MDM5MzM0YjcxMzcyYjQyNmU3NTRkNzM1NTRiNGUzNTQwMzg1YTQ4NmU3OTMzNGM1NTU0Mzc0NzcwNTM3ODQ1NTU1NDMzNDE0MDM0NGU0MTZlNWU1YTIzNTU1MzUyNzYyMTI1Mzc0OTcwNTQ1OTczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTczMjEzODcwNzQ2ZDM4MjY1NzRmNzk1YTQ1MjEzOTVhNGM1NTUxNzQyMzcwNTQ0ZTUwNmU1Mzc4Nzg2ZTdhMzIyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTYzNTZkNTM1MjRiNDAzODMyNzM2ZDI1Mzc3ODZmNGYyNDc0NmU1Mzc4MjU0MDM0NGU0YzQwMzk1YTRjNmQzODJiNDc1NTU0NzA0MjcwNTM3MzczNmY1MzM3NGI1ODM4NzQ0ODZmNWUzMjczMjEyNTJiNDcyMTVlMzc0YjZmNzkzNzQ3MjE1ZTc3NzMyMTI1NTI0OTZmNGI0ZTc0NmU3OTMyNzM1YTUwNTUyYTU1NTM1Njc0MjEyNTQ2NDg0MDc5MjE0NzU1NzU1NTc1NGY3MzQxNzM1NTRmNGQ3MzQwNTMzNzc5NTU1MjJiNzI2ZDM4MmE0MjcwNTIyYjcyNTc1NDVhNzg2ZTUzMjE0NTU1NTMyNDc0NzE1MjJiNDk0MDM5NTY3MjZkNTMyYjRjNzA0ZjQ5NzM3MDUzNzg0NjQwMzgyYjI0NzA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTRjNDAzOTVhNGM2ZDM4MmI0NzU1NTAyMzczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3MzYyNTM3NGM2ZjI1Nzg0ODZlNzU3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTIyMTM4NWE0MTU1NTM3ODQ3NTgzODQwNDU2ZDM4NzA0MTcwNGY0ZTRiNDAzOTUyMjQ0MDM5NWEyMzU1NTM3NDQ4NmU1MzMzNGM1NTUzNTE3MzZkNTMyYjRjNzA0ZjRlNGM2ZTUzMmIyMzU1NTQzNzQ3NzA1Mzc4NDU1NTUzNzgyMzZmNGI0ZTc1NmUyNTMzMmE1NTUzNzg0YzU1NTM1YTQ1NmU1ZTVhNzg0MDRmNDk3MzZmMjU1ZjczNmUzODUyMjYzOTVlNGU3ODZmNzgyYjQxNmU1ZTVhMjM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGU3NjZlMjUyYTQ3NDAzODVhMjM2ZDM4MmI0NzZmNGI0ZTQ5NDAzOTU1NzM2ZDUzMmI0YzcwNGY0ZTc0NmY3OTM2NzMyMTM4NGE1ZTIxMzk3ODRjNTU1MzM3NDc2ZTVlMzc3YTZkNGY0ZTc0NmU3OTMyNzM2ZTc5MmI0NzQwMzQ0ZTdhNDAzOTMyNzM0MDUzNzg0YzIxMjU1MjRiNDA1MzM3Nzc1NTUzNDA0ODZmNzU0ZTc0NTU1MzQwMjQ2ZTUzNDk3MzZmNTMyYjQ4NmU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzUyNzcyMTM5NGUyMzQwMzk1NTczMzEzNDRlNTUzNzUyMzMzMjMyMzgzMzc0NmY1NDMzNzg2Zjc1NzQ0OTZlMjUyYjQ1MzkyNTVhNDg2ZTc5MmE3ODIxNWUzMzQyNmUyNTJhNGMzMTM1NTEyNTU4NGY0ZTQ5NmUyNTJiNDUzOTI1MjQ3NDcxNTQ1YTQyNzE3OTM2MmI2ZTM4NTIyNjM5NWU0ZTc4NmY3ODJiNDE2ZTVlNWEyMzU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDc2ZjI1Mzc0YzZmMjU3ODQ4NmU3NTJhNDY2ZTVlMzc0NzcwNGY3MzdhNmQ1NDMzMjM2ZjU0NTkyODU4NGI1ZjdhNTg0ZjRlNzQ0MDUzNTI0OTcwNTMzNzRiNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzZmMjUzNzRjNmYyNTc4NDg2ZTc1MmE0NjZlNWUzNzQ3NzA0ZjczN2E2ZDU0MzMyMzZmNTA0MTQ4NTg0YjZmNDU1NTUzNTI3NzIxMzk0ZTIzNDAzOTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTQ2MjEzOTc0NzI2ZjUzMzc0YjM5MjU3NDQ4NmY1ZTMyNzMzMTM0NGU0NjIxMzk3NDcyNmY1MzM3NGIzOTI1NzQ0ODZmNWUzMjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODdhMzM0MjZlMzgzNzQ4NzAzOTMyNzMzMTM0NGUyMzZkMzgyNDc4NmU1ZTM3MjM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyNmU1MzJiNzY2ZDRiNGQyYjU1NTQzMzQxNmY3OTM3NzQ0MDUzNzg0NzQwNGIyYTU5NmUyNTVhNDQ1NzRmNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNDE2ZTVlNWEyMzZmNGI0ZDJiNTU1NDQ2MmI1NTRmNGQ3NjU1NTQ0NjQxNmU1ZTVhMjMzMDc1NGUyOTU2NWU1YTQ1NmU1ZTMzNGM1NjRjNDE3MzMyNzkyYjI0NmU3OTMzNzg0MDUyNWE3ODZlMzg1MjQ5NmQ1MzJiNGI0MDM0NDk3MzU2NWU1Njc4NmY1ZTM3NDY0MDM3MmI3NDcwNGY2ZjI4NTU1MzI0NDg2ZTc5MmIyMzZlMjUyYTQyMjE0YjRlMjM2ZDM4MjQ3ODU4NGY0ZDdhNmY1ZTMzNGI2ZDM4NDY3ODZmNGI2ZjI4NTU1Mzc4NDc3MDU0MjQyYjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTIyYjQxNmU1ZTVhMjMzOTVlNWEyMzIxMzkzMzc4NTc1NDVhNzg2ZTUzMjE0NTU1NTM3NDQ4NmY1ZTMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NzA0MjcwNTM3MzczNmYyNTM3NDU0MDc1MmE3MjZlNTMyYjc2NmQ0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzc0NzA1MzM2NzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiNDE2ZTVlNWEyMzZmNGIyYTdhNDAzOTMyNDE2ZDUzMmI0YzcwNGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzZmNWUzMzc0NzA1MzM2NzM2ZDM5NTk3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjMyMTM5MzM3ODU1NTAyMzczNzE0YjcwNGM2ZTUzMmIyMzZmNGI2ZjI4NTU1NDMzNDE2Zjc5Mzc3NDQwNTM3ODQ3NDA0YjJhNGY2ZTVlMzc0NzQwNTMzNzc3MzYyNTM3NDYyMTM5NGU0MTZlNWU1Njc4NTc1NDVhNzg2ZTUzMjE0NzZlMzg1MjI2Mzk1ZTRlNzg2Zjc4MmI0MTZlNWU1YTIzNTczNDQ5NzM1NjVlNTY3ODZmNWUzNzQ2NDAzNzJiNzQ3MDRmNmYyODU1NTA0ZDQ3NTk0ZjQ5NzM1NjVlNWEyMzZmNzk3ODQ0NDAzOTU5N2EzMDc1NGQ0OTcyMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI2ZDUzMmI0YzcwNTQ1YTZlNmQ1MzJiNGM3MDUyMjM3MzMxMzQ0ZTRjNzA1MzUyMjM0MDMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzZmNWUzMzc0NzA1MzM2NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM0MDI1MzcyMzU3NTQ1YTc4NmU1MzIxNDU1NTU0Mzc0YjZlNGY0OTczNTc3NTQyNDQ3MDI1NTI0YjQwNWU1OTQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTRjNDAzODRhNzk1ODdhNTY3ODZmMzkzNzc4NmY1ZTMyNDE1NjIzNzA1MjM3NGY2ZjQ1NTU1NDM3NGI2ZTRmNDk3MzU3NzU0MjQ0NzAyNTUyNGI0MDVlNTk0MjRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTQ1Njc4NmYzOTM3Nzg2ZjVlMzI0MTZmMjUzNzQ1NDA3NTQ5NzM2ZTM4MzcyMzZkNTMyYjc3NTg0ZjRlMjQ2Zjc5NDk0NTU1NGY0MTQzNmQ1ZTcwNzQ2Zjc5NzA0YzU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc1NTU3NTU2MzU0MDM4MmE3NzU1NTM1MTczNmY3OTM3NGE3MDM4Mzc0YzcwNGY0ZTIzNmQ1NDU2NDg3MDM4NzA0MTU1NTQzMzQxNDAzNDRlNDk2ZTI1MmI0NTQwMzgzMjczNmYyNTM3NGM2ZjI1Nzg0ODZlNzU0OTczNDA3OTUyNDI2ZTUzNzg0NzQwNGI0ZTc5MjEzOTVhMjM1NTU0NzA0MTZkMzg0YTc4NTU1NDMzNDE0MDM0NGU0MTZlNWU1YTIzNTU1Mzc4NGM1NTUzNTY3NDIxMjU0Njc4NDA0ZjRlNDg0MDc5MjE0NzRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTE1MTczNWE1MDU1MmE1NTUzMmI0YjU1NTAzNjQ5NTk0YjRlNGM3MDUzNTI0YjcwNTQ1OTczMjEzNDRlNzUyMTM4NWE0NDZlMjU0MDc5NTU1MzUyNDc0MDRmNGU0YjIxMzg3ODRjNDAzOTU5NzMzNDUzMmI0YzcwNTE1Njc0MjEyNTQ2NDg0MDc5NDA1MjZmN2E1NjQ4NmY3NTRlNDU2ZDM4NDY3ODU1NTQzMzQxNDAzNDRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjRlNGI0MDM4NDAyNDZmMjUzNzc3NTU1MzMzMjQ2Zjc5Nzg0NzQwNGI0ZTQyNzA0ZjI2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzU1NTc1NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MTZlNWU1YTIzNTU1MDIzNzM3MDM5NTY0NTZmNWU0ZTQ1NmQzOTMyNDE3MDM5NTY0NTU3MzQyYTQ3NDAzOTMzNDU2ZTI1NTk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNDAzNDRkMmI1NTU0NWE3ODZlNTMyMTQ3MzkyNTc0NDg2ZjVlMzM3MjZmNWUzMzc0NzA1MzM2NDE2ZDUzMmI0YzcwNGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ1MjEzODU2Nzg2ZTU0NTk3MzMxMzQ0ZDQxNTc0ZjcwNDE2ZTVlNWEyMzU2NGI0OTczNmQ1MzJiNGM3MDRmNzc0NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDU2MmEzOTI1Nzg0NzU1NTAyMzczNmY1ZTMzNzQ3MDUzMzc2ZTU2NWU1Njc4NmY1ZTM3NDY0MDM3MmI3NDcwNGY3MDcwNTU0ZjIzNzM3MDUzNzg0NjQwMzQyYTQ2NmUyNTJhNDg3MDUzMmI0NzZkMzg1OTQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTU0NTY3ODcwNTQ1NjJhMzkyNTc4NDc1NTUwMjY3MzU5NTA0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTM4MzcyMzZmNzk3ODc2NmY0YjJhNDI2ZTc5NTk0MTU2NWU0ZTRiNmUyNTU2NzgzOTI1NTY3NDIxMjU0NjQ4NDA3OTQwNzI2Zjc5Mzc0MzQwMzg1YTIzNmQzODJiNDc2ZjI0MmIyMzZlNWUzMzc0NmU0ZjZmNDU1NTUzNGE3NDIxNzkzNzQ1NmY0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzk1MjQyNmYyNTM2NzMzNDUzMmI0YzcwNTE1Njc0MjEyNTQ2NDg0MDc5NDA1MjZmN2E1NjQ4NmY3NTc0Nzk1NTdhNDY0MTZlNWU1YTIzNzIzNDRlNDI2ZjRiNGU0YjIxMzkzMzc4NTU1MzRhNDI2ZTM4NzgyMzQwMzgzMjQ1NTU1NDU2Nzg3MDU0NTYyYTZkMzgyYTdhNTU1MzRhNzQ3MDUzMzc0YjU1NzU0OTczNmY3OTM3MjM2ZjdhNzg3MjZkMzgyNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlMzkyMTM4NzgyMzU1NTM1MjIzNTU1MzI0NDg2ZjVlMzI3MzZlMjUyYTc4NTU1MzVhNDg2ZTc5MmE3ODIxNWUzMjczNzA1Mzc4NDY0MDM4MmIyNDcwNGY0ZTc5NmU1ZTU1NzMyMTM0NGU3OTZmNzkzNzc4NTU1NDVhNDU2ZTVlMzI3MzZmMjU1ZjczMjEzNDRlNGM2ZTUzMmI1ZTU1NTM3NDQ4NmY1ZTMyNzMyMTI1NTI0NzU2NWUzMjczNmY1Mzc4NDU0MDM0NGUyNDZmNGY0ZTc2MjEzODRhNDU0MDM5NTY0YzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmU3OTJiMjM1NTU0NWEyMzIxMzkzMzc4Mzg0YjcwNGM2ZTUzMmIyMzZmNGI3MDcwNTg3OTUyNzY2ZjM5Mzc0MjZmNzkzNjQxNzA1Mzc4NDY0MDM4MmIyNDcwNTAyNDRjNDAzODRhNzk1ODdhMzM0MjZlMzgzNzQ4NzAzOTMzNmU1OTUyMjM0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTc4NDcyMTRiNzM3YTZmNTQ1NjQ4MjE3OTM3NzIyMTc5NTI3NjZkMjUyYjc5NDA3ODJiNGI0MDM4NDI3ODIxNWUzMzQyNmUyNTJhNGMzOTVlMzM0ODcwNTM1MjQ1NTY0YjQ5NzM2ZTUzNTI3NTQwMzg0YTRjNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjIxMzg3ODRjNDAzNDRlNTU2ZTVlNWEyMzMyNzk1Mjc2NmQyNTJiNzk0MDc3Mzc0YjZmNzkyYjRiNTc1MzIxNzUzNzUzMmI0ODU1NTMyNDc0NmU3YTc3NzM2Zjc5Mzc0YTcwMzgzNzRjNzA1NDU5NzM2ZDM4MjY3MzQwNzk0YTQyNDAyNTc0MjM1NTU0MzM0ODU1NTQ0NjQxNmU1ZTVhMjM3MjM0NTU0MjRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzMjEzOTU2MjM0MDM4MzI3MzMxMzQ0ZTIzNmQzODI0Nzg1ODc5MjQ0ODZlNzkyYjIzNmUyNTJhNDIyMTRiNzM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY3MzMxMzQ0ZTMwNmUyNTJhNzg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDU0NTYyYTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDQ3MDI1NTI0YjQwNWU1OTQ3NmYyNTM3MjM0MDUzMzc3OTIxMzkzNzQ1NzA0ZjczN2E3MDUzNzg0NjQwMzgyYjI0NzA0ZjZmNDU1NTU0NWE3ODZlNTMyMTQ3NzA1Mzc4NDY0MDM4MmIyNDcwNGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NzMzMTM0NGU0YzQwMzg0YTc5NTg3YTVhNzg2ZjVlNWE0MjZlMjUyNjQ3NmY3OTM3NGE3MDM4Mzc0YzcwNGY3NDQ2NDAzOTMzNDE2ZTI1MzI0NTU1NTQzNzRiNmU0ZjQ5NzM1Nzc1NDI0NDcwMjU1MjRiNDA1ZTU5NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzNTU1NDU2Nzg2ZjM5Mzc3ODZmNWUzMzRjNTg3ODMzNDI2ZTM4Mzc0ODcwMzkzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMjQ3ODcwNTQ1NjQyMjE1ZTU5NDc2ZDM4MmE3NjU3NGY3MDQ5NmY3OTJiNzU0MDM3MmIyMzZkMzgyNDc4NmU1ZTM3MjM2ZjI0MmIyMzZlNWUzMzc0NmU0ZjZmNDU1NTUzNGE3NDIxNzkzNzQ1NmY0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzk1MjQyNmYyNTM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3MzY3OTM3NGE3MDM4Mzc0YzcwNTEzNzI2MjEyNTM3NDk3MDUzNzg0ODZlNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTM4MzcyMzZmNzk3ODc2NmY0YjJhNDI2ZTc5NTk0MTU2NWU0ZTRiNmUyNTU2NzgzOTI1Mzc0YjZmNzkyYjRiNmYyNDJiMjM2ZTVlMzM3NDZlNGY2ZjQ1NTU1MzRhNzQyMTc5Mzc0NTZmNGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5NTI0MjZmMjUzNjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5NmQzODJhNzQ2ZTUzNGEyYTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0NGU0MjZmNGI0ZTQ3NmU1ZTMyNzMzNTc5MmI0NzQwMzQ0ZTc0NmU3OTMyNzM2ZDVlNzA3NDZmNzk3MDRjNTg3OTcwNzg3MDRmNzM3YTZmNWUzMzRiNDAzODUyNDY1NjRiNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTIzMzQxNDAzNDRlNzU2ZTI1MzMyYTU1NTM3ODRjNTU1NDU2NzgyMTM4MzI3MzIxMzg0MDIzNDAzOTU1NzM3MDI1MzY3MzZmNzkzNzIzNzAzOTU2NDczMDRiNGU0NDQwMzgzNzQ5NTU1NDMzNDE0MDM0NGU0YzZlNTMyYjIzNTU0Zjc0NzQ2ZTc5MzI3MzZkMzkzMzRjNTU1MzVhNDg2ZTc5MmE3ODIxNWUzMzQyNmUyNTI2NDI1NTU0Mzc0NzcwNTM3ODQ1NTU1Mzc4MjM1NTUzNzg0YzU1NTM1YTQ1NmU1ZTVhNzg0MDRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyNmY3OTM3NDU0MDM4NTI0YzQwMzcyYjQ4NmU3ODJiNzY2ZTUzMmI0YzQwMzQ3NDRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0OTczNmY1ZTMzNzQ3MDUzMzc2ZTU2NWU1YTQ1NmU1ZTMzNGM1NjI0MjM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNDAzNzQ1N2E2ZjI1NGE0ODcwNTQ1OTdhMzkzNDJhNGI0MDM4NGE3ODIxMzk1YTc4NTc0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDY0MDM5MzM0YjZkMzg1YTRjNTg3OTJiNzU2ZjI1Mzc0YjcwNzkzNjQxNTY1ZTRlNGI2ZTI1NTY3ODM5NWU1Njc4NmYzOTM3Nzg2ZjVlMzM3MjQwNTQzNzRiMjEzOTMzNDI2ZTI1MmE3MjZmMjUzNzc2NmUyNTJhNzc2ZjRiNmY0NTU1NTQzMzQyNmUzODM2NDc2ZTM4MmI0NzZlNWUzMzQ4NmU3OTc4NzY1NzRmNzc3MzU4MzQ0ZTRjNzA1MzUyNGI3MDUzMzc3NzU4NGY0ZTQ1MjEzODU2Nzg2ZTU0NTk0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlMzgzNzIzNmY3OTc4NzY2ZjRiMmE0MjZlNzk1OTQxNTY1ZTRlNGI2ZTI1NTY3ODM5NWU1Njc4NmY1ZTRlNDg2ZTdhNWE3ODZmMjQyYjIzNmU1ZTMzNzQ2ZTRmNmY0NTU1NTM0YTc0MjE3OTM3NDU2ZjRiNGQ0NDU1NGY3MzQxNTYyNTVhNDg0MDUzMzY3YTU4NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQyYTRjNzA1MzUyMjM3MDM5NWE3MjIxMjUyYjc3NDAzNDc3NDU1NzM0Nzc1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjQ3NmY1ZTMzNzQ3MDU0Mzc0YzM5MjU1YTQ4NDA1MzM2NzM2ZDM4MjY3MzU3NTAzMjRiMzAzNDQ5NzM1YTM1NGQ0YzU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDUzMzc0NTIxMzk3NzczMzEzNDRlNGM0MDM4NGE3OTU4NzgyYjc1MjEzODVhNDQzOTI1MmI3OTQwNzU3NDQxNmU1ZTVhMjM1ODRmNGU0YzcwNTM1MjIzNDAzNDQ5NzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU4Nzk1YTQ1NmU1ZTVhNzg1NzRmNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTUyNDI2ZjI1MzY3MzM0NTMyYjRjNzA1MTU2NzQyMTI1NDY0ODQwNzk0MDUyNmY3YTU2NDg2Zjc1NzQ3OTU1N2E0NjQxNmU1ZTVhMjM3MjM0NGU0YjQwMzkzMzI0NmY3OTJhNzg0MDRmNGUyOTZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY0NzZmNWUzMzc0NzA1NDM3NGMzOTI1NWE0ODQwNTMzNzJiNTg0ZjRlNGI0MDM5MzM0YjcxMzg3ODQ3NDA0YjRlNDI2ZTc1NGUyOTQwNTMzNzQ1MjEzOTc3Mjg1ODc2NGU3OTcyMzk1OTc1NTg0ZjRlNzc0MDM4NGE3NDcxMzQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNzA1MzUyMjM0MDM3NDU3YTZmNWUzMzRiNmQzODQ2Nzg2ZjRiNzA3MDU1NTAyMzczNTk0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzI0MTU3NTU0ZjRkNzM1NTUxNGU0YzcwNTM1MjIzNmQzODVhNDY0MDM5MzM0MTZlMjUzMjU3NTU0ZjRkNzM1NTUzMzM3ODQwNzU0ZTcyNmY3OTM3NDU0MDM4NTI0YzQwMzcyYjQ4NmU3ODJiNzY2ZTUzMmI0YzQwMzQ3NDRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0OTczNmYyNTRhNDg3MDU0NTk0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1YTQ1NmU1ZTVhNzg1NTUwMjM3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY0NzIxMjU0YTQ4NmYyNTM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM4NGE3ODIxMzk1YTc4NDA0ZjRkMmI1NTUyNDY3MDRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNzY2ZTUzMmI0YzQwMzcyYjc0NmU3OTMzNzI2Zjc5Mzc0NTQwMzg1MjRjNDAzNDczNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNmY3YTc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzY2ZTUzMmI0YzQwMzQ3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNDA0MjZlNzk1MjQ1NmU1NDc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU0NzZlNWUzMjczNmY3OTM3NDU0MDM4NTI0YzQwMzgzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5Mzc0NTQwMzg1MjRjNDAzODMyNDcyMTM5NGU0OTQwMzgyYTc3NTc1MjMzNGI3MDM4MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTRhNDg3MDU0NTk0NzZmNzkzNzQ1NDAzODUyNGM0MDM0NzM0MjRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU4Nzk1YTQ1NmU1ZTVhNzg1NTUwMjM3MzIxMjU0YTQ4NmYyNTM3NzIyMTM4MmE3NzM5NWU1Njc4NmU1MzM3NzQ2ZjI1MzY1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzM5MjU1Njc0MjEyNTQ2NzI2ZTI1NDA3OTU3NTQ1YTc4NmU1MzIxNDU1NTUzNzQ0ODZmNWUzMjQ1NTU1NDVhMjMyMTM5MzM3ODU4NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDUzMzc2ZTU2NWU1YTIzNmY3OTc4NDQ0MDM5NTk3YTM5MzQ0ZDQ0MzEzNDRkNGE0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDUzMzc0NTIxMzk3NzczMzEzNDRlNGM0MDM4NGE3OTU4NzgyYjRiNDAzOTMzNGI3MTM3MmI3NDQwN2EzMzc4NmY3NTc0NGI0MDM5NWE0OTZlMjUyYTRjNDAzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU3NzQwMzg0YTc0NzEzNDRlNDI2ZjRiNGUzMDZlMjUyYTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NzQwMzg0YTc0NzEzNDRkMmI1NTUxNzQzNjM3NTI0ZTcyMzM1MTM3NTMzMjM3Mzc1OTM3NTIyYjRmMzIzNjVhNTgzNTIzNDA1MzU1NGY0MTczNTk3NTRkNDM1Nzc1NGQ0MTZmNWUzMzc0NzA1MzM3NmU1NjVlNWEyMzZmNzk3ODQ0NDAzOTU5N2EzOTM0NGQ0NjU1NTA1MTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNDA1MzM3NDUyMTM5Nzc3MzMxMzQ0ZTQ2NmQzODI2NDE0MDUzMzc0NTIxMzk3NzQ1NTU1MTc0MzYzNzUyNGU3MjM1MzY1MjIxMzkyMzU2NGUzMjIzNDYzMTMzNzcyMTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDUzMzc2ZTU2NWU1Njc4NmY1ZTM3NDY0MDM3MmI3NDcwNGY3MDcwNTU1MDIzNzM3MDUzNzg0NjQwMzQyYTQ2NmUyNTJhNDg3MDUzMmI0NzZkMzg1OTQxNTczNDRkNDQ1NTUzMzM3ODZlNTM1MjJhNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDI2ZTdhMzI0MTQwNzU1NjI5NmQ1MzJiNGM3MDU0MjM3MzZmNzkzNzIzNzAzOTU2NDc0MDM4MzI3MzcxNWU1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU4N2E1YTIzMjEzOTMzMjQ2ZjI0MmI3NjZlMjUzMzc4NzIzNDQ5NzMyMTc5NTI3NjZkMjU3ODQ3NDA0YjRlNDg0MDc5MjE3MzQwNzkyYjRiNTU1NDQ2Nzc0MDM4NGE3NDcxMzU0MTQ3NTk1MzQwMmI2ZjRiNTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTUzMzM3ODZlNTM1MjJhNGY3MzQxNzM1NTRmNGQ3MzMyNTQ1YTIzMjEzOTMzNDIyMTI1MjQ3ODcwNTM3NDQ4NDA0ZDQxNzM1NTRmNGQ3MzQwNTMzNzc5NTU1MjJiNGI0MDM5MzM0YjcxMzcyYjc0NDA3YTMzNzg2Zjc1NzQ0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NzU1NTc1MzY1MzUyNGI2ZjI1MzY3MzIxMzQ0ZTM0NDAzOTMzNGI3MTM0MjQ0ZTQwN2EzMzc4NmY3NTRlNDE0MDM4NTI3NzQwMzk1NTczNDAyNTc4MjU0MDM4MjY3MzQwMzg3ODIzNmQ1MzM3NGI1NTUzNTI0YzU1NTQ1YTc4MjEyNTJiNDc0MDU0NTk3MzZlNWU1NTczMjEzOTU5NzMyMTM4MjY3MzM0NTIzMzM2MzY0ZjRlNzcyMTM5MzM3ODU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDQwNzQ2ZTU0Mzc3ODU1NTAyMzczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjQ3NmQ1MzM3NzQ0MDUzMzc0YjZmNGIyYTdhNDAzOTMyNDE1NjI0NTY3ODcwNTQ1NjJhNTgzNjUyNzk3MDUzMzc0YjU2NGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDc2ZTVlMzI3MzcwNzk1MjQ1NzAzODM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUzMDZlMjUyYTc4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzZlMzg1MjI2NTc1MzQwNDU2ZTI1NTIyMzU3NTQ0MDc0NmU1NDM3Nzg1NzM0NDk3MzU5NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzM3Nzk1MjQ1NzAzODM3NTI2ZjdhNTY0ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjUzNTI0YzZmNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNmY3YTc4NzIyMTM5MzI3MzMxMzQ0ZTQ5MjEzOTU2NGM0MDM4MzM3NDcwNTMzNzcyNzA1MzJiNzI0MDUzNTIyMzQwMzkzMzQyNmUzODM2NDE3MDc5NTI0NTcwMzgzNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NGY3NDM2NzEzOTRlNzgzMzM5NTY0YjZlNWU1NTQ1NTU1MjQwNzQ2ZTU0Mzc3ODMzMzk1NjRiNmU1ZTU1NDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzM1NzkyYjQ3NDAzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTQ2MjEzOTczNDE1NzU0NTY3ODcwNTQ1NjJhMzkyNTUyMjM1NTRmMjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc1NDU2Nzg3MDU0NTYyYTM5MjU1MjIzNTg3YTMzMjg2ZDM4MmE3OTZlNGI3NzQyNTg3YTMzNDg3MDUzNTI0NTM5NWU1YTc4MjEyNTJiNDc0MDU0NTk0MTU3MzQ0OTczNTk0Zjc3NTc0Zjc5NzQyMzcwNTQ0ZTcyMjEyNTRhNDI0MDM4MmEyMzU1NTAyMzczMzQ1NDMzMjM2ZjUxNWE0NTZkMzgzNzQ3NzA0Zjc0NTUzNzUyMzMzMjM5MjMyNDRlMzg1MjJiMzIzMzM3NTY3MjM0NTEyYjM1Mzc0ZjQ5NzM1NzUxNzQzNjM3NTI0ZTcyMzIyMzJiMzAzNTc3Mzc1MDM3NTIyYjM2MzQzNjI0NTIzNTI0MzczNjU4NGY0ZTU1Mzc1MjMzMzIzOTI0NTY1MjMyMzYzMzcyMzc1MTc4NWEzMzM2MmIzNzM3NGY3NzQyNGY3MzQyNzIzNTM2NzgzNTM2MjM3ODMwMzM0YjRkMmI1NTUzMmI3NTZkNzkzNzc2NzA0ZjczNDI0ZjczNDI3NjZlNTM1MjRjNmY0YjRlMzU2ZDM4MmE3YTZlNTMzNzUzNmU1Mzc4N2E2ZDU0MzIyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1MDZlMjU0YTQ1MjEzOTRlNGM0MDM0NGU3NjZlMjUyYTc2NzAzOTU2NGI0MDM4MmEyMzU1NTM1YTc0NmU1MzRhNGM1NTUzNDA0ODZmNzU0ZTIzNmQ1MzM2NzM2ZjI1NTI0NjQwMzQ0ZTQ0NDAzOTc3NzM2ZDM4MmEyMzZlNGI0ZTQ4NmU3OTM2NzMyMTI1NTI0NTZlNGY0ZTVlNmQ1MzJiNGM0MDM0NGU0YjQwMzk1YTI0NmU1NDMyNzM0MDM5NDA3ODZmN2E3ODQ4NmU3OTM2NzM2ZjI1NzQ3NDZmNzkzNzRjNTg3NTU1NzU1NTczNDE1NzU1NGY0ZDczNTU1MzMzNzg0MDc1NGU3MjM5MjU3ODQ3NmQzOTMzNzIzOTRiNzQ0YzQwMzg0YTc5NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ1NmUyNTVhNDQ1NTUwMjM3MzcwNTM3NDRiNDAzODUyNzc2ZDM4MmE3YTU4Nzc0YTQ4MjEyNTQ1NDE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3MzkyNTVhNzQ2ZTUzNGE0YzU1NTAyMzczNzE1ZTIzNzM1NTRmNTk3MzcxMjU0Njc4NzEzNTQxNzM3MTRiNzA3NzZlMjUyYTc4NTY0YzQxNzMzMzM5NDA3ODZlN2EzMjQ1NTU0ZjcwNGI0MDM5NWEyNDZlNTQzMjdhMzA3NTRlMjUyMTM4NGEyNDQwMzQ0OTczNTYyNTM3NGI2Zjc5MmI0YjU2NGM0MTczNDAzOTc0NzY0MDM5NGUyMzZkMzgyYjQ3NzIzOTIzNTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM0MDUzNWY0MTZmMjUzNzQ1NDA3NTQ5NzM2ZDI1MzcyYTU4NGY0ZTc5NzAzODJhNzY1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkMzkzMzQxNTU1NDVhNzg2ZTUzMjE0NzM5MjU0YTQ4MjEyNTQ1Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1YTc0NmU1MzQ5NzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiNzYyMTM4NGE0NTZmNGIyYTdhNDAzOTMyNDE2ZDI1MzcyYTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDU0MDM4NTI3NzQwMzk1NTczMzEzNDRlNzYyMTM4NGE0NTU1NTM3ODRjNTU1MTJhNDg2ZTc5MzY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM2ZTUzMzc3NDQwNTMzNzRiMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEyNTUyNDU2ZTRmNGQyYjU1NTQ1YTc4NmU1MzIxNDczOTI1NWE3NDZlNTM0YTRjMzgyNTQ2Nzg3MTM3MjM3MzMxMzQ0ZTI5NTYyNTMzNDg2ZTc5MzY3YTMwNzU0ZTIzNmQ1NDU2NzgyMTM4MzM0MjZlNzk2ZjQ3MzMzOTQwNzg2ZTdhMzI0MTU3MzQ0OTczNTY1ZTU2Nzg2ZjVlMzc0NTcwNGY2ZjI4NTU1MTJhNDg2ZTc5MzY0NTU1NGY3MDc4NmY3YTU2NDg2Zjc1NmYyODU1NTEyYTQ4NmU3OTM3MmI0ZjczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTM0YTc4MjEzODMzNzg2Zjc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTI1NTI0NTZlNTI0NTdhNmY3OTM3NGM3MDM4NGEyMzU2MjQyMzczMzEzNDRlNzk3MDM4MmE3NjU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzNTU1MTM3MjYyMTI1Mzc0OTcwNTM3ODQ4NmU3NTRlNzQ2ZjRiNGU3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxMjU1MjQ1NmU1MjQ1N2E0MDM5NTY0YjZlNWU1NTdhMzkzNDRkMmI1NTUzMzY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDA3OTc4NDcyMTM4NGE0NTcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDQyNzA1MzczNzM2ZjI1Mzc0NTQwNzUyYTcyNmU1MzJiNzY2ZDRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc3NDAzODQ5NzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTUyNDU2ZTU0NWE2ZTZkMjUzNzJhMzkzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEyNTUyNDU2ZTUyNDU3YTQwNTMyYjQ3NDAzNDcwNzA1ODdhNWE3ODcwNGY3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNGM0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEyNTUyNDU2ZTUyNDU3YTQwNTMyYjQ3NDAzNDcwNzA1ODdhNzA3NDZkMzkzMjQxNTczMjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU3NjIxMzg0YTQ1Mzg0YjcwNzg2ZjdhNTY0ODZmNzU3MDcwNTU1Mzc4NGM1NTUzMmE0ODcwNGY0ZTMwNmUyNTJhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiMjEzODc4NGM0MDM0NGU3NjIxMzg0YTQ1Mzg0YjcwNzg2ZjdhNTY0ODZmNzU3MDcwNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTM1YTc0NmU1MzRhNmU1NjVlNTY3ODZmNWUzNzQ1NzA0ZjcwNzA0ZjczNDI3NjZlNTM1MjRjNmY0YjRlMzYzNzUxNGE1MDIxMzg1YTQxNDAzNTQxNTc1NTRmNGQ3MzU1NGY1NTc1NTU3ODMzNDE2Zjc5Mzc3NDQwNGYyNDRjMjEzODQwNzg1NTUxNGEzNDM3MzQ0ZTc2MjEzODVhNDE0MDM0NGU1ZTZkNTMyYjRjNDAzNDRlNzg2ZTdhMzM0YjZkMzgzNzRjNTU1MzM3MjY2ZjUzNzg0YjQwMzQ0ZTczNzA1NDMzNDUyMTRmNGU0YzQwMzg1YTQ4NmU3OTMzNGM1NTUzNTI3OTcwNTMzNzRiNTU1NDMzNDE0MDM5Nzc3MzIxMzk1Njc4NTU1NDVhMjM2ZTVlNTY3ODQwNGYyNjU3NGY3NTRkNzM1NTRmNGUzNTZkMzk0Mjc4NTU1Mzc4NGM1NTUzNTY0ODcwMzgyYTc3NDAzODMyNzMyMTdhNzc3MzQwMzgyYTIzNmY3YTc3NzMyMTI1MmIyNDZlN2EzMjczMjEzODJhNzc1ODRmNGU0MjQwNzU0ZTczNmUzODUyMjYzOTI1NTYyYTcwNTMzNzRjMjE0ZjRlNDI2ZjRiNGU3YTZkMzk0MDc4NmU3NTQ5NzMyMTdhNzc3MzcwNTM3NDc4NGY3NTRkNzM1NTRmNGU3NDZmNTQ0ZTRiNmU1ZTc0NDI2ZTM4NTIyMzQwMzQ0ZTQ2NDAzODI0NDg2ZjdhNzc3MzQwMzg1Mjc2NmQ0ZjRlMjUyMTM4NGEyNDQwMzQ0ZTRiNDAzOTRlNDg2ZjdhMzM0YzU1NTQzMzQxNmY3OTJiMjQ0MDI1NzM3MzIxNTQ1YTQyNzE3OTM3NDg0MDc5NGQ0NzRmNzU0ZDczNTU0ZjRkNzU1NTc1NTU1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzM5MjQyYjQyNmU3OTc4MjMzOTI0NWY0MTZmMjUzNzQ1NDA3NTQ5NzM3MDU0MzM0NTU4NGY0ZTQ2MjEzOTc0NzI0MDM4MmEyMzZmNzk3ODc4NmY0YzIzNGE1OTUwNGQ0OTU5NGY0OTczNmUzODUyMjYzOTI1NTYyYTcwNTMzNzRjMzEzNjJhNDg2ZTc5MzY0NTU1NTQ1YTQyNzE3OTM3NDg0MDc2MjQzMDZlMjUyYTc4NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4N2EzMzIzNmU0ZjRkMmI1NTU0MzMyMzZlNGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDc2ZTM4NTIyNjM5MjUzNzQ3NzA1NDU2NDI0MDM5NTk3MzMxMzQ0ZTQ2MjEzOTc0NzI0MDM4MmEyMzZmNzk3ODc4NmY0OTQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzZlMzg1MjI2MzkyNTU2MmE3MDUzMzc0YzU1NTAyMzczNmUzODUyMjYzOTI1NTYyYTcwNTMzNzRjNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE0YzZkMzk0Mjc4NmUyNTIxNzMzMTM0NGU0YzZkMzk0Mjc4NmUyNTIxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjQ1NmUyNTVhNDQ1NTUwMjM3MzcwNTM3NDRiNDAzODUyNzc2ZDM4MmE3YTU4Nzc0YTQ4MjEyNTQ1NDE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3MzkyNTMzNzQ3MDUzNTE3MzMxMzQ0ZTMxNmY3OTMzNzg2Zjc5Mzc3NzMzNTM3ODc2NzA0ZjczNDI1NTRmNGQ3NjU1NTQ0NjQ0NDAzOTc3Mjg1NTRmNzQ3ODcxNTQ0ZTQyNmY3OTM3NGMzOTI1NTIyMzU4NGY0ZTI1MjEzODRhMjQ0MDM0NDk3MzZmMjU3ODI4NDAzNDc4MmI1ODRmNGU0NTQwMzg1MjRjNzA0ZjRlNGI0MDM4NWE3ODZlN2EzMzQ1NzEzNDRlMjQ2ZjI1Mzc3NzU1NTM0MDQyNmY3YTVhMjM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjE3YTc4MjM0MDM5NTk3MzMxMzQ0ZDQ5NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjQwNzk0YTQyNDAyNTc0MjM2ZjRiNGQyYjU1NTI1YTQyNmU3OTcwNDU0MDM2NDA0NTZkMzg3MDQxNzA0ZjczNDI0ZjczNDE3MzU1NGY0ZDczNDA1MzM3Nzk1NTUzNzA3ODcwNGY3NDRjNDAzODRhNzk1ODRmNGU0NDQwMzk3NzQ1NTU1MzMzNzg0MDc5NTIyNDZlNTQzMjJiMzkyMzI0NTYzNjI0NWE1NjM1Nzc2ZjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZmMjUzNzQ1NDA3NTJhNzI2ZTUzMmI3NjZkNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4MmEyMzZmN2E3NzczMzEzNDRlNGM0MDM4NGE3OTU4NzgyYjc3MjEzOTMzNzQ1ODc5NzA3ODcwNGY3NDQ0NDAzOTc3NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzM3NDc3MDU0NTYyYTU1NTM3ODRjNTU1MTJhNDg2ZTc5MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzM0MDUzMzc3OTIxMzkzNzQ1NzA0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTc4NmU3YTMzNGI3MTM3NDU0OTM5MzQ0ZDVmMzEzNDRlMjM2ZDM4MjQ3ODU4NzkyNDQ4NmU3OTJiMjM2ZTI1MmE0MjIxNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjIxN2E3ODIzNDAzOTU5NzM1ODM1MjM3MzZmMjUzNzQ1NDA3NTJhNzI0MDUzNTIyMzIxMzQyYTQ5NmU1ZTRkNDE2ZDI1MzcyYTU3Mzc0NTRiMzkzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTMzMzc4NDA3OTUyMjQ2ZTU0MzI1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjQwNTM1MjIzMjEzNDJhNDY2ZTVlNDA3ODM5NWUzMzQ4MzkyNTM3NDc0MDRmNzQ0NDQwMzk3NzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlNzg2ZTdhMzM0YjcxMzc0NTRhMzkzMjQxNTc1NTRmNGQ3MzU1NTMzMzc4NDA3NTRlNGM0MDM5MzI0MTZmMjUzNzQ1NDA3NTQ5NzM2ZDI1MzcyYTU4NGY0ZTI1MjEzODRhMjQ0MDM0NDk3MzcwNTQzMzQ1MzEzNjJhNDg2ZTc5MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTQyNzE3OTM2NzMzMTM0NGU0YzQwMzg0YTc5NTg3YTVhNDI3MTc5Mzc0ODQwNzU3NDI1MjEzODRhMjQ0MDM0Nzc3MzZkMzgyMTczNmYyNTM3NDU0MDc1MmE0YzZkMzk0Mjc4NmUyNTIxNzM0MDM4NGE0YzQwMzQ0ZDQ5NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAyNTc4MjM2ZDRmNGU0YzQwMzg0YTc5NTg3ODJiNDU2ZTI1NWE0NDMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDg2ZTUzMzI3MzMxMzQ0ZTRjNDAzODRhNzk1ODc4MmI3NzIxMzkzMzc0NTg3YTRlNDg2ZjRmNzQ0NDQwMzk3NzQ1NTU1MTJhNDg2ZTc5MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmI0NTQwNGY0ZTQyNmY0YjRlNDc2ZTVlMzI3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5MjU1NjJhNzA1MzM3NGM1NTRmMjMyYjU1NTMyYjQ1NDA1MjQ1NGIzOTMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3NzIxMzkzMzc0MzgyNTQ2Nzg3MTM3MjM3MzMxMzQ0ZDQxNzA1Mzc4NDY0MDM0MmE0NjZlMjUyYTQ4NzA1MzJiNDc2ZDM4NTk0MTU3MzQ0ZDQ0NTU0Zjc0NGM0MDM4NGE3OTU4N2EzMzIzNmU0ZjRlNDI0MDc1NGUyMzcwNTM0OTczNmQzOTU5NzMzNTc5MmI0NzQwMzQ0ZTc4NmU1NDVhNzg1NTU0MzMyMzZlNGY3NzQ1NTU1NDQwNzQ2ZTU0Mzc3ODU4NGY0ZTRjNmQzOTQyNzg1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3NTcxMzkzMzc4NmY0YjRkNDQzMTM0NGU0YzZkMzk0Mjc4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NzA0MTZkMzg0YTc4NTU1NDVhNzg2ZTUzMjE0NzM5MjUzMzc0NzA1MzUxNzMyMTM4MmE3NzU1NGY3NDQ1NDAzODI2NDE2ZjI1Mzc0NTQwNzUyYTcyNDA1MzUyMjMyMTM0Nzc3MzMxNzU0ZTRjNDAzODRhNzk1ODc5MjQ3NDcxNTIyYjc4NmU3YTMzNGI2ZDM4Mzc0YzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0ODZmNzU0ZTRjNDAzODRhNzk1ODc5MjQ3NDcxNTIyYjc1NzEzOTMzNzg2ZjRiNGU0MjZmNGI0ZTQ3NmU1ZTMyNzMzNTc5MmI0NzQwMzQ0ZTc0NmU3OTMyNzM2ZjI1Mzc0NTQwNzUyYTcyMjE3YTc4MjM0MDM5NTk3MzMxNzU0ZTRjNDAzODRhNzk1ODc5MjQ3NDcxNTIyYjc1NzEzOTMzNzg2ZjRiNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNzU3MTM5MzM3ODZmNGI0ZDQ2MzEzNDRlNGM0MDM4NGE3OTU4NzgyYjc3MjEzOTMzNzQ1ODdhNGU0ODZmNTM3ODIzNDAzODIzNDE2ZTUzNTI0YzcwNTAyNDUzMjEzODRhNGM0MDM0Nzg2ZTU5MzcyNDZlNTk3ODIzNTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM0MDI1MzcyMzM5MjUyYjRiMzkyNTRhNDgyMTM4MzI0MTZmMjUzNzQ1NDA3NTQ5NzM2ZDI1MzcyYTU4NGY0ZTQ1NmUyNTUyNzc1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NTU1NzU1NjM0NDAzOTMzMjQ2Zjc5MjY3MzcwNTM3NDc4NTU1MzVhNzQyMTI1NzQ3ODQwNGY0ZTI1MjEzODRhMjQ0MDM0NDk3MzZlNWU1NTczMjEyNTUyNDU2ZTRmNGU0NTZlMjU1Mjc3NTc0Zjc3NzM2ZTI1MmE3NjQwMzQ0ZTc5NmU1ZTU1NzMyMTM4NGE0NTU1NTM1YTQ4NmU3OTVhMjQ2ZjdhNTY3ODZlN2EzMjczMjEyNTUyNDU2ZTUzMzc0YjZmNGI0ZTc0NmU3OTMyNzMyMTI1NTI3NjZkNTMzNjczMjEzODJhMmE1NTUzMmE0ODZlNzUyNDMwNmUyNTJhNzg1NTU0NTY3ODZmNWUzNzQ1NzA0ZjI2NzU1NTc1NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyNTIxMzg0YTI0NDAzNDRkMmI1NTU0NWE3ODZlNTMyMTQ3NDAyNTM3MjM1NzUzNDY3ODcxMzQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlMjUyMTM4NGEyNDQwMzQ0ZTQyNmY0YjRlNzIzNTM2NzgzNTM2MjM3ODMwMzM0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNzk1MjQ1NzAzODM2NzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiNzk2ZTUzNzg3YTZkNTQzMzRjNTg3OTMzNDg1NzUzNDY3ODcxMzQ0OTczNmU1MzUyNDYyMTc5MzM3NDMwNzU0ZTRjNDAzODRhNzk1ODc4MmI0NTZlMjU1Mjc3NTc1MzQ2Nzg3MTM0NDk3MzZlNTMyYjc0NDA0Zjc3NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1NDQwNzQ2ZTU0Mzc3ODRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTIyYjQ1NmUyNTUyNzc1NzU0NWE3ODZlNTMyMTQ1NTU1MzQ2Nzg3MTM0NDk3MzZlNTMyYjc0NDA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDc5NTI0NTcwMzgzNjczMzEzNDRlNDU2ZTI1NTI3NzU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlMjUyMTM4NGEyNDQwMzQ0ZTQyNmY0YjRlNDc2ZTVlMzI3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNGM0MDM5MzI0MTZkMjUzNzJhNTg0ZjRlMjUyMTM4NGEyNDQwMzQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzcwNzk1MjQ1NzAzODM2NTc0ZjdhNWEyMzIxMzkzMzI0NmYyNDJiNzYyMTM4NWE0MTQwMzQ0ZDJiNTU1MjMzMzYzNTUxNWE3NDIxMjU3NDc4NTc1MjVhMzYzMjM3MzMzNzM2MjQyYjUwMzIzNjVhNTUzMzM3MmIzNjM3NTE0OTQyNGY3MzQyNzc0MDM4MjE3MzIxMjU1Mjc2NmQ1MzM3NzczOTI1NWE0MTQwMzg1YTQ0NTc1MzVhNDE0MDM4NWE0NDM5NWUzMzJhNmY1MzM2NDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODRmNGU0OTZmNzkyYjc1NDAzNDc3Mjg0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU2NGU2ZTdhNWE1ZTQwMzk1NTczMjEzODI2NzM2ZTI1MjY0NjQwNTMzNzQ2MjEzODJhNzc1NTUzNWE0MTQwMzg1YTQ0NTU1MzQwNGI2ZTI1MjM3MzcwNTM3NDc4NTU1MzVhNzQyMTI1NzQ3ODU4NGY0ZTRjNmQ1MzUyNGI2ZDM4MmE3YTU1NTMyYjQ3NDAzNDRlMjQ2ZjU0NWEyMzZmNzkzNzc0NmUzNDRlNzYyMTM4NGE0NTU1NTM1Njc4NzA1NDcwNzg0MDM4MjY3MzIxMjUyYjQ3MjE1ZTM3NGI2Zjc5Mzc0NzcwNGY0ZTc0NmYyNTQ2Nzg2ZjdhNTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzM2ZjVlMzM3NDcwNTQzNzRjMzkyNTVhNzQyMTI1NzQ3ODU4Nzk3MDc4NzA1MjJiNDg2Zjc4MmI0NTZlMjU1Mjc3NTc0Zjc0NzY2ZDUzMzc3NjZkMjQyYjIzNzEzOTRlNzg1ODRmNGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0Nzc0NTU1NTM0YTc0NmUzODU2NzcyMTM1NDE3MzZmNTQ1NjQ4MjE3OTM2NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI1NzMyNDE1NzIxMjU0YTc0NmY1ZTU5NzMzNzUzMmI0NDQwMzgyYTRmNzAzODVhNDQ0MDM5MzIyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1NTIxMzgyYTc3NmY0YjRlNDg3MDM5MzI3MzIxNTQ1Njc0NzA1MzM3NzM1NTU0MzM0ODZkMjUzNzQ3NmY0YjRlNDk0MDM5NTU3MzZmMjUzNzc2NmUyNTJhNzc1ODRmNGU3NDZlNTM0YTQ4NzAyNTc4NDc0MDRiNGU3NTcwMzk1NjRjNzA1NDU5NzM2ZTI1MjE3MzcwMzk0ZDczNzA1MzVmNzMyMTUzNWE3NDZmNTM1Mjc2NmQzOTMzMmEyMTRmMjY3NTU1NzU1NTU3NGY3NTRkNzM1NTRmNGU3NzQwMzgyMTczMzkyNDJiNDI2ZTc5NzgyMzM5MjQ1ZjQxNmYyNTM3NDU0MDc1NDk3MzZmNzk1MjIzNDAzNDQ5NzMyMTI1NTI0OTIxMzg1YTQyNzA1NDc3NDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3NmY3OTUyMjM0MDM0NGQyYjU1NTQ1Njc0NzA1MzM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4Nzk1YTc0NmY1MzUyNzY2ZDM5MzMyYTU1NTAyMzczMjEyNTUyNDkyMTM4NWE0MjcwNTQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmIyMzZlMjU0Njc4NmU3YTU5NzMzMTM0NGU3NjIxMzk0ZTc0MjEyNTc4MjM3MTMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTM3NDk0MDUzNTIyMzQwMzgzMjczMzEzNDRlMjM2ZDM4MjQ3ODU4NzkyNDQ4NmU3OTJiMjM2ZTI1MmE0MjIxNGI3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjZlNTMyYjc2NmQ0YjRkMmI1NTU0MzM0MTZmNzkzNzc0NDA1Mzc4NDc0MDRiMmE1OTZlMjU1YTQ0NTc0Zjc3NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzM2Zjc5Mzc0YzQwMzk1NjI1NDAzNDc0NGM0MDM4NGE3OTU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc1NTU3NTU2MzYyMTM4NDY3ODU1NTM1MTczNzA1MzJiNDQ0MDM4MjY3MzIxMzgyYTc3NTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTQxNmU1ZTZmNzM2ZTM4NTI0NzcxMzQ0ZTRjNDAzODVhNDg2ZTc5MzM0YzU1NTQzMzQxNDAzNDRlNzYyMTM4NGE0NTQwMzk1NTczNmQ1MzUyNGM1NTU0MzM0ODU1NTQ3MDc0NmQzOTMyNzMyMTc5Mzc3OTZlNWU1Njc4NTU1NDM3NGM2ZDM4MmE3YTU1NTM3ODIzNTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NzA0MjcwNTM3MzczNmYyNTM3NDU0MDc1MmE3MjZlNTMyYjc2NmQ0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNzkyYjVlNTU1MDIzNzM3MDUzNzg0NjQwMzQyYTQ2NmUyNTJhNDg3MDUzMmI0NzZkMzg1OTQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiMjM2ZTI1NDY3ODZlN2E1OTczMzEzNDRlNDY2ZDM4MjY0MTZmMjUzNzQ1NDA3NTJhNzYyMTM5NGU3NDIxMjU3ODIzNzEzNDQ5NzM2ZjI1Mzc0NTQwNzUyYTcyNzA1MzJiNDQ0MDM4MmE0YzU1NGY0NTczNTc1MzJhNDg3MDRiNGQ0NjU1NTQ1YTc4NmU1MzIxNDczOTVlMzc0OTQwNTM1MjIzNDAzODMyNDI1NTRmNDE3MzZmMjUzNzQ1NDA3NTJhNGIyMTM5MzM3ODU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM0MDM4NGE3OTU4NzgyYjI0NmY1MzMzNzQ3MDUzMzc3NzU1NTAyMzczNmU3OTJiNWU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDczOTVlMzM0ODZkMjUzNzQ3NmY0YjRkNDYzMTM0NGQ0YTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZDQ5NTU1Mzc4Nzk1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTMzNDg2ZDI1Mzc0NzZmNGI0ZDNjMzEzNDRkNDk1NTUzMzc0NTZmMjUzNjczNTgzOTVhNzg2ZTUzMjE0NzM5NWUzMzQ4NmQyNTM3NDc2ZjRiNGQ0ODU1NTQ1YTc4NmU1MzIxNDc2Zjc5NTIyMzQwMzI0MTU3MjEyNTRhNzQ2ZjVlNTk3MzM1NzkyYjIzNmQzODQwNDI0MDM5NTUyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTYzMzcwMzgzNzI0NDAzNDRlNzk2ZTVlNTU3MzIxNzkyYjIzNTgzODc4NDc2ZDM5MzM0MjIxMzkzMzc4NDA0ZjRlNDY0MDM5NWE0YzIxMzg3MDc4NmY0YjRlNWU2ZDM5MzM0MTU1NTQ0ZTc4NmY3NTI0NzY2ZDUzNTIyMzU1NTM1MjQ3NDA0ZjRlN2E2ZTUzMmI3NTIxMzg0OTczNmY3OTUyMjM0MDM0NGU0NTZkMzgyNDQyNzA1NDU5NDc0ZjczNDE3MzU1NGY0ZDczMzIyNTUyNDU2ZTUzMzc0YjZmNGI0ZTQ3NDAzOTQwNzg2Zjc1NGU1ZTIxMzg3ODIzNTU1MzJiNDc1NTUyMzM3ODZlNTMzNzdhNmY3OTUyNDY1ODc1NGU1MjIxMzg1YTQxNTU1MzVhNDEyMTM5MzI3MzZkNTM1MjRjNTU1MzUyMjM1NTUzMjQ0ODZmNWUzMjczNmUyNTJhNzg1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NzM2ZDM4MjY1NzU1NGY0ZDczNTU1MzQwNDU2ZDM4NzA0MTcwNGY0ZTc0NmU3OTMyNzM2ZDM5NTk3MzZmNWU0ZTc0MjEyNTM3Nzc1NTUzNGU3NjZkNTM1MjIzMzkyNTc4NDc3MDUzMzc0YjcwNzk1MjQ1MjE0ZjRlNzQ2ZjUzNTI0YjcwNGY0ZDQxMjEzNDRlNDg2ZTc5MzY0NjcwNTMyYjQ0NDAzODI2NzMyMTdhMzc3NjZkMjUzNzIzNTczNDI2NzMzNzUzMzcyNjcwNTQ1OTU3NTU0ZjRkNzM1NTU0MzM0MTIxMzkzMjczNmYzOTM3Nzg3MDM4MzY3MzcwMzk0ZDczNDA3OTJiNGI1NTUzNTE3MzIxMjU3NDc0NzA0ZjRlNDI2ZTc1NGUyMzZkNTMzNjczNmUzODM3NzQ2ZTdhMzM0MjZlMzgzNjczNDAyNTVmNzM2ZTVlMzcyMzU1NTM1MjRjNTU1MzUxNzM2ZjI1Nzg0NzQwMjU0YTc4NTU1MzMzNDI0MDI1Mzc0YzcwNGYyNjU3NTU0ZjRkNzM1NTUxNTE3MzVhNTA1NTJhNTU1NDRlMjQ3MDU0NTk3MzcwNTM3NDc4NTU1MzMzNDI0MDI1Mzc0YzcwNGY0ZTc1MjEzODVhNDQ1NTUzNTI0NzQwNGY0ZTQ5MjEzOTM3NGM0MDM5NTk3MzcwNTM3NDc0NzA0ZjRlNzY2ZDUzNTIyMzU1NTM0MDQ4NmY3NTRlNzM2Zjc5MzcyMzZmN2E3ODcyMjEzODQwMjM0MDM5NTY3MzU4NzM0MTczNTU0ZjRkNzM1NTc1NTU3NTRmNzM0MTczNTU0ZjRkNzM0MDUzMzc3OTU1NTIyYjcyNmQzODJhNDI3MDUyMmI3MjU3NTQ1YTc4NmU1MzIxNDU1NTU0NzA0ODZmNzk0Njc4NmY3YTU5NDU1NTUzNzA0NTZlMjU1Njc0NmU1MjJiNGIyMTM5MzM3ODU4NGY0ZTc2NmQ1MzUyMjMzOTI1Nzg0NzcwNTMzNzRiNzA3OTUyNDU1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3OTVhNDEyMTM5MzM3MjZkMzgyYTIzNDAzOTU2MjUyMTM4NDk3MzMxMzQ0ZTc2NmQ1MzUyMjMzOTI1Nzg0NzcwNTMzNzRiNzA3OTUyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc0MDRmNGQyYjU1NTQzMzQxNmY3OTM3NzQ0MDUzNzg0NzQwNGIyYTUwNmUyNTJhNzc2ZDM5MzM0MjZlMjUyNjQxNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5NWU0ZTc4NmU3OTMzNDI2ZTc5NmY3MzMxMzQ0ZTI5NzIzNDRkNzM1NTRiNGUyOTIxMjU3NDc0NzA1MjJiNDI0MDUwNDE3MzQwNTMzNzRhNzAzODM2NzM2ZTI1MjE3MzZmNTM0YTc0NmQzODI2NzM3MDUzMzcyNjcwNTQ1YTJiNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjIxMzg1YTIzNmQzOTQwNzg1NTUwMjM3MzZmMjUzNzIzNTc0Zjc3NzM1NTRmNTk3MzMyMjU3NDc0NzA1NDU5NzM3MDI1NTI0MjcwNTM3ODQ3NDA0YjRlNDI2ZTc1NGU3MjZmNzkzNzc0NDA1NDc3NzM2ZTVlNTU3MzIxNzkzNzQyNmU3OTZmNzM2ZjI1Mzc0NzcwNGY0ZTIzNmU0OTQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5NWU1Njc4MjEzODMzMmE1NTUwMjM3MzM4MjQyMzczNTU0ZjU5NzMzODRiNzQ0YzQwMzgyYTc3MzkyNTUyMjM1ODRmNGU0YzQwMzk1MTQ1NTU1MzVhNDEyMTM5MzM3MjZkMzgzMjQyMzkzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5MjUyYTc4NzE1NDMzNzI2ZjI1Mzc0NzQwNGY0ZDJiNTU1NDQ2MmI1NTRmNGQ3NjU1NTQ0Njc2NmQ1MzUyMjMzOTI1Nzg3NzMwNzU0ZTc4MjEzOTU2NDU2ZDM4Mzc0YzcwNGY0ZTQ2NmUyNTJhNDg3MDUzMmI0NzZkMzg1OTczNzA1Mzc4NDY0MDM0NGU3OTZlNWU1NTczNzA1Mzc0Nzg1NTUzMmE3ODcxNTQzMjczNmYyNTM3NDc0MDU0MjM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNzkyMTM4Nzg0NTcwMzk1Njc4NmY0YjRkMmI1NTU0NDYyYjU1NGY0ZDc2NTU1NDQ2NzY2ZDUzNTIyMzM5MjU3ODc3MzA3NTRlNzY2ZTI1MmE0YzQwMzg1YTI0NzA1Mzc4MjU0MDM0NGU0NzQwMzkzMzVlNmU1ZTU2NDQ1NTUzNDA3NDZkMzg0YTI0NmY3OTM3NGM3MjMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTVhNzg2ZjM0NGQyYjU1NTM3ODIzNDAzOTU2MjM2ZTI1MmI0NTZmNGIyYTc2NmU1ZTM3NDc3MDRmNzM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI0MDI1NGE0ODIxNzk1MjQ1NTU1MDIzNzMzNzUzMmI0NDQwMzgyYTRmNzAzODVhNDQ0MDM5MzI0MTQwMjU0YTQ4MjE3OTUyNDUzOTVlNTY3NDcwNTMzNjQ1NTU1MzcwNDU2ZTI1NTY3NDZlNTIyYjRiMjEzOTMzNzg1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTVhNDU2ZTVlMzM0YzU1NTAyMzczNzA1Mzc0NGI0MDM4NTI3NzZkMzgyYTdhNTg3NzU2NDg3MDM4MmE3NzQwMzgzMzM1NDAzODI0NzQ2ZjUzNzQ0ODZmNzkzNjQxNzAyNTJiNGI2ZDI1Mzc0YjZmNGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI0OTZlMjUyYjQ1NTU1MDIzNzMzNzUzNzQ0YjQwMzg1Mjc3MzY1MzJiNDg2ZTUxMzcyNjQwMzg1YTI0NzA1MzJiNGI1NzUzMjQ3NDcxNTIyYjVlNmU1ZTU2NDQ0MDM5NTY0YzMxMzk3MDQ4NmY3OTQ2Nzg2ZjdhNTk0NTU1NTQzMzQxNmY3OTM3NzQ0MDUyMmI0NzIxMzgyNDc4Mzk1ZTRlNGI0MDM4NDA0MjcxNTAyMzc1NmU3OTJiMjM2ZDM4NDAyYTU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTM2NmQ1NDU2NzgyMTM4MzI0MTcwNTM1MjRiNDAyNTM3MjMzMTM5NWE3ODZlNTMyMTQ3Mzk1ZTU2MjQ2ZTc1NDk3MzZlNzk1MjQ2NDAzNTIzNzU2ZTc5MmIyMzZkMzg0MDQyNDAzOTU1NzU1ODRmNGU3NzIxMzgzNzQ2NmUyNTI2MmIzNzU0NTYyNDQwMzQ3NzQ3NmY1ZTMzNzQ2ZjdhMzI0MTU3MzI0MTU3NTU0ZjRkNzM1NTUzMzM3ODQwNzU0ZTRjNDAzODJhNzc1NzU0NWE3ODZlNTMyMTQ1NTU1MzVhNDEyMTM5MzM3MjZkMzgzMjQ1NTU1NDMzNzg3MTU0MzI0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1NTc1NTU3ODUyMjQ0MDM5Mzc3ODU1NTM1MTczNmY1MzRhNzQ2ZDM4MjY0NjcwNTMzNzI2NzA0ZjRlNDY0MDM5NWE0YzIxMzg3MDc4MzA0YjRlNDI3MDRmNGU0NjIxMzk3NzczMjE3OTM2NzMyMTc5NTIyMzIxMjU3NDc4NDA0ZjRlNWU2ZDM5MzM0MTU1NTMyYjIzNmQ1MzM3NGI2ZjRiNGU3OTZlNWU1NTczNzA1Mzc0Nzg1NTU0NWE3NDZlMzgzNjczMjEyNTc0NzQ3MDRmMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlNmQzOTMzNDE1NTU0NWE3ODZlNTMyMTQ3MzkyNTVhNDg2ZTc5MzIyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5NWU0ZTc4NmU3OTMzNDI2ZTc5NmY0NzZmMjUzNzIzNDA1MzM3NzkyMTM5Mzc0NTcwNGY3NDc2NmQ1MzUyMjMzOTI1Nzg3NzU4NGY0ZTc3NDAzOTUyMjQ0MDM0NzM0MjU3MzQyYTc0NmY1NDRlNzg2ZTc5MzI0MTcwNTMzNzI2NzA0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY0ZTQ3NmU1ZTMyNzM2ZDM4MjY3MzZmMjUzNzQ1NDA3NTJhNzIyMTM4NWEyMzZkMzk0MDc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjIxMzg1YTIzNmQzOTQwNzg1ODc5NTI3NzQwNGY3NDc2NmQ1MzUyMjMzOTI1Nzg3NzU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkNTMzNzc0NmY1NDUxNDc2ZDUzMzc3NDZmNTQ0ZTI0NmYyNTczNDE2ZjI1Mzc0NTQwNzUyYTcyNmY3OTM3NzQ0MDU0Nzc0NTU1NGY3NDRjNDAzODRhNzk1ODc4MmI0NzQwMzk3NDIzMzk1ZTVhNzg2ZTc5MzI0NzZmNTMyYjQ5NTc1MzVhNDEyMTM5MzM3MjZkMzgzMjQ1NTU1MDRkNDI1ODRmNGU0NzQwMzk3NDIzNTc1NDVhNzg2ZTUzMjE0NzM5NWU1YTc4NmYzNDc3NDU1NTUzNWE0MTIxMzkzMzcyNmQzODMyNDI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc0MDRmMmE0NzZlNWUzMzQyNDA3YTc3NDE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDU0MDM4MjY0MTZmMjUzNzQ1NDA3NTJhNzI2ZTc5MzcyNjcwNTIyYjRjNDAzODJhNzc1NzM0NGQzYzU1NTA1MTQ5NTk1MDRkNDkzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTc5MmI1ZTU1NTAyMzczNzA1Mzc4NDY0MDM0MmE0NjZlMjUyYTQ4NzA1MzJiNDc2ZDM4NTk0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI2ZTc5MzcyNjcwNTIyYjRjNDAzODJhNzc1NTUwMjM3MzcxMjU0NTI4NTU1NDIxNzM0MDc5MmI0YjU1NTM0NTQ1NTU1NDIxNzM2ZDM4MjY3MzZmMjUzNzQ1NDA3NTJhNzI2ZTc5MzcyNjcwNTIyYjRjNDAzODJhNzc1ODc5NzgyMzQwMzgyNDRjNTc0Zjc3NzM2ZDM4MjE3MzcwNzU0ZDNjNTU1MzJhNDg3MDVlMjM1NzRmNzU0ZDczNTU0ZjRlNzc0MDM4MjE3MzQwNTMzNzQ5NzA1MzczNDE2ZjI1Mzc0NTQwNzU3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU3NTU1NzUzNTdhMzc0NjIxNzkzNzRiNTU1MzJiNzk1NTU0MzM3ODcxNTQzMzRjNTU1NDcwNzQ2ZDM5MzM0MjZlNzk2ZjczNzA1MzVmNzMyMTc5MzY3MzZmMjUzNzQ3NzA0ZjI2NzU1NTc1NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkMzkzMzQxNTU1NDVhNzg2ZTUzMjE0NzM5MjU1YTQ4NmU3OTMyMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU0YzcwMzgyMzQxNmU1MzM3NDc1NzU0MzM3ODcxNTQzMzRjNTczNDRlNzk2ZTVlNTU3MzcwNTMzNzI2NzA1NDU5NzM2ZDM4MjY3MzZmMjUzNzQ1NDA3NTJhNzI2ZjUzMzc0NzQwNTM3ODQ3NDA0YjJhMjUyMTM4NGEyNDQwMzk1OTQxNTczNDc3NTc0Zjc1NGQ3MzU1NGY0ZTc3NDAzODIxNzMzOTVlNTYyNDZlNzU3NDRjNDAzODRhNzk1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU1ZTZkNTM3ODQ1NDAzNDRlMzY2ZjdhMzc3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNWU2ZDM5MzM0MTU1NTQ1YTc4NmU1MzIxNDczOTI1NWE0ODZlNzkzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTVlNmQ1Mzc4NDU0MDM0NGU0NzZlNWUzMjczNmYyNTM3NDU0MDc1MmE3MjZmNzkzNzc0NDA1NDc3NzM2ZTVlNTU3MzZmMjUzNzQ1NDA3NTJhNzI2Zjc5Mzc3NDQwNTQ3ODZlNTk1MjI0NmU1OTUyMjM3MzMxNzU0ZTIzNmQzODI0Nzg1ODc5MjQ0ODZlNzkyYjIzNmUyNTJhNDIyMTRiNzM0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNDI2ZTM4Mzc0ODcwMzkzMjczMzEzNDRlNGM0MDM4NGE3OTU4NzgyYjRiNDAzODUyNzc3MTM3NDU0OTM5Mzc0NTQ5MzkzNDRkNDY1NTU0MzM0MjZlMzgzNjQ3NmUzODJiNDc2ZTVlMzM0ODZlNzk3ODc2NTc0Zjc3NzM2ZDM4MjE3MzZmMjUzNzQ1NDA3NTJhNzI2Zjc5Mzc3NDQwNTQ3NzczNDAzODRhNGM0MDM0NGUzMDZlMjUyYTc4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NTQwNzUyYTcyMjEyNTJiNDc0MDRmMmE1ZTIxMzg3ODIzNTc1NDMzNDI2ZTM4Mzc0ODcwMzkzMjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTcyNTg0ZjRlNzI1ODRmNGU3NjZkNTM1MjIzMzkyNTc4Nzc1NTUwMjM3MzZkNTMzNzc0NmY1NDUxNDc2ZDUzMzc3NDZmNTQ0ZTQ4NmY0Zjc0NGM0MDM4NGE3OTU4NzgyYjRiNDAzODUyNzc3MTM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0MzM3ODcxNTQzMzRjNTU1MDIzNzM2ZjI1Mzc0NTQwNzUyYTcyNzA1MzUyNDQ0MDM3MmI3NzZkMzg3MDc4NmY1ZTMyNDEyMTI1NzQ3NDcwNTIyYjQyNDA0Zjc3NTc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDc0NmQzOTMyNzMzMTM0NGU0YzQwMzg0YTc5NTg3ODJiN2E2ZTUzMmI3NTIxMzg0OTQ3NmY3OTM3NGM0MDM5NTYyNTQwMzQ3MzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTQ3MDc0NmQzOTMyNzMzMTc1NGQ0OTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNTM3ODQ2NDAzNDJhNGM2ZTUzMzc3ODZmNGY3NDVlMjEzODc4MjM1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI0YzZlNTMyYjIzNmY0YjJhNzQyMTVlNTIyNDZkMzk1Njc4NTc0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzI2ZjUzMmI0ODZlNGYyYTRjNzAzODU2NDY2ZDM5MzI0MTZmMjUzNzQ1NDA3NTJhNzI0MDUzMzc0NTZkMzk0MDc4NmY3NTQ5NzMyMTI1NzQ3NDcwNTIyYjQyNDA0ZjQ5NzM3MDUzMzcyNjcwNTQ1OTQyNGY3MzQxNzM1NTRmNGQ3MzQwNTMzNzc5NTU1MjJiMjMyMTM4NDY3ODM5MjUzMzQyNDAyNTM3NGM3MDRmNzQ0YzQwMzg0YTc5NTg0ZjRlNzY2ZDUzNTIyMzM5MjU3ODc3NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzU1NTc1NTYzMjZlNWU0ZDczMjEzOTU5NzM2ZTM4NTI0NzcxMzQ0ZTRhNzAzODM3MjQ0MDM4MzI3MzcwNTMzNzI2NzA1NDU5NzM0MDc5MmI0YjU1NTM1MTczMjEyNTc0NzQ3MDRmNGU3NDZmNGI0ZTc5NmQzOTMyNzM2ZDM4MjY3MzZlMjUyYTc4NTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjUzMzc0NzQwNTM3ODQ3NDA0YjRkMmI1NTU0NWE3ODZlNTMyMTQ3Mzk1ZTRlNzg2ZTc5MzM0MjZlNzk3MDZlMjEyNTc0NzQ3MDUyMmI0MjQwNTIyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNDAzOTc0MjM2ZjRiNGQyYjU1NTI0NjQ5NDAzODJhNzc2ZDM4MmE3YTU4N2E0ZTQ4NmY1MzRhNzg0MDdhMzI0MTU3MzcyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ1NDAzODJhN2E3MDUzNzM3MzMxMzQ0ZTQ1NDAzODI2NDE3MDUzMzcyNjcwNTQ1YTZlNTk1MjIzNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDI1NzQ0MjZlNTMzNjczNmY1MzM3NDc0MDUzNzg0NzQwNGI0ZTc0NmU3OTMyNzM2ZTUzMzc0NzQwNWUzMzQxNTU0ZjQ1NzM1OTM0NGQ0NDU1NTM0YTc4NmU3NTc0NDk0MDM4MmE3NzZkMzgyYTdhMzg0YzRlNzA1NzM0NGQ1ZjMxMzQ0ZTMwMzUyNDMzNTYzMzc4Nzg3MjMzNTE3ODU0MzMzNzVhMzYzOTIzMjQ0ZTM4NTIyYjUwMzQ1MTUyMzQzNjRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmU1MzM3NDc0MDVlMzM0MTU1NGY0NTJiNTU1MDUxNzM1NzRiNGU0NTQwMzgyNjQxNmY1MzM3NDc0MDUzNzg0NzQwMjQ0NTQ5MzkzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNTMzNzI2NzA1NDU5NDcyMTM5NGU0OTQwMzgyYTc3NTc1NDRlNzg2ZTc5MzM0MjZlNzk2ZjQ3NmY1MzJiNDk2ZTUzMzc3OTcwNGY3MzQyNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmE0ODcwNGY0ZTQ5NDAzODJhNzc2ZDM4MmE3YTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzc0MDM4NDk3MzZmMjUzNzQ1NDA3NTJhNzI2ZjUzMzc0NzQwNTM3ODQ3NDAyNDQ2NzY2ZDUzNTIyMzM5MjU3ODc3MzkzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTIzNDAzOTc0MjM2ZjQ5NDE1NzU1NGY0ZDczNTU1MzMzNzg0MDc1NGU3MjQwNTMzNzQ1NmQzOTQwNzg2Zjc1NzQ0YzQwMzg0YTc5NTg0ZjRlNzY2ZDUzNTIyMzM5MjU3ODc3NTg0ZjRlMjM0MDM5NzQyMzZmNGI3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM2ZjdhNzg3MjIxMzg0MDIzNDAzOTU1NzMzMTM0NGUzMDZlMjUyYTc4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3NGM3MDM4NGEyMzU1NTAyMzczNTYyNTJiNDQ1NjQ5NDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyMzIxMzk1NjIzNDAzODMyNzMzMTM0NGUyMzZkMzgyNDc4NTg3OTI0NDg2ZTc5MmIyMzZlMjUyYTQyMjE0YjczNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDU0NTYyYTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUyNGU0NTIxMzg3ODQ3NTU1NDMzNzg3MTU0MzIyODU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODZmNGI0ZTc0NmY3OTM2NzM0MDdhMzc0NTZlNGY0ZTQ4NDA3NTRlMjQ2ZTc5MzM3ODZmN2E1YTc2NmU1ZTU2Nzg2ZjRiNGUyMzZkNTM1MjIzNTU1NDcwNDg3MDM4NGE3NzU1NTM1NjRiNDAzODUyNDQ1NTUxMjQ3NDZmNzk0Njc3NmU1ZTcwNDc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1NjQ4NzA0ZjJhNGM0MDM4MmE3NzM5MjUyNDc4NmY1ZTVhNzQ0MDI1MzY0MTIxMjU3NDc0NzA1MjJiNDI0MDRmNDk3MzU1Nzg0YTQ3NTU3NTJhNDM2ZTI1Nzg0NzU3NTQzMzc4NzE1NDMzNGM1NzM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTM3NDU0MDc1MmE3MjQwNzk1MjQyNmU1NDM3NGI0MDM5NTk0NzZmNTMyYjQ5NTc1MzVhNDEyMTM5MzM3MjZkMzgzMjQ1NTU1MTJhNDg2ZTc5MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTU0MzM3ODZlNTMzNzc1NmU1ZTMyNDcyMTM5NGU0MjZkNTMzNzQ1NmY1MzM3NGI1ODc3NTI0OTZkMzczMzc4NmU1MzM3N2E2Zjc5NTI0NjMzMzk3NDc2NDAzOTRlMjM2ZDM4MmI0NzU1NTM1MjRjNTU1MzM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzM2NDc0MDM5NTY0YjZlNWU1NjcyMjEyNTJiNzc0MDM0NGQyYjMxMzQ0ZDIzNTk3Njc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzM0YjcxMzcyYjc0NDA3YTMzNzg2Zjc1NGQyYjU1NGY3NDc4NTg3YTU2Nzg2ZjVlMzc0NTcwNTIyYjQzNmYyNTJiNDc1NTUzMmI0YjU1NTQ0NjJiNTczNDJhN2E0MDM5MzI0MTU2NWU0ZTc0NmY3OTUyNDY0MDM5MzM3ODZmN2E1OTdhNTg0ZjRlMjk3MjM0Nzc0NzQwMjUzNzIzNTc0ZjcwNGI0MDM5MzM0YjcxMzcyYjc0NDA3YTMzNzg2Zjc1NmY0NTU1NTA1MTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhMjQ2ZTU0MzI3MzMxMzQ0ZDdhNmY3OTM3MjM2ZjdhNzc3YTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZmNzk3ODQ3NzA0Zjc0Nzk1NTc3MzM0YjZlNWU0ZTQ5NmQzODJhN2E1NTUzMmE0ODcwNTM3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzU0ZTIzNmU0YjRlMjkyMTI1NzQ3NDcwNTIyYjQyNDA1NDIzMjg1NTU0NDY3ODcyMzQ1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhMjQ2ZTU0MzI3MzMxMzQ0ZDdhNDA1NDU2NDg2ZjU0NGU3ODQwNGY2ZjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzMzMzk3NDc2NDAzOTRlMjM2ZDM4MmI0NzU1NTM1MjRjNTU1MzM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDc0NmQzODRhMjQ2Zjc5Mzc0YzU1NTAyMzczNmYyNTM3NDU0MDc1MmE3MjQwNzk1MjQyNmU1NDM3NGI0MDM5NTk0NzQwMjUzNzIzNTc1MzVhNDEyMTM5MzM3MjZkMzgzMjQ1NTU1MDRkNDI1NTRmNDU3MzU5MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU3OTIxMzg3ODQ1NzAzOTU2Nzg2ZjRiNGQ1ZjU1NTEyYTMxMzc1MTc4NTMzODM3MmI1YTMyMzc3NDcyMzIzNzMzMzYzMzM2MjQzMjM3NTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNDAzODRhNzk1ODc4MmI3OTIxMzg3ODQ1NzAzOTU2Nzg2ZjI0NDY3NjZkNTM1MjIzMzkyNTc4NzczOTM0NGQyYjU1NTM0MDc0NmQzODRhMjQ2Zjc5Mzc0YzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzRiNzEzNzJiNzQ0MDdhMzM3ODZmNzU0ZDJiNTU1NDVhNzg2ZTUzMjE0NzIxMjU3NDc0NzA1MjJiNDI2ZTdhMzM3ODZmN2E0MDc0NmU0ZjRkNDM1NTUwNTU3MzU3NzU0MTczNDA3OTUyNDI2ZTU0Mzc0YjQwMzk1OTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTM3NDU3MDRmNGQyYjU1NGY3MDRiNDAzOTMzNGI3MTM0NmY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNGM0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWE3ODZlNTMyMTQ3MzkyNTQwNzQ2ZDM4NGEyNDZmNzkzNzRjNTg3YTRlNDg2ZjRmNzQ3NjZkNTM1MjIzMzkyNTc4Nzc1ODRmNGUzMDZlMjUyYTc4NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDI2ZTdhMzI0MTQwNzU1NjUxNmY3OTJiNDk2ZjUzNzg0NzQwNGI0ZTQ3NmU1ZTMzNDI0MDc5Nzg3NjIxMzkzMzQyNmUyNTI2NzM3MDUzNWY3MzcxMjU1YTQxMjEzOTMzNzI2ZDM4MzMyYjU1NTM1Mjc5NzA1MzM3NGI1NTU0NDY3OTIxMzg3ODQ1NzAzOTU2Nzg2ZjVlMjM3MzIxMzkzMzIzNDAzODI0NDk3MDU0NTkyODU1NTQ0Njc4NzIzNDU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5NWEyNDZlNTQzMjczMzEzNDRkN2E0MDU0NTY0ODZmNTQ0ZTc4NDA0ZjZmNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzk2ZDM4MmE3NDZlNTM0YTJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzQwMzg0YTc5NTg3ODJiNGM2ZTUzMmIyMzZmNGIyYTRiNDAzODRhNzgyMTM5NWE3ODU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2NDAzOTMzNGI2ZDM4NWE0YzU4NzkyYjc1NmYyNTM3NGI3MDc5MzY0MTU2NWUzMzc4NmU1MzM3N2E2Zjc5NTI0NjM5NWU1YTc4NmU3OTMzNzI0MDU0Mzc0YjIxMzkzMzQyNmUyNTJhNzI2ZjI1Mzc3NjZlMjUyYTc3NmY0YjZmNDU1NTU0MzM0MjZlMzgzNjQ3NmUzODJiNDc2ZTVlMzM0ODZlNzk3ODc2NTc0Zjc3NzM1ODM0NGU0YzcwNTM1MjRiNzA1MzM3Nzc1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMjQ3ODcwNTQ1NjQyMjE1ZTU5NDc2ZDM4MmE3NjU3NGY3MDIzNDAzODRhNzg0MDVlNTY3NDZlMzcyYjRjNDAzODJhNzc2ZjI0MmIyMzZlNWUzMzc0NmU0ZjZmNDU1NTRmNzM0MTU2NWU1Njc4NmY1ZTM3NDU3MDRmNmY0NTU1NTQ1Njc4NmY1ZTM3NDU3MDRmNzc0NTU3MzQ3NzU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAyNTc4MjM2ZDRmNGU0YzQwMzg0YTc5NTg3ODJiNzY2ZTI1MmE3NzMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU0YjQwMzkzMzRiNzEzNzJiNzQ0MDdhMzM3ODZmNzU0ZTQyNmY0YjRlNDc2ZTVlMzI3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhNzg2ZTUzMjE0NzM5NWU0ZTc4NmU3OTMzNDI2ZTc5NmY0NzZmMjUzNzIzNDA1MzM3NzkyMTM5Mzc0NTcwNGY3NDc2NmQ1MzUyMjMzOTI1Nzg3NzU4NGY0ZTc3NDAzOTUyMjQ0MDM0NzM0MjU3MzQyYTc4NzE1NDMzNzg2ZTc5MzM0NTQwMzg0MDIzNTc1NDU2Nzg3MDc5Mzc0YjZmMjUzNzc3NTc1NDMzNzg3MTU0MzM0YzU3MzQ3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NzQwNTIyYjc0NzA0ZjRkMmI1NTU0MzM0MjZlMzgzNjQ3NmUzODJiNDc2ZTVlMzM0ODZlNzk3ODc2NTc0Zjc3NzM1NzRiNGQ0MTZmMjUzNzQ1NDA3NTJhNzY2ZDUzNTIyMzM5MjU3ODQ3NzA1MzM3NGI3MDc5NTI0NTU1NTM3ODc5NTU1NDU2Nzg3MDU0NTYyYTM5MjU1Mjc5NzA1MzM3NGI1NTUzNzg0YzU1NTEyYTQ4NmU3OTM2NzM0MDM4NGE0YzQwMzQ0ZTRiNDAzOTMzNGI3MTM3MmI3NDQwN2EzMzc4NmY3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY0ZTQyNmU3NTRlNGM0MDM4NGE3OTU4NzgyYjQ5NDAzODJhNzc2ZDM4MmE3YTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkNTMzNzc0NmY1NDUxNDc2ZDUzMzc3NDZmNTQ0ZTI0NmYyNTczNDE2ZjI1Mzc0NTQwNzUyYTcyNmY3OTM3NzQ0MDU0Nzc0NTU1NGY3NDRjNDAzODJhNzczOTI1NTIyMzU4NGY0ZTQ3NDAzOTc0MjM1NzU0NWE3ODZlNTMyMTQ3Mzk1ZTVhNzg2ZjM0Nzc0NTU1NTM1YTQxMjEzOTMzNzI2ZDM4MzI0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzIyMTI1MmI0NzQwNGYyYTQ3NmU1ZTMzNDI0MDdhNzc0MTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmMjUzNzQ1NDA3NTJhNzIyMTM4NWEyMzZkMzk0MDc4NTg3OTMzNDI2ZjI1NWE3NDZmNzkzMjQxMjEyNTc0NzQ3MDUyMmI0MjQwNGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTc4NmU1MzIxNDczOTI1MmE3ODcxNTQzMzcyNmYyNTM3NDc0MDUyNDY3NjZkNTM1MjIzMzkyNTc4NzczOTM0NGQyYjU1NTQ1YTc4NmU3OTMzNzIyMTM5MzI1NzRmNzkyYTQ4NzA1Mzc4Nzk2ZDM4Mzc0YjU1NTAyMzczMzU3OTJiMjM2ZDM4NDA0MjQwMzk1NTQxMzU3NzJiMzYzNDM2NDA0MDM5MjQ3MDMxMzY3NzQ2NTIzNjc4NTk0NTU1NTEyYTMxMzc1MTc4NTMzODM3MmI1NDM1NTEyYjRmMzIzNjRhNzIzNjc3NTIzNjMzMzQ0OTczMzU3NzJiMzYzNDM2NDA0MDM5MjM1YTU1MzIzNzMzNzIzNDM2MmEzNjMzMzc1NjM4MzIzNjQ5NDI0ZjczNDI3NzQwMzgyMTczNmQzODJhNzI2Zjc5NTI1ZTM5NWUzMzc4NzE1NDMyNDE0MDUzNTIyMzIxMzQ0OTczNmY1MzJiNGM1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc4MzM0YjcwMzgzNjczNmQzODIxNzMyMTU0NGU0ODZmMjU0ZDczNDA3OTUyNDU2ZTU0NTk3MzZkMzgyYTRjNmQzODMzNzg1NTUzNTE3MzIxMjUyYjQ2NmUzODM3NDc3MDRmNDk3MzMxNTQ1YTc2NmY3OTc4NDk3MDUwMjY3MzZlNWU1NTczMzE1NDVhMjM3MTM4NGE3ODMxNzU0ZTIzNmQ1MzUyMjM1NTUzNzQ3NDZmMjUyNjdhNzA0ZjRlNzY2ZTUzMmI0YzQwMzgzMjczMjE3YTc3NzM3MDUzNzQ3ODZlNzUyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM1Njc4NDA3OTJiNGI0MDM0NGQyYjU1NTMzMzc0NzA1MzUyNmUzMDdhNGU0ODZmMjQyMzQ3NmU1MzJiNWU0MDM5NTU0MTU3MzI0MTczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1MzUyNDc3MTM0NzQ3NTQwMzg0MDQ4NmY3OTM2NDc2Zjc5NDA0MjZlNzkzMjQxNmU1ZTRlNzg2ZTc5Mzc0YjU3MzQ0ZDNjNTU1MzU2Nzg0MDc5MmI0YjQwMzQyYTRiNDA3OTc4NDc0MDRmNzQ3NjZlNTMyYjRjNDAzOTU1NDI1NTUzNDA0ODZmNzU0ZTQ4NmY1MzM3NDc0MDM5NTU0NTU1NTM1YTQ1NmU1ZTVhNzg2Zjc1NGU0MjZlNzU0ZTM0MzIzNzcwNzIzNzUxMzcyMTM3NTIyYjRmMzU1MTJiNTAzNDI0NTk0MjRmNzM0Mjc3NDAzODIxNzM2ZjI1NWE3NDZlNzgyYjQxNDAzODUyNzczOTI1NDA0ODZmNzgyYjQ4NDAyNDJiNzc0MDM5NWE3NjZmNzk3ODQ5NzA1Mzc4NDg2ZTc1NzQ3NjZkNTQzNzQ3NmQ1ZTU5NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNTUzMmI0ODZkNGI0ZTc5NmU1ZTU1NzMzMTUzMjQ3ODcwNTM1MTczNmY1NDU2NDg2ZjUzMzc0YjcwNTQ3NzJiNTU3OTJiN2EzMDc5MzM3ODZmMjU1YTRiNmQzOTRlMjM2ZDM4MmI0NzU1NzYyNjczNzAyNTc0NDI2ZTUzMzY3MzZmNzkzNzc0NDA1Mzc4NDc0MDRiNGU3NDU1NTQ0ZTc0NDAyNTM2NDU1NTU0NWEyMzZlNWU0ZTQ5NmQzODJhN2E1NTUzMmI0NzIxMjUzNjczMzE1Mzc0NzgyMTM4MzIzYzU1NTM3ODRjNTU1MzMzNDg2ZTc5MzY0NzRmNzM0MTczNTU0ZjRkNzMzNjc5MzcyMzcwMzk1NjQ3NmY0YjRkNDE0MDc5MmIyNDZlNzkzMjQ1NTU1MzMzNzQ3MDUzNTE0MjMwNzU0ZTc5NmU1ZTM3NDc0MDRmNGU0MjZmNGI0ZTM2NmY3YTM3Nzg1ODIzNDA3NDZlNTQ1YTc4NTU1NDcwNDE0MDM4MjY3MzcwNTM3NDc4NTU1Mzc0NzgyMTM4MzI3MzZmMjUzNzIzNzA1MzRhNzg2ZjRiNGU0MjcwNGY0OTczNmU1ZTU1NzMzNTc5MmI0NzQwMzQ0ZTVlNmQ1MzM3NDc1NTU0MzM0MTQwMzI0MTczNTU0ZjRkNzM2ZjUzNTI3YTQwMzQ0ZTQyNmY0YjRlNzQ2ZTM4NTY0MjQwNWUzNzQ4NzAzOTU5NzMyMTM4MmE3NzU1NTMyYTc4NDAzODMzNGM1NTUzNTE3MzQwN2EzNzQ1NmU0ZjRlNDkyMTM5NTY0YzQwMzU0NTczNDA1MzUyMjMyMTM0NGU0MjZmNGI0ZTc4NzA3OTM3NGI3MTM0NGU3NTcxMzkzMzc4NTU1MzVhNDg2ZTdhNWEyNDZlMzgzNzc3NTU1NDVhNDg1NTUzNDA3NDZmNzUyNjczMzIzNDRlMjMyMTM4NmY3MzZlNWU1NTU3NTU0ZjRkNzM1NTUzNzQ3ODIxMzgzMjczNDAzODJhNzc1NTUzNzg0NzZmMjU3ODc3NDAzNDRlNzQ1NTUzNWE0ODZlMzgyNDc4NmU3YTMyNDU1NTUwNGE0YzIxNWU1NjQyNmY1NDMyM2M1NTUzMmI0YjU1NTA0YTRjNzA1NDc4NDU0MDM1MjY3MzZkMzk1OTczMjEzODI0NzU2ZDM4NzAyNDZlNWUzNzRjNTg0ZjRlNWU2ZDUzNTIyMzQwMzk0MDc4NmY3NTRlMjM2ZDUzMzY3MzIxMjU3NDI0NmU3OTQ1NzM2ZjI1NzgyODQwMzQyNjU3NTU0ZjRkNzM1NTRmNTU3NTU1NzM0MTczNTU0ZjRkNzM0MDUzNTIyMzIxMzQ0ZDJiNTU1MzU1NzU1NTczNDE3MzU1NGY0ZDczNDA3OTJiNGI1NTUzNWE0MTcwMzgyYTQ0NTU1Mzc4NDc1NTUzNWE0MTcwMzgyYTQ0NmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzY1NTUyNTY3ODU4Mzk1YTc2MjEzODI2NzMyMTM0NGU0NTZkMzkzMzIzNmU1MzM2NzM2ZTI1MjE3MzcwNTM3NDc4NTU1NDRlNGI0MDM5NDA0MjZlNWUzNzRjNTU1MzMzNzQ3MDUzNTE3MzZmMjU1ZjczNzA1MzUyN2E2ZjRiNGU0YzZmNTM0YTQyNzA0ZjRlNzQyMTVlNTY0ODZmNWU1OTczMjEyNTc0MjQ2ZTc5NDY0YzU1NTQ1YTIzNmQzODRhNDU1NTUzMjQ3NDcwNTM1YTQxNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmYyNTVhNzQ2ZTc4MmI3OTZmNzkyYjQ2NTU1MDIzNzM2ZTM4NTIyNjU3NTM0YTc4NmU3NTc0NzcyMTM5MzM3NDU3MzQ0ZDQ2NTU1MDM2NGE1OTc1NDk3MzU5NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc3MjEzOTMzNzQ1NTRmNDUyYjU1NTM1YTQxNzAzODJhNDQ0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTM4NTIyMzIxMjU3MzczMzEzNDRlMzEzMzI0MmI1MTMzMzc1YTUwMzY3Nzc4MzIzNzUxNzgzMTM1NzgyYjM0MzMzNDJhNGM0MDM4NTI0YjIxMjU3MzQxNDA1MzUyMjMyMTM0NDk3MzZmMjU1YTc0NmU3ODJiNzk2Zjc5MmI0NjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzI0NzQ3MDUzNWE0MTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczNTc1MTJhNDg2ZTc5MzY3MzZkMzgyMTczNmQzODJhNzI2Zjc5NTI1ZTM5NWUzMzc4NzE1NDMyNDE0MDUzNTIyMzIxMzQ0OTczNmUzODUyMjMyMTI1NzM0NzZmNWUzMzc0NmY3YTMyNDE1NzM0Nzc3MzQwMzg0YTRjNDAzNDRlMzY2ZjdhMzc3ODU3MzQ0OTczNDA1MzUyMjMyMTMyNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MTQwMzg1Mjc3MzkyNTM3NDc0MDRmNGQyYjU1NTE3NDUyMzIzNjMzNzIzMzM2MmE1MTM5MjQ1NjUyNTg3YTVhNzgyMTM5NTY3NjZkNGY3NDc3MjEzOTMzNzQ1ODRmNGU0YzIxMjU1MjQ3MzkyNTQwNGI2ZTI1MjM0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmQ1MzM3NzQ0MDUyMmI3ODZlNzkzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzMyMzQ0ZTc2NmU1MzJiNGM0MDM4MzI3MzZkNTMzNzc0NDA0ZjRlNWU2ZDM5MzM0MTZlNWUzNzIzNTU1NDMzNDE0MDM0NGUyMzIxMzg2ZjczNmQzOTU5NzM2ZTI1MmE0NTcxMzQ0ZTc2NmUyNTJhNzY2ZTU0Mzc0YzZkMzk0MDc4NTU1Mzc4Nzk1NTUzMmE0ODcwNTM3NDQyNmU3OTZmNzM3MDUzNTI3YTU4Mzg0YTQyNmQyNTM2NzM3MDI1NTI0YzU1NTQ1YTc4NDAzODI2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmQzODJhNzI2Zjc5NTI1ZTM5NWUzMzc4NzE1NDMyNDE0MDUzNTIyMzIxMzQ0OTczNmQ1MzM3NzQ0MDUyMmI3ODZlNzkzMjQ3NmY1ZTMzNzQ2ZjdhMzI0MTU3MzQ3NzczNmU1ZTU1NzMyMTc1NTY0ODQwNGM0Mjc3NDAzOTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTU1NzM2ZDM4MjY3MzQwNTM1MjIzMjEzNzQ1Mjg2ZDUzMzc3NDQwNTIyYjc4NmU3OTMyNDc2ZjVlMzM3NDZmN2EzMjQxNTczNzIzNDc2ZTUzMmI1ZTQwMzk1NTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTMwNmUyNTJhNzg1ODRmNGU3NzIxMzkzMzc0NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlNTMyMTM4NGE0YzQwMzQ0OTczNDA1MzUyMjMyMTMyNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTQ1NDAzODI2NDE0MDUzNTIyMzIxMzQ3NzczMzE3NTRlMzIzMjM2NzA1MjM5MjMyNDRlMzg1MjJiNTUzMzM2NTI1MTM5MjM1NjQwMzc1MTM3MzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzM1NzkyYjQ3NDAzNDQ5NzM0MDUzNTIyMzIxMzI0MTU3NTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlMzA2ZTI1MmE3ODU4NGY0ZTc3MjEzOTMzNzQ0ZjczNDI3NzQwMzgyMTczNDA1NDU2NzQ2ZDM4MjY0MTZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY0NTU1NTM1YTQxNzAzODJhNDQ2ZjRiNDk3MzZlNTM3ODQ2NmQzOTMyNDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNjc5Mzc3NDQwNGY0ZTc0NmU3OTMyNzM0MDUzNzg0YzIxMjU1MjRiNDA0ZjRlMjM2ZDUzMzY3MzZmNzkzNzRjNzA0ZjRlNDg0MDc1NGU3NDU1NTQ1YTIzNmY3OTM3NzQ2ZTM4Mzc3NzU1NTM1NjQ4NDA1NDc3NzM2ZjI1NWY3MzZkMzkzMzRjNTU1MzVhNDg2ZTc5MmE3ODIxNWUzMzQyNmUyNTI2NzM0MDI1MmI3ODZmNGI0ZTc1MjEzODVhNDQ1NTU0MzM0ODU1NTQzMzQxNDAzNDRlNDk2ZTI1MmI0NTU4NzM0MTU3NTU0ZjRkNzM1NTUxMmI0NzZlNTQ3NzczNDA1MzJiNDc0MDM0NGU1ZTZkNTMzNzQ3NTU1MTVhNDg2ZTdhMzM3ODZlN2EzMjQ2MzU1MzM3NDc0MDVlMzM0MTU1NTQ1YTQxNmU1ZTcwNGM1NTUzNTIyMzU1NTMyNDQ4NmY1ZTMyNzMyMTUzNGE0MjZlMzg3ODIzMjE0ZjRlNzU3MTM5MzM3ODZmNGI0ZTQ1NDAzODQwMjMzMDRiNGU0ODcwNTM3NDc4NmY3YTcwNDI2ZjI1MzY3MzcwNTM3NDc4NTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU1Mzc4NGM0Zjc1NGQ3MzU1NGY0ZTQ1NDAzODQwMjM1NTU0Mzc0NzZmNzkzNzc0NDA0ZjRlNzQ2ZTc5MzI3MzIxMjU0YTQ4NmYyNTc4NDc0MDRiNGU0MjcwNGY0ZTc3NmY3OTJiNDk2ZjRiNGUyMzZkNTMzNjczMjEyNTJiNDc2ZTc5Mzc3NjcwNTM3ODQ4NmU3NTQ5NzM3MDI1NzQ0MjIxMjU3MzczNmQzOTU5NzMyMTI1NzQ3ODIxMzk0ZTc4NmY3NTRlMjM2ZDUzNTI0NzU1NTMzMzQ4NzAyNTJhNDU2ZTI1NTI3NzZkMzgyYTdhNTU1NDMzNDE0MDM0NGU0OTIxMzg3MDc4NTg3MzQxNzM1NTRmNGQ3MzM2NzkzNzIzNzAzOTU2NDc2ZjRiNGUzNjZmN2EzNzc4NTU1Mzc4Nzk1NTU0MzM0MTQwMzQ0ZTc1NmUyNTMzMmE1NTU0NzA3NDZmNGI0ZTc3NmY3OTUyNDI2ZTc5Mzc3NzU4NzM0MTczNTU0ZjRkNzM1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzQ2MjEzODc4NDc2ZDM4MmE3YTU1NTAyMzczNmQzODJhMjM1NzU0NTY3ODZmNWU0ZTQ4NmU3YTVhNzg1ODc5NzQ3ODIxMzgzMzc4NmY3YTVhNmU1NjIzNWE0ODZlN2EzMzc4NmU3YTMyNDYzNTUzMzc0NzQwNWUzMzQxNTYyNDIzNDI1NTRmMjM3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY0NzZmNzk1MjVlNTg3YTMzNzg2ZTUzNDk0MTU3MzI0MTczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzNTU0Zjc0NTg0MDM5Nzg1MjZmN2E1NjQ4NmY3NTQ5NzMzNzc5NTI0NTcwMzgzNzUyNmY3YTU2NDg2Zjc1NzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTUxNDA3NDZlNTQ1YTc4NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTRiNDAzODI0NzQ2ZDM4MmE0MjZlNzk2ZjczMzE3NTRlNDU2ZDM4MjQ0MjcwNTA0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzMzNzk1MjQ1NmYyNTM2NTc1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlNzI1NTUzNzg0NzU1NTM1YTQxNzAzODJhNDQ2ZjRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTIxMzk1YTRjNGY3NTRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzMzNzU0NTYyNDQwMzI0MTU3NDA1MzM3Nzk1NTUzNzQ3NDZmMjQyYjQ4NDAyNDJiNzc0MDM5NWE3NjZmNzk3ODQ5NzA1Mzc4NDg2ZTc1NzQ0MTcwNTMyNDQ1NTczNTQxNTc1NTRmNGQ3MzU1NGY1NTc1NTU3NzQwMjQ2ZTUzNDk0NjQwNTMyYjc2NzAzODI0Nzg2ZTdhMzI3MzQwNzk1MjQ1NmU1MzU2NzQyMTI1NDU3MzQwNzkyYjRiNTU1NDRlNzQ0MDI1Mzc0YzU1NTQzMzQxNDAzNDRlNDE0MDM4NTI3NzU1NTQ1YTc2MjEzODI2NzMyMTI1NTI0NzU2NWUzMjczNmYyNTM3MjM3MDUzNGE3ODU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZmMjUyYjI0NmY0ZjRkMmI1NTUxNTY3ODIxMzkzNzIzNmQzODQwMjQ2ZTUyNWE0ODcwMzk0ZDQxNmQ1NDMzNDY2ZTRmNDk3MzU2MjU0YTI2NmUzODQ5N2E1NzMyNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTM1NjQ4NmUyNTQ5NDE2ZjI1MmIyNDZmNGYyYTc5NmQzODJhNzc1NzRmNzA0NjQwMzkzMzc0NTY0YjQ5NzM2ZjU0NTY0ODZmNTMzNzRiNzA1NDc3MmI1NjI1MmI3YTMwNzkzMzc4NmYyNTVhNGI2ZDM5NGUyMzZkMzgyYjQ3NTY0Yjc3NDI0ZjczNDI3NzQwMzgyMTczMjEyNTc0NzgyMTI1NDY3MjZkMzgyYTRjNzA1MzUyN2E2Zjc5NTI0NjM5NWU1YTIzMjEzOTMzMjQ2ZjRiNzQyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1MDZkNTMzNzc2NmQ0YjRlNDI0MDc1NGU3NDZlNzU0ZTU2NmU3YTVhMjMyMTM4NzA0YjIxMzgyMzczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTc4NzE1Mzc4NGM3MDU0NTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGUyNDZmNzk0OTczMzEzNDRlNzk1NTdhNDY1NjM1Nzg1YTM2MzIzNjcwMzQzMjM2MjQ3MjMyNzc1MjM1MzMzNzJiMzczNjc3NGEyYjU4NWU0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzQ4NTU3MzQxNzM1NTRmNGQ3MzcwNTQ1NjJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzNDM4MmE3NjZlNTQzNzc3NDAzNDRlNzQ1NTUyMzc0YzQwMzk1NTQ2MzIzODcwNzg2ZTdhMzI3MzZkNTMzNzc0NDA1MzM3NGI1NTU0MzM0ODU1NTMyNDQyNmUzODc4NzY1NTUzNTE3MzIxN2E1NjQ4NzA1ZTVhNzg2Zjc1NGU0YjQwMzk1MjI0NDAzOTVhMjM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDI1NzgyMzZkNGY0ZTQxNzA1NDMzNDkzOTI1NWE0NTZkMzgzNzQ3NzA0ZjJhN2E0MDM5MzI0MTcwMzk1NjQ1NTg0ZjRlNDE0MDM4NTI3NzQwMzk1NjRjMzEzOTQ1NzUzNzM5NWE3ODZmNzUyNDRlNDAyNTM3NDc3MDRmNTUyODU1NGY1NjVhNmU1ZTQyNDI2ZTUzNGE3NDU4NGMzNjQ3NTk0ZjU2MmI1ODRmNGU0YzcwNTQ1Njc4MjEzODIzMmIzNzU0NTYyNDQwMzQ3NzczMjEzOTU5NzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTg3YTVhMjMyMTM5MzMyNDZmMjQyYjc2NmUyNTMzNzg1NTUwMjMyYjU1NTA1NTQ5NTk1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzNjc5Mzc3NDQwNGY0ZTQ4NmU3OTRhMmE1NTUzNTI0YzU1NTMyNDI0MjEyNTczNzM2ZTI1MjE3MzcwNTM3NDc4NTU1NDRlNzQ0MDI1MzY3MzIxMzk1OTczNmQzOTMyNzM3MDUzNTI0NDQwMzk1OTczNzA1MzVmNzM0MDc5Nzg0NzQwNGY0ZTQ2NDAzOTMzNzQ1NTU0NGU0YjZlNWU0ZTc4NmY3YTMzMmEzMTM0NTY0ODQwNGM0Mjc3NDAzOTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzVhNDE3MDM4MmE0NDZmNGI0ZDJiNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTg3OTc4MjM0MDM5NTY3MjIxMjUyYjQ3NzA1MzM3NDc3MDRmNzQ3NjZkNTQzNzQ3NmQyNDJiNGM2ZDM5NDI3ODMxMzc0ZTRlMzMyMzM3NzIzMjIzNzQzNzM1Nzc0NjcyMzYyMzc4NmQzMzM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDM5NzQ0MjZmNWUzMzRjNTg0ZjRlNzcyMTM5MzM3NDU1NTAyMzczNmYyNTVhNzQ2ZTc4MmI0MTQwMzg1Mjc3MzkyNTQwNDg2Zjc4MmI0ODQwMjQyYjc3NDAzOTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTc0NzY2ZDU0Mzc0NzZkNWU1OTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNzQyMTI1NWE0ODcwMzgyYTIzMzkyNTM3MjY2ZDM5NWEyMzZmNGI0ZTQyNmY0YjRlMzA2ZTI1MmE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzUyNzYyMTI1MmIyNDZlN2EzMzcyNDAzOTc0NDI2ZjVlMzM0YzU1NTAyMzczNmQ1MzUyNGMzOTI1MmI3YTM5MjUzMzc4NmYyNTVhNGI2ZDM5NGUyMzZkMzgyYjQ3NTc1MzMzNzQ3MDUzNTE3MzU3NGI0ZTc1NTU3NTU1NDc2ZDc5MmI0MjZlNzU3NDc2NmQ1NDM3NDc2ZDVlNTk0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTE1YTQ1NmU1ZTVhNDI2ZTc5NmY3MzIxMzQ0ZTQxMjEzODRhNzk1ODM5NTY3ODIxMzgzMjczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczNDA1Mzc4NGMyMTI1NTI0YjQwNTQ1OTczNmQzOTMzNGM1NTUzNWE0ODZlNzkyYTc4MjE1ZTMzNDI2ZTI1MjYyOTU1NTM0Njc4NDAzOTRkNzM2ZDM5MzI3MzZkMzgyMTczNmU1Mzc4MjM3MDUzNGE3ODU1NTM3ODRjNTU1MzRhNzg0MDdhMzI1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc3NmY3OTUyNDI2ZTc1NzQ0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0NDk3MzIxMjU3NDI0NmU3OTQ2NGM1ODRmNGUzMjMyMzY3MDUyMzkyMzI0NGUzODUyMmI1MTM2Nzc1MjU2MzU3ODJiNGYzODM3MzM1MjM2NGI3NzU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MTRhNDg0MDRiNGU0YjQwMzk1YTI0NmU1NDMzNGM1NTUzNDA0ODZmNzU0ZTc3NDAzODU2MjQ0MDI1NzA0MjZlNzk2ZjU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ0ZTRiNmQzODJhMjM1NzUzMjE3NTMyMzg1YTc2NmU1ZTM3NDc3MDRmNGU0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTc4NzE1Mzc4NGM3MDU0NTkyODU1NTQ0Njc0MjEyNTVhNDg3MDM4MmEyMzM5MjUzNzI2NmQzOTVhMjM2ZjVlMjM3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDM5NzQ0MjZmNWUzMzRjNGY3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTEzNzRiNmY3OTJiNGI1NTU0NGU3NDQwMjUzNzRjNTU1MzUyNGI0MDM0NGU0YzZlMzg1MjQ1NmU1MDQ1NzM2Zjc5Mzc3NDQwNGY0ZTIzNmQ1MzM3NDY1NTUzMmIyNDcwNGY0ZTIzNmUyNTVmNzM2ZjI1NWY3MzcwNTM3NDc4NTU1MzVhNDg2ZTc5MmE3ODIxNWUzMzQyNmUyNTI2NzM2ZDM5NTk3MzZmNzkzNzI0NmYyNTM3Nzc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzMzRiMjEzODc4NDc1NzU0NTY3ODZmNWU0ZTQ4NmU3YTVhNzg1ODRmNGU0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0MmE0MjcwNTMzNzRiMzkyNTVhNDg2ZTdhMzM3ODZlN2EzMjQxMjEyNTc0MjQ2ZTc5NDY3MjZmMjU3ODI4NDAzNTI0MzIzMjM2NzA1MjM5MjM1YTU1MzczNjJhNTgzOTI0NWE1NjM4NzczNjQyNTg0ZjRlMzIzMjM2NzA1MjM5MjMyNDRlMzg1MjJiNTEzNjc3NTI1NjM1NzgyYjRmMzgzNzMzNTIzNjRiNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NDc2ZjVlMzM3NDcwNTQzNzRjMzkyNTVhNDg0MDUzMzY3MzMxMzUyMzczNWE1MDRkMjMzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRiNGU1NTIxMzgyYTc3NmU1MzM2NzMyMTI1NTI0YzQwMzk1OTczNzAyNTc0Nzg2Zjc5MzY3MzcwNTM3NDc4NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjczNmQzOTU5NzMyMTc5NTI0NzZlNzkzNzc3NTU1MzJiNGI1NTUzMzM0ODQwMzk1OTczNmU3OTJiMjM1NTUzMzcyNjZkMzk1YTIzNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ5NmY3OTc4NDc3MDRmNzQ3OTU1Nzc1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzMyMTc5NTI0NzZlNzkzNzc3NTU1MzJiNGI1NTUzMzM0ODQwMzk1OTczNmU3OTJiMjM1NTUzMzcyNjZkMzk1YTIzNTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzM3OTUyNDU2ZjI1MzY1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTE0YTQ4NDA0YjRlMjQ2ZTc5MzcyNjZmNTMzNzc2NzA1MzM3Nzc1NTU0NWEyMzIxMzkzMzI0NmY0YjRlNzY2ZTI1MzM3ODZmNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNTQ1NjQyNmU3YTMyNDE0MDc1NTYzNzZlNzkzNzI2NmY1MzM3NzY3MDUzMzc3NzU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGU3NjZlMjUzMzc4NTU1NDQ2NGI0MDM5NWE0OTZlMjUyYTRjNDAzNDJhNGM3MDUzNTIyMzcwMzk1YTcyMjEyNTJiNzc0MDM5MjM3MzQwNzkyYjRiNTU1MTRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlMzA2ZTI1MmE3ODRmNzM0MTczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzNTU1MTc0NDg2ZjVlMzM0ZjIxMzg1YTQ0NmUyNTQwNzkzMzM5NTY0YjZlNWU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTUyNDI2ZjI1MzY3MzU1NGY1OTczMzU3OTJiMjM1NTUzNTI0NzU1NTM1MjQ3NmY1ZTcwNzg2Zjc1NGU3NDIxNzkyYjI0NzA0ZjRlMjM2ZDUzMzY3MzIxMzg1YTc2NmU1ZTM3NDc3MDUwNDU3MzcwNTM3NDc4NTU1MzVhNzQ2ZTUzNGE3ODZmNzU0ZTc3NDAzODVhNDI0MDUzMzc0YzU1NTQ3MDQxNDAzODI2NzM3MDUzNWY3MzIxMzk1YTQ0NTU1MzUyN2EyMTM4Nzg0NzRmNzU0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczNmY3OTM3NGE3MDM4Mzc0YzcwNTQ1OTQ3MzY3OTM3NGE3MDM4Mzc0YzcwNTEzNzI2MjEyNTM3NDk3MDUzNzg0ODZlNzU0ZTc0NmY0YjRlNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzM0NTM1MjQ3NDA1MzRhNzg1NTU0NTY3ODZmMzkzNzc4NmY1ZTMyNzM0MDM5NTY0YjZlNWU1NjRjNTU1MzcwNGIyMTM4NWE3ODQwN2EzNzQ1NmU1NDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDk2Zjc5Nzg0NzcwNGY3NDc5NTU3Nzc0MzYzNzUyNGQ3MzZmNzkzNzRhNzAzODM3NGM3MDRmNGU3OTIxMzg3ODQ1NDAzODMyNzM0MDc5MmI0YjU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiMzA3NTRlMjk0MDM5MjM3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUzMDZlMjUyYTc4NGY3MzQyNzc0MDM4MjE3MzZmNTQ1NjQ4MjE3OTM3NzI2ZDM4MmE0YzcwNTM1MjdhNmY3OTUyNDYzOTVlNWEyMzIxMzkzMzI0NmY0Yjc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3Mjg0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU2NTA2ZDUzMzc3NjZkNGI0ZTc0NmU3NTRlNzQyMTI1NWE0ODcwMzgyYTIzNTU1MzRhNDI3MDc5MzY3MzIxMzgyYTc3NTU1NDVhNDEyMTM5NTY3ODU1NTQzMzQxNDAzNDRlNzQ2ZTdhNWE1ZTQwMzk1NTczNzAyNTc4MjM2ZDRmNGU0ODZlNzUyNDc3NDAzODI0NzQ2ZTc5MzI3MzZlNTMyYjQ4NmQ1ZTM3NDk2ZjRiMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTU0NWEyMzIxMzkzMzI0NmY0YjRkMmI1NTUzNWE0MTQwMzg1YTQ0MzkyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNzJiNGM3MDUzNTIyMzcwMzk1OTQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyNGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTRjNzA1MzUyMjM3MDM5NTk3MzZkMzk1OTczNmU3OTJiMjM1NTUxMmE0ODZlNzkzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDU0Mzc0YzM5MjU1YTc0MjEyNTc0Nzg1ODdhNWE3ODcwNGY3MzQxNTYyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDZmNDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM0NDk3MzZmNWUzMzc0NzA1NDM3NGM1NzMyNDE3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzU1NTQ1YTIzMjEzOTMzMjQ2ZjQ5NDE1NzQwNTMzNzc5NTU1MzcwNzg3MDUyMmI0MjZlN2E1YTIzMjEzODcwNGIyMTM4MjQ3MjZmNWUzMzc0NzA1NDM3NGM1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NTI3NjIxMjUyYjI0NmU3YTMyNzM2ZjVlMzM3NDcwNTQzNzRjNTU1MzQwNDg2Zjc1NGU0ODZlNzUyNDc3NDAzODI0NzQ2ZTc5MzI3MzIxMjUyYjQ2NmUzODUyNDc0MDU0NTk0NTU1NTM1YTc0MjEyNTc0Nzg0MDRmNGU3NTZmNzk3ODc4NDA3OTRhMmE1NTUzNTI0NzQwNGY0ZTc2NmUyNTUyNDU0MDM5NWE3NjQwMzgzMjczNmY1MzM3NGI1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM3MDU0NTYyYTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU3NjIxMzg1YTQxNDAzODMzNzIyMTI1NzQ3ODIxMjU0NTQxNTYyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDZmNDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODRmNGU0OTZmNzkyYjc1NDAzNzJiNDI2ZTdhNWEyMzIxMzg3MDRiMjEzODI0NzI2ZjVlMzM3NDcwNTQzNzRjNTczMjQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxNzQ0ODZmNWUzMzRmMjEzODVhNDQ2ZTI1NDA3OTMzMzk1NjRiNmU1ZTU1NzMyMTM5NTk3MzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ5NmY3OTc4NDc3MDRmNzQ3OTU1Nzg1YTIzMjEzOTMzMjQ2ZjRiNGU3NjZkNTMzNzc2NmQ0YjRlNzk2ZTVlNTU3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmYyNTQ2NDI2ZjU0NGU3ODQwNTA0MTczNzEyNTM3MmI1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzMzNTc5MmI0NzQwMzI0MTU3NTU0YjRlMzE2ZTc5MzY3MzM0MzgyYTRjNzA1MzUyNDU2ZTI1NTI3NzQwMzk1NTczNmYyNTM3NGM2ZjI1Nzg0ODZlNzU0ZTc5NmU1ZTU1NzM0MDM5NDA3ODZmN2E3NzczNTgyNTc4N2E2ZDM4MmE3OTZlNGI0ZTQ1NmUyNTJiNDQ3MDM5NGQyOTU1NTM3ODIzNmY0YjRlNzY2ZTI1MmEyMzQwMzk3NDIzNTU1Mzc4NGM1NTUzMmE0ODcwNGY0ZTIzNmQ1NDU2NzgyMTM4MzI0NjZmMjU1Mjc5NDAzMjQyNDI2ZTdhNWEyMzIxMzg0YTQ4MjEzODMzNzg2Zjc4MmI3NjZlNTM3ODc4NmU3YTMyNzMzMTM0NGU0MjZlN2E1YTIzMjEzODRhNDgyMTM4MzM3ODZmNzUyYTU2NmU3YTVhMjMyMTM4NGE0ODIxMzgzMzc4NmY3NTczNDI0Zjc5Nzg0NzZmNWUzMzc0NmU1MzJiNzQ0MDUzMzc0YjM5MjU0YTQ4MjEyNTQ1NzMzMTM0NGUyMzZkNTQ1Njc4MjEzODMzNDI2ZTc5NmY0NzM1NTMyYjc2NmQ0YjczNDI0ZjczNDI3NzQwMzgyMTczMzkyNTJhNzQ2ZTM4Mzc0YzZmNTM1Mjc2NDAzNzJiNGM2ZDM5NDI3ODU3NTMyYTc0NmUzODM3NGM2ZjUzNTI3NjQwMzQ3NzI4NGY3NTRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzM1OTc2NGQ0OTU1NGY0NTczNmY1ZTM3NDY1NzUzNGE3ODZlNzU3NDI1MjEzODRhMjQ0MDM0Nzc3MzZkMzgyMTczNmQzOTVhNDI2ZTdhNWEyMzIxMzgyYTc2NDAzNDc0MjUyMTM4NGEyNDQwMzQ0OTczNmY1ZTMzNGI1NzM0NGU3ODZlNTQ1YTc4NTU1MDUxMjU1NTUzNDA0ODZmNzU0ZTI1MjEzODRhMjQ0MDM0NGU0MjZlNzU0ZTI1MjEzOTU2NGM1NzUzMmE3NDZlMzgzNzRjNmY1MzUyNzY0MDM0Nzc0NzcwNzk1MjQ1NzAzODM3NGM1NzRmNzc0MjRmNzM0MjQ5NmY3OTJiNzk2ZDM4NGE3ODM5MjU1YTc0MjEyNTc0Nzg1NTUwMjM3MzM3NTIzMzU5MzIyNTUyNzY2ZDUzMzY0MTM2NTI1NjMxMzM3Nzc4NTkzMzM3MmI1MDMyMzY1YTU1MzMzNzJiMzYzNzUxNDk0NTU1NTMyNDc0NzE1MjJiNzU3MTM5MzM3ODZmNGMyNDMyMzY3NzJiNTMzNDM2NGE1MjM5MjM1YTRlMzIyMzc0NTIzOTIzMjQ0ZTM4NTIyYjRmMzgzNzMzNTIzNjRiNDk3MzZmMjU3ODI4NDAzODJiNzkzMTM3MmI0NzIxMzgyNDc4NmY1ZTRlNzQyMTI1Mzc3MjZmMjU3ODI4NDAzNDc3NTc2ZjVlMzM0ODZmNzk3ODc4NmYyNDJiNzYyMTM4NWE0MTQwMzQ0ZDJiNTU1MjMzMzYzNTUxNWE3NDIxMjU3NDc4NTc1MjVhMzYzNTI0NTY1NjMzMzc1YTcyMzIyMzUyNTAzNDUxMzc3MjM3NTIzMzU5NTg0ZjRlNDYyMTM5NzQ3MjIxN2E3ODIzNDAzOTU5MmIzNjUyNTYzMTMzNzc3ODU5MzMzNzJiNTAzMjM2NWE1NTMzMzcyYjVhMzIzNzc0NzIzMjc4NzgzNjMzMzc1OTQ1NTU1NDVhNDI3MTc5Mzc0ODQwNzYyNDQ1MjEzODI0NzU0MDUzNTE3MzcwMzk1NjQ1NmY0YzQxNzM1OTM1NGQ0OTU1NGY0NTczNmY1ZTM3NDY1NzUzNGE3ODZlNzU3NDI0NmY3OTQ5NDI1NTUzNDA0ODZmNzU0ZTI0NmY3OTQ5NzM2ZDM4MjY3MzcwMzk1NjQ1NmY0Yjc3NDI0ZjdhNGU0YjZlMjU0MDQyNmU1MzM3NzI2ZjUzNzg3NjM5MjU1YTc0MjEyNTc0Nzg1NTUwMjM3MzM3NTIzMzU5MzIyNTUyNzY2ZDUzMzY0MTM2NTI1NjMxMzM3Nzc4NTkzMzM3MmI1MDMyMzY1YTU1MzMzNzJiMzYzNzUxNDk0NTU1NTMyNDc0NzE1MjJiNzU3MTM5MzM3ODZmNGMyNDMyMzY3NzJiNTMzNDM2NGE1MjM5MjQ0ZTU2MzIyNDJiNTAzMjM2NWE1NTMzMzcyYjVhMzIzNzc0NzIzMjc4NzgzNjMzMzc1OTQ1NTU1NDVhNDI3MTc5Mzc0ODQwNzYyNDQ1NDAzODI2NDI0ZjczNDI3NzQwMzgyMTczNmU1MzJiNzQ0MDUyMmI0OTZmNzkyYjc5NmQzODRhNzg1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NDA3ODcwNTM1YTQxNTU1NDMzNDE0MDM0NGU0OTZmNzkyYjc5NmQzODRhNzg1NTUzNDA0MjQwMzg0YTc3NmY0YjRkNDg2ZDM4NzA0MjZlNzk0MDQ4NTU1NDVhNDE2ZTVlNzA0YzU4NGY0ZTc3NDAzOTMzNzQyMTI1NzQ3ODQwNGY0ZTc5NmY3OTJiNDY1NTUxNzg0NzZmNWUzMzc0NmU1MzJiNzQ0MDUzMzc0YjU1NTQ1YTQ4NTU1NDMzNDE0MDM5Nzc3MzIxMjU1MjQ3NTU1MzU2Nzg1NTUzNWE3NDIxMjU3NDc4NDA0ZjI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1NDcwNDI3MDUzNzM3MzZkMzgyYTRjNzA1MzUyNDU2ZTI1NTI3NzQwMzk1NjcyNmU1MzJiNzY2ZDRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZmNzkyYjc5NmQzODRhNzg1NTUwMjM3MzZkMzgyYTRjNzA1MzUyNDU2ZTI1NTI3NzQwMzk1NTQ3MzY1NDU2NDg0MDc5Nzg0NTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzUzNzg0NzZmNWUzMzc0NmU1MzJiNzQ0MDUzMzc0YjM5MjU1YTQ1NmQzODM3NDc3MDRmMmE3NjZlMjUyYTIzNDAzOTc0MjM1ODRmNGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzMzNjI1Nzg0NjZmNTM0YTc4MzU3OTUyNDY0MDM5NWE0OTIxMzg1YTc4NTc0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyNDZmMjUzNzRiNmQzODMyMmI2ZjU0NTY0ODQwNzk3ODQ1NDAzNDJhMjQ2ZjI1Mzc0YjZkMzgzMjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNDAyNDZlNTM0YTcyNmU3OTUyNDY0MDM1MjQ0OTZmNzkyYjc5NmQzODRhNzg1ODc5NDAyNDZlNTM0YTcyNmU3OTUyNDY0MDM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTc4NDg0MDVlNTY3NDZmNTM3NDJhMzEzOTRlNGI2ZTI1NDA0MjZlNTMzNjQ3MjE3OTc4NDg0MDVlNTY3NDZmNTM3NDJhNTg0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjZmMjQyYjI1NDAzOTU2NDI0MDc5Nzg3ODQwNTAyNDQ5NmY3OTJiNzk2ZDM4NGE3ODU4Nzk3ODRjMzk1ZTQwNzg2Zjc5Nzg3OTZkMzgzNzc3NTg0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTcwMzk1YTQyNmU3OTM3NGM2ZjI0MmI3NjIxMzkzMzc4NDAyNTJiNGI3MTM3MmI0NzIxMzgyNDc4MzEzOTRlNGI2ZTI1NDA0MjZlNTMzNjQ3MjE3YTM3NGM2ZDM4MmE3ODZmNWU1YTcyMjEyNTUyMjM0MDM4NzA0ODZmN2E3ODcyNmU3OTUyNDY0MDM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1NDU2NDg0MDc5Nzg0NTQwMzcyYjQ5NmQzODVhNzI3MDM5NTY0NTMxMzk0ZTRiNmUyNTQwNDI2ZTUzMzY0NzZmNTQ1NjQ4NDA3OTc4NDU0MDM3MmI0OTZkMzg1YTcyNzAzOTU2NDU1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5NmUyNTRhNDU2ZTVlNzA3ODZmN2E1OTJiNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTc5NmUyNTRhNDU2ZTVlNzA3ODZmN2E1OTQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNDA0ODZlNTM0YTQ4NzAyNTM3Nzg2ZjRjMjQ0OTZmNzkyYjc5NmQzODRhNzg1ODc5NDA0ODZlNTM0YTQ4NzAyNTM3Nzg2ZjRiNDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmUzODM3Nzc2ZDM4NTI3NjZlNWUzNzQ3NzA1MDI0NDk2Zjc5MmI3OTZkMzg0YTc4NTg3OTI0Nzg0MDUzNzg3NDIxMjUyYjI0NmU3YTMyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NzMyNDE1NzQwNTMzNzc5NTU1MzRhNDgyMTM4MzM3MjZmNWUzMzQ4NmY3YTc4NzI3MDM5NTY0NTZmNGI3NDI0NmYyNTM3NGI2ZDM4MzI0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMzNzkzNzIzMjEyNTczNzMyMTVlMzc0YjZmNzkzNzQ3NzA0ZjRlNGM3MDUzMmI0YjcxMzQ0ZTQ2NDAzODMzNDIyMTM0NGUzNzM2Nzc0YTRjNTg3NTRlNTMyMTM4Nzg0NTcwMzk1Njc4NmY0YjRkNDE0MDM0MmE3YTU4NzU0ZTQ3NmU0YjRlNDU2ZTI1NzA0MjZlNzU3NzczMjEzOTU2Nzg1NTUzNWE3NDIxMjU3NDc4NDA0ZjRlNzQ2ZjRiNGU0NzZlNGI0ZTRjNzA1MzJiNGI2ZDM4Mzc0YzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZmNWUzMzQ4NmY3OTc4Nzg2ZjRiNGQyYjU1NTI0NjcwNGY3NTRkNzM1NTRmNGUyMzZmN2E3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzAyNTc4MjM2ZDRmNGU0MjZlN2E1YTIzMjEzODRhNDgyMTM4MzM3ODZmNzgyYjQ1NmUyNTVhNDQzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc5NmU1ZTU1NzM2ZjVlMzM0ODZmN2E3NzczNmQzODI2NzM2ZDM4MmE0YzcwNTM1MjQ1NmUyNTUyNzc0MDM5NTY3MjIxMjU0YTQyNDAzODJhMjM1ODc5NzA3ODcwNTIyYjRjNzA1MzJiNGI2ZDM4Mzc0YzU3NTI0NjI0NmYyNTM3NGI2ZDM4MzM3MDU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlNDI3MDUzMzc0NjU1NTM3ODQ3NTU1NDVhMjM2ZTVlNTYyYTU4Nzk3MDc4NzA1MjJiNDI3MDUzMzc0NjZmNGI3MzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTM3ODIzNDAzODIzNDc2ZDM5NWE3MjcwNzk3ODc3NDAzODVmMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjM2ZTVlNTY0MjQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTM3ODIzNDAzODIzNDc3MDc5Nzg3NzQwMzgyYjcyNzAzOTU2NDU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmYyNTM2Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDVhMjM2ZTVlNTY0MjQwMzk1OTQ3MjEzOTRlNDk0MDM4MmE3NzU3NTM3ODIzNDAzODIzNDc3MDM5NTY0NTU3MzI0MTczNTU0ZjRkNzM0MDM5NzQ3NjQwMzk0ZTIzNTU1MTM3MjYyMTI1Mzc0OTcwNTM3ODQ4NmU3NjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzMmI0YjZkMzgzNzRjNTU1MDIzNzMzODI0MjM1NzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzU0ZTRjNzA1MzJiNGI2ZDM4Mzc0YzRmNzM0Mjc3NDAzODIxNzM2ZTUzMmI3NDQwNTIyYjQ5NmY3OTJiNzk2ZDM4NGE3ODM5NWU0ZTQyMjE0Yjc0MjQ2Zjc5NDk0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMzNTMyYjVlNmU3OTRhNDgyMTM4MzI3MzIxMzQ0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODU1NTQ0ZTQyMjE1ZTMzMjQ2Zjc5MzY0NzU1NTI1Njc4NzA1NDM3NGI2ZTdhNTk3MzM1NzkyYjQ3NDAzNDRlNDI0MDc1NGU0MjcwNGY0ZTc2NmU1ZTM3NDU0MDUzMjY3YTcwNGY0ZTc1NDAzNDRlNzk0MDM5MzM3NjZkNTMzNzc3NTg3NTU1NzU1NTczNDE3MzU1NGY0ZDczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczMzEzNDRlNDE3MDU0MzM0OTM5MjU1YTQ1NmQzODM3NDc3MDRmMmE3YTQwMzkzMjQxNzAzOTU2NDU1NzMyNDE3MzU1NGY0ZDczNmQzODIxNzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NDc2ZjVlMzM3NDcwNTQzNzRjMzkyNTVhNDg0MDUzMzY3MzU1MzUyMzczNTk3NjRkNDkzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlMzA2ZTI1MmE3ODRmNzU0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjQ3MjEyNTJiNDc3MDUzMzc0NzcwNGQ0MTU3NDA1MzM3Nzk1NTUzNzA3ODcwNTIyYjQ5NmY3OTJiNzk2ZDM4NGE3ODM5NWU0ZTQyMjE0Yjc0MjQ2Zjc5NDk0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTM2NTQ1NjQ4NDA3OTc4NDU0MDM0NGU0OTZkMzg1YTIzNzAzOTU2Nzg1NTUzNTYyYTcwNTMzNzRjNTg0ZjRlNzYyMTM4NWE0MTQwMzgzMjczMjE3YTc3NzMzNzM3NTY1OTU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTU0NGU0YjZlMjU0MDQyNmU1MzM3NzI2ZjUzNzg3NjM5MjU1YTc0MjEyNTc0Nzg1ODc5NzA3ODcwNTIyYjQ4NmY3ODJiNDU2ZTI1NTI3NzU3NTQzNzRiNmU0ZjQ5NzM2ZTUzNTI0NjIxNzkzMzc0MzA3NTRlNDU2ZTI1NTI3NzM5NWU0ZTRiNmUyNTQwNDI2ZTUzMzc3MjZmNTM3ODc2NTc1NDM3NGI2ZTRmNzc0MjRmNzM0Mjc3NDAzODIxNzM0MDI1MzcyMzM5MjU3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzcyYjQyNmU3OTQwNDg1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NzA3ODcwNGY0ZTc3NDAzOTMzNzQ2ZDM4NGE3ODQwNGY0ZTU2NmU3YTVhMjMyMTM4NzA0YjIxMzgyMzczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTQyNmU3OTQwNDg2Zjc5MjQ3NDcwNTM3ODQ4NmU3NTI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1NDMzNGI3MTM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZmNzkyYjc5NmQzODRhNzg1NTUwMjM3MzZmNTQ1NjQ4NDA3OTc4NDU0MDM3MmI3NjIxMzg1YTQxNDAzNDJhN2E0MDM5MzM3MjZlNWU1NjcyNmU1MzJiNzQ0MDRmNzQyNDZmMjUzNzRiNmU3OTUyNDY0MDM0MmE0NTZlNWU3MDc4NmY3NTczNDI1ODRmNGU0NTIxMzgyNDc1NDA1MzUxMjg1NTUzNGE0ODIxMzgzMzcyNmY1NDU2NDg0MDc5Nzg0NTQwMzQ3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTQ0MDM5MzI3MzZmNTQ1NjQ4NDA3OTc4NDU0MDM0NGU0OTZkMzg1YTIzNzAzOTU2Nzg1NTUyMzczNDM1NGY0ZDQxNmQ1Mzc4N2E2ZDRmNGU0YTcwMzg1MjQ1NmQzOTMzMmE1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NGU0YjZlMjU0MDQyNmU1MzM3NzI2ZjUzNzg3NjM5NWUzNzRiNmU0ZjRkMmI1NTU0NGU0YjZlMjU0MDQyNmU1MzM2NDc2ZjU0NTY0ODQwNzk3ODQ1NDAzNzJiNDk2ZDM4NWE3MjcwMzk1NjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTQ0MDM5MzI3MzZmNWUzMzQ4NmY3OTc4Nzg2ZjRiNGUzNzM2Nzc0YTRjNTU1Mzc4Nzk1NTUzNTIyNTIxMzg3ODQ1MjEzODU2NDU0MDM1NDU3MzcwNTM3NDc4NzEzNDRlNzY2ZDUzNTI0NzQwMjUzNjczNDA3OTUyNGM3MDUzMzc0YjU1NTQzMzQxMjEzODI2NzM3MDUzNzQ3ODU1NTQ0ZTRiNmUyNTQwNDI2ZTUzMzY3MzZmMjU1ZjczMjEzOTU2Nzg1NTUzNWE3NDIxMjU3NDc4NDA0ZjRlNDg2ZTc1NGUyMzZkNTMzNzQyNmY3NTRlNDg3MDI1MjY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTMyYjRiNmQzODM3NGM1NTUwMjM3MzZmNWUzMzQ4NmY3OTc4Nzg2ZjI0MmI3NjIxMzg1YTQxNDAzNDJhN2E0MDM5MzM3MjZlNWU1NjcyNmU1MzJiNzQ0MDRmNzQ0OTZmNzkyYjc5NmQzODRhNzg1ODdhMzc0YzQwMzk1NjQyNDA0ZjQ5NzM2ZTUzNTI0NjIxNzkzMzc0MzA3NTRlNDU2ZTI1NTI3NzM5NWU1YTIzNmU1ZTU2MmEzOTVlMzc0YjZlNTQ1OTQxNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTI0NmYyNTM3NGI2ZDM4MzI0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1OTczMzI1ZTU2NzgyMTM5MzM3ODU1NTQ1YTIzNmU1ZTU2MmE1NTUzNGE0MjZlNzk0NjRjNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNDg2ZjdhNzg3MjZlNTM3ODQ3NmQ1ZTU5NzMzMTM0NGQ3NTU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1NDVhMjM2ZTVlNTY0MjQwMzk1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyMzZlNWU1NjJhMzkyNTRhNDI2ZTc5NDY0YzU1NTAyMzczNTU3NTRkNzU1ODc5NDI0ODZkMzgyNjQxMzgyNTIxNzUzODI1NGE0MjZlNzk0NjcwNTc1NDQ2MjQ2Zjc5NGEyYjU3MzQ1NTczNDA3OTJiNGI1NTU0Mzc0YjZlNGY0ZTQyNmU3NTRlNGM3MDUzMmI0YjZkMzgzNzRjMzkzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzMmI0YjcxMzcyYjQ1NmQzODJhNDQ2ZjRiNGQyYjU1NGY1NjMwNmU0YjRlNGM3MDUzMmI0YjZkMzgzNzRjNTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzMzI1MzcyMzU1NTQ0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzU1NTQ1YTIzMjEzOTMzMjQ2ZjQ5NDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NDA3ODZmNzk3ODc5NmQzODM3NzczOTVlNWEyMzIxMzkzMzI0NmY0YjRkMmI1NTRmNTY0MDQwMzk1OTc1NTU1Mzc4Nzk1NTU0NGU0YjZlMjU0MDQyNmU1MzM2NDc2ZDM5NWE3MjcwNzkzNzRiNmQzODQwNDI0MDM4MzI3MzQwMzg0YTRjNDAzNDRkNzUzNTc5NWY3NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGI0ZTUwMjEzODRhNzY3MDM4NGE3NDcwNTMzNjczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTc0NDAyNTM2NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzQyMTI1NWE0ODcwMzgyYTIzMzkyNTUyN2E0MDM0NGQyYjU1NGY1NjM3NmU3OTUyMjUyMTM4Nzg0NTIxMzg1NjQ1NDAzNDU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzNzU0NTYyYTU1NTQzMzQ4NTU1MzcwNzg3MDRmNGU3NDZmNTQ0ZTRiNmU1ZTc0NDI2ZTM4NTIyMzQwMzQ0ZTc0MjEyNTVhNDg3MDM4MmEyMzU1NTM1MjdhNDAzNDRlNzk2Zjc5MmI0NjU1NTQzNzRjNDAzOTU1NzMzNDM2MzI1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM2ZjU0NTY0ODQwNzk3ODQ1NDAzNDJhMjQ2ZjI1Mzc0YjZkMzgzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDRlMjQ2ZjI1Mzc0YjU1NTE3ODUxNmY0YjRlNzQ2Zjc5MzY3MzZmNzkyYjI0NDAyNTc0NDU3MTM0NGU3NjZkNTQ1NjQ4NmU3OTJiNDU2ZTI1NzA0MjIxMjU1MjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MjMzNDE2ZDM5NTk3MzZkMzk1OTczMjEzODI2NzMyMTM5NGU0OTZmNzkyYjI2NmQzODI0NzQ3MDUzNzg0ODZlNzU0ZTc1MjEzOTVhNzg0MDRmNGU0ODZlNzU0ZTQ0NmU3OTJiNWU2ZTc1NGU1NjZlN2E1YTIzMjEzODcwNGIyMTM4MjM3MzZlNTM1MjI0NmU3OTVhNDE1NTUzMzM3NDcwNTMzNzRjNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTI0NmYyNTM3NGIzOTI1Nzg3NzU1NTAyMzczNmQzODJhMjM1NzU0NGU0YjZlMjU0MDQyNmU1MzM2NDc3MDM5NWE3ODZmNzk3ODc3NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjRkNWY1NTUwNTE0OTU5NTA0ZDQ5NTk1MDRkMjg1NTRmNGQ3NjU1NTI0MDc4NmY3YTc3NzM0MDM4NTI0YjZlNTQ3NzczNzAzOTVhNzg2ZjdhNTk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc0MjEyNTVhNDg3MDM4MmEyMzM5MjU1MjdhNDAzNDRkMmI1NTRmNTU0YjU5NTA1MTQ5NTgzNTU1NDk1OTM1NTE3MzU3NTEzNzc0NmY3OTRhMmE1NTUyMzc0YzQwMzk1NTQyNTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNDI0MDc1NGUyNDZmMjUzNzRiMzkyNTc4Nzc1NTUwNDk3MzU5MzU0ZDQ5NTk1MDRkNDk1OTUwNGQyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc0NDAyNTM2NzMzMTM0NGQ3NTU5NzY0ZDRhNTkzNDIzNGI1OTUwNTE0YjU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlMjQ2ZjI1Mzc0YjM5MjU3ODc3NTU1MDQ5NzM1OTM1NGQ0OTU5NTA0ZDQ5NTk1MDRkNDkzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzM3MjIxMzg3MDc4NTU1MDIzNzM1NTc2NTU0OTU5MzU1NTQ2NTk3NjRkNGE1OTRiNTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzc0NTZkMzgyMTczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0ZDVmNTU1MDM2NDk1OTUwNGQ0OTU5NTA0ZDQ5NTk1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1NTI3YTQwMzQ0ZDJiNTU0ZjU1NGI1OTUwNTE0YzU4MzU1NTQ5NTkzNTMyNzU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTUzNzg3OTU1NTQzNzRjNDAzOTU2NzI2ZDM4MzI3MzMxNGY0ZDRhNTk1MDRkNDk1OTUwNGQ0OTU5NTA0ZDQ5MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzIyMTM4NzA3ODU1NTAyMzczNTU3NjU1NDk1OTM1MzI0NjU5NzY0ZDRhNWEzNDU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc0NDAyNTM2NzMzMTM0NGQ3NTU5NzY0ZDRhNWEzNDRlNDg2Zjc1NGU0NTIxMzkzMzc4NmY3NTU1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzIyMTM4NzA3ODU1NTAyMzczNTU3ODM3NDcyMTM5NDA3NDZkMzg0YTc0MjE3OTRhNzg1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTk3MzMzMjUzNzIzNTU1MzRhNDgyMTI1NTIyMzZkMzgyYjQ3NTgyNTU2NzQ2ZjI1Mzc3NzU1NTM3ODQ3NDA3OTVmNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDU2ZTI1NWE3NDcwNTM3ODQ4NmU3NTRkMmI1NTRmNTYzNzZlNzk1MjI1MjEzODc4NDUyMTM4NTY0NTQwMzQ1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDk2Zjc5MmI3OTZkMzg0YTc4NTg3OTU2MjQ2ZjI1Nzg0NzQwMzk1YTRjMzkyNTVhNzQ3MDUzMzc3YTZlNWU1NjJhMzkyNTJhNzQ2ZTM4MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzRhNDgyMTI1NTIyMzZkMzgyYjQ3NTU1MDIzNzM2ZjU0NTY0ODQwNzk3ODQ1NDAzNDJhNzU3MDM5NWE0MjZlNzkzNzRjNmYyNDJiNzYyMTM5MzM3ODQwMjUyYjRiNzEzNzJiNDcyMTM4MjQ3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNDk2Zjc5MmI3OTZkMzg0YTc4NTg3OTU2NDI2ZTI1NzA0YjIxMzk0ZTQxNzEzNDRlNzQ2ZTc5MzI3MzIxMzgyYTJhNTc1MzVhNDg3MDM4MmEyMzZmN2E3NzczNmQzODI2NzM2ZjU0NTY0ODQwNzk3ODQ1NDAzNDJhNzU2ZDM4MmI3YTZmNzk1MjQ5NmQ1NDc3NDc2ZTUzMmI1ZTQwMzk1NTQxNTczNDRlNzk2ZTVlNTU3MzIxMjUyYjI0NmU3YTMzNGI3MTM0NGU0MjZlNzU0ZTZlNTY1ZTM3NGMyMTM0NmY0NTU1NGY3MDQyNmU3OTMzNDIyMTM0NmY0NTU1NGY3MDI0NmQ0YjZmNDU1NTRmNzA3NjIxMzgyYTc0NDA1MzUxN2E1ODRmNGQ3YTIxMzkzNzRjNzA1NDU2NzQ2ZTUzNzg3NDU2MjQyMzQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTIzMzRiNzEzNDRlMjM2ZTRiNGU3ODcxNTQzMzRiMjEzODVhMjM1NTUzNGE0ODIxMjU1MjIzNmQzODJiNDc1NTUzNDA0YjZlMjUyMzczMjE3OTc4NDg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1NjQyNmUyNDJiNDU2ZTVlNzA3ODZmNzU0ZDJiNTU1NDRlNGI2ZTI1NDA0MjZlNTMzNjQ3MjE3OTc4NDg0MDVlNTY3NDZmNTM3NDJhNTg3OTRhNDg3MDI1Mzc0YjU3NGY3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzU2NWUzNzRjMjEzNDZmNzM2ZDM4MjY3MzIxNzk3ODQ4MzkyNTRhNDg3MDI1Mzc0YjU1NTMyYjRiNTU0ZjcwNzQ2ZTM4Mzc0YjZkMzg1YTc0NTY0YjRlNDI2ZTc1NGU3NTZkMzgyYjcyNmU1MzJiNWU0MDM5NTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NTZlMjU1YTc0NzA1Mzc4NDg2ZTc1NGQyYjU1NGY1NjM3NmU3OTc4MjM0MDM4MzI3MzM2NWUzMzc0NzA1MzM3NGM1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1Mzc4Nzk1NTRmNzA0MjZlNzkzMzQyMjEzNDZmNzM2ZDM4MjY3MzIxNzk3ODQ4MzkyNTRhNDg3MDI1Mzc0YjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNTMyYjc2MjEzOTMzNDI2ZTI1MjY3MzMxMzQ0ZDc1MzQzODJhNzc2ZDM4NTE3NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZDM4MjE3MzU2NWUzNzQ0NTY0YjRlNDI2ZTc1NGU3NTZkMzgyYjcyNmU1MzJiNWU0MDM5NTU3MzZlNWU1NTczNTYyNTU2NGI2ZDM5MzM3NDZkMzgyNjdhNTU1Mzc4NDc1NTUzNTY0MjZlMjQyYjQ1NmU1ZTcwNzg2Zjc2NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNGE0ODIxMjU1MjIzNmQzODJiNDc1NTUwMjM3MzU1NzgzNzQ3NmQzOTMzNzg0MDRmNGU1ODZkMzgyYTdhNDA1MzJiNDY1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1Mzc4Nzk1NTRmNzA3NjIxMzgyYTc0NDA1MzUxN2E1NTUzNzg0NzU1NTM1NjQyNmUyNDJiNDU2ZTVlNzA3ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM0YTQ4MjEyNTUyMjM2ZDM4MmI0NzU1NTAyMzczNTU3NzVhNzQ2ZTc5NTI3NzIxMzQ1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM4NGE0MjQwNzU0ZDdhMjEzOTM3NGM3MDU0NTY3NDZlNTM3ODc0NTY0YjRlNDI2ZTc1NGU3NTZkMzgyYjcyNmU1MzJiNWU0MDM5NTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NTZlMjU1YTc0NzA1Mzc4NDg2ZTc1NGQyYjU1NGY1NjRlNzAzOTVhMjM2Zjc5NTI0NTZkMzg1MTc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODJhNzk2ZTI0MmIyMzQwMzk3NDIzNTU1MDIzNzM0MDc1NTU3NTU1NzgzNzRjNDAzOTU2NDcyMTM4MjQ3ODMwNzU0ZTRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzMjQyMzg0MDM5NTY0MjQwNzk3ODc4NDA1MDQxNzM3MTVlNDA3ODZmNzk3ODc5NmQzODM3NzczOTVlNWEyMzIxMzkzMzI0NmY1ZTIzNTczNjVlMzM0ODZmNzk3ODc4NmY0YzQxNzM3MTVlNWEyMzZlNWU1NjJhMzkyNTRhNDI2ZTc5NDY0YzcyMzI0MjMwMjEzODI0NzgzMDc1NGUyOTZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE3OTcwMzg0YTQ1MzkyNTJhNzQ2ZTM4MzY3MzZkMzgyMTczNmY1NDU2NDg0MDc5Nzg0NTQwMzQyYTc5NzAzODRhNDUzOTI1MmE3NDZlMzgzNjczNDAzODRhNGM0MDM0NGQ3YTM1NzkyYjQ3NDAzNDcwMmI0Zjc3NTY0MjZlNGM0MTczNzE1ZTRlNGI2ZTI1NDA0MjZlNTMzNjQ3MjE3OTc4NDg0MDVlNTY3NDZmNTM3NDJhNTU1Mzc4Nzk1NTU0NGU0YjZlMjU0MDQyNmU1MzM2NDcyMTc5Nzg0ODQwNWU1Njc0NmY1Mzc0MmE1NTUzMzc0NTZmMjUzNjczNTYyMzJhNDg2ZTc5MzY3YTcyMzI0MjRlMjEyNTVhNDg3MDM4MmEyMzU1NTM1MjdhNDAzNTQxNzM3MTI1NTI3NjIxMjUyYjI0NmU3YTMzNzIyMTM4NzA3ODcyMzI0MjRlMjEyNTVhNDg3MDM4MmEyMzU1NTM1Njc0NmYyNTM3NzczMDc1NGUyOTZlNTMyYjc2MjEzOTMzNDI2ZTI1MmEyYjRmNzc1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzM3Mzc1NjU5MzA3NTRlNWU3MDVlNmY0NzZkMzgyYTRjNzA1MzUyN2E2Zjc5NTI0NjU4Nzk1YTQ4NmUzNDJiMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI0Zjc3NDA0ODZlNTM0YTQ4NzAyNTM3NGI2ZjRjNDE3MzcxNWU0ZTRiNmUyNTQwNDI2ZTUzMzY0NzQwNzkyYjQ1NmU1MzJiNWU0MDM5NTY0YzMwNzU0YTJiNTU1NDQ5NzMzMzc5MmI0NTZlNTMyYjVlNmQzODJhN2EzMDc1NGUyOTZmNTQ1NjQ4NDA3OTc4NDU0MDM0MmE3OTZlMjU0YTQ1NmU1ZTcwNzg0MDM5NTkyODU4NTQyMzczNzI0ZjRlMzI2ZTVlNWEyMzZmNGM0MTczNzE1ZTRlNGI2ZTI1NDA0MjZlNTMzNjQ3NmUzODM3Nzc2ZDM4NTI3NjZlNWUzNzQ3NzA1MDQxNDU3MjM0NTU3NTU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU0MjZlNzk0MDQ4Mzk1ZTMzNzg3MTU0MzI0NTU1NTQ0ZTRiNmUyNTQwNDI2ZTUzMzc3MjZmNTM3ODc2Mzk1ZTM3NGI2ZTRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NTEzNzI2MjEyNTM3NDk3MDUzNzg0ODZlNzU0ZTc0NmY0YjRlNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NGU0YjZkMzgyYTIzNTc1MzIxNzUzMzM5NTY0YjZlNWU1NTczNDAyNTM3MjM3MDUzNzg0NzQwNGI0ZTU2NmU3YTVhMjMyMTM4NzA0YjIxMzgyMzczNmQzODJhNzk2ZTRiNGU3OTZlNWU1NTczNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNTQxNzM3MTI1MzcyYjU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzU1NzgzMzQxNmQzOTU5NzMyMTM4NWE3NjZlNWUzNzQ3NzA0ZjRlNDI2ZjRiNGUyNDZlNzk1MjI1MjEzODc4NDUyMTM4NTY0NTQwMzQyNjc1NTg0ZjRlMzA2ZTI1MmE3ODRmNzM0Mjc3NDAzODIxNzMyMTVlMzc0YzcwNTMyYjQ2MzkyNTM3NGMyMTI1NTI0OTQwMzcyYjQ2MjEzOTU2NDQ0MDUzMmI1ZTZlNzU3NDIzNDAzOTc0MjM1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3Mzc0YzIxMjU1MjQ5NDAzNDRlNGM2ZjUzMzc3NjZkMzg1MjQ1NTU1MzVhNDEyMTM5NTY3NDIxNWUzMzc4NmY3YTU5NzM0MDc5MmI0YjU1NTIzMzc4NmU1MzM3N2E2Zjc5NTI0NjU1NTEyNDc0NmY3OTQ2Nzc2ZTVlNzA0NzM3NzY1NTQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTc4NmYyNTVhNzQ2ZjUzMzc3MjIxMjU3NDc0NmY3YTU5NzMzMTM0NGU0YjU1Nzg1ZjQzMzgyNDIzNDE1NzM5MmE3MzMxNzU1OTQ0NTgzNTI0NWY3MTVlMjM0NzU1MzQ1NTU3NTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRkN2E1NjRiMmE0MzZlMjU3ODQ3NTc1MzIxNzUzOTUyNGEyOTIxMjU3NDc0NmY3YTIzNzU1NTUzNzg3OTU1NTM1YTQxMjEzOTU1NzM2ZDM4MjY3MzQwMzk1YTc2MjEzOTRlNzgzOTI1NWE0MTIxMzk1NjRjNTU1MzM3NDU2ZjI1MzY3MzIxMjU3NDc0NmY3NTRlNzk2ZTVlNTU3MzIxMjU3NDc0NmY3NTRlNDI2ZTc1NGUyMzQwMzk3NDIzNTczMjQxNTc0MDUzMzc3OTU1NTM0MDQyNmU3OTc4NGM2ZDUyMmI1ZTIxMzkzMzc2NmQ0Zjc0NWUyMTM5MzM3NjZkNTMzNzRjNTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3Mjg0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU2MzQ0MDM4MjQ0ODcwNzkzNjczMjEzNDRlNzk2ZDM4MmE0MjZmMjU3NDc4NDA0ZjRlNWUyMTM5MzM3NjZkNGY0ZTc0NmU3OTMyNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1Mzc4MjM2ZjRiNGU0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjZmNGI0ZTc0NmY0YjRlMjM2ZDUzMzcyYTU1NTQ3MDc4NmY3OTM2NzMyMTM5MzI3MzZmNzkzNzQ2NmU1ZTQwNzQ2ZTRmMjY1NzRmNzU0ZDczNTU0ZjRlNGY2ZTVlMzM0MTU1NTM3NDc0NmY1NDRlNzg2ZTc1NGUyNDZlNzkzMzc4NmY3NTRlNWUyMTM5MzM3NjZkNTMzNzRjMzkyNTRhNDgyMTI1NDU0NTU1NTQ1YTQ4NTU1MzUxNzM3MDM5NWE3ODZmNzU0ZTVlNmQ1MzVmNzM2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2ZjRiNGU0NjQwMzg1MjQ3NzAyNTc0NDI2ZTUzMzY3MzQwMzg3ODIzNmQ1MzM3NGI0Zjc1NGQ3MzU1NGY0ZTQ2MjEzODQ2Nzg2ZjRiNGUyMzZkNTMzNjczNmYyNTJhNzQ2ZjU0NWE0MTZlNWUzMjczNmU1ZTU1NzM2ZjVlMzM3NDZmN2EzMzRjNTU1MzUxNzM2ZTc5Mzc1ZTU1NTQ3MDc0NzA1MzVhNDE1ODczNDE3MzU1NGY0ZDczNTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTQ0NmQzODJhNzc1NTUwMjM3MzU2MjU1Mjc2MjEyNTJiMjQ2ZTdhMzI3YTU1NTM3ODc5NTU1NDcwNzQ3MDUzNWE0MTQwMzk1OTczNmQzOTU5NzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGM1NTUzMzc0NTZmMjUzNjczNTY1ZTQwNzg2Zjc5Nzc3YTRmNzU0ZDczNTU0ZjRlNWU2ZDM5MzM0MTU1NTQ3MDc0NzA1MzVhNDE0MDM5NWE3MjZlNTMyYjc2NmQ0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNWUyMTM5MzM3NjZkNGY0ZDJiNTU1NDcwNzQ3MDUzNWE0MTQwMzk1OTQ3NmY1MzJiNDk1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODRmNGUzMDZlMjUyYTc4NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTU0NzA3NDcwNTM1YTQxNTU1Mzc4NGM1NTUxMmE0ODZlNzkzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3NTRlNmUzOTM0NGQ3MzU1NGI0ZTM1NzA1MzJiNDk2ZjUzMzc3NzU1NTQ3MDQxNmQzODRhNzg1NTU0MzM0MTQwMzQ0ZTQ5NmY3OTJiNzU0MDM0NGU1ZTIxMzk1OTczNmY3YTM3NDc2ZTc5Nzg0NzQwNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzMjEzOTMzNzgzOTVlNWEyMzZlNWU1Njc4NTg3OTMzNzg2ZTUzMzcyMzQwMzcyYjVlMjEzOTMzNzY2ZDRmNzQ0NDZkMzgyYTc3NTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczNmU1Mzc4NGM3MDRmNzQ1ZTIxMzkzMzc2NmQ1MjQ1N2E2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2ZjdhNTk3YTM5MzQyYTI1MjEzODRhMjQ0MDM5NTk0MTU3MzQ3NzU3NGY3OTMzNzg0MDc1NGU0NjZlMjUyYTQyNzA1MzJiNGIzOTI1NTI3NjIxMjUyYjI0NmU3YTMyNDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNjdhMzc0NzU1NTMyYjQ3NDAzNDRlNzUyMTM4MjY0ODcwMzgyYTc1MjEzODI2NzMyMTI1NzQ3ODIxMjU0NTQ3NTU1MjU2Nzg3MDU0Mzc0YjZlN2E1OTczMzM3OTUyNDU2ZjI1MzY3MzZlMjUyYTc2NDAzNDRlMjM2ZDUzMzY3MzcwMjU1MjIzMjEyNTczNzM2ZDM5NTk3MzQwNzk3ODQ3NmQzOTVhNDE0MDM4MzI0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZTQ3NmU1ZTMyNzM2ZDM4MjY3MzZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzM5MjU1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU1MzIxMzg0YTRjNDAzMjQxNTc1NTRmNGQ3MzU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGQyYjU1NTQ0ZTRiNmUyNTU2NzgzOTI1Nzg0NzZmNWUzMzc0NDA1ZTU2NzQ2ZTM3MmI0YzcwNTM1MjIzNzAzOTU5NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI0ZjczNDE3MzU1NGY0ZDczMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjc3MjEzOTMzNzQ1NTUwMjM3MzZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzM5MjU1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzU4Nzk3MDc4NzA0Zjc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzUyNzYyMTI1MmIyNDZlN2EzMzcyNDA1MzUyMjMyMTM0NGU3NDZlNzkzMjczNmQzOTVhNDI2ZTdhNWEyMzIxMzgyYTc2NDAzNDc0NzQyMTI1NWE0ODcwMzgyYTIzMzkyNTMzNzQ3MDUzNTE0NTU1NTMzMzQyMjE1ZTMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzM3MjQwNTM1MjIzMjEzNDJhN2E0MDM5MzI0MTU2MjUzNzI2NmQzOTVhMjM2ZjRiNmY0MjU1NTM1MjQ3NDA0ZjRlNGM3MDUzNTIyMzcwMzk1OTczNmQzOTU5NzMzMzc5NTI0NTZmMjUzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMmE0ODcwNTM3ODc5NzEzNzJiNGM3MDUzNTIyMzcwMzk1YTcyMjEyNTc0NzQ2ZTc5NzA3ODU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU4NGY0ZDc1MjE3OTUyNDc2ZTc5Mzc3NzU1NzU0OTczNDA3OTc4NDc2ZDM5NWE0MTM5NWU3MDc0NzA1MzVhNDE1NzUzMjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDUyMmI3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzM3OTUyNDU2ZjI1MzY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODZlNTM3ODc5NTU1MzJhNDg3MDRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1MzM3NDcwNTM1MjZlNTYyNTM3MjY2ZDM5NWEyMzZmNGI3MDcwNTU1MzUyNDc0MDRmNGU0YzcwNTM1MjIzNzAzOTU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMyYTQ4NzA1Mzc4Nzk3MTM3MmI0YzcwNTM1MjIzNzAzOTVhNzIyMTI1NzQ3NDZlNzk3MDc4NTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRkNzU3MDM4MmE3NTIxMzgyYTQ3NDAzODMyNzU1ODRmNGU3OTZkMzgyYTQyNmYyNTc0NzI3MDI1NTIyMzIxMjU3MzQxNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjNTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDc3NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU1MzIxMzg0YTRjNDAzMjQxNTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NGU0MjZlNzU0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTU3NGY3OTMzNzg0MDc1NGU0YzcwNTM1MjRiNzA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzMzkyNTI0NDg2ZTc5NzgyMzZlNWU1NTQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTU1MzMzNzg2ZTUzNTIyYTMxMzU0ZDQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTVhNDE0MDM4MzMyNDZlNTMzNjczMjE3OTUyNDc1ODVlMzc0NzIxNzk1MjQ3NTU1MzVhNDE0MDM4NWE0NDZmNGI0ZTc5NmU1ZTU1NzMyMTM4MjY3MzIxMzg1YTc2NmU1ZTM3NDc3MDRmNGU0MjZlNzU0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTVlMjEzOTMzNzY2ZDUyMmIyMzcxMzk0ZTc4NTU1MDIzNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGMzODVlMzc0YzQwMzk1NjQ3MjEzODI0NzgzOTM3NDU3YTcwNTQ3ODQ5NDAzNDcwNzA0Zjc1NGQ3MzU1NGY0ZTRjMjEyNTc0Nzg0MDU0Mzc0NTQwMzk1NTQ3NmYyNTVhNDE0MDM4MzMyNDZlNTMzNjQxNTc1NDcwNzQ3MDUzNWE0MTM5NWUzMzJhNmY1MzM2NDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM0NDk3MzZlNTM1MjQ2MjE3OTMzNzQzMDc1NGU0NjZlMjUyYTQyNzA1MzJiNGIzOTI1NTI3NjIxMjUyYjI0NmU3YTMyNDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI1ODRmNGU0ZjMyMzYyYTcyMzIyMzc0NTIzMjIzNDY3MjM0MzYyYTM2MzMzNzU2MzgzMjM2NDk0NTU1NTMzMzc4NmU1MzUyMmEzMTM4MzM3ODZlNTM1MjJhNTczMjQxNTc0MDUzMzc3OTU1NTM0MDQ4NmY3OTI0NzQ3MDUyMmIyMzZkMzgyNDc4Mzk1ZTMzNzQ2ZDI1Mzc0NzU3NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNzcyNmY1ZTMzNGI1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3MzM3ODZmMjU1YTRiNmQzODU2Nzg1NTU0MzM0MTQwMzQ0ZTIzNmQzODI0Nzg1NTUzMzc0NTIxMzk0ZTRjNDAzODMyNzM2ZjI1Nzg0NzIxMjUzNjczMjEzNDRkNzU1NjM3Nzc0NjU2MzgyMzQ2NTYzODMyNzM1NjM2NzMyODU2MzYyMzI4NTYzNzU5NzU1NTU0MzM0MjZlMzgzNzRjNzA1MzUyNDY2ZjRmMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTU0NWEyMzIxMzk1NjIzMzk1ZTMzNDI2ZTM4MzY3MzMxMzQ0ZTc3MjEzOTMzNzg3MDUzNzg0NjQwMzQyYTRjNzA1NDU2NDk3MDUzNzg0NjQwMzQ3NDRjNzA1MzUyNGI3MDUyMmIyMzZkMzgyNDc4Mzk1ZTVhMjM2Zjc1NDk3MzU1NzUzNzQwNTgzNDM3NDY1ODM0Mzc3NzU1NGYzNzU1MzA3NTM3NWEzMDc1MzczNTU1NzU3NzU3NTU0ZjRkNzM1NTUzMzc0NzQwNTIyYjIzNmQzODI0Nzg1NTUwMjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc0Zjc3NTc0Zjc1NGQ3MzU1NGY0ZDc2NTU1MTVhNzQ2ZTUzNWEyNDZlNTM1MjIzNDAzNDRlMjM2ZDM4MjQ3ODU1NTMzMzQyNDA3OTQwNzg2Zjc5Mzc0NzIxMjUzNjU3NTU0ZjRkNzM1NTU0MzM0MjZlMzgzNzcyNDA1Mzc4Nzk0MDc1NGQyYjU1NTMzNzQ3NDA1MjJiMjM2ZDM4MjQ3ODU1NGYyMzczNmY1ZTMzNzQ2ZjdhMzM3MjcwNTM3ODQ2NDAzMjQxNzM1NTRmNGQ3MzQwNTM1MjJhNmY0YjRkMmI1NTU0MzM0MjZlMzgzNzcyNDA1Mzc4Nzk0MDc1MmE3NzIxMzk3ODRjNGY3NTRkNzM1NTRmNGU0YzQwMzg1YTQ4NmU3OTMzNGM1NTUwMjM3MzcwNTM3ODQ2NDAzNzJiNzc2ZDM4NDA3OTU4N2E1YTc4MjEyNTJiNDc0MDU0NTk1NzU1NGY0ZDczNTU1Mzc0NDg3MDM5NTY0YzU1NTAyMzczNmYyNTM3NzY2ZTI1MmE3NzZmNGI0ZDQ4NTg0YjRkNGM1YTc2NGQ0OTRmNzU0ZDczNTU0ZjRlNDY2ZDM4MmEyNDcwNTMzNzRjNTU1MDIzNzM1NzU0NWE3ODIxMjUyYjQ3NDA1NDU5NzM1NjM0NGQ0YzVhNzY0ZDQ5NTczNDRkNDg1ODRiNGQyNTU5NGQ0MTczNTU0ZjRkNzM2ZjI1Mzc3NjZlMjUyYTc3NmY0YjRkMmI1NTU0NWE3ODIxMjUyYjQ3NDA1NDU5NzM1NjM0NGQyNTU5NGQ0MTU3NTU0ZjRkNzM1NTRmNTk3MzMzNzkyYjRiNmUzODUyMjM1NTU0MzM0MTQwMzQ0ZTIzNmQzODI0Nzg1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NTc1NTRmNGQ3MzU1NTQzMzQyNmUzODM3NzI2ZTM4Mzc0YzZmMjU1MjdhNDAzNDRkMmI1NTRmNTU3NTRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU3NzIxMzk3ODRjNTU1MDI2NzM1OTUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyMzZkMzgyNDc4MzkyNTI0Nzg2ZjVlNWE3NDQwMjUzNjczNTc0YzIzNzM0MDc1NTYyOTQwNTM1MjJhNmY1ZTIzNzM0MDUzNTIyYTcxNGI3MDRjNTY0YjRlNDI0MDc1NGU3NzIxMzk3ODRjNTU1MDI2NzM1OTM0NGU3ODZlNTQ1YTc4NTU0ZjZmN2E3MjM0NGQ3NTRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0MTZlNWUzNzRiNmY0YjRkM2M1NTUwNGQ3MzZlNWU1NTczNDA1MzUyMmE2ZjRiNGQzYzU1NTA0ZDI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1Mzc4NDY0MDM3MmI0NjQwMzk1YTRjMjEzODcwNzg1NTRmNDUyYjU1NTMyMTc1NzEyNTc0NDg3MDM5NTY0YzcyMzQ0ZTQxNmU1ZTM3NGI3MTRiNzA0YzU2NGI0ZTQyNDA3NTRlNDE2ZTVlMzc0YjZmNGI0ZDNjNTU1MDUxNzM0MDM4NGE0YzQwMzQ0ZDdhNTY1ZTIzNzM1NTczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTM4Nzg0NzcwMzkzMzc4NmY0YjRkM2M1NTUwNGQ3MzZlNWU1NTczNmQ1MzJiMjQ2ZjdhNTk3MzMxNzU0ZDQ5NTU1MzJiNGI1NTUzMzM3NDcxMzk1OTczMzE3NTRkNDkzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0MzM0MjZlMzgzNzcyNmUzODM3NGM2ZjI1NTI3YTQwMzQ0ZDQ0MzEzNDRlNzk1NTdhNDY0NjZkMzgyYTI0NzA1MzM3NGM3MjM0NGU0NjZkMzgyYTI0NzA1MzM3Mjk1NjVlNTk3YTU1NTM3ODc5NTU1MzI0NDI2ZTdhMzcyMzQwMzk1OTczMzE3NTRkNGE1NTUzMzc0NTZmMjUzNjczNTY0YjcwMmI1NTRmNTU1NzU1NGY0ZDczNTU1NDMzNDI2ZTM4Mzc3MjZlMzgzNzRjNmYyNTUyN2E0MDM0NGQ0NDMxMzQ0ZTc5NTU3YTQ2NGM0MDM4NWE0ODZlNzkzMzRjNzIzNDRlNGM0MDM4NWE0ODZlNzkzMzI5NTY1ZTU5N2E1NTUzNzg3OTU1NTQ1YTc4MjEyNTJiNDc0MDU0NTk3MzU1MzUyMzczNTkzNDRlNzg2ZTU0NWE3ODU1NGY2ZjdhNzIzNDU1NTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUyMzZkMzgyNDc4MzkyNTI0Nzg2ZjVlNWE3NDQwMjUzNjU3NGY3OTMzNzg0MDc1NGU0NzZlNWUzMzQyNDA3YTc4NzI2ZjVlMzM3NDcwNTQzNzRjMzkyNTVhNDEyMTM4MmE3YTQwMzQ3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNmY1ZTMzNzQ3MDU0Mzc0YzU4NGY0ZTRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0Yjc3Mjg0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU2MzU0MDM4MmE3NzU1NTM1MTczNmY1ZTMzNzQ3MDU0Mzc0YzU1NTM1YTQxMjEzODJhN2E0MDM0NGU0NzZlNWUzMzQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczNzAyNTc4MjM2ZDRmNGUyMzZkMzgyNDc4NTU1NDMzNzQ2ZDI1Mzc0NzU1NTQzMzQ4NTU1MzM3MjU0MDM5NTYyYTU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NTQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTc5NmU1ZTU1NzM2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2Zjc1NGU0MjZlNzU0ZTRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZDM4MjQ3ODM5MjUyNDc4NmY1ZTVhNzQ0MDI1MzY3MzMxMzQ0ZTc5NmU1ZTU2NDYyMTM5MzM3MjcwNTM3ODQ2NDAzNzJiMjMyMTM4NDY3ODZlNzU3NDRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiMzg0YjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjI0MjM0MjRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1OTczMzM1MzM3MjM0MDM5NTY0NjZkMzgyYTc4NTU1NDMzNDE0MDM0NGU3NDZmNTQ0ZTRiNmU1ZTRlNGI2ZDM4NTIyMzQwMzQ0ZTRjNzA1MzUyMjM3MDM5NTk3MzZlMzgzNzRjNmYyNTUyN2E0MDMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGQyYjMxMzQ0ZDc1NzAzODJhNzUyMTM4MmE0NzQwMzgzMjc1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NjQwMzk1YTRjMjEzODcwNzg1NTUwMjM3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGUzNDQwMzg1YTQ4NzA3OTM3NGI0MDM4MzI3NDU1NTIzMzQ4NmUyNTQ1NzM3MTVlMzM0MjZlMzgzNzcyNmUzODM3NGM2ZjI1NTI3YTQwMzkyMzc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNDI0MDc1NGU0YzcwNTM1MjIzNzAzOTU5NzMzMTM1MjM3MzU1Nzk1Njc0NmU3OTJhNzg0MDRmNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjczMzEzNDRlNzk1NTc3NGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU1NTM3ODRjNTU1MTU2NzQ2ZTc5MmE3ODQwNGY1MTczMzc1MzJiNDg2ZDRiNGUyOTcwNTM3ODQ2NDAzNzJiNDY0MDM5NWE0YzIxMzg3MDc4NzIzNDU1NTc0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZTc5MmIyMzZkMzg0MDQyNDAzOTU1NDc2ZjI1Mzc0NzQwNGY3NDRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiMzg0YjcwNzY2ZDUzNTIyMzM5MjU3ODc3NTYyNDIzNDU1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NDI0ZjczNDI0ZDIxNzkyYjIzNTg3OTVhNzQ2ZTUzNGE3NTIxMzg1YTQ0Mzk1ZTUyMjQ0MDM5NTYyYTM5MjU3NDc0NmU3OTMzNDU0MDM5NTU0MTQwN2EzNzQ3MjE0YzI0NDUyMTM4MjQ3NTQwNTM1MTczMjEyNTUyNDU2ZTUwNDE3MzIxMjU1MjQ1NmU0ZjJhNzcyMTM5MzM3NDU4N2E1YTIzMjEzOTU2MjM2ZjVlNzA0MjcwNTM3MzQxNTYyNTcwNGIyMTM4MmEyMzM5NGI2ZjQyNTczMjQyNzc0MDM4MjE3MzZkNTM1MjQ3NDA1MzRhNzgzOTI1NzA0YjIxMzgyYTIzMzkyNTVhNzQ2ZTUzNGE3NTIxMzg1YTQ0NTc1MzVhNzQ2ZTUzNDk0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTM0NTM1MjQ3NDA1MzRhNzg1NTUzNzA0YjIxMzgyYTIzNTU1MzMzMjQ2Zjc5NTIyMzZkMzgyYjQ3NTU1NDVhNzg2ZTUzMzc3NjcwNTM3ODQ4NmU3NTI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1Mzc4Nzk1NTUzNWE3NDZlNTM0OTQ3NDA3YTU2NDg2ZTM3MmIyNDZmMjUzNzRiNTg3OTc4Nzc1NTUzMmE0ODcwNGY0ZTQyNmU3NTRlNGUzMzUxMjQ1NjM1NzgyYjU2MzM1MjU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4Nzk1MjQ3NmY1ZTcwNzg2Zjc4MmI3NjIxMzg0YTQ1MjE3OTUyNzY2ZDI0MmI0YTcwMzgzNzRiNzEzNDc0NzYyMTM4NGE0NTU4Nzk3ODc3NTg0ZjRkNzUzNTI1MmE0NTcxMzQ0ZTRkMzIzOTQwNzg2ZjVlNDE3MzIxMjU1MjQ3NTU1MzUyNDk2ZjU0NTY0ODcwNzkzNjczNzAzOTVhNzg2ZjdhNTk0NzU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY1NzRmNzU0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwNTM1MjIzMjEzNzJiNDkyMTM5NTYyMzZmNGI0ZDJiNTU1MzVhNzQ2ZTUzNDk0NzQwNTM1MjIzMjEzNDJhNGM2ZjUzNGE0MjcwNGY3MzdhMzk0YjZmNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjRkMmI1NTUzMzM3NDcwNTM1MjcyNmY1MzUyNGI3MDU0NWE2ZTU5MzcyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiNTU1MzMzNzQ3MDUzNTI3MjZmNTM1MjRiNzA1NDVhNmU1OTc4MjM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3NjU1NTE1YTc0NmU1MzVhMjQ2ZTUzNTIyMzQwMzQ0ZTc4NzE1NDRlNDI2Zjc5NTIyMzZkMzgyYjQ3NTU1NDMzNDI2ZTM4MzY1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzU0ZDJiMzEzNDRkNzU1OTM4MjQ0MjZlNzU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjZmNTM3ODRiNzEzNzJiMjM2ZDM4MjQ3ODU1NTAyMzczNDA1MzUyMjM0MDM5MzM0MjZlMzgzNjQ3NmU3OTJiNWU1NzRmNzc3MzU3NGI0ZTIzNmQzODI0Nzg0MDUzMzc0NTcwNTM1MTQxNmUzODc4NDc3MDM5MzM3ODZmNGMyMzRhNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZDM4MjE3MzQwNTQzNzRiMjEzOTMzNDI2ZTI1MjY3MzMxMzUyMzczNTU3NjVhNzcyMTM5Nzg0YzU1NzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ0OTZkMzk1NjJhMzk1ZTMzNDI2ZTM4MzY3MzMxMzQ0ZTc3MjEzOTMzNzg3MDUzNzg0NjQwMzQyYTQ3NmU1ZTZmNDE1NzM0NGQ0NDU1NTQzMzQyNmUzODM3Nzc0MDM4NGEyMzIxMzQ3NDc3MjEzOTc4NGMzMTM1NTk0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNzc3MDM5NTY3NDcwNTM3ODQ4NmU3NTRkMmIzMTM0NGQ3NTVhMjUzMzc0NzEzOTU5NzUzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NzE1NDRlNDI2ZjdhNzg3MjcwNTM3ODQ2NDAzNDRkMmI1NTUzMzM3NDcwNTMzNzIzNmQzODI0Nzg1ODc5MmE0ODcwNGI3MzQyNTU0ZjQ1NzM3MDUzNzg0NjQwMzgzMzc4NmU1NDMzNzQ1NzUzMzM3NDcxMzk1OTJiNWE0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTUzNzg3OTU1NTMzMzI0NmY3OTUyMjM2ZDM4MmI0NzU1NTAyMzJiNTU0ZjU1NGE2ZTM4MmI0NzcwNTM3Mzc1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3ODcxNTQ0ZTQyNmY3YTc4NzI3MDUzNzg0NjQwMzQ0ZDJiNTU1MzMzNzQ3MDUzMzcyMzZkMzgyNDc4NTg3OTJhNDg3MDRiNzM0MjU1NGY0NTczNzA1Mzc4NDY0MDM4MzM3ODZlNTQzMzc0NTc1MzMzNzQ3MTM5NTkyYjU5NGM0ZDQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNDI0MDc1NGU3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc1NGQyYjMxMzQ0ZDc1NTkyNTI0NDg2ZTdhMzM0MTU1NzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ0OTZkMzk1NjJhMzk1ZTMzNDI2ZTM4MzY3MzMxMzQ0ZTc3MjEzOTMzNzg3MDUzNzg0NjQwMzQyYTQ3NmU1ZTZmNDE1NzM0NGQ0NDU1NTQzMzQyNmUzODM3Nzc0MDM4NGEyMzIxMzQ3NDc3MjEzOTc4NGMzMTM1Nzc0OTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM0MDU0Mzc0YjIxMzkzMzQyNmUyNTI2NzMzMTM1MjM3MzU1NzY0MDQ2NmUyNTJhMjM2ZDRmNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjY2ZjUzNzg0YjcxMzcyYjIzNmQzODI0Nzg1NTUwMjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc0Zjc3NzM1NzRiNGUyMzZkMzgyNDc4NDA1MzM3NDU3MDUzNTE0MTQwNTM1MjJhNmY0YzIzNGEzMDUwNGQ0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNzc3MDM5NTY3NDcwNTM3ODQ4NmU3NTRkMmIzMTM0NGQ3NTU5MzU1NjQ2NmUyNTJhMjM2ZDRmNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjY2ZjUzNzg0YjcxMzcyYjIzNmQzODI0Nzg1NTUwMjM3MzQwNTM1MjIzNDAzOTMzNDI2ZTM4MzY0NzZlNzkyYjVlNTc0Zjc3NzM1NzRiNGUyMzZkMzgyNDc4NDA1MzM3NDU3MDUzNTE0MTQwNTM1MjJhNmY0YzIzNGM1YTc2MzY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTQyNDA3NTRlNzc3MDM5NTY3NDcwNTM3ODQ4NmU3NTRkMmIzMTM0NGQ3NTZkMzgyYTc5NmQzODJhNDI3MDU0Nzc3NTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg3MTU0NGU0MjZmN2E3ODcyNzA1Mzc4NDY0MDM0NGQyYjU1NGY1NjQyNmU3OTQwNDI2ZTc5NzgyMzcxMzQ1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MjVhMjM2ZTVlNTY3ODU1NTQzNzRjNDAzOTU1NzM0MDUzNTIyMzIxMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTIzNzM1MzMzNzU2NzIzMzUxNTIzNjMyMzc0NjI0NmYyNTM3NGIzOTI1Nzg3NzM5MzQ0ZDJiNTU1NDQ1NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU2MjUzNzI2NmY1Mzc4NGI3MTM0NmYyODU1NTMzNzI2NmY1Mzc4NGI3MTM3MmIyMzZkMzgyNDc4NTU1Mzc4Nzk1NTUzMzMyNDZmNzk1MjIzNmQzODJiNDc1NTUwMjMyYjU1NGY1NjQyNmU3OTQwNDI2ZTc5NzgyMzcxMzQ1NTczNDAzODRhNGM0MDM0NGU3ODcxNTQ0ZTQyNmY3YTc4NzI3MDUzNzg0NjQwMzQyYTRjNzA1NDU2Nzk3MDUzNzg0NjQwMzQ3Mzc1NTYzNzc3NDY1NjM4MjM0NjU2MzgzMjczNTYzNjczMjg1NjM2MjMyODU2Mzc1OTc1NTczNDQ5NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU2MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzM5MjU1NjJhNTY0YzQxNzMyMTI1NTI0NTZlNGYyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3MDc0NmY1NDRlNGI2ZTVlNDA3ODQwNTIyYjc0NzA0ZjZmMjg1NTUzMzM3NDcwNTMzNzIzNmQzODI0Nzg1ODc5MmE0ODcwNGI3MzQyNTg3YTVhMjM2Zjc5NDAyMzZkMzgyNDc4NTc0ZjU1NzgzODM0MjM3ODZlMzQyMzc4NDA0ZjRkNzgzNDUwNDE3ODM1MzU0MTc4MzY0YjU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM3MjMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyMzIxMzkzMzc4Mzk1ZTVhMjM2ZTVlNTY3ODU4N2E1YTc0NzA3OTM3NzI3MDM5NWE3ODZmNzU3NDI0NmYyNTM3NGIzOTI1Nzg3NzU4NGY0ZTM3MzYyMzM3MzQzOTIzMzM0ZTM3NTE1MjZlNzAzOTVhNzg2Zjc4MmI0MjQwNTIyMzQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM2ZDM4MmEyMzU3NTQzNzRjNDAzOTU2NzI2ZDM4MzI0MjU1NTMyYTQ4NzA0ZjRlNDI2ZTc1NGU0ZTM2NTI0ZTM0MzUyNDQwNTIzMzUyMmIzNzM2MjMzNzM0MzY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzMyMzc0ZTMyMzY3NzJiMzgzMzM2MzM3MjM3Mzc1YTUyMzY3ODU5NDcyMTM5NGU0OTQwMzgyYTc3NTc1Mzc4NDc3MDRmNzQyNDZmMjUzNzRiMzkyNTc4Nzc1NzM0Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc4MmIyMzQwMzk3NDIzNTU1MDIzNzM1NTc5NDA0ODZmNzkzNzI1NDAzOTU1NzU1NTUzNzg3OTU1NTMzMzI0NmY3OTUyMjM2ZDM4MmI0NzU1NTAyMzJiNTU0ZjU2NDI2ZTc5NDA0MjZlNzk3ODIzNzEzNDU1NzM0MDM4NGE0YzQwMzQ0ZTc3NzAzOTU2NzQ3MDUzNzg0ODZlNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1NjQ4NzA0ZjJhNzg0MDUzNzgyMzM5MjUyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjcwNTMzNzI2NzA0ZjczNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwNzU1NjM1NzAzODVhNzY0MDM5NWE0YzQwN2EzNzQ1NmU1NDc3NzMyMTM5NGU0OTZmNzkyYjI1NDAzODMyNzM3MDM5NWE3ODZmNzU0ZTI5NzAzOTVhNzg2Zjc4MmI0MjQwNTQyMzczNDA3OTJiNGI1NTU0NDY3NzcwMzk1Njc0NzA1Mzc4NDg2ZTc4MmIyMzQwMzk3NDIzNzIzNDU1NDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1YTc0NmU1MzQ5NDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzY2ZDUzNTIyMzU4Nzk3ODc3NTg0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NjIxMzg0YTQ1NTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NmUzODM3NGM2ZjI1NTI3YTQwMzcyYjQyNDA0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzIxMzgyYTRjNzAyNTM3NGIzOTI1NWE3NDZlNTM0YTc1MjEzODVhNDQzOTVlNTIyNDQwMzk1NjJhNTc1MzVhNzQ2ZTUzNDk0NzZkMzgzMjQ1NTU1MzIxNzUzNzM5NWE3ODZmNzU0ZTc0NmY1NDRlNGI2ZTVlNDA3ODQwNGY0ZTc5NmU1ZTU1NzM3MTI1MzMyNDZmNzk1MjIzNmQzODJiNDczOTVlMzM3ODcxNTQzMzJiNTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDRmNGU1MjcxNTM1YTc4NmY1NDMzNDI2ZTI1MjY3MzIxMzk1OTczNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzIxMzgyYTRjNzAyNTM3NGIzOTI1NWE3NDZlNTM0YTc1MjEzODVhNDQzOTVlNTIyNDQwMzk1NjJhNTc1MzVhNzQ2ZTUzNDk0NzZkMzgzMjQ1NTU0ZjU2NTI2ZjdhNTY0ODZmNzU0ZTQ5NmY3OTJiNzY0MDM5NWE0YzZkMzgyYTdhNTU1NDU2Nzg2ZjM5Mzc3ODZmNWUzMjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDRlNGI2ZDM4MmEyMzU3NTMyMTc1MzMzOTU2NGI2ZTVlNTU3MzZkMzgyNjczNDA1ZTU2NzQ2ZTdhMzI3MzIxMjU1MjQ1NmU1MzU2NzQyMTI1NDUyODU1NTQ0Njc4NzIzNDU1NDI0ZjczNDI0ZDIxNzkyYjIzNTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNzcyNmQ1MzUyNDc0MDUzNGE3ODZmNzU3NDc2NmUyNTI0NDYyMTM4MmE3NzZmNGMyNDZlNTYyNTcwNGIyMTM4MmEyMzU2MjQyMzQyNGY3OTMzNzg0MDc1NGU3NDZmNTQ0ZTRiNmU1ZTQwNzgzOTVlMzc0YzQwMzk1NTQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjRlNmY1NDRlNGI2ZTVlNDA3ODU1NTM1MTczNzAzOTVhNzg2Zjc1NGUyMzZlNGI0ZTI0NmYyNTM2NzM3MDUzNzQ3ODU1NTM1NjQ4NzA0ZjRlNWU2ZDM5MzM0MTU1NTMzMzI0NmY3OTUyMjM2ZDM4MmI0NzU1NTQ1YTc4NmU1MzM3NzY3MDUzNzg0ODZlNzU0ZTc1NzAzOTMzMjM2ZTI1MmE0YzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZkMzgyMTczNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNzM2ZTc5MmIyMzU1NTM3ODQ3NTU1MTUyNTEzNTM2NzgzMDM5MjM3ODUxMzY0YzQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1NzcyYjQ3NmU1NDc3NzMzMjUxNTIyNTQwMzk1YTI4NTU1MzVhNzQ2ZTc1NGU3NDZmNTQ0ZTRiNmU1ZTQwNzg1NTU0Mzc0YzQwMzk1NjRjNTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3MzQxNzM1NTRmNGQ3MzcwNTQ1NjJhMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDM3NGM0MDM5NTY3MjZkMzgzMjczMzEzNDRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3YTMzNzg3MTU0MzI0NzZmNWU0ZTQ1NmQzOTMyNDE1NjRiNGQ3YTU3Mzc0NTRhMzkzMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjU5NzMzMjVlNTY3ODIxMzkzMzc4NTU1Mzc4NDc2ZTUzNzg0NzQwMzQ0ZTQ0NDAzOTc4NzU2ZTI1NTI0YjQwNGY0ZTVlNmQzOTMzNDE1NTUzMzMyNDZmNzk1MjIzNmQzODJiNDc1NTUzMmI0OTcwNTM3ODQ4NmU3YTU5NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDYyMTM5NTY0NDcwMzk0ZDczMzEzNDRlMjM0MDM4NGE3ODIxNzkyYjIzNTg3YTMzMmE2ZjUzMzc0YzU4Nzc3ODQ3NmU1Mzc4NDc0MDM2NDY3ODcxMzg1NjQ4MjEzOTU2NzczNTM4NTI0YjZkNWUzNzQ5NTc1NDU2NDg3MDI0MmI1ZTZkMzgzMzIzNmQ1MDIzNGI1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTYyNDcwNTQzMzQ4NmU3YTU5NzMzMTM0NGU2ZTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNzg2ZTUzMzc3NTZlNWUzMjQ3NzA1NDc4NDk0MDM5NTk0NzM0MzgyYTQ1NmQzODJhNzgzNDI1MzcyYTIxNzkyYjc0NmY3OTMzNGY3MDM5MzMyMzZlMjUyNjQxNTU3NjUxNzMzNTM4Nzg0NzcwMzkzMzc4NTU3NTQ5NzMyMTI1NTI0NTZlNTM1Njc0MjEyNTQ2NzI0MDUzNTIyMzIxMzUyNDc5NTU3OTcwNGIyMTM4MmEyMzM5NWU0NjI0NmYyNTM3NGIzOTI1Nzg3NzcyMzc1ZjRhNmUzODc4NDc1NTc1Nzc0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDMzNzg2ZTUzMzc3NTZlNWUzMjQ3NzA1NDc4NDk0MDM5NTk0NzM0MzgyYTQ1NmQzODJhNzgzNDI1MzcyYTIxNzkyYjc0NmY3OTMzNGY3MDM5MzMyMzZlMjUyNjQxNTU3NjU5NzMzMzUzNTIyYTZmNGI1NTQ1NTU1MzVhNzQ2ZTUzNGE3NTIxMzg1YTQ0MzkyNTMzNzQ3MDUzNTEyYjQwNzU1NjdhNmY3OTUyNDc3MDUyMmIyOTcwMzk1YTc4NmY3ODJiNDI0MDU0MjQ3MjU5MjUzMzc0NzEzOTU5NzU1NzM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1MzM3NDU0MDM4NTY0ODcwNGYyYTIzNzEzOTRlNzg2ZjRiMmE1NjZlNzk0YTQyNmU3OTM3NTg0MDM5Nzg3NTZlMjU1MjRiNDA1MTU2MjQ3MDU0MzM0ODZlNzU3Mzc1NWE0YjRlNTEyMTM5Nzg0YzU1NzU0OTczMjEyNTUyNDU2ZTUzNTY3NDIxMjU0NjcyNDA1MzUyMjMyMTM1MjQ3OTU1Nzk3MDRiMjEzODJhMjMzOTVlNDYyNDZmMjUzNzRiMzkyNTc4Nzc3MjM3NWY1ZTQwNTM1MjJhNmY0YjU1NDI1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNDAzODRhNzgyMTc5MmIyMzU4N2EzMzJhNmY1MzM3NGM1ODc3Nzg0NzZlNTM3ODQ3NDAzNjQ2Nzg3MTM4NTY0ODIxMzk1Njc3MzI3YTM3MjM3MDUzMmI0NzU3NGY1NTRhNTU1MTI0NDg2ZTdhMzM0MTU1NzU0OTczMjEyNTUyNDU2ZTUzNTY3NDIxMjU0NjcyNDA1MzUyMjMyMTM1MjQ3OTU1Nzk3MDRiMjEzODJhMjMzOTVlNDYyNDZmMjUzNzRiMzkyNTc4Nzc3MjM3NWY0YTZlMzgyYjQ3NzA1MzczNzU1NzM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNzA1MzM3NDU0MDM4NTY0ODcwNGYyYTIzNzEzOTRlNzg2ZjRiMmE1NjZlNzk0YTQyNmU3OTM3NTg0MDM5Nzg3NTZlMjU1MjRiNDA1MTU2MjQ3MDU0MzM0ODZlNzU3Mzc1NTk0YjRlNWE2ZTI1MmEyMzZkNTQ1OTc1NTg0ZjRlNzYyMTM4NGE0NTIxNzk1Mjc2NmQyNDJiNzcyMTM5MzM3NDMxMzgyMTc1NDA1ZTU2NzQ2ZTdhMzM3MjcxNWUzNzRjNDAzOTU2NzI2ZDM4MzMyYjM5NGM1YTQ2NmUyNTJhMjM2ZDRmNTU0MjU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM0MDM4NGE3ODIxNzkyYjIzNTg3YTMzMmE2ZjUzMzc0YzU4Nzc3ODQ3NmU1Mzc4NDc0MDM2NDY3ODcxMzg1NjQ4MjEzOTU2NzczMjdhMzcyMzcwNTMyYjQ3NTc0ZjU1MjU1NTUxMjQ0ODZlN2EzMzQxNmY0YjU1NDU1NTUzNWE3NDZlNTM0YTc1MjEzODVhNDQzOTI1MzM3NDcwNTM1MTJiNDA3NTU2N2E2Zjc5NTI0NzcwNTIyYjI5NzAzOTVhNzg2Zjc4MmI0MjQwNTQyNDcyNWE3OTI0NDg2ZTdhMzM0MTU1NzU3NzQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0MzM3ODZlNTMzNzc1NmU1ZTMyNDc3MDU0Nzg0OTQwMzk1OTQ3MzQzODJhNDU2ZDM4MmE3ODM0MjUzNzJhMjE3OTJiNzQ2Zjc5MzM0ZjcwMzkzMzIzNmUyNTI2NDE1NTc2NTE0YjU1NTEyNDQ4NmU3YTMzNDE2ZjRiNTU0NTU1NTM1YTc0NmU1MzRhNzUyMTM4NWE0NDM5MjUzMzc0NzA1MzUxMmI0MDc1NTY3YTZmNzk1MjQ3NzA1MjJiMjk3MDM5NWE3ODZmNzgyYjQyNDA1NDI0NzI1OTM1NTY0NjZlMjUyYTIzNmQ0ZjU1NDI1ODRkNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzNDAzODRhNzgyMTc5MmIyMzU4N2EzMzJhNmY1MzM3NGM1ODc3Nzg0NzZlNTM3ODQ3NDAzNjQ2Nzg3MTM4NTY0ODIxMzk1Njc3MzI3YTM3MjM3MDUzMmI0NzU3NGY1NjU2NmU3OTQwNDI2ZTc5NzgyMzcxMzQ1NTQ1NTU1MzVhNzQ2ZTUzNGE3NTIxMzg1YTQ0MzkyNTMzNzQ3MDUzNTEyYjQwNzU1NjdhNmY3OTUyNDc3MDUyMmIyOTcwMzk1YTc4NmY3ODJiNDI0MDU0MjQ3MjZkMzgyYTc5NmQzODJhNDI3MDU0Nzc3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTIyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ2MjEzOTU2NDQ3MDM5NGQ0NzIxMzgzMzc3NTc0ZjQyNzU3MDM5MzMyMzZlMjUyYTRjNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMjE3NTM2MjUzNzQ1NDAzODVhMjM1NTUzMzMyNDZmNzk1MjIzNmQzODJiNDc1NTUzNDA0ODZmNzU0ZTI0NmYyNTM3NGI1NTU0NDYyNDZmMjUzNzRiMzkyNTc4Nzc3MjM1NDE3NTU4NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5NGU0NTcxMzcyYjQ2MjEzOTU2NDQ3MDM5NGQyYjZlMzg1MjRiNmQ1ZTM3NDk0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NzMyNDE1NzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTU2NmU3OTMzNzg3MTUxMzc0YjZmNzkyYjRiMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNTYzMjZlNTMzNzc0NmYyNTM2NzM2ZjU0NTY0ODcwNzk3ODc3NDAzNDRlNzQ1NTU0NDA3NDZlNTM3ODc3NTU1NDM3NGM0MDM5NTU3MzM0MzYzMjQ3NTU1MjM3NGMyMTM4NzA3ODMwNzU0ZDQ4NDA1ZTU2NzQ2ZTdhMzI3MzMxNTQzNzRjNDAzOTU2NzI2ZDM4MzIzYzU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3NzU3NGY3NzRlNzU2ZTVlMzI0NzZlMzgzNzRjNmYyNTUyN2E0MDM3MmI0MTIxMzgyYTc3NmU1MzM3NGI1NzUzNWE0ODZlMzgyNDc0NmU3OTMzNGMzMTM3NDU3YTZmNzkzNzI1NmUyNTQ2Nzg1NjI0MjM0MjRmNzkzMzc4NDA3NTRlMjQ2ZTc5NTI0OTZmNTQ1NjQ4NzA3OTM3NzI3MDM5NWE3ODZmNzU3NDQ2NDAzOTVhNGMyMTM4NzA3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1NzgzNzQ3MjEzOTRlNDk2Zjc5MmIyNTQwMzQ0ZTc0NTU1NDM3NGM0MDM5NTU3MzcwNTM1ZjczNmY3OTM3NGM3MDU0NTY0MjIxNWUzMjczNzA1Mzc0Nzg2ZTM0NGU3OTZmNzkyYjQ2NTU1NDM3NGM2ZDM4MmE3YTU1NTQzMzQxNDAzNDRlNzU2ZTVlMzI0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0ZjRlNDc2ZTVlMzI3MzZkMzgyNjczMzIzNjMzNWEzNDM2MmE3MjM0MzYzMzM1MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM1MjUyYTQ1NzEzNDRlNGQzMjM5NDA3ODZmNWU0MTczMjEyNTUyNDc1NTU0Mzc0NzIxMzk0ZTQ5NmY3OTJiMjU0MDM0NGUyNDZmMjUzNzRiNmY0YjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjQ2ZjI1Mzc0YjM5MjU3ODc3NTU1MDIzNzM2ZDM4MmEyMzU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzcwNTMzNzI2NzA0ZjJhNGM2ZjUzNGE0MjcwNGY3MzdhNTU0ZjZmNDIzODRjNTI3MDU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQzNzRjNDAzOTU2NzI2ZjVlMzM0YjU1NTAyMzczNmY1ZTMzNGI1NzU0Mzc0YzQwMzk1NjcyNmQzODMyNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3ODJiNDI0MDRmNGU0MjZlNzU0ZTRlMzY1MjRlMzQzNTI0NDA1MjMzNTIyYjM3MzYyMzM3MzQzNjRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMzIzNzRlMzIzNjc3MmIzODMzMzYzMzcyMzczNzVhNTIzNjc4NTk0NzZmNzkzNzQ2NmU1ZTQwNzg1NzU0Mzc0YzQwMzk1NjcyNmQzODMyNDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3ODJiNGM3MDU0NTU3MzZkMzgyNjczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUzNzM2MjMzNzM0MzkyMzMzNGUzNzUxNTE0NzZmNTMyYjQ5NTc1NDM3NGM0MDM5NTY3MjZmNWUzMzRiNTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNDAzNzJiNGM3MDUzMmI0YjQwMzQyYTc3NDAzODRhNzg3MDUzMzc3MjcwMzk1YTc4NmY3NTc0MjQ2ZjI1Mzc0YjM5NWU1YTIzNmY3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzNzM5NWE3ODZmNzU0ZTI5NzAzOTVhNzg2Zjc4MmI0MjQwNTQyMzczNmQ1MzUyNGM1NTUzNTY3ODQwMzgyNjczNzAzODJhNzQ2ZjU0NGU0YjZlNWU0MDc4NDA0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NGY3NDU2NmU3OTMzNzg3MTUxMzc0YjZmNzkyYjRiNTg0ZjRlMzgyMTM4NGEyNDQwMzYzNzRiNmY3OTJiNGI1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNTU3ODRlNDU0MDM4NTI0YzQwMzQ0ZTQ5NmY3OTJiMjU2ZDM4MzM3ODU1NTM1MTczNzA3OTUyNDU2ZDM4MzI3MzcwMzk1YTc4NmY3NTRlNTYzMzRmMjY3MzM3Mzk1YTc0NDAyNTM2Mjg1NTRmMmI0YjQwMzk0MDQ4NmQyNTM2NzMzMTU0Mzc0YzQwMzk1NjcyNmQzODMyM2M1NTc1Nzc1NzRmNzc0ZTc1NmU1ZTMyNDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNzJiNDEyMTM4MmE3NzZlNTMzNzRiNTc1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjMzEzNzQ1N2E2ZjVlMzM3NDZmN2EzMjdhNTg0ZjRkN2E2ZDUzMzc0NTZmNGY3MDcwNTczMjQyNzc0MDM4MjE3MzZmMjUzNzQ3NDA1MjJiNWU0MDM4NGE3NjZlMjUyNDc4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzYyNTM3NDc0MDRmNGU1ZTQwMzg0YTc2NmUyNTI0Nzg1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NzM3MDI1NzgyMzZkNGY0ZTc2NmUyNTI0NDYyMTM4MmE3NzZmNGI0ZTc0NmU3OTMyNzM2ZTUzMmI3YTZlNGIyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNDg3MDRmNGU0MjZmMjQyYjI0NmYyNTM3NGIzOTI1NTI0OTZmNTQ1NjQ4NzA3OTM3Nzc1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc0MDdhNTY0ODZlMzcyYjI0NmYyNTM3NGI1ODc5Nzg3NzU3MzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4Nzg0ODcwMzQ0ZTc0NmY3OTM2NzM2ZTc5MmIyMzU1NTM1MjI0NzA1Mzc0NDg2Zjc5NzgyODQwMzgzMjczNzA1MzVmNzM3MDM5NWE3ODU1NTQzMzQxNmQzOTU5NzMyMTc5MmIyMzU4NzU0ZTUwNmUyNTJhMjMyMTM4NWEyMzU1NTE0ZTRlNzA3OTM3NGM3MTc1NGUyMzZlNGI0ZTdhNDAzOTMyNzMyMTM5NGU0OTZmNzkyYjI1MjEzODQ5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZTQxNDAzODRhNDkzOTVlMzM3ODcxNTQzMjczMzEzNDRkNzU1NTc1NTY1NjZlN2E1YTIzMjEzODcwNGIyMTM4MjM3MzM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTRmNmU1ZTMyNzMzMjI1MmI0NjZlMzg1MjQ3NDA1NDU5Mjg0ZjczNDE0ODcwMzgyYTc1MjEzODI2NzM1ODM0NGU1YTZlMjUyYTQyNzA1MzJiNGI1NTUzNTI0NzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzQwNzkyYjRiNTU1NDM3NDcyMTc5NTI0NzZlNzk3ODQ3NDA0OTQxNDgyMTc5NTI0NzU1NGYyMzczMzUzODJiNDc2ZDM5MzM0ODZmNzU0ZTc0NmU3NTRlNzQyMTI1NWE0ODcwMzgyYTIzNTU1MzQwNDg2Zjc1NGU3NTIxMzgyYTQ3NmQzODJhN2E0Zjc1MmI0YzcwNTM1MjIzNzAzOTU5NzM1ODM0NGU1MDZkNTMzNzc2NmQ0YjRlMjM2ZDUzMzY3MzIxNWUzNzRiNmY3OTM3NDc3MDRmNGU0YzcwNTM1MjIzNzAzOTU5NzM2ZTI1MjE3MzIxMzgyNjczMjEzODVhNzY2ZTVlMzc0NzcwNGQ0MTQ4NzA3OTM3NGI2ZDM0NGQ0NjU1NTEyNDQ4NmU3OTc4MjM2ZTVlNTU3MzIxMzgyNjczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTc5NmU1ZTU1NzM3MDc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU1NTQ1YTIzMjEzOTMzMjQ2ZjQ5NDE0ODZmNWUzMzQ4NmY0ZjRkNDY1NTUyNWEyMzZlNWU0ZDczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0YjRlNzQ1NTU0NWE0OTQwMzg1YTQyNDA3OTc4NzY1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM1NzUzNDA0ODZmNzU0ZDQ4NzAzODJhNzUyMTM4MjY0NTU1NGYyYjc1MjEzODI2NDU1NTRmMmIyNTQwMzk1NjQyNTczMjQxNDg2ZTUzNzg0YzcwNGY0ZDQ2NTU1MjVhNDE2ZTVlNmY3MzIxMzg0YTQ1NTU1MzUyNzYyMTI1MmIyNDZlN2EzMzRjNTU1MzVhMjQ2ZjdhNTY3ODZlN2EzMzQ1NzEzNDRlNzU0MDM4Nzg0NzQwNGI0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMjU3NTg1ZTRlNDI2ZTc5NmY3MzU4MzQ0ZTUwNmQ1MzM3NzY2ZDRiNGU3NTZlNWUzMjczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczNzA1Mzc4NDY0MDMyNDE0ODZkMzgyYTc5NmU0YjRkNDY1NTUyNWE0MTZlNWU2ZjczNzEzODJiMjQ2Zjc1NGU0OTZmNzkyYjc5NmQzODRhNzg1NTUzNzg0NzQwNzkyYjRiNmUzODUyMjM2ZDM4MmI0NzRmNzUyYjQyNDAyNTc4NDc0MDc5NWY3MzU4MzQ0ZTU0NDAzOTMyNzM0MDUzMzcyMzIxMzg3ODQ1NDAzODMyNzMzNDM4MmE0YzcwNTM1MjdhNmY3OTUyNDY1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM2ZDM4MmE3OTZlNWU1NjQ2MjEzOTMzNDI2ZTI1MjY1NzRmNzc1Mjc3NmUzODc4NDc1NTUxNWE0ODZlMzgyNDc0NmU3OTMzNGM1NTRmNzQzMTcwMjUyYTc4NmY3NTRlNDg2ZTc5NGEyYTU3MzU0MTU3NTgyNTcwNGIyMTM4MmEyMzU1NGYyMzczMzIzOTRlNDk2Zjc5MmIyNTQwMzQ0ZTc0NTU1NDM3NGM0MDM5NTU3MzcwNTM1ZjczNzAzOTVhNzg1NTU0MzM0MTQwMzQ0ZTc1NmU1ZTMyNTc1ODVlNTY3ODcwNzkyYjQ0NDAzNDRkNDY1NTUyMzc0NzIxMzk0ZTQ5NmY3OTJiMjU0MDM0NGU3NDU1NTQzNzRjNDAzOTU1NzM3MDUzNWY3MzZmNzkzNzRjNzA1NDU2NDIyMTVlMzI3MzIxMzg1YTc2NDAzOTVhNGM0ZjczNDI1MDZlMjUyYTIzMjEzODVhMjM1NTUxNGU0ZTcwNzkzNzRjNzE3NTRlNzk2ZTVlNTU3MzZmNWUzNzQ5NmY1MzJiNGI3MDRmNTU3NTU1NzM0MTczNTU0ZjRkNzM0Zjc1NGQ3MzU1NGY0ZDc2NTU1MTMzNzgyMTI1MmI3NzQwMzQ0ZTc0NmU3OTMyNzM2ZjI1Mzc0NzQwNGY0ZTQ1NmUyNTcwNDg1NTU0NzA0MjcwNTM3MzczNzA1MzM3MjY3MDRkNDE3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNGE0ODQwMjUyYjcyNDA1MzUyMjMyMTM0NGQyYjU1NTM1Njc0NmYyNTM2MjU1YTRmMmE3NTVhNzYzMzc3NDAzODVhNDg0MDUzMzY0MTMyNzcyYjM2MzkyMzRhMzEzMzIzMmI3MjMyNzc1MjM1MzMzNTIxMjM1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRjNDAzODJhNzczOTVlNGU0MTZlNWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3MjEyNTc0NzQ3MDRmMmE0MjQwNGY0OTczNmU1MzJiN2E2ZTI0MmI3NzIxMzkzMzc0NTg0ZjRlNzYyMTM5NGUyMzZkMzgyYjQ3MzEzODc0Nzg2ZTU0NGU3MjcwNTMzNzI2NzA0Zjc3NTc1NTRmNGQ3MzU1NTMzNzI2MjEyNTM3NDk3MDUwNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNmQ1MzM3NDU2ZjUyMmIyMzQwMzk3NDIzNTczMjQxNTczMjUzNTY0ODcwNGYyYTQ2NDAzOTVhNGMyMTM4NzA3ODM5MjU3NDc0NmU3OTMzNDU0MDM5NTU0MTIxMjUyYjQ2NmUzODUyNDc0MDU0NTkyYjM4NGI3MDQ5NmQzODJhN2E1NjI0MjM0MjRmNzkzMzc4NDA3NTRlNDk2ZDM4MmE3YTM5MjU1YTQ4NmUzODI0NzQ2ZTc5MzI0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1MDZkNTMzNzc2NmQ0YjRlNzU2ZTVlMzI3MzZmNzkzNzRjNmY1MzJiNDc2ZjI1MzY3MzcwNTM3ODQ2NDAzNDI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1Mzc4Nzk1NTUzMmE0ODcwNGY0ZTQyNmYyNDJiMjQ2ZjI1Mzc0YjM5MjU1MjQ5NmY1NDU2NDg3MDc5Mzc3NzU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1Nzg3ODQ4NzAzNDRlNzQ2Zjc5MzY3MzZlNzkyYjIzNTU1MzUyMjQ3MDUzNzQ0ODZmNzk3ODI4NDAzODMyNzM3MDUzNWY3MzcwMzk1YTc4NTU1NDMzNDE2ZDM5NTk3MzIxMjUyYjQ2NmUzODUyNDc0MDRmMjY3MzMyMjUyYjQ3NzA1MzUyNzY3MDRmNGU0ZDMyMzk0MDc4NmY1ZTQxNzM3MDUzNWY3MzQwMjUzNzIzNTU1MzUyNDk2ZjU0NTY0ODcwNzk1MjQ1NTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NGY3NTRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NzMzMTM0NGUyMzZkMzgyNDc4NTg3YTMzNDI2ZTM4MzY0MTU3MzI0MTczNTU0ZjRkNzM2ZjI1Mzc0NzcwNTIyYjQ2NDAzOTVhNGMyMTM4NzA3ODU1NTAyMzczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTYzMjZkMzgyYTdhNmQzODJhN2E1ODc1MjY0NzU1NzU3NzU3NTU0ZjRkNzM1NTUzMzc0NzQwNTIyYjIzNmQzODI0Nzg1NTUwMjM3MzcwNTM3ODQ2NDAzNDJhMjM2ZDM4MjQ3ODU3NGY3NzU3NTU0ZjRkNzM1NTRkNDE3MzU1NGY0ZDczNmY1Mzc4NDc0MDI0MmI0NjZmNGI0ZDJiNTU1NDU2NDg3MDM4MmE3NzU3NGY3NDc4NmU3OTMzNzI3MDUzNzg0NjQwMzQ0ZDQ2NTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM2NDI1NTRmNDE3MzU5MzU0ZDQ5NTk0ZjQ5NzM1OTc1Nzc1NzU1NGY0ZDczNTU0ZDQxNzM1NTRmNGQ3MzIxNzkyYjIzNTg3OTM3Nzc2ZDM5MzM3MjZlMzgzNzRjNmYyNTUyN2E0MDM3MmIyMzQwMzk3NDIzNTc0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzIxNzUzMjc5MmIyMzU1NTM3ODRjNTU1MzJiNDc2ZTUzNzg0NzQwMzQ1MTczMzgzODJiMjQ2Zjc1NGU3NjcwMzk1NjRiNDAzODJhMjM1NTU0NGU0MjZlNzk2ZjI4NTU1NDQ2NDk2ZDM4MmE3YTM5MjUyNDRjNzIzODI0NGM1NTc1NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0NjQwMzk1YTRjMjEzODcwNzg1ODc5NWE0MTIxMzkzMjQ3NmQzODMyNDU0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjI1Mzc0NzcwNTIyYjQ2NDAzOTVhNGMyMTM4NzA3ODU4NzkyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjZkMzgzMjU3NTU0ZjRkNzM1NTRmNzc1NzRmNzc0ZTc1NmU1ZTMyNDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNzJiNDEyMTM4MmE3NzZlNTMzNzRiNTc1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjMzEzNzQ1N2E2ZDM4MmE3OTZlNGI3MDcwNTczMjQyNzc0MDM4MjE3MzcwMzk1YTc4NmY3ODJiNDI2ZTc5NDA0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMzNTM3ODRjNmY1MzRhNzQ3MTM0NGUyNDZmMjUzNzRiNTU1Mzc4NDc0MDc5MmI0YjZlMzg1MjIzNmQzODJiNDc1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM2ZDM4MjE3MzZlNzkyYjIzNTU1Mzc4NGMzOTVlMzc0YzQwMzk1NjcyMjEzOTRlNDk2Zjc5MmIyNTQwMzgzMjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDc1MzgzODJiMjQ1NTUzNTI0YjQwMzQ0ZTQ3NmU1ZTMyNzMyMTM5MzcyMzZkNTMyYjRiNmQzOTQyNzg0MDRmNGUyMzZlNGI0ZTI0NmYyNTM2NzM3MDUzNzQ0MjZmNGI0ZTc2NmUyNTI0NDYyMTM4MmE3NzU4NzU0ZTUwNmUyNTJhMjMyMTM4NWEyMzU1NTE0ZTRlNzA3OTM3NGM3MTc1NGUyMzZlNGI0ZTdhNDAzOTMyNzMyMTM5NGU0OTZmNzkyYjI1MjEzODQ5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM3MDM5NWE3ODZmNzU0ZDJiNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NDA3YTU2NDg2ZTM3MmIyNDZmMjUzNzRiNGY3NTRkNzM1NTRmNGUyNDZmMjUzNzRiMzk1ZTVhMjM2Zjc1NGQyYjU1NTQ1YTIzNmY3NTc0MjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczMjQxNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzY1NTUxNzA3ODcwNGY0ZTRjNzAzODU2NGMyMTVlNTY0MjZmNTQzMzQyNmUyNTI2NzM2ZDM4MmE3OTZlNDk0MTczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3NTJhNDI0MDRmNGU0MjZlNzU0ZTRlMzM1MTI0NTYzNTc4MmI1NjMzNTI1OTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTM3NzU2ZjI1NWE0YjZkMzk0ZTIzNmQzODJiNDc1NTUwMjM3MzU1Nzc1Mjc3NmUzODc4NDc1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjZmNTM3ODRiNzEzNDRkMmI1NTRmNTYzMDQwMzk0MDc4NmY3NTU1NTc1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM3MDM5NWE3ODZmNzgyYjRjNzA1NDU1NzM2ZDM4MjY3MzM3Mzc1YTUyMzY3ODJiNTEzMjM3MzM0ZTMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTI0MjE3YTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3NTRkMmI1NTRmNTYzMjZmNzkzNzQ2NmQzOTM3NDY1NTczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzcyNjZmNTM3ODRiNzEzNzJiNzcyMTM5MzM3ODU1NTAyMzczMzczNzVhNTIzNjc4MmI1MTMyMzczMzRlMzg1ZTM3NGM0MDM5NTY3MjZmNWUzMzRiMzkzNDJhN2E0MDM5MzI0MTU2MjUzNzI2NmY1Mzc4NGI3MTM0NmY0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNDAzOTc0NDk2ZDM5NTYyYTM5MjUzMzc0NzA1MzM2NzMzMTM1MjM3MzU2MjU3ODQ3NDA3OTc4NDc2ZDM5MzMyYTU2NGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM0MDM5NzQ0OTZkMzk1NjJhNTU1MDIzNzM1NTc3MmE3ODcwNzkzNzRiNTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3MjY2ZjUzNzg0YjcxMzQ0ZDJiNTU1MzM3MjY2ZjUzNzg0YjcxMzcyYjc3MjEzOTMzNzg0Zjc1NGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NWEyNDIxN2E1YTc2NmY3OTc4NDk3MDUzNzg0ODZlNzU0ZDJiNTU0ZjU2NTM2Zjc5Mzc3ODU1NzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzI2NmY1Mzc4NGI3MTM0NGQyYjU1NGY1NjMwNTgyMzUxNzU0Zjc1NGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTUzNzg0NzQwNzkyYjcyNzA1MzM3MjY3MDRmNGQyYjU1NTMyMTc1NTU3NTU2Mzc2ZjI1Mzc0YjU1NTE3ODQ3NDA3OTJiNGI2ZTM4NTIyMzZkMzgyYjQ3NGY3MzQyNDA2ZTVlMzc0YjU1NTMyYTc0NmUzODM2Mjg1NTU0NDYyNDZmMjUzNzRiNTg3OTQwNDI2ZjdhNWEyMzM5MjUyYTc0NmUzODM2NzM2ZTVlNTU3MzU2MjMyYTQ4NzA0ZjRlNGM0MDM5MzI3YTcyMzQ0ZTI5NzAzOTVhNzg2Zjc1MmE0NTIxMzk1YTIzMzkyNTJhNzQ2ZTM4MzY3MzZlNWU1NTczNTY0YjcwMmI0Zjc4Nzg0ODcwMzk1NTczNzA1MzM3NDU0MDM4NzA0YjIxMzgyMzczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjI4NTU1MTRlMjk3MDM5NWE3ODZmNzUyYTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZTQ4NmY3NTRkN2EzNTc5MmIyMzU1NTQ1YTc4NzA0ZjcwMmI0Zjc4Nzg0ODcwMzk1NTczMjEyNTc0NzQ3MDRmNGU1NjMzNTA0MTczNzE1ZTM3NGM0MDM5NTU0NzZkMzgzMzJiNGY3ODVhMjQyMTdhNWE3NjZmNzk3ODQ5NzA1Mzc4NDg2ZTc2NDE3MzcxNWU1YTI0MjE3YTVhNzY2Zjc5Nzg0OTcwNTM3ODQ4NmU3YTIzNTczMzM5NzQ0OTZkMzk1NjJhNTU1MzMzNzQ3MDUzMzYyODU1NTQ0Njc4NzE1NDRlNDI2ZjdhNzgyYjU1NzU1NTc1NGY3NTRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU0MjZlNzk0MDQ4Mzk1ZTMzNzg3MTU0MzI0MjRmNzM0MjRkMjE3OTJiMjM1ODc5MjQ3ODZmNWU1YTc0NDAyNTM3NzI2ZDUzNTI0NzQwNTM0YTc4NmY3NTc0NzY2ZTI1MjQ0NjIxMzgyYTc3NmY0YzI0NmU1NjI1Nzg3YTZkMzgyYTc5NmU0YjcwNzA1NzMyNDI3NzQwMzgyMTczNmQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2MzkyNTc4NDc0MDc5NWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1NDQwMzkzMjczNDA1MzM3MjMyMTM4Nzg0NTQwMzgzMjczMzQzODJhNGM3MDUzNTI3YTZmNzk1MjQ2NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjczNmQzODJhNzk2ZTVlNTY0NjIxMzkzMzQyNmUyNTI2NDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0NzZlNWUzMjczNmQzOTVhNzI3MDM5NWE3ODZmNzgyYjc0NmY1NDRlNGI2ZTVlNDA3ODQwNGY3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0Zjc3Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NGY1NjQwNmU1ZTM2NzMyMTM5NTY3ODU1NTMyYTQ4NzA0ZjRlNzQ3MDM5MzM0MTZlNWU1NjQyNzE3OTM3Nzc1NTU0MzM0ODU1NTQzNzRjNDAzNDRlMjM2ZDUzNzg0YzU1NTM1YTQ4NmUzODI0NzQ2ZTc5MzI0NzU1NTE1YTQ4NmU3YTMzNzQyMTVlMzI3MzMyNTE1MjI1NDAzOTVhMjg1NTU0MzM0ODU1NTM3MDc4NzA0ZjRlNzQ2ZjU0NGU0YjZlNWU0MDc0NmU0ZjI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDRkMmI1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NDc3MDUzMzcyNjcwNGYyYTRjNmY1MzRhNDI3MDRmNzM3YTU1NGY2ZjQyMzg0YzUyNzA0Zjc1NGQ3MzU1NGY0ZTc4NzE1MzVhNzg2ZjU0MzI3MzM0MzgyYTc3NDAzOTc0NTI2ZjdhNTY0ODZmNzY0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM1NTc4NGU0NTQwMzg1MjRjNDAzNDRlNDk2Zjc5MmIyNTZkMzgzMzc4NTU1MzUxNzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDc1NTUyMzc0YzIxMzg3MDc4MzA3NTRkNDg2ZDM4NzA0MjZlNzk0MDQ4NTU1MDRhMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NGY1OTczMzYyNTM3NDc0MDRmNGU0NTZlMjU1Mjc3NmQzODJhN2E1NTUzMjQ3ODZmNWU1YTc0NDAyNTM2NTc1NTRmNGQ3MzU1NTM0YTQ4MjEzODMzNDI2ZTc5NzA3MjZlMzk1YTdhNTU1MDIzNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NGY1NjU0NDAzOTMzMjM2ZDM4MmE3YTU1NTE3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzQ0ZTQyNmU3OTQwNDg2Zjc5MjQ3NDcwNTM3ODQ4NmU3NTI2NDc1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI2ZTc5NDA0ODU4NGY0ZTQ5NmY3OTJiNzk2ZDM4NGE3ODM5NWU0ZTQyMjEyNDJiMjQ2Zjc5NDk3MzMxMzQ0ZTdhNDAzOTMzNzI2ZDM4MmE0YzcwNTM1MjdhNmY3OTUyNDYzOTI1Nzg0NzQwNzk1ZjQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0YjRlNTE0MDM4NGE3ODcwNTMzNjczNmU1MzJiNzQ0MDUzNzg0NzQwNGI0ZTQ2NDAzOTVhNGMyMTM4NzA3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3OTMzNzg2ZTUzMzcyMzQwMzcyYjQ2NDAzOTVhNGMyMTM4NzA3ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzIxMjU3NDc0NzA0ZjJhNDI0MDRmNDk3MzZlNTMyYjc0NDA1Mzc4NDc0MDI0MmI0NjZmMjU2ZjQ3NmUzODM3NGM2ZjI1NTI3YTQwMzcyYjQyNDA0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNDI0MDc1NGU0OTZmNzkyYjc5NmQzODRhNzgzOTVlNGU0MjIxMjQyYjI0NmY3OTQ5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY1OTczMzM1MzJiNWU2ZTc5NGE0ODIxMzgzMjczNmY1NDU2NDg0MDc5Nzg0NTQwMzQ0ZTQ5NmQzODVhMjM3MDM5NTY3ODU1NTM1MjQ3NDA0ZjRlNGM0MDM4MmE3NzU1NTQ3MDQyNzA1MzczNzM2ZDM4MmE3OTZlNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0OTZkMzg1OTczMzEzNDRlN2E0MDM5MzM3MjZmNTQ1NjQ4NDA3OTc4NDU0MDM3MmI0OTZkMzg1OTQxNmY1NDU2NDg0MDc5Nzg0NTQwMzcyYjQ5NmQzODVhNzI3MDM5NTY0NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmY1Mzc4NzY1NTUzNzg0YzU1NTMyYTQ4NzA0ZjRlMzA2ZTI1MmE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YzQwMzgyYTc3Mzk1ZTRlNDE2ZTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzIxMjU3NDc0NzA0ZjJhNDI0MDRmNDk3MzZmNTM3ODc2NTg0ZjRlNzYyMTM5NGUyMzZkMzgyYjQ3MzEzODc4NDc0MDc5NWY0NTU1NTQ0ZTc0NmY3YTVhNzgzOTI1MjQ0ODQwNTMzNjJiNTYyMzI0NzQ2Zjc5NDY3NzZlNWU3MDQ3NTY0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzM3NDU2ZjI1MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzNzg0NzQwNzk1ZjQ1NTU1NDRlNzQ2ZjdhNWE3ODM5MjUyNDQ4NDA1MzM2MmI1NjIzMjQ3NDZmNzk0Njc3NmU1ZTcwNDc1NjRiNzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1Mzc4NDc0MDc5NWY0NTU1NTQ0ZTc0NmY3YTVhNzgzOTI1MjQ0ODQwNTMzNjJiNTYyMzI0NzQ2Zjc5NDY3NzZlNWU3MDQ3NTY0Yjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1NzgzMzQxNmQzOTU5NzMyMTM4NWE3NjZlNWUzNzQ3NzA0ZjRlNDI2ZjRiNGUyNDZlNzk1MjI1MjEzODc4NDUyMTM4NTY0NTQwMzQyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ1NzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTUyNzE1MzVhNzg2ZjU0MzM0MjZlMjUyNjczMjEzOTU5NzM0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NDAzODMzNDI3MDUyMmI0NjQwMzk1YTRjMjEzODcwNzgzOTVlMzM3ODcxNTQzMjQxNTU3ODMzNDE2ZDM5NTk3MzIxMzg1YTc2NmU1ZTM3NDc3MDRmNGU0MjZmNGI0ZTI0NmU3OTUyMjUyMTM4Nzg0NTIxMzg1NjQ1NDAzNDI2NzU1ODRmNGU0NjQwMzk1YTRjMjEzODcwNzg1ODc5NWE0MTIxMzkzMjQ3NmQzODMyNDU1NTUzNGE0ODIxMzgzMzQyNmU3OTcwNzI2ZTM5NWE3YTU4NzkyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjZkMzgzMjQyNGY3MzQyNGQyMTc5MmIyMzU4NzkyNDc4NmY1ZTVhNzQ0MDI1Mzc3MjZkNTM1MjQ3NDA1MzRhNzg2Zjc1NzQ3NjZlMjUyNDQ2MjEzODJhNzc2ZjRjMjQ2ZTU2NWU1YTIzMjEzOTMzMjQ2ZjRiNzA3MDU3MzI0Mjc3NDAzODIxNzMyMTI1NzQ3ODIxMjU0NjcyNmY1ZTMzNzQ3MDU0Mzc0YzU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTMyMjU3NDc4MjEyNTQ1NzM3MDUzNzQ3ODU1NTM1YTI0NmY3YTU2Nzg2ZTdhMzI3MzZmNWUzMzc0NzA1NDM3NGM1NTUzMmI3OTU1NTM1MjQ3NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNDc2ZTVlMzI3MzZkMzk1YTcyNzAzOTVhNzg2Zjc4MmI3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDRmNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc1MmE0MjQwNGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTY0MDZlNWUzNjczMjEzOTU2Nzg1NTUzMmE0ODcwNGY0ZTc0NzAzOTMzNDE2ZTVlNTY0MjcxNzkzNzc3NTU1NDMzNDg1NTU0Mzc0YzQwMzQ0ZTIzNmQ1Mzc4NGM1NTUzNWE0ODZlMzgyNDc0NmU3OTMyNDc1NTUxNWE0ODZlN2EzMzc0MjE1ZTMyNzMzMjUxNTIyNTQwMzk1YTI4NTU1NDMzNDg1NTUzNzA3ODcwNGY0ZTc0NmY1NDRlNGI2ZTVlNDA3NDZlNGYyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZDJiNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NzA1MzM3MjY3MDRmMmE0YzZmNTM0YTQyNzA0ZjczN2E1NTRmNmY0MjM4NGM1MjcwNTg3OTRhNDg3MDI1Mzc0YjU3NGY3NzU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTY2ZTc5MzM3ODcxNTEzNzRiNmY3OTJiNGIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDc1MzY1MzRhNzgyMTM5NWE3ODU1NTQ0ZTRiNmU1ZTQwNDI0MDUzMzY3MzIxMzQ0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQyNjczMzczOTVhNzQ0MDI1MzYyODU1NGYyYjRjNzA1MzUyMjM3MDM5NTk3MzMxNTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODMxNzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM2ZjVlMzM3NDcwNTQzNzRjNTU1MDIzNzM0MDI1MzcyMzM5MjU3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzcyYjRjNzA1MzUyMjM3MDM5NTk0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU0YzcwNTM1MjIzNzAzOTU5NzM2ZDM5NTk3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjM3NmU3OTUyNzU2ZTUzMzY3MzcwNTM1ZjczMjEyNTc0NzgyMTI1NDU3MzcwNTM3NDc4NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZTQ4NDA3NTRlNGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0MjY3MzM2NTM0YTc4MjEzOTVhNzg1NTU0MzM0YjcxMzQ0ZTc0NDAyNTUyNDI2ZTc1NGU0NTIxMzkzMzc4NmY3NTI2NzU1NzMyNDE3MzU1NGY0ZDczNDAzODRhNDI0MDc1NGU0YzcwNTM1MjIzNzAzOTU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNzM2ZDM5NTk3MzIxNWUzNzRiNmY3OTM3NDc3MDUzNGEyYTU1NTE1Mjc2NzA1Mzc4MjU0MDM0MjY3NTU3MzI0MTczNTU0ZjRkNzM0MDM4NGE0YzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTQyNmY0YjRlNzY3MDM5NTY0YjQwMzgyYTIzNmU1NDc3NzMzMjc5NTI0NzZlNzkzNzc3NTg3NTU1NDI0ZjczNDI3NzQwMzgyMTczMjEzODMzNzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNzI2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2Zjc1NzQyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NDk3MzcwMjU1MjIzMjEyNTc0NzI3MDU0Nzg0OTQwMzQ0OTczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0OTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjM1NzAzODU2NGMyMTVlNTY0MjIxNzkzNjczMjEzNDRlMjQ2ZjI1Mzc0YjU1NTQzMzQ4NTU1NDMzNDE0MDM0NGU0YzZkNTM1MjRiNDAzODMyNzMyMTc5NTI0NzU4NWUzNzQ3MjE3OTUyNDc1NTU0NzA3NDcwNTM1YTQxNTU1MzJiNzk1NTUzNTI0NzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI0NTU1NTQ1YTIzMjEzOTU2MjM2ZDM4MmE3YTU1NTQzMzQxNDAzNDRlNWUyMTM5MzM3NjZkNGY0ZTQyNDA3NTRlNDc0MDM4Mzc3NzQwMzgzMjQ3NGY3MzQxNzM1NTRmNGQ3MzM2NzkzNzIzNzAzOTU2NDc2ZjRiNGU1MzIxMzg0YTRjNDAzNDRlNDI0MDc1NGUyMzZkNTMzNjczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTQyNmY0YjRlNzQ2ZTU0NTY3ODIxMzgzMzJhNTU1NDcwNzQ3MDUzNWE0MTQwMzgzMjczNzA1Mzc0Nzg1NTUzMmIyMzZkNTMzNzRiNTU1NDcwNzQ3MTM0NGU0YjZlNWUzNzQ3NDA0ZjI2NTc1NTRmNGQ3MzU1NGY1NTc1NTU3MzQxNzM1NTRmNGQ3MzZmNWUzMzc0NmY3YTMzNzI3MDUzNzg0NjQwMzQ0ZDJiNTU1MzMzNzQ3MDUzMzcyMzZkMzgyNDc4NTg3OTJhNDg3MDRiNzM0MjU4N2E1YTIzNmY3OTQwMjM2ZDM4MjQ3ODU3NGY1NTc4MzgzNDIzNzg2ZTM0MjM3ODQwNGY0ZDc4MzQ1MDQxNzgzNTM1NDE3ODM2NGI1NTQyNGY3NTRkNzM1NTRmNGU1ZTZkMzkzMzQxNTU1NDcwNzQ3MDUzNWE0MTQwMzk1YTcyNmU1MzJiNzY2ZDRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1MzM3NDcwNTM1MTczMzEzNDRlNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NDc0MDI1MzcyMzU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzUyNzYyMTI1MmIyNDZlN2EzMzcyNDA1MzUyMjMyMTM0NGU0MjZmNGI0ZTQ3NmU1ZTMyNzMzNTc5MmI0NzQwMzQ0ZTc0NmU3OTMyNzMyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNzcyMTM5MzM3NDM4NGI3MDIzNzEzOTRlNzg1NjI0MjM3MzU1MzUyMzczNzAyNTUyMjMyMTI1NzQ3MjcwNTQ3ODQ5NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc1NTUxNDA3NDZlNTQ1YTc4NGY3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzJhNzg3MDI0MmI1ZTIxMzkzMzc2NmQ0ZjRkMmI1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDUzNTIyMzIxMzQ0ZTQyNmY0YjRlMzA2ZTI1MmE3ODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmU3OTM3NWUzOTVlNzA3NDcwNTM1YTQxMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NDIxMjU1YTQ4NzAzODJhMjMzOTI1MzM3NDcwNTM1MTczMzEzNDRlNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDVhNmU3MDM5NWE3ODZmNzkyYTc0NmUzODM3NzA1NTUwMjM3MzcxNDk0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU2MjUzNzI2NmQzOTVhMjM2ZjRiNmYyODU1NTQ3MDc0NzA1MzVhNDEzOTVlMzMyYTZmNTMzNjczMzEzNTIzNzM1NjI1NTY3NDZlNzU2ZjQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDdhNmY1ZTMzNzQ2ZjdhMzM3MjcwNTM3ODQ2NDAzNDZmMjg1NTU0NWEyMzIxMzk1NjIzMzk1ZTMzNDI2ZTM4MzY0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3YTcwNTQ3ODQ5NDAzNDZmMjg1NTU0NzA3NDcwNTM1YTQxMzk1ZTMzMmE2ZjUzMzY0NTRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3YTZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmN2E1OTdhMzA3NTRlMjk3MjMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTJiNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3NTRkMmI1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI0MDUzNTIyMzIxMzc0NTdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2EzOTM3NDY0YzcwNTQ1NTQxNzAzOTVhNzg2Zjc4MmI0MjQwNGY3ODcwNTU1MDIzNzM3MTRiNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjRjNDE3MzIxMjU3NDc0NzA1MjJiNDI0MDRmNDk3MzU2NWU1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNjdhMzA3NTRlNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg3MjMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTc4NzAyNDJiNWUyMTM5MzM3NjZkNTA0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjVlMzM3NDcwNTMzNzcyNmY1ZTMzNDg2Zjc5MzY0NzZmMjU1MjI1NDAzNzJiNWUyMTM5MzM3NjZkNGY3MzdhMjEzODVhNzY2ZTVlMzc0NzcwNGY2ZjQ1NTU1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRlNzQyMTI1NWE0ODcwMzgyYTIzMzkyNTMzNzQ3MDUzNTE0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzc0NzA1MzM3NzI2ZjVlMzM0ODZmNzkzNjQ3MjEzODMzNzczOTVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTU0MTU2MjU1Mjc2MjEyNTJiMjQ2ZTdhMzI3YTU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0OTczNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3NTc3NTc0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNDc0MDM5NzA3MjcwMjU1MjIzMjEyNTczMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjVlMzM3NDZmN2EzMzcyMjEzODVhNzY2ZTVlMzc0NzcwNTIyYjQ2NmUyNTJhNDI3MDUzMmI0YjU3NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU4NGY0ZTc3NDAzODRhNzQ3MTM1MjQ0ZjMyMzYyYTcyMzIyMzc0NTIzMjIzNDY3MjM0MzYyYTM2MzMzNzU2MzgzMjM2NDk0MjRmNzU0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzc1NDU2MjQ0MDMyNDE1NzMyNTM1NjQ4NzA0ZjJhNDY0MDM5NWE0YzIxMzg3MDc4MzkyNTc0NzQ2ZTc5MzM0NTQwMzk1NTQxMjEyNTJiNDY2ZTM4NTI0NzQwNTQ1OTJiMzg0YjcwMjQ2ZTc5NTY3NDZlNzU3MDcwNTczMjQyNzc0MDM4MjE3MzcwMjU1MjIzMjEyNTc0NzI3MDM4MmE3NTIxMzgyNjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjVhNmUyNTJhNDI3MDUzMmI0YjU1NTM1MjQ3NTU1MzUyNzYyMTI1MmIyNDZlN2EzMjczNDA3OTJiNGI1NTU0Mzc0NzIxNzk1MjQ3NmU3OTc4NDc0MDRiMjY3NTU1NzU1NTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNDI2ZjI0MmIyNDZmMjUzNzRiMzkyNTUyNDk2ZjU0NTY0ODcwNzkzNzc3NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NDA3YTU2NDg2ZTM3MmIyNDZmMjUzNzRiNTg3OTc4Nzc1NzM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNTU3ODc4NDg3MDM0NGU3NDZmNzkzNjczNmU3OTJiMjM1NTUzNTIyNDcwNTM3NDQ4NmY3OTc4Mjg0MDM4MzI3MzcwNTM1ZjczNzAzOTVhNzg1NTU0MzM0MTZkMzk1OTczMjEyNTJiNDY2ZTM4NTI0NzQwNGYyNjczMzIyNTJiNDc3MDUzNTI3NjcwNGY0ZTRkMzIzOTQwNzg2ZjVlNDE3MzcwNTM1ZjczNDAyNTM3MjM1NTUzNTI0OTZmNTQ1NjQ4NzA3OTUyNDU1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0ZjczNDE3MzU1NGY0ZDczNzA1NDU2MmEzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NTUwMjM3MzZlMzgzNzRjNmYyNTUyN2E0MDM0MmEyMzQwMzk3NDIzNTg3YTVhNDk2ZTUzNzgyMzU3NGY2ZjczNTY0Yjc4NmU1OTM3MjM0NzZlNTMyYjVlNDAzOTU1NDE1NzMyNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NTE3ODQ3NDA1MzM3MjYzMzM5NTY0YjZlNWU1NTI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTYzMjZlNTMzNzc0NmYyNTM2NzM2ZjU0NTY0ODcwNzk3ODc3NDAzNDRlNzQ1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODc1NGUzNzZmMjU1MjdhNDAzNTQxNzM1ODVlMzc0NzIxNzk1MjQ3NTU1MDRhMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTM3ODc5NTU1NDVhMjM2Zjc1NzQ0NjQwMzk1YTRjMjEzODcwNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc1MmE0MjQwNGY3NzczNmQzODI2NzM2ZTM4MmI0NzZkMzkzMzQ4NmY3OTM3NzczOTI1NTI3NjIxMjUyYjI0NmU3YTMzNGM1ODc5NzA3ODcwNGY3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzE1ZTIzNDI1ODc5NzA3ODcwNGY3MzdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2E1ODRmNGUyOTcyMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNmQzOTU5NzMyMTM4NGE0YjQwMzg1Mjc3NzEzNDRlNzU0MDM4Nzg0NzQwNGI0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMjczNDA3OTJiNGI1NTUzNTY3NDZlNzUyYjI0NmU3OTU2NzQ2ZTc1MjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU1MzM3MjY2ZDM5NWEyMzZmNGI0ZDJiNTU1MzcwNzg3MDUyMmI0MjZlN2E1YTIzMjEzODcwNGIyMTM4MjQ3MjZmNWUzMzc0NzA1NDM3NGM1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzMyNDE3MzU1NGY0ZDczNmQzODIxNzM0MDM5NzQ0MjZmNWUzMzRjNTU1Mzc4NGM1NTUxMmE0ODZlNzkzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTM3MzgyYTc0MjE3OTRhNzg1NTU0MzM0ODU1NTM1YTQxNDAzODVhNDQ1NTU0MzM0MTQwMzQ0ZTRjNzA1MzUyMjM3MDM5NTk3MzZlMjUyMTczMzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNDc1NTUyMzM0YjcxMzQ0ZTc0NDAyNTUyNDI2ZTc1NGU0NTIxMzkzMzc4NmY3NTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzM3MjY2ZDM5NWEyMzZmNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTQyNmY0YjRlNzQyMTVlMzM0MjcwNzkzNjQ3NTU1MTJhNDg1NTUzMmE3ODQwMzgzMjczNzA1MzVmNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3NTRlNzk2ZTVlNTU3MzcwMzgyYTc1MjEzODI2NDc1NTc1Nzc1NzU1NGY0ZDczNTU1MzM3NDU2ZDM4MjE3MzZlNzkyYjIzNTU1MzUyNzc0MDUyMmI3NDIxMjU1YTQ4NzAzODJhMjMzOTVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTU0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0NTU1NGY3MDI0NmU3OTU2NzQ2ZTc1NmY0NTU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTg0ZjRlNDY0MDM5NWE0YzIxMzg3MDc4NTg3OTQwNGI2ZTI1MjQ3MjcwMzk1YTc4NmY3NTJhNDI0MDRmNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzZkMzk1OTczMjEzODRhNGI0MDM4NTI3NzcxMzQ0ZTc1NDAzODc4NDc0MDRiNGU0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzI3MzQwNzkyYjRiNTU1MzU2NzQ2ZTc1MjY3NTU3MzI0MTczNTU0ZjRkNzM0MDM4NGE0YzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc1NmU1ZTMyNDc2Zjc5Mzc0OTZlNTQ3ODcyNzA1MzVmNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDQ5NzM0MDc1NTY0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQ0ZTQyNmY0YjRlNzUyMTM4MmE0NzQwMzgzMjQ3NTU1MTI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM2ZjVlMzM3NDZmN2EzMzc4NDA0ZjRlNzk2ZTVlNTU3MzcwMzgyYTc1MjEzODI2NDc1NTc1Nzc1NzRmNzc0ZTc1NmU1ZTMyNDc2ZTM4Mzc0YzZmMjU1MjdhNDAzNzJiNDEyMTM4MmE3NzZlNTMzNzRiNTc1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjMzEzNzQ1N2EyMTc5NTI0NzU2MjQyMzQyNGY3OTMzNzg0MDc1NGU1ZTIxMzkzMzc2NmQ1MjJiNzUyMTM4MjY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NzcyODRmNzU0ZDczNTU0ZjRkNzU1NTc1NTY1YTZlMjUyYTQyNzA1MzJiNGI1NTUzNTI0NzU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzQwNzkyYjRiNTU1MzU2NzQ2ZTc5MmE0MjZlNzk2ZjQ3NTU3NTU1NzU0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNDc2ZTVlMzI3MzZkMzk1YTcyNzAzOTVhNzg2Zjc4MmI3NDZmNTQ0ZTRiNmU1ZTQwNzg0MDRmNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc1MmE0MjQwNGY3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTRmNTY0MDZlNWUzNjczMjEzOTU2Nzg1NTUzMmE0ODcwNGY0ZTc0NzAzOTMzNDE2ZTVlNTY0MjcxNzkzNzc3NTU1NDMzNDg1NTU0Mzc0YzQwMzQ0ZTIzNmQ1Mzc4NGM1NTUzNWE0ODZlMzgyNDc0NmU3OTMyNDc1NTUxNWE0ODZlN2EzMzc0MjE1ZTMyNzMzMjUxNTIyNTQwMzk1YTI4NTU1NDMzNDg1NTUzNzA3ODcwNGY0ZTc0NmY1NDRlNGI2ZTVlNDA3NDZlNGYyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0ZDJiNTU1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ3NzA1MzM3MjY3MDRmMmE0YzZmNTM0YTQyNzA0ZjczN2E1NTRmNmY0MjM4NGM1MjcwNTg3OTRhNDg3MDI1Mzc0YjU3NGY3NzU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTY2ZTc5MzM3ODcxNTEzNzRiNmY3OTJiNGIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDc1MzY1MzRhNzgyMTM5NWE3ODU1NTQ0ZTRiNmU1ZTQwNDI0MDUzMzY3MzIxMzQ0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQyNjczMzczOTVhNzQ0MDI1MzYyODU1NGYyYjc1MjEzODI2NzMzMTU0Mzc0YzQwMzk1NjQ3MjEzODI0NzgzMTc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0ZjczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZjVlMzM0YjU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzQwN2E1NjQ4NmUzNzJiMjQ2ZjI1Mzc0YjU4Nzk3ODc3NTczNDRlNDI2ZTc1NGU0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzM3MjIxMzg1YTc2NmU1ZTM3NDc3MDU0NTk0NzQwMjUzNzIzNTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTg0ZjRlMjk3MjM0Nzc0NzQwMjUzNzIzNTc0ZjcwNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGI2ZjRiNmY0NTU1NTQ0NjJiNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU3NDZlNTQ1Njc4MjEzODMzMmE1NTUzNTY3ODZkMzgyYTdhNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA0ZjRlNzk2ZTVlNTU3MzIxNzk1MjQ3NTg1ZTM3NDcyMTc5NTI0NzU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM0MDM5NzQ0MjZmNWUzMzRjNTU1MDIzNzM0MDI1MzcyMzM5MjU3ODQ3NmY1ZTMzNzQ0MDVlNTY3NDZlMzcyYjRjNzA1MzUyMjM3MDM5NTk0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjRmNzU0ZDczNTU0ZjRlNDI0MDc1NGU3ODcxNTM3ODRjNzA1NDU5NzM2ZDM5NTk3MzM1NzkyYjQ3NDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjM3NmU3OTUyNzU2ZTUzMzY3MzcwNTM1ZjczMjEyNTc0NzgyMTI1NDU3MzcwNTM3NDc4NTU1NDVhMjMyMTM5MzMyNDZmNGI0ZTQ4NDA3NTRlNGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0MjY3MzM3NTQ1NjJhNTU1MzUyN2EyMTM4Nzg0NzU1NTM0YTc0NzA1MzM3NGI1ODc1NTU0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzkzNzIzNzAzOTU2NDc0ZjczNDE3MzU1NGY0ZDczNmQzODIxNzM2ZTc5MmIyMzU1NTMzNzI2NmQzOTVhMjM2ZjRjNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNDA3NTU2NGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0NGU0MjZmNGI0ZTc0NmU1NDU2NzgyMTM4MzMyYTU1NTM1Njc0NmU3OTJhNzg0MDRmMjY3MzM1Nzk1ZjczNmU3OTM3Nzg0MDRmNGUyMzZlNGI0ZTQ2NmUyNTJhNDI3MDUzMmI0YjU1NTM0MDQ4NmY3NTRlNzUyMTM4MjY0NzU1NzU3NzU3NTU0ZjRkNzM1NTUzMzc0NTZkMzgyMTczNmU3OTJiMjM1NTUzNTI3NzQwNTIyYjc0MjEyNTVhNDg3MDM4MmEyMzM5NWU1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NTQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQ1NTU0ZjcwNzUyMTM4MjY3YTU4NGY0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4Nzk0MDRiNmUyNTI0NzI3MDM5NWE3ODZmNzUyYTQyNDA0ZjQ5NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzk2Zjc5MmI0NjM5NWUzNzRjNDAzOTU1NDc2ZDM4MzI0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1NjQ4NzA0ZjJhNGI0MDM5NGU0NTcxMzcyYjIzNmU0Yjc0NDY0MDM5NWE0YzIxMzg3MDc4NTg0ZjRlNzk1NTc3NGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjU1NTM3ODRjNTU1MzUyNDU2Zjc5Mzc3NDQwNTQ3NzczMjE3OTM3NDI2ZTc5NmY3MzZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzU1NTM0MDQ4NmY3NTRlMjQ2ZTc5NTY3NDZlNzUyNjc1NTczMjQxNzM1NTRmNGQ3MzQwMzg0YTRjNDAzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU3NDIxNWUzMzQyNzA3OTM2NDc1NTUxMjQ0ODZlNzk3ODIzNmU1ZTU2NDI2ZTc5NmY3MzZmNWUzMzc0NmY3YTMzNzg0MDRmNGU3OTZlNWU1NTczMjE3OTUyNDc1ODc1NTU0MjRmNzM0MTc2NTU0ZjIzNDY1ODM0NGUzMDQwMzk2ZjczNDA3YTM3NDcyMTVlMzM0MjZlMjUyYTRjNTU1MzQwNDg2Zjc1NGQ0ODcwNzkzNzRiNmQzNDRlNzY2ZTI1MjQ0NjIxMzgyYTc3NTU0ZjIzNDY1ODMyNDI3NzQwMzgyMTczNDA3OTJiNGI2ZTM4NTIyMzM5NWUzMzQyNmUzODM3NzI0MDU0Mzc0YjIxMzkzMzQyNmUyNTI2NDE2ZjI1Mzc3NjZlMjUyYTc3NmY0Yjc3Mjg0Zjc1NGQ3MzU1NGY0ZTQxNmU1ZTM3NGI2ZjRiNGQyYjU1NTM3ODQ3NzA0Zjc0NGM0MDM4NWE0ODZlNzkzMzRjNTU0ZjVmNDg1NTUwNTkyNTU5NTA0ZDQyNGY3NTRkNzM1NTRmNGU0NjZkMzgyYTI0NzA1MzM3NGM1NTUwMjM3MzZkMzgyYTIzNTc0Zjc0NGM0MDM4NWE0ODZlNzkzMzRjNTU0ZjM2NzM1OTRjMjE0OTU5NGY3NzczNTg0YjVmNzM1YTc2NGQ0MjRmNzU0ZDczNTU0ZjRlNGM0MDM4NWE0ODZlNzkzMzRjNTU1MDIzNzM2ZDM4MmEyMzU3NTQ1YTc4MjEyNTJiNDc0MDU0NTk3MzU2MzQ0ZDI1NTk0Zjc3NTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU3OTU1N2E0NjQxNmU1ZTM3NGI2ZjRjNDE0OTU5N2EyMzI4NzEyNTI0NDI2ZTdhMzcyMzQwMzk1OTI4NTk1MDU2MmIzMDdhNDY0YzQwMzg1YTQ4NmU3OTMzNGMzMDc2NGQ0YjcyMzQ1NTU3NGY3OTMzNzg0MDc1NGU3NjZkNTMzNzc2NmQyNDJiMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MmE3MjZmNWUzMzc0NzA1NDM3NGM1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc3NDA3ODcwNTM1YTQxNTU1NDMzNDE0MDM0NGUyNTQwMzk1NjQyNDA3OTc4Nzg0MDRmNGU3OTZlNTM1MjdhNTU1MzQwNGI2ZTI1MjM3MzM3NTQ1Njc4NmU3OTMzNTU0MDM5NTY0ODU4NzU0ZTM0NDAzOTMzMjQ2Zjc5MmE0YzU1NTEyYTQ4NmU3OTM2NzM2ZDM4MjE3MzZkMzkzMjczNmQzOTU5NzM2ZTM4Nzg0YzZmMjU3ODQ3NDA0YjRlNzk2Zjc5MmI0NjU1NTQzMzQxNDAzNDRlNGI0MDM5NWE0OTZlMjUyYTRjNDAzNDI2NzU1NTc1NTU1NzU1NGY0ZDczNTU1NDU2Nzg2ZjRiNGQyYjU1NTM3NDIzNzA1NDRlNzIyMTI1NGE0MjQwMzgyYTIzNTg3OTcwNzg3MDRmNzQzNjM2NzczNzMwMzM1MTc0NTIzNjc3MmI3MjM3Mzc1NjU5NTg0ZjRlNDE0MDM4NTI3NzQwMzk1NjRjMzEzNzMzMzQzMzM2MmE1MTM0NTEzNzM0MzUyNDJiNTUzMzM2NTI1MTMzMzc1NjM1NTg0ZjRlNDkyMTM5NTY3NDZlMzk1OTJiNzE0YjcwMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDZmMjg1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0Nzc1NzU1NGY0ZDczNTU1NDU2Nzg2ZjRiMmE0YjIxMzg3ODRjNDAzNzJiNzk2ZTVlNTY3MjZmNWUzMzc0NzA1NDM3NGM1NzRmNzc1NzU1NGY0ZDczNTU1MzMzNzQ3MDUzNTE3MzMxMzQ0ZTRiNDAzOTU5NDc2ZDdhNWE0ODZlNzU3MzQyNGY3NTRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzM0MDUzNTIyMzIxMzQyYTdhNDAzOTMyNDE1NjVlNGU0YjQwMzk0MDQyNDAzOTZmN2E1ODRmNGUyOTcyMzQ3NzQ3NDAyNTM3MjM1NzRmNzAyNDZmMjUzNzRiMzkyNTc4NDc0MDc5NWY3YTU4NGY0ZTI5NzIzNDc3NDc0MDI1MzcyMzU3NGY3MDQyNmYyNDJiMjU0MDM5NTY0MjQwNzk3ODc4NDA0ZjZmNDI0ZjczNDI3NzQwMzgyMTczNmY1NDU2NDgyMTc5Mzc3MjcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3Mzk1ZTVhMjMyMTM5MzMyNDZmNGI3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3NTU1NzU1NjUwNmQ1MzM3NzY2ZDRiNGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczNmU1Mzc4MjU0MDM0NGU3NDZlNzkzMjczNmYyNTc0NzQ2Zjc5MzY3MzcwNTM3NDc4NTU1MzUyNDc2ZjVlNzA3ODZmNzU0ZTVlNmQzOTMzNDE1NTUzMmI0NzU4MzgzMzc4NmUzODUyNDc0MDRmNGU0NTZlMjUyYjQ0NzAzOTRlNGM1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNzMzMTM0NGU3NjZkNTMzNzc2NmQyNDJiMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MmE3MjZmNWUzMzc0NzA1NDM3NGM1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzMyNDE3MzU1NGY0ZDczNmQzODIxNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNzM2ZDM5NTk3MzZlNzkyYjIzNTU1MTJhNDg2ZTc5MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzc0NzA1NDM3NGMzOTI1NWE3NDIxMjU3NDc4NTg3YTVhNzg3MDRmNzM0MTU2NWU0MDc4NmY3OTc3N2E1ODRmNGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0Nzc0NTU1NTQ0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzU3MzI0MTczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3NGY3MzQyNzc0MDM4MjE3MzQwMjUzNzIzMzk1ZTQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc4MmI0YzcwNTM1MjIzNzAzOTU5NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNzc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU1NTQ1YTIzMjEzOTMzMjQ2ZjRiNGU3OTZlNWU1NTczNmUyNTI2NDY0MDUzMzc0NjIxMzgyYTc3NTU1MzVhNDg2ZTM4MjQ3NDZlNzkzMzRjNTg0ZjRlNzYyMTM4NWE0MTQwMzgzMjczMjE3YTU2NDI0MDM4NDA0NTcxMzQ0ZTc0NmU3OTMyNzMyMTI1MmI3NDZlNTMzNzRjMjEyNTM3Nzc1NTU0NGU3ODZmNzU0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQyNjc1NTU3NTU1NTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU3NjIxMzg1YTQxNDAzODMzNzIyMTI1NzQ3ODIxMjU0NTQxNTY1ZTQwNzg2Zjc5Nzc3YTU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNmY1NDU2NDgyMTc5Mzc3MjcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3Mzk1ZTVhMjMyMTM5MzMyNDZmNGI3NzU3NGY3OTMzNzg0MDc1NGU0NzZlNWUzMzQyNDA3YTc4NzI3MDc5Mzc0YjZkMzcyYjRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0Yjc0MjMyMTM5NWE0NDU4NGY0ZTIzNDAzOTc0MjM1NzM1NDE1NzU1NGY0ZDczNTU1MzQwNDg2Zjc1NGU0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjU1NTM3ODQ3NTU1MzRhNDI2ZjVlMzI0MTcwNTM1MjRjNmQyNDQ1N2E2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2ZjdhNTk3YTM5MzQyYTI1MjEzODRhMjQ0MDM5NTk0MTU3MzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmU3OTJiMjM2ZDM4NDA0MjQwMzk1NTQ3NmYyNTM3NDc0MDRmNzQ0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjM4NGI3MDc2NmQ1MzUyMjMzOTI1Nzg3NzU2MjQyMzQ1NTU1NDMzNzg3MTU0MzI0MjRmNzM0Mjc3NDAzODIxNzM2ZTM4MmI0NzZkMzkzMzQ4NmY3ODJiMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MjY0MTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTc1NTU3NTM2N2EzNzQ3NTU1MzJiNDc0MDM0NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczMjEyNTc0NzgyMTI1NDU0NzU1NTI1Njc4NzA1NDM3NGI2ZTdhNTk3MzMzNzk1MjQ1NmYyNTM2NzM2ZTI1MmE3NjQwMzQ0ZTIzNmQ1MzM2NzM3MDI1NTIyMzIxMjU3MzczNmQzOTU5NzM0MDc5Nzg0NzZkMzk1YTQxNDAzODMyNDc1NTc1NTU3NTRmNzU0ZDczNTU0ZjRlMjMyMTM5NWE0NDU1NTAyMzczMjEzODVhMjM2ZDM5NDA3ODM5NWU0MDc4NmY3OTc4NzI3MDUzNTI0YzZkNWU1OTQ3NDAyNTM3MjM1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzMyNDE3MzU1NGY0ZDczNmQzODIxNzM3MDUzNTI0YzZkNGI0ZTQyNmY0YjRlMzA2ZTI1MmE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGU1MzIxMzg0YTRjNDAzMjQxNTc1NTRmNGQ3MzU1NTQzMzRiNzEzNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMjU0MDM5NTY0MjQwNzk3ODc4NDA0ZjRkMmI1NTU0NGU0YjZlMjU1Njc4Mzk1ZTQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc4MmI0YzcwNTM1MjIzNzAzOTU5NDE3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDI0ZjczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNzg3OTU1NTQ0MDc4NmY3OTc4Nzk2ZDM4Mzc3NzU1NTM3ODRjNTU1MTJhNDg2ZTc5MzYyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzQwNDg2Zjc1NGU0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjU1NTM3ODQ3NTU1MzQwNDI2ZTc5Nzg0YzZkNTIyYjVlMjEzOTMzNzY2ZDRmNzQ3NDIxNWUzMzQyNzA3OTM3NzI3MDc5Mzc0YjZkMzcyYjIzMjEzOTVhNDQ2ZjRiNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNzkyYjIzNmQzODQwNDI0MDM5NTU0NzZmMjUzNzQ3NDA0Zjc0NGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGIzODRiNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjI0MjM0NTU1NTMyMTc1MzIyNTJiMjQ2ZTUzMzI3MzZlNzkyYjIzNTU1MzMzNzg3MDUzMzc0YjZlMzg3ODQ3NDAzNDRlMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MjY3MzZmNWUzMzc0NzA1NDM3NGM1NTUzNDA0ODZmNzU0ZTRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY3MzMzNzk1MjQ1NmYyNTM2NzM1NTRiNGU1MjcxNTM3ODIzNTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzM2ZDM4MjE3MzZmNWUzMzc0NzA1NDM3NGM1NTUzNWE3NDZlNzkyYTQ4NzA0ZjRlNzU0MDM0NGU3NzQwMzkzMzc4NmY3OTI0NDI2ZTc5Mzc3NzRmNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3NTU0ZjUxMmI1NTU0MzM3NDZmMjU0NTQ3NDAyNTM3MjM1NzRmNzA0NTIxMzk1YTIzMzk1ZTVhMjMyMTM5MzMyNDZmNGI2ZjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjIzNzAzOTU5NzMzMTM0NGQ3YTM3NzkzNzRiNmQzODQwNDI0MDM4MzI3YTU1NTM3ODc5NTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3NTU1MzM3NDU2ZjI1MzY3MzU2MjMyYTQ4NzA0ZjRlMzg0MDM5NTY0MjQwNzk3ODc4NDA0ZjZmNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNzkyYjIzNmQzODQwMmEzOTVlNDA3ODZmNzk3ODcyNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5NDE3MDUzNTI0YzZkNGI0OTczNDA3NTU2NGQ3MTVlMzc0YzQwMzk1NjQ3MjEzODI0Nzg3MjM0NGU0YzcwNTM1MjIzNzAzOTU5NzMyMTI1NzQ3NDZlNzk3MDc4NDA1MDQxNzM3MTVlNWEyMzIxMzkzMzI0NmY1ZTIzNzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzMjEzOTVhNDQzODRiNzA0NTIxMzk1YTIzMzk1ZTVhMjMyMTM5MzMyNDZmNGI3MDcwNTU1MDIzNzM3MDc5Mzc0YjZkMzg0MDQyNDAzODMyNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzc0NzA1MzM3NzI2ZjVlMzM0ODZmNzkzNjQ3NmY3OTM3NzY2ZTVlNTY3NzM5NWU1YTIzMjEzOTMzMjQ2ZjRiNzM3YTcwNzkzNzRiNmQzNDZmNDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODRmNGUyNTQwMzk1NjQyNDA3OTc4Nzg0MDRmNzc1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNzA3OTM3NGI2ZDM4NDA0MjQwMzgzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNDA0ODZmNzU0ZTRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNTU1Mzc4NDc1NTUzNDA0MjZlNzk3ODRjNmQ1MjJiNWUyMTM5MzM3NjZkNGY3NDc0MjE1ZTMzNDI3MDc5Mzc3MjcwNzkzNzRiNmQzNzJiMjMyMTM5NWE0NDZmNGI0OTczNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNDAzODRhNzQ2ZjU0NWE3ODQwNGY0ZDJiNTU1MzQwNDg2Zjc5MjQ3NDcwNTIyYjIzNmQzODI0NzgzOTI1MzMyNDZmNzk1MjIzNmQzODJiNDc1NzU0MzM0MjZlMzgzNjQ3NzA1Mzc4NDY0MDM0NzM0MjU1NGYyMzczNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3ODQ1N2E2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM0NzA3MDU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZlNzkyYjIzNmQzODQwNDI0MDM5NTU0NzZmMjUzNzQ3NDA0Zjc0NGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGIzODRiNzA3NjZkNTM1MjIzMzkyNTc4Nzc1NjI0MjM0NTU1NTMyMTc1MzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNzM2ZDM5NTk3MzZlNzkyYjVlNTU1NDQwNzg2Zjc5Nzg3OTZkMzgzNzc3NTU1NDcwNDI3MDUzNzQ0MjZlNzU0ZTI5NDAzODRhNzQ2ZjU0NWE3ODQwNTQyMzc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NzMzMzc5NTI0NTZmMjUzNjczNTU0YjRlNTI3MTUzNzgyMzU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY0MjZlNzk2ZjczNmUyNTJhNzY0MDM0NGUyNTQwMzk1NjQyNDA3OTc4Nzg0MDRkNDE3MzU1NGY0ZDczNDAzOTc0NzY0MDM5NGUyMzU1NTE3NDQ4NmY1ZTMzNGYyMTM4NWE0NDZlMjU0MDc5MzMzOTU2NGI2ZTVlNTUyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNzk1MjQyNmYyNTM2NzM1NTRmNTk3MzM3NTQ1Njc4NmU3OTMzNTU0MDM5NTY0ODU1NTM3ODRjNTU1NDU2NzQ3MDUzMzY3MzZlNTM3ODQ2NmQzOTMzNDI2ZTc5NmY3MzcwMzk1OTI5NTU1NDMzNDE0MDM0NGU0YzIxMjU3NDc4NDA1NDM3NDU0MDM5NTU3MzZmNzkzNzIzNmY3OTc4Nzg2ZjRiNGU0ODZlNzk1YTc4NTU1NDMzNDE0MDM0NGU3NTIxMzg1YTQ0NmUyNTQwNzk1NTUzMzc0NzQwNTQ1OTU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNGI0MDM5NTIyNDQwMzk1YTIzNmY0YjJhNzg3MTUzNWE3ODZmNTQzMzQyNmUyNTJhNGM1ODc4NTY3ODZmMzkzNzc4NmY1ZTMzNTI3MTUzNWE3ODZmNTQzMzQyNmUyNTI2NzMyMTM5NTk3MzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ3NmU1ZTMzNDI0MDdhNzg3MjcwNzkzNzRiNmQzNzJiNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGI2ZjRiNzQyMzIxMzk1YTQ0NTg0ZjRlNzk1NTc3Mzc0YjZmNzkyYjRiNTU1MzVhNDE0MDM4NWE0NDZkMzgyYTdhNTU1MTRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmI1NTRmNzQ0NzQwMzkzMzVlNmU1ZTU2NDQ1NTUzNzg0YzZmNWUzNzc4NTczNTQxNzM3MTI1MzcyYjU1NzU3NzU3NTU0ZjRkNzM1NTUzMzcyNjIxMjUzNzQ5NzA0ZjRlNTI3MTUzNWE3ODZmNTQzMzQyNmUyNTI2NzMyMTM5NTk3MzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQ3NmU1ZTMzNDI0MDdhNzg3MjcwNzkzNzRiNmQzNzJiNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGI2ZjRiNzQyMzIxMzk1YTQ0NTg0ZjRlNzk1NTc3Mzc0YjZmNzkyYjRiNTU1MzVhNDE0MDM4NWE0NDZkMzgyYTdhNTU1MTRlMjk3MDM5NWE3ODZmNzkyYTc0NmUzODM3MmIzMDc1NGUyOTQwMzkyMzc1NTczMjQxNTc1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTc1NGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NGU0MjZlNzU0ZTc0MjE1ZTMzNDI3MDc5Mzc3MjcwNzkzNzRiNmQzNzJiMjMyMTM5NWE0NDZmNDk0MTU3NDA1MzM3Nzk1NTU0NWEyMzIxMzk1NjIzMzk1ZTQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc4MmI0NjZlMjUyYTQyNzA1MzJiNGI1NzU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1ODRmNGU3NzQwMzg0YTc0NzEzNTIzNDk1NzM1NDE1NzU1NGY0ZDczNTU0ZjU1NzU1NTc4NWE3NjZkNTMzNzc3NzAzODRhNzg1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzU0ZTc2NmQ1MzM3NzY2ZDVlNTk3MzQwNzkyYjRiNTU1MzUyNDc1NTUzNTI3NjIxMjUyYjI0NmU3YTMyNzM2ZDM4MjY3MzIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNTk0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0YzIxMjU3NDc4NDA1NDM3NDU0MDM5NTU0NzZmMjU1YTQxNDAzODMzMjQ2ZTUzMzY0MTU3NGY3MDI1NDAzOTU2NDI1NjRiNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0MjU4NGY0ZTQ1MjEzODI0NzU0MDUzNTEyODU1NTMyNDQ4NmU3OTc4MjM2ZTVlNTY3MjcwNzkzNzRiNmQzODQwNDIyMTI1NTIyMzZkMzgyYjQ3NTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczNDQ5NzMzNzc3MzczNDM0MzcyYjUwMzQ1MTM3NTAzNDI0MmI1NjM1NzgzMzUyMzY3ODQwNGUzNTRmNDk3MzQwNTMzNzQ1MjEzOTc3MmI0MDUzMzc0NTIxMzk3NzQyNGY3MzQyNzc0MDM4MjE3MzIxMzgzMzc3Mzk1ZTQwNzg2Zjc5Nzg3MjZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmNzU3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzAzOTVhNzg2Zjc4MmI0MjQwNGY0OTczMjEyNTc0NzQ3MDUyMmI0MjQwNGY0OTczNmU1MzUyNGM3MDUyMmI0YzcwNTM1MjIzNzAzOTU5NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg1NTUzNTE3MzcwMzk1YTc4NmY3NTRlMjM2ZTRiNGUyMzZkNTMzNjczNmYyNTc0NzQ2Zjc5Mzc3NzU1NTQ0MDc4NmY3OTc4Nzk2ZDM4NWE3NDcwNTM3ODQ4NmU3NTRlNWUyMTM5MzM3NjZkNGY0ZTQ4NDA3NTRlNzQ2ZTc1NGU3NDIxMjU1YTQ4NzAzODJhMjM1ODRmNGU0YzcwNTM1MjRiNzA1Mzc4NDc0MDRiNGUyMzZkNTMzNjczNzAyNTUyMjMyMTI1NzM3MzZkMzgyMTczNmU3OTM3Nzg0MDUzMzc3NzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZmNWUzMzc0NmY3YTMzNzI3MDUzNzg0NjQwMzQ0ZDJiNTU1NDMzNDI2ZTM4MzY0NzcwNTM3ODQ2NDAzNDczNDI0Zjc1NGQ3MzU1NGY0ZTVlNmQzOTMzNDE1NTU0NzA3NDcwNTM1YTQxNDAzOTVhNzI2ZTUzMmI3NjZkNGM0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTIzMjEzOTVhNDQ1NTUwMjM3MzIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNTk0NzQwMjUzNzIzNTc1NDM3NGM0MDM5NTY0NzIxMzgyNDc4NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzJhNzg3MDI0MmI1ZTIxMzkzMzc2NmQ0ZjRkMmI1NTU0MzM3NDZmMjU0NTczNmQzOTU5NzMzNTc5MmI0NzQwMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNzg3MDI0MmI1ZTIxMzkzMzc2NmQ1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNTM1MjRjNmQ0YjRkMmI1NTUzNTI3NjcwNTM3ODI1NDAzNzJiMjU0MDM5NTY0MjM5NWUzMzc0NmYyNTQ2NGMzODVlMzc0YzQwMzk1NjQ3MjEzODI0NzgzOTM0NGQyYjU1NTQ0NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY3MDRjNzA1MzUyNGI3MDUyMmIyMzZkMzgyNDc4NTY0YzQxNzM2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM0NDk1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNzAyMzcxMzk0ZTc4NTY0YzQxNzM1NjVlNDA3ODZmNzk3NzdhNTg0ZDQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTYyNTRhNzQ2ZjVlMzM3MjZmNWUzMzc0NzA1NDM3NGM1NjRjNDE3MzZlNTM1MjRjNzA1MjJiNGM3MDUzNTIyMzcwMzk1OTQ1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2EzMDc1NGUyOTcyMzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlMmI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZjVlMzc3NTZmMjU1YTRiNmQzODU2Nzg2Zjc1NGQyYjU1NTQzMzc0NmYyNTQ2NmU1NjVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTY0YzU2MjQyNDZlNmY1ZTMzNGI1NzU0Mzc0YzQwMzk1NjcyNmQzODMyNDIzOTM0NGQyYjU1NTQ0NTdhMjEyNTc0NzQ3MDUyMmI0MjQwNGY2ZjI4NTU1MzVhNDEyMTM5MzM3MjZkMzgzMjQ1NTU0ZjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjRjNDE3MzZmNWUzMzc0NmY3YTMzNzI3MDUzNzg0NjQwMzkyMzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTQyNDA3NTRlNDc0MDM5NzA3MjcwMjU1MjIzMjEyNTczMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzMjEzOTMzNzgzOTVlNWEyMzZlNWU1Njc4NTg3YTVhNzQ3MDc5Mzc3MjcwMjU1MjIzMjEyNTczNDE1NjVlNDA3ODZmNzk3NzdhNTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM3MDUzNTI0YzZkNGI3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTc4NmU1NDVhNzgzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjNzA1MzUyMjM0MDM3MmI0YzcwNTMyYjRiNDAzNDJhNzQ0MDUzMzM3MjZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmNzU3MzdhNzA3OTM3NGI2ZDM0NmY0NTU1NTQzNzRjNDAzOTU2NDcyMTM4MjQ3ODU4NGY0ZTI0NmYyNTM3NGIzOTI1Nzg3NzU4NGY0ZTRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNTczMjQxNTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNzg3MDI0MmI1ZTIxMzkzMzc2NmQ1MDQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzNTI0YjcwNTIyYjI1NDAzOTU2NDI0MDc5Nzg3NjIxMzkzMzQyNmUyNTJhNzI2ZTM4MmI0NzZkMzkzMzQ4NmY3NTc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM0MDUzMzc0NTIxMzk3NzJiMzc3NzM3MzQzNDM3MmI1MDM0NTEzNzUwMzQyNDJiNTYzNTc4MzM1MjM2Nzg0MDRlMzU0Zjc3NTc0ZjczNDI0ZDIxNzkyYjIzNTg3OTI0Nzg2ZjVlNWE3NDQwMjUzNzcyNmQ1MzUyNDc0MDUzNGE3ODZmNzU3NDc2NmUyNTI0NDYyMTM4MmE3NzZmNGMyNDZlNTY1ZTQwNzg2Zjc5Nzc3YTM5MzQ3NzU3NDA1MzM3Nzk1NTU0NDA3ODZmNzk3ODcyMjEyNTJiNDY2ZTM4NTI0NzQwNGY3NDQ2NDAzOTVhNGMyMTM4NzA3ODU3MzU0MTU3NTU0ZjRkNzM1NTRmNTU3NTU1Nzg1YTIzMjEzOTU2MjM1NTUzMjQ0ODZlNzk3ODIzNmU1ZTU2NDI2ZTc5NmY3MzIxMzgyNjczMjEzODVhNzY2ZTVlMzc0NzcwNGY0ZTc5NmU1ZTU1NzM3MDc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzU4NzU1NTc1NTU3MzQxNzM1NTRmNGQ3MzZkMzgyMTczNmU3OTJiMjM1NTUzNzg0YzM5NWUzNzRjNDAzOTU2NzIyMTM5NGU0OTZmNzkyYjI1NDAzODMyNDE2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzk2Zjc5MmI0NjM5NWUzNzRjNDAzOTU1NDc2ZDM4MzI0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTM1NjQ4NzA0ZjJhNGI0MDM5NGU0NTcxMzcyYjIzNmU0Yjc0NDY0MDM5NWE0YzIxMzg3MDc4NTg0ZjRkNzUzODM4MmIyNDU1NTM1MjRiNDAzNDRlNDc2ZTVlMzI3MzIxMzkzNzIzNmQ1MzJiNGI2ZDM5NDI3ODQwNGY0ZTIzNmU0YjRlMjQ2ZjI1MzY3MzcwNTM3NDQyNmY0YjRlNzY2ZTI1MjQ0NjIxMzgyYTc3NTg3NTRlNTA2ZTI1MmEyMzIxMzg1YTIzNTU1MTRlNGU3MDc5Mzc0YzcxNzU0ZTIzNmU0YjRlN2E0MDM5MzI3MzIxMzk0ZTQ5NmY3OTJiMjUyMTM4NDk0NzU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTMzMjQ2Zjc5MjY1NzRmNzU0ZDczNTU0ZjRlMjM2ZjdhNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY3MzMxMzQ0ZTQ2NDAzOTVhNGMyMTM4NzA3ODU4N2EzMzc4NzE1NDMyNDc2ZjVlNGU0NTZkMzkzMjQxNTY0YjRkN2E1NzM3NDU0YTM5MzQyYTQ1NmU1ZTcwNzg2Zjc1NzM0MjRmNzU0ZDczNTU0ZjRlNzg3MTUzNWE3ODZmNTQzMjczMzQzODJhNzc0MDM5NzQ1MjZmN2E1NjQ4NmY3NjQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzU1NzgzNzRjMjEzODcwNzgzMDc1NGQ0ODcwNzkzNzRiNmQzNDRkNWY3MDM5NWE3ODZmNzkyYTc0NmUzODM2M2M1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZTQyNDA3NTRlNGM3MDU0NTU0MTZlMzgzNzRjNmYyNTUyN2E0MDM0MmE3OTZmNzkyYjQ2Mzk1ZTM3NGM0MDM5NTU0NzZkMzgzMjQyNTU1Mzc4NDc1NTUzNTI3NjcwNTM3ODI1NDAzNzJiMjU0MDM5NTY0MjM5NWUzMzc0NmYyNTQ2NGM1ODc5NzA3ODcwNGY3NDI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNzE1ZTIzNDI1ODc5NzA3ODcwNGY3MzdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2E1ODRmNGUyOTcyMzQ3NzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMyMzg0YTRiNDAzODUyNzc3MTM0NGU0NjZlMjUyYTQyNzA1MzJiNGI2ZDM4MmE3YTU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiNTU1MzQwNDg2Zjc1NGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGQ3NjU1NTE1YTQxNDAzODVhNDQ1NTUzNzg3OTU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzI3MzZkMzk1OTczMjE3OTUyNDc2ZTc5Mzc3NzU1NTM1Njc4NDA3OTJiNGI0MDM0NGU0YzcwNTM1MjRiNzA1Mzc4NDc0MDRiNGUyNTQwMzk1NjQyNDA3OTc4NzYyMTM5MzM0MjZlMjUyNjczNmUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0OTQxNzM1NTRmNGQ3MzQwMzk3NDQyNmY1ZTMzNGM1NTUwMjM3MzQwMjUzNzIzMzkyNTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNzJiNGM3MDUzNTIyMzcwMzk1OTQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyNGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTc4NzE1Mzc4NGM3MDU0NTk3MzZkMzk1OTczMzU3OTJiNDc0MDM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDk2ZTU0Nzg3MjcwNTM1ZjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQ0OTczNDA3NTU2Mzc2ZTc5NTI3NTZlNTMzNjczNzA1MzVmNzMyMTI1NzQ3ODIxMjU0NTczNzA1Mzc0Nzg1NTU0NWEyMzIxMzkzMzI0NmY0YjRlNDg0MDc1NGU0ZDcxNWUzNzRjNDAzOTU2NDcyMTM4MjQ3ODcyMzQyNjczMzc1NDU2MmE1NTUzNTI3YTIxMzg3ODQ3NTU1MzRhNzQ3MDUzMzc0YjU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTM3ODc5NTU1MzJhNDg3MDRmNGU3ODcxNTM3ODRjNzA1NDU5Mjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNzM2ZDM5NTk3MzIxMzg0YTRiNDAzODUyNzc3MTM0NGU3NTIxMzgyYTQ3NDAzODMyNDc1NTUxNWE3NDZlNzU3MDIzNTU1MzI0NDg2ZTc5NzgyMzZlNWU1NTczNDA3OTJiNGI1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzUyNjc1NTczMjQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg3MDU0Mzc0YjZlNzM0MTU3NTU0ZjRkNzM1NTU0MzM0YjcxMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDc2NTU1MTc4NDc2ZDM5MzM0MjIxMzg0OTczMjEyNTc0NzgyMTI1NDU3MzQwNzkyYjRiNTU1MzVhMjQ2ZjdhNTY3ODZlN2EzMjczNmY1ZTMzNzQ3MDU0Mzc0YzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzcwNzkzNzRiNmQzODQwNDI0MDM4MzI3MzMxMzQ0ZTdhNDAzOTMzNzI3MDc5Mzc0YjZkMzg0MDQyMjEyNTUyMjM2ZDM4MmI0NzM5NWU1YTIzMjEzOTMzMjQ2ZjRiNzQyNDZmMjUzNzRiNmU3OTUyNDY0MDM0Nzc1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNzA3OTM3NGI2ZDM4NDA0MjQwMzgzMjczNmQzOTU5NzMzNTc5MmI0NzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzIyNTJiMjQ2ZTUzMzI3MzZlNzkyYjIzNTU1NDU2Nzg3MDU0NTY0MjQwMzk0MDc4NTU1NDQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc1NGU0YzcwNTM1MjIzNzAzOTU5NzM0MDc5MmI0YjU1NTE0ZTI5NzAzOTVhNzg2Zjc5MmE3NDZlMzgzNzJiNTg3NTU1NDI0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0MjQwNzU0ZTI1NDAzOTU2NDI0MDc5Nzg3ODQwNTA0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzI1NDQ2MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzOTIzNzM2ZDM5NTk3MzIxMzg0YTRiNDAzODUyNzc3MTM0NGUyNTQwMzk1NjQyNDA3OTc4Nzg0MDRmMjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjU3NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjEzODMzNzczOTVlNDA3ODZmNzk3ODcyNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3NTc0MjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzk2Zjc5MmI0NjM5NWUzNzRjNDAzOTU1NDc2ZDM4MzI0NTU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzIxMjU3NDc0NzA0ZjJhNDI0MDRmNDk3MzcwNzkzNzRiNmQzODQwNDI0MDM4MzI0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU1MzIxNzUzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTRjNzA1MzUyNGI3MDUzMzc3NzU1NTM0MDQ4NmY3NTRlMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MjY0NzU1NzU3NzU3NGY3NTRkNzM1NTRmNGU3ODcxNTM1YTc4NmY1NDMyNzM2Zjc5Mzc0YTcwMzgzNzRjNzA1NDU5NDc0MDM5NzQ3NjQwMzk0ZTIzNmQzODJiNDc2ZjRiMmEzNDQwMzk1MjI0NDAzOTVhMjMzMzM5NzQ3NjQwMzk0ZTIzNmQzODJiNDc1NTUzNTI0YzU1NTMzNjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTMzMzk1NjRiNmU1ZTU1NzM0MDc5MzcyMzIxMjU3NDQyNmU3OTZmNzM2ZDM4MmE3OTZlNGI0ZTc5NmU1ZTU1NzMzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzU3NTMyYTc4NzA1NDcwNDg2Zjc5NDU3MzZkMzk1YTRjNzAzODM2NDIzMDc1NGUyOTQwMzkyMzc1NTczMjQxNzM1NTRmNGQ3MzQwMzk3NDc2NDAzOTRlMjM1NTUxMzcyNjIxMjUzNzQ5NzA1Mzc4NDg2ZTc1NGU3NDZmNGI0ZTc4MzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGU3OTU1NzczNzRiNmY3OTJiNGI1NTUzNDA3ODcwNTM1YTQxNmQzODJhN2E1NTUzNzg0NzQwNzk1ZjczNDA3OTJiNGI1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjMwNzU0ZTI5NDAzOTIzNzU1NzMyNDE3NjU1NGYyMzQ2NTgzNDRlNTI2ZTc5MzI3MzZlNzkzNzVlNTU1MzQwMjQ2ZTc5NWEyMzZkMzgyYjQ3NmY0YjRlNzk2ZTVlNTU3MzU4NWU0MDc4NmY3OTc3NzMyMTI1MmI0NjZlMzg1MjQ3NDA0ZjRkNDY1ODM0MjM1NzRmNzM0Mjc3NDAzODIxNzM2Zjc5Mzc0NjZlNWU0MDc4Mzk1ZTVhMjQyMTdhNWE3NjZmNzk3ODc1NDAzOTU1NDE3MDI1NTIyMzIxMjU3NDc4NmY0YjQ5NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTU0Mzc0YzQwMzk1NjcyNmQzODMyNDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzMzU0NTY0ODZmNGY0ZTc0NTU1NDM3NGM0MDM5NTU3MzQwN2E1NjQ4NmUzNDRlNzQ1NTU0NWE0MTIxMzk1Njc4NDA0ZjRlNWUyMTM5MzM3NjZkNGY0OTczNDAzODJhNzc2ZDM4MmE3YTU1NTQzMzQxNDAzNDRlNWUyMTM5MzM3NjZkNGY0ZTQ4NmU3OTVhNzg1NTUzMmE0ODIxNzkyYjc3NzEzNDRlNDI2ZjRiNGU0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc3NzU4NzM0MTU3NTU0ZjRkNzM1NTUxNTI0NzU1NTM1Mjc3NmUzODc4NDc1NTU0NzA0MTZlNGI0ZTQyNmYyNTI2N2E3MDRmNGU0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc3NzU1NTQ1YTIzNmU1ZTRlNGM1NTU0MzM0MTQwMzQ0ZTVlMjEzOTMzNzY2ZDRmNGU3OTZlNWU1NTczNDAzOTQwNzg2ZjdhNzg0ODZlNzkzNjQ3NTU1MjU2Nzg3MDU0Mzc0YjZlN2E1OTczMzc1NDU2MjQ0MDM0NGU0MjQwNzM0MTczNTU0ZjRkNzM2ZjI1MmI0NjQwMzkzMzQxNmQzODJhN2E1NTU0NzA3NDZmNGI0ZTRjNzA1MzJiNDk2ZjUzMzc3NzU4NGY0ZTUzMjEzODRhNGM0MDM0NGU0MjQwNzU0ZTIzNmQ1MzM2NzM3MDM5NWE3ODZmNzU0ZTQ2MjEzOTc3NzM2ZTc5MmIyMzU1NTQ1YTIzNmU1ZTRkNzM2ZDM5MzI3MzIxMzgyYTc3NTU1MTJhNDg2ZTc5MzY3MzZkMzgyMTczNzA1Mzc0Nzg0Zjc1NGQ3MzU1NGY0ZTc0MjEyNTVhNDg3MDM4MmEyMzU1NTM3ODRjNmU3NTcwMjM1NTU0NzA3NDcwNTM1YTQxNDAzODMyNDc0Zjc1NGQ3MzU1NGY0ZDc1NTU3NTU1NTc1NTRmNGQ3MzU1NTQ3MDQyNzA1MzczNzM3MDI1NTIyMzIxMjU3NDc4NmYyNDJiNDU2ZTI1NWE0NDMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ3MDc0NzA1MzVhNDE1NTUwMjM3MzcwMjU1MjIzMjEyNTc0Nzg2ZjRiMmE3YTQwMzkzMjQxNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM3MDI1NTIyMzIxMjU3MzczNmQzOTU5NzMzNTc5MmI0NzQwMzU0MTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2Zjc5MzcyMzcwMzk1NjQ3NTU1MTJhNDg2ZTc5MzY1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMjU3ODQ3NDA0ZjRkMmI1NTRmNzA3NDIxMjU1YTQ4NzAzODJhMjM1NjRiNGU0MjQwNzU0ZTVlMjEzOTMzNzY2ZDUzMzc0YzU1NTM3ODRjNTU1MzI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzQyMTI1NWE0ODcwMzgyYTIzNmY0YjRlNzg2ZTU0NWE3ODU1NGY3MDI1NDAzOTU2NDI1NjQ5NDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0Mzc0YzQwMzk1NjcyNmY1ZTMzNGI1NTUwMjM3MzZmNWUzMzRiNTc1NDM3NGM0MDM5NTY3MjZkMzgzMjQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmQzODIxNzM3MDM5NWE3ODZmNzgyYjRjNzA1NDU1NzM2ZDM4MjY3MzcwMjU1MjIzMjEyNTc0NmU1NjVlNWEyNDIxN2E1YTc2NmY3OTc4NzU0MDM5NTY0YzU2MjQyMzI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzMzM3ODZlNGY0ZTVlMjEzOTMzNzY2ZDUyNDU3YTZmNWUzNzc1NmYyNTVhNGI2ZDM4NTY3ODZmN2E1OTdhMzkzNzQ2MjQ2ZjI1Mzc0YjM5NWU1YTIzNmY3ODIzNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZmNWUzMzc0NzA1MzM3NzI2ZjVlMzM0ODZmNzkzNjQ3NmY3OTM3NDY2ZTVlNDA3ODM5NWU1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NTQxNmQyNTc4NDc0MDRmNDk3MzcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0NTU1NTQzNzRjNDAzOTU2NzI2ZjVlMzM0YjU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTMzNzQ1NmQzODIxNzM3MDM5NWE3ODZmNzgyYjQyNDA0ZjRlNDI2ZTc1NGU0ZTMzNTEyNDU2MzU3ODJiNTYzMzUyNTkyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDcwNzQ3MDUzNWE0MTM4NGI3MDRjNzAzODU2NGMyMTVlNTY0MjIxNzkzNzRiNmY0YjcwNzA1ODc5NWE0NTQwMzg1MjRiNTc0Zjc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzM3OTUyNDU2ZjI1MzY1NzRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzZkMzgyMTczNmU3OTJiMjM1NTU0NzA3NDcwNTM1YTQxMzg0YjcwNGM3MDM4NTY0YzIxNWU1NjQyMjE3OTM3NGI2ZjRiNzA3MDMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzc0MDM4NDk3MzcwMjU1MjIzMjEyNTc0Nzg2ZjI0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM3MjM1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY1ZTMzNzQ3MDUzMzc3MjZmNWUzMzQ4NmY3OTM2NDc0MDUzMzc0NTQwMzkzMzc4Mzk1ZTcwNzQ3MDUzNWE0MTU3NTM0NjQyNmU3OTMyNDU1NTU0Mzc0YzQwMzk1NjQ3MjEzODI0Nzg1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRjMjEyNTc0Nzg0MDU0Mzc0NTQwMzk1NTQ3MjEyNTUyNDcyMTI1Mzc0NTU3NGY3NDVlMjEzOTMzNzY2ZDUyNDU3YTcwNTQ3ODQ5NDAzNDcwNzA1ODRmNGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0Nzc0MjRmNzU0ZDczNTU0ZjRlNGI0MDM5MzMyNDZmNzkyNjczMzc1NDU2MjQ0MDMyNDE1NzMyNTM1NjQ4NzA0ZjJhNDY0MDM5NWE0YzIxMzg3MDc4MzkyNTc0NzQ2ZTc5MzM0NTQwMzk1NTQxMjEyNTJiNDY2ZTM4NTI0NzQwNTQ1OTJiMzg0YjcwNGM3MDUzMmI0OTU2MjQyMzQyNGY3OTMzNzg0MDc1NGU0YzcwNTMyYjQ5NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQyMzA3MzQxNzM1NTRmNGQ3MzU1NzU1NTc1MzY1ZTMzNDg2ZjRmNGU0NjZlMjUyYTQyNzA1MzJiNGI2ZDM4MmE3YTU1NTM1MjQ3NTU1MTc4NDc2ZjVlMzM3NDQwNWU1Njc0NmUzNDRlNzQyMTI1NWE0ODcwMzgyYTIzNTU0Zjc0Nzk2ZTVlNTU3MzIxNzk1MjQ3NTg1ZTM3NDcyMTc5NTI0NzU1NTMyYjRiNTU1NDQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc1Nzc0NzU1NzU1NTc1NGY3NTRkNzM1NTRmNGU0MjQwNzU0ZTQ3NmU1ZTMyNzM2ZDM5NWE3MjcwMzk1YTc4NmY3ODJiNzQ2ZjU0NGU0YjZlNWU0MDc4NDA0Zjc0NDY0MDM5NWE0YzIxMzg3MDc4NTg3OTQwNGI2ZTI1MjQ3MjcwMzk1YTc4NmY3NTJhNDI0MDRmNzcyODRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzIxNzkyYjIzNTg3YTU2Nzg2ZjUzNGEyYTM5NWUzMzQ4NTc1MzI0Nzg2ZjVlNWE3NDQwMjUzNjQ1NTU0ZjU2NDA2ZTVlMzY3MzIxMzk1Njc4NTU1MzJhNDg3MDRmNGU3NDcwMzkzMzQxNmU1ZTU2NDI3MTc5Mzc3NzU1NTQzMzQ4NTU1NDM3NGM0MDM0NGUyMzZkNTM3ODRjNTU1MzVhNDg2ZTM4MjQ3NDZlNzkzMjQ3NTU1MTVhNDg2ZTdhMzM3NDIxNWUzMjczMzI1MTUyMjU0MDM5NWEyODU1NTQzMzQ4NTU1MzcwNzg3MDRmNGU3NDZmNTQ0ZTRiNmU1ZTQwNzQ2ZTRmMjY3NTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NzA1NDM3NGI2ZTczNDE1NzU1NGY0ZDczNTU1NDMzNGI3MTM1NDE1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0NGQyYjU1NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NzcwNTMzNzI2NzA0ZjJhNGM2ZjUzNGE0MjcwNGY3MzdhNTU0ZjZmNDIzODRjNTI3MDU4Nzk0YTQ4NzAyNTM3NGI1NzRmNzc1NzU1NGY0ZDczNTU1MzM3MjYyMTI1Mzc0OTcwNGY0ZTU2NmU3OTMzNzg3MTUxMzc0YjZmNzkyYjRiMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM2NTM0YTc4MjEzOTVhNzg1NTU0NGU0YjZlNWU0MDQyNDA1MzM2NzMyMTM0NGUyNDZmMjUzNzRiNmU3OTUyNDY0MDM0MjY3MzM3Mzk1YTc0NDAyNTM2Mjg1NTRmMmI0YzcwNTMyYjQ5NTU1MDRhMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNTI2NzU1NzMyNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTU0NTY3ODcwNTQzNzRiNmU3MzQxNzM1NTRmNGQ3MzRmNzU0ZDczNTU0ZjRkNzY1NTUyMzM0MTQwMzQ0ZTIzNzAyNTVmNzM2ZDI1Nzg0NzQwNTQ1OTczNmUyNTIxNzM3MDI1NTIyMzIxMjU3MzczMjEyNTUyNDc1NTUzNTY3ODZlNTMyYjQ3NDA0YjRlMjM2ZTRiNGU3NzZkMzg0MDc5NDAzOTU2Nzg2ZTdhMzI3MzcwMzk1YTc4NmY3YTU5NDU1NTU0NWE0ODU1NTQzMzRiNzEzNDRlNzU2ZTVlMzM0MTU1NTM1Njc4NDA3OTJiNGI0MDM0NGU3NDZlN2E1YTVlNDAzOTU2NDI2ZTc5NmY1NzU1NGY0ZDczNTU1MzUyNzYyMTI1MmIyNDZlN2EzMzcyNmY3OTM3NGM3MDM4NGEyMzU1NTAyMzczNmY3OTM3NDY2ZTVlNDA3ODM5NWU1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NTQxNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjNTg0ZjRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM2ZTM4Mzc0YzZmMjU1MjdhNDAzNDJhNzk2Zjc5MmI0NjM5NWUzNzRjNDAzOTU1NDc2ZDM4MzI0MjRmNzU0ZDczNTU0ZjRlMjU0MDM5NTY0MjM5NWU1Njc4NmY1ZTM3NDU3MDRmNGQyYjU1NTQ1Njc4NmUzODJiMjU0MDM3MmI0YzcwMzg1NjRjMjE1ZTU2NDIyMTc5Mzc0YjU3NTM1Mjc2NzA1Mzc4MjU0MDM3MmIyNTQwMzk1NjQyMzk1ZTMzNzQ2ZjI1NDY0YzU4NGY0ZTI0NmYyNTM3NGI2ZTc5NTI0NjQwMzQ0OTczNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNDI0ZjczNDE3MzU1NGY0ZDczNmQzODIxNzMyMTM4NWE3NjZlNWUzNzQ3NzA1MjJiNGI0MDM5NWEyNDZlNTQzMjI4NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczMjE3OTJiMjM1ODdhNTY3ODZmNTM0YTJhMzk1ZTMzNDg1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDU1NTUzMjE3NTM1MzgyYjQ3NmQzOTMzNDg2Zjc5Nzg0NzQwNGI0ZTc5NmU1ZTU1NzMzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjM3MzU3NTM1Njc0NmU3NTJiMjQ2ZTc5NTY3NDZlNzU3NzczNmQ1MzUyNGM1NTUzNTY3ODQwMzgyNjczNmY1ZTMzNDg2ZjU0NGU3ODQwNGYyNjc1NTczMjQxNzM1NTRmNGQ3MzZkMzgyMTczNzA3OTM3NGI2ZDM3MmI0YjQwMzk1YTI0NmU1NDMyMjg0Zjc1NGQ3MzU1NGY0ZDczNTU0ZjRkNzMyMTc5MmIyMzU4N2E1Njc4NmY1MzRhMmEzOTVlMzM0ODU3NTMyNDc4NmY1ZTVhNzQ0MDI1MzY0NTU1NTMyMTc1MzUzODJiNDc2ZDM5MzM0ODZmNzk3ODQ3NDA0YjRlNzk2ZTVlNTU3MzMyNTQ0NjI0NmYyNTM3NGI2ZTc5NTI0NjQwMzkyMzczNTc1NDQwNzg2Zjc5Nzg3OTZkMzg1YTc0NzA1Mzc4NDg2ZTc1Nzc3MzZkNTM1MjRjNTU1MzU2Nzg0MDM4MjY3MzZmNWUzMzQ4NmY1NDRlNzg0MDRmMjY3NTU3MzI0MTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlNzQyMTI1NWE0ODcwMzgyYTIzMzk1ZTU2Nzg2ZjVlMzc0NTcwNGY0ZTc0NmU3OTMyNzM2ZTc5MmIyMzU1NTQ0MDc4NmY3OTc4NzI2Zjc5Mzc0YzcwMzg0YTIzMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1Mzc4Nzk1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNzI2Zjc5Mzc0YzcwMzg0YTIzNTU1Mzc4NGM1NTUxNDA3NDZlNTQ1YTc4NTU1MzJiNGI1NTU0NDA3ODZmNzk3ODcyNmY3OTM3NGM3MDM4NGEyMzU1NTM3ODRjNTU1MTQwNzQ2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjQwNmU1ZTM2NzMyMTI1NTI0NzU1NTMyYjQ3NmU1NDc3NzM2ZjVlMzM0ODZmNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjZkMzgyYTdhNTU1MzUyNzYyMTI1MmIyNDZlN2EzMzRjNTU1NDMzNDEyMTM5MzI3MzcxMzgyYjI0NTU1NDVhMjMyMTM5NTYyMzQwMzgzMjQ3NTU3NTc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzg2ZTU0NWE3ODMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNzkzNzQ5NmU1NDc4NzI3MDUzNWY0MTZlMzgzNzRjNmYyNTUyN2E0MDM0NDk3MzQwNzU1NjRkNzE1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NzIzNDRlNDI2ZjRiNGU0NzZlNWUzMjczMjE3OTM3NDI2ZTc5NmY3MzZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzU1NTM1NjJhNTU1NDc4NDg3MDM0MjY3NTU3MzI0MTU3NGY3NzRlNzU2ZTVlMzI0NzZlMzgzNzRjNmYyNTUyN2E0MDM3MmI0MTIxMzgyYTc3NmU1MzM3NGI1NzUzNWE0ODZlMzgyNDc0NmU3OTMzNGMzMTM3NDU3YTZlNTM3ODRjNzA0ZjcwNzA1NzMyNDI3NzQwMzgyMTczNmUzODJiNDc2ZDM5MzM0ODZmNzgyYjQ1NmQzOTVhMjM1NzUzMjQ3ODZmNWU1YTc0NDAyNTM2NDIzMDczNDE3MzU1NGY0ZDczNTU3NTU1NzUzNTUzNzg0YzcwNGY0ZTQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMjczMjEzODVhNzY2ZTVlMzc0NzcwNTQ1OTczNDA3OTJiNGI1NTU0MzM0MTQwMzQ0ZTRjNmY1MzM3NzY2ZDM4NDA0MjIxNGI0ZTI0NmYyNTM3NGI1ODc1NTU3NTU1NzM0MTczNTU0ZjRkNzM2ZDM4MjE3MzZlNzkyYjIzNTU1Mzc4NGMzOTVlMzc0YzQwMzk1NjcyMjEzOTRlNDk2Zjc5MmIyNTQwMzgzMjQxNmUzODM3NGM2ZjI1NTI3YTQwMzQyYTc5NmY3OTJiNDYzOTVlMzc0YzQwMzk1NTQ3NmQzODMyNDIzMDczNDE3MzU1NGY0ZDczNTU0ZjRkNzM1NTUzNTY0ODcwNGYyYTRiNDAzOTRlNDU3MTM3MmIyMzZlNGI3NDQ2NDAzOTVhNGMyMTM4NzA3ODU4NGY0ZDc1MzgzODJiMjQ1NTUzNTI0YjQwMzQ0ZTQ3NmU1ZTMyNzMyMTM5MzcyMzZkNTMyYjRiNmQzOTQyNzg0MDRmNGUyMzZlNGI0ZTI0NmYyNTM2NzM3MDUzNzQ0MjZmNGI0ZTc2NmUyNTI0NDYyMTM4MmE3NzU4NzU0ZTUwNmUyNTJhMjMyMTM4NWEyMzU1NTE0ZTRlNzA3OTM3NGM3MTc1NGUyMzZlNGI0ZTdhNDAzOTMyNzMyMTM5NGU0OTZmNzkyYjI1MjEzODQ5NDc1NTc1Nzc1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzkzMzI0NmY3OTI2NTc0Zjc1NGQ3MzU1NGY0ZTI0NmYyNTM3NGIzOTVlNWEyMzZmNzU0ZDJiNTU1NDVhMjM2Zjc1NzQ0NjQwMzk1YTRjMjEzODcwNzg1ODc5NDA0YjZlMjUyNDcyNzAzOTVhNzg2Zjc1MmE0MjQwNGY3NzU3NGY3NTRkNzM1NTRmNGQ3NjU1NTE0MDQyNmU1NDMzNzg2Zjc1NGU3NDIxMjU1YTQ4NzAzODJhMjM2ZjRiNGU0NjZlMjUyYTQyNzA1MzJiNGI0MDM4MzI3MzIxN2E3NzczNzA1Mzc0NDI2ZjRiNGU0YzZmNTMzNzc2NmQzODQwNDIyMTRiNGUyNDZmMjUzNzRiNTU1MzQwNDg2Zjc1NGU3NTIxMzgyNjQ4NzAzODJhNzUyMTM4MjY1NzU1NGY0ZDczNTU1NDM3NGM0MDM5NTY3MjZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzM5MjU1Njc0NmU3ODJiMjQ2ZTc5NTY3NDZlNzU0ZDJiNTU1NDQ2NDQzMDc1NGUyNTU1NTM0MDQ4NmY3NTRlNDQ1ODRmNGUyNTU1NTM3ODQ3NTU1MzRhNDI2ZjVlMzI0MTZlMzgyYjQ3NmQzOTMzNDg2Zjc5Mzc3NzM5MjU1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzU4Nzk3ODIzNDAzODI0NGM1NzRmNzc0MjRmNzU0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3ODJiNGM3MDU0NTU3MzZkMzgyNjczNzA3NTJhN2E0MDM5MzI0MTU2NWU1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjRjNTY0YjQ5NzM3MTVlMjM0MjcyMzI0MTU3NTU0ZjRkNzM1NTRmNTk3MzMzNzk3ODQ1NzA1MzM3NGI1NTUzNTI3NjIxMjUyYjI0NmU3YTMzNGM1NTUzMjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDRmNGU3NTcxMzQ0ZTIzNmQ1Mzc4NGM1NTU0NWE0OTQwMzg1YTQyNDA3OTc4NzY1NTU0Mzc0YzQwMzk1NTczNDA3OTJiNGI1NTU0NDA3ODZmNzk3ODc5NmQzODVhNzQ3MDUzNzg0ODZlNzM0MTczNTU0ZjRkNzM3MDM5NWE3ODZmNzgyYjQ2NmUyNTJhNDI3MDUzMmI0YjQwMzgzMzcyNzA3OTM3NGI2ZDM0NGQyYjU1NTQ0NjQ0MzA3NTRlMjU1NTUzNDA0ODZmNzU0ZTQ0NTg0ZjRlMjU1NTUzNzg0NzU1NTM0YTQyNmY1ZTMyNDEyMTM4NWEyMzZkMzk0MDc4Mzk1ZTQwNzg2Zjc5Nzg3MjcwNTM1MjRjNmQ1ZTU5NDc2ZDM5MzM3ODZlMzk1OTQxNTczNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM2ZDM4MjE3MzcwMzk1YTc4NmY3ODJiNGM3MDU0NTU3MzZkMzgyNjczNzA3NTJhN2E0MDM5MzI0MTU2NWU1YTI0MjE3YTVhNzY2Zjc5Nzg3NTQwMzk1NjRjNTY0YjQ5NzM3MTVlMjM0MjcyMzI0MTU3NTU0ZjRkNzM1NTUzNzg3OTU1NTMyYTQ4NzA0ZjRlMjQ2ZjI1Mzc0YjM5MjUyNDQ4NmU3OTc4MjM2ZTVlNTY3ODQwNTIyYjc1MjEzODJhNzI3MDM4MmE3NTIxMzgyNjczMjEzODJhNzc1NTUzMmE0ODcwNGY0ZTI0NmYyNTM3NGIzOTI1MjQ0ODZlNzk3ODIzNmU1ZTU2Nzg0MDUyMmIyNTQwMzk1NjQyMzA3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1MzU2NDg3MDRmMmE0YjQwMzk0ZTQ1NzEzNzJiMjM2ZTRiNzQ0NjQwMzk1YTRjMjEzODcwNzg1ODRmNGQ3NTM4MzgyYjI0NTU1MzUyNGI0MDM0NGU0NzZlNWUzMjczMjE1ZTM3NGI2Zjc5Mzc0NzcwNTM0YTJhNTU1MzI0NDg2ZTc5NzgyMzZlNWU1NjQyNmU3OTZmNzMyMTM4MmEyYTU1NTM1Mjc2MjEyNTJiMjQ2ZTdhMzM0YzU4NzU1NTQyNGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3MjM3MDM5NTY0NzRmNzM0MTczNTU0ZjRkNzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NzMzMTM0NGQ3NTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMzk1MzI2NzU0Zjc1NGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRkNzU1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRkNzM1NTUxMjQzMTM1Nzc3ODM2MzUyNDU2NTIzMzRmNGU0ZTMyMjM1YTMxMzczNjJhMzYzNjI0NGE0NzU1NzM0MTczNTU0ZjRkNzM2Zjc5Mzc0YzZmNTMyYjQ3NmYyNTM2NzM1NzRjMjM3MzU1NDc1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzM3MTU3MzY3MzcxNTczNjczNzE1NzM2NzMzNzRhNDczOTUzMjY3NTRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTM0MDQ4NmY3NTRlMjQ2ZjI1Mzc0YjZlNzk1MjQ2NDAzNDQ5NzM0MDUzMzcyMzIxMzg3ODQ1NmY0YjRlNDI2ZTc1NGUyNDZmMjUzNzRiMzkyNTI0NDg2ZTc5NzgyMzZlNWU1Njc4NDA1MjJiNzUyMTM4MmE3MjcwMzgyYTc1MjEzODI2NDc2ZDM5MzM3ODZlMzk1OTQxNTczNTQxNTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzNTIyMzcwMzk1YTcyNzA1NDc4NDk0MDM0NGQyYjU1NGY1NjM3MzU3NzU2NGUzNTc1NTU3MzZkMzgyMTczNDA1MzM3MjMyMTM4Nzg0NTZmNGIyYTdhNDAzOTMyNDE1NjVlMzMyYTZmNTMzNjdhNTczNDRkMmIzMTM0NGQ3YTcwMzgyYTc1MjEzODI2N2E1NTUzMzc0NTZmMjUzNjczNTU3NzU2NGUzNTc1NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODU1NTAyMzczNDA1MzM3MjMyMTM4Nzg0NTZmMjQ0NTdhNmY1ZTM3NzU2ZjI1NWE0YjZkMzg1Njc4NmY3YTU5N2EzOTM3NDYyNDZmMjUzNzRiMzk1ZTVhMjM2Zjc4MjM0NzQwMjUzNzIzNTc0ZjcwNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0Nzg1NjRiNDk3MzU2MjQzNzQ3NmQyNTJhNDg3MDI1MjY3YTU3MzI0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NGQ0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1Njc4NmY1ZTRlNDg2ZTdhNWE3ODU1NGY0NTJiNTU1MzIxNzUzMjM4NWE3NjZlNWUzNzQ3NzA1MDQxNzMzMjU0NDYyNDZmMjUzNzRiNmU3OTUyNDY0MDM5MjQ2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc4MzMyYTZmNTMzNjI4NTU1NDQ2NGM3MDUzNTIyMzcwMzk1YTcyNzA1NDc4NDk0MDM5MjQ2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc4NWEyMzIxMzk1NjIzNDAzODMyMjg1NTU0NDY0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODcyMzc0YTQ3NTU3MzQxNzM1NTRmNGQ3MzU1NGY0ZDczNTU1NDU2Nzg2ZjVlNGU0ODZlN2E1YTc4NTU0ZjQ1MmI1NTRmNTg3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1NDc1Nzg1NTU0NzU3ODU1NTQ3NTc4NTU1MjZmNmU3NTU1NTc0Zjc1NGQ3MzU1NGY0ZTc5NmU1ZTU1NzM3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTUzMzM3ODcwNTM1MjQyNmU1NDU5NzM2ZDM4MjY3MzcwMzk1YTc4NmY3ODJiNDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzI3MDc5Mzc0YjZkMzQyYTQyNzA1MzM3NDY2ZjRiNzM0MjMwNzM0MTczNTU0ZjRkNzM1NTRmNGQ3MzU1NTQ1YTIzMjEzOTU2MjMzOTVlMzM0MjZlMzgzNzcyNDA1NDMyNzMzMTM0NGU3NzIxMzkzMzc4NzA1Mzc4NDY0MDM0MmE3OTZmNzkyYjQ2NzA1Mzc4NDY0MDM5NWEyMzIxMzgyNDQ5NTc1MzMzNzg3MDUzNTI0MjZlNTQ1YTZlNTY1ZTVhMjQyMTdhNWE3NjZmNzk3ODc1NDAzOTU2NGM1NjI0MjQ2ZTcwMzk1YTc4NmY3ODJiNGM3MDU0NTY3MDU4Nzk3MDc4NzA0ZjczN2E2ZjVlMzM3NDZmN2EzMzcyNzA1Mzc4NDY0MDM0NmY0NTU1NTQzMzQyNmUzODM2NDc3MDUzNzg0NjQwMzQ3MzQyNTczNDc3NTc1NTRmNGQ3MzU1NGY0ZDczNTU0ZjRlNGM3MDUzNTI0YjcwNTIyYjIzNmQzODI0NzgzOTVlNWEyMzZmNzU0ZDJiNTU1NDVhMjMyMTM5NTYyMzM5NWUzMzQyNmUzODM3NzI0MDU0MzI0NzZmNWUzMzRiNDA3YTMzNDI2ZTM4MzY0MTU1NzUzNzQwNTgzNDM3NDY1ODM0Mzc3NzU1NGYzNzU1MzA3NTM3NWEzMDc1MzczNTU1NzU3NzU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZDU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc3NTI3NjIxMjUyYjI0NmU3YTMyMjg1NTUxNGUyOTcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzcyYjM5NTMyNjc1NGY3NTRkNzM1NTRmNGQ3MzU1NGY0ZDczNmY3OTM3NGM2ZjUzMmI0NzZmMjUzNjczNTc0YzIzNzM0MDc1NTYzNjcxMzk0ZTc4MzA3NTRlMzgzMzM3NTY1NjMzNzc3ODUwMzIzNzMzNTYzNTIzMmE2ZjZlNzU1NTU3NTU0ZjRkNzM1NTRmNGQ3MzU1NGY0ZTRiNDAzOTVhNDk2ZTI1MmE0YzQwMzQ0ZDQ0MzEzNDRlNzk1NTc4NWEyMzIxMzk1NjIzNDAzODMyMjg1NTU0NDY0YzcwNTM1MjRiNzA1MjJiMjM2ZDM4MjQ3ODM5NWU1YTIzNmY3YTI0NmY2ZTc1NTU1NzU1NGY0ZDczNTU0ZjRkNzM1NTRmNGU0YjQwMzk1YTQ5NmUyNTJhNGM0MDM0NGQ0NDMxMzQ0ZDc1MjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUyNjQyMzQ0ZTI2NDIzNDRlMjY0MjM0NGUzOTUzMjY3NTRmNzU0ZDczNTU0ZjRkNTc1NTRmNGQ3MzU1NTM1NjQ4NzA0ZjJhNGI0MDM5NGU0NTcxMzcyYjIzNmU0Yjc0NDY0MDM5NWE0YzIxMzg3MDc4NTg0ZjRlNGI0MDM5NWE0OTZlMjUyYTRjNDAzNDc3NTc0Zjc1NTk3MzM2NTM3ODc2NmQ0YjRlMjQ2ZjRmNGUyMzZkNTMzNjczNzAyNTUyMjMyMTI1NzQ3ODZmNGI0ZTIzNmQ1MzUyMjM1NTU0NzA3ODZmNzkzNjczNmY3YTM3NDc2ZTc5Nzg0NzQwNGI0ZTc1NDAzODQwNDg2Zjc5MzY3MzcwNTM3NDc4NTU1MzRhNzQ2ZjVlMzI3MzZmMjU3NDI0NzA1MzMzNDg3MDI1MjY0NTU1NTQ1YTQ5NmY3OTM3NzQ0MDRmNGU0ODcwNzkzNzRiNTU1MzJiNDc0MDM0NGU0MjZlN2EzMzc4NmY3YTQwNzQ2ZTRkNDI3OTZlNWU1NTczMzk1ZTM3NGM0MDM5NTY0NzIxMzgyNDc4NTU1Mzc4NDc1NTUzNGE0MjZmNWUzMjQxNmUzODJiNDc2ZDM5MzM0ODZmNzkzNzc3MzkyNTUyNzYyMTI1MmIyNDZlN2EzMzRjNTczNTQxNTc1NTRmNGQ3MzU1NTQ1YTIzMjEzOTU2MjMzOTI1NTI3NjIxMjUyYjI0NmU3YTMzNzI2ZTM4MmI0NzZkMzkzMzQ4NmY3NTc0NzI3MDM5NWE3ODZmNzkyYTc0NmUzODM2NDU1NTUzMzM3ODZlNTM1MjJhMzEzOTU2NzQ2ZTc5MzM0ODZlMzQyYTI0NmU3OTc4Nzk2ZTVlNTY0NjU3NTA0ZDQ1NTU1MTU2NGUzNTc4MmI1MDM0NTEzNzUwMzQyNDJiNTYzNTc4MzM1MjM2Nzg0MDRlMzU0Zjc3NDI0Zjc5NDA0ODZmNzU0ZTcyNzAzOTVhNzg2Zjc5MmE3NDZlMzgzNjczNmQzODI2NzM2ZTUzNzg0YzcwNGY3NDc0MjE1ZTMzNDI3MDc5Mzc3MjcwNzkzNzRiNmQzNzJiMjMyMTM5NWE0NDZmNGI3NzI4NGY3NTRkNzM1NTRmNGU0YzcwNTM1MjRiNzA1MjJiMjU0MDM5NTY0MjQwNzk3ODc2MjEzOTMzNDI2ZTI1MmE3MjZlMzgyYjQ3NmQzOTMzNDg2Zjc1NzQ3MjcwMzk1YTc4NmY3OTJhNzQ2ZTM4MzY0NTU1NTMzMzc4NmU1MzUyMmEzMTM5NTY3NDZlNzkzMzQ4NmUzNDJhMjQ2ZTc5Nzg3OTZlNWU1NjQ2NTc1MDRkNDU1NTUyNDA1MjM2Nzc3ODcyMzIyMzc0NTIzMjIzNDY3MjM0MzYyYTM2MzMzNzU2MzgzMjM2NDk0MjU3MzI0MjQ5NmY3OTc4NDc3MDRmNzQ3OTU1Nzg1Njc4NmY1ZTM3NDY0MDM4MzI3MzcxMjU0YTc4NmU3NTc0NDY2ZTI1MmE0MjcwNTMyYjRiNDAzODMzNzIyMTM4NWE3NjZlNWUzNzQ3NzA1NDU5NDI3MjM0NGU3NTIxMzgyNjQ4NzAzODJhNzUyMTM4MjY3MzIxMzgyYTc3NTU1NDQ2NDU0MDM4MjY0MTIxMzg1YTIzNmQzOTQwNzgzOTVlNDA3ODZmNzk3ODcyNzA1MzUyNGM2ZDVlNTk0MjcyMzQ0ZTI1NDAzOTU2NDI0MDc5Nzg3NjIxMzkzMzQyNmUyNTI2NzM3MDI1NTIyMzIxMjU3NDc4NmY0YjU1NDI0ZjczNDI0YzIxMjU3NDc4NDA1NDM3NDU0MDM5NTU0NzZmMjU1YTQxNDAzODMzMjQ2ZTUzMzY0MTU3NGY3MDQ2MjEzODc4NDc3MDUzMzc0NzIxMzgyYTc2NDAzNDZmNDU1NTRmNzA3NjZlMjUyNDQ5MjEzODVhMjM1NjRiNzc0NTU1NTQ1YTIzMjEzOTMzNzgzOTVlNWEyMzZlNWU1Njc4NTg3OTVhNDg2ZTM5NGU3NDIxNWUzMjQ1NTU1MjVhMzYzMjM3MzM1MjM5MjM1YTMxMzUzNzRlNGUzMjI0MzM3MjM0MzYyYTM2MzMzNzU2MzgzMjM2NDk0NTU1NTMzMzc4NmU1MzUyMmEzMTM3NWEzNjMyMzczMzUyMzkyMzVhMzEzNTM3NGU0ZTMyMjQzMzcyMzQzNjJhMzYzMzM3NTYzODMyMzY0OTQyNGY3MzQxNzY1NTUyNWEyMzIxMzk1NjIzNTU1NDMzNDE0MDM0NGU3NTZlNWUzMjU3NmQzODIxNzMzNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzczNjc3NDkyODRmNzU0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmMjUzNzIzMzk1ZTcwNzgyMTc5NzQ0ODZlMjU0NTQxNzAzOTU2NDUzMTM3NzA1MjMyNzc3NDMxMzUyMzQ2NzIzNzM3NTY1OTU4N2E1NjRjNzA1NDU2NDI2ZjRmNzM3YTU4NGI2ZjQyNTU0ZjQ1NzMzNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzIzMjM3MzM1NTU4NGY0ZTRjNDAzODVhNGI0MDM5MzM3MjcwNTMyYjQ0NDAzODI2MmIzNzIzMzc0ZjM0NTEyYjMxMzQyNDJiMzUzMzM2NWEzNDMzMzczMjQyNGY3NTRkNzM1NTRmNGU0OTZmNzk3ODQ3NzA0Zjc0Nzk1NTc4NTY3ODIxMjUzNzQyNzA3OTc4NDc0MDRiNGUyNDZmNTMzMzc0NzA1MzM3NGM1NTUzNTYyYTU1NTQ3MDc4MjE3OTc0NDg2ZTI1NDU3MzIxMzkzMjczNzEyNDcwNTIzMjc3NzQzMTM1MjM0NjcyMzczNzU2NTk1ODdhNTY0YzcwNTQ1NjQyNmY0ZjczN2E1ODRiNmY0MjcyMzk0NjM5MzMzNjU2NTUzNTIzMmI1ODM5MjQ0ZTRlMzc1MTc0MmI1NTc1Nzc1NzU1NGY0ZDczNTU1NDU2MjQ2ZTc4MmI3OTZlNTM1MjRjNmQ0YjczNDI0Zjc5Mzc0NTZmMjUzNjI4NGY3NTRkNzM1NTRmNGU3NTZlNWUzMjQ3NmY3OTM3NDY2ZTVlNDA3ODM5NWU3MDc4MjE3OTc0NDg2ZTI1NDU0MTU3MzI0MTczNTU0ZjRkNzM2ZDI1Mzc3ODZmNTIyYjc0NmU1Mzc4MjU0MDM0NzM0MjRmNzU0ZDczNTU0ZjRlNzU2ZTVlMzI0NzZmNTMyYjQ1NmU1Mzc4NDc0MDRiNzQ0NzZlMjUyYTc4Mzk1ZTVhMjM2ZTVlNGQyYjM3NTQ1NjI0NDAzNDc3M2ZGT0s4SmQyUg=="
 ENC_METHOD = "self_enc"
 ENC_METADATA = {'method': 'self_enc', 'shift_key': 12, 'salt': 'R2dJ8KOF', 'layers': 4}
 